@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark DEXPI model serialization: pyDEXPI JsonSerializer vs src/core/dexpi_serialization.
+
+For synthetic plants (pumps with two nozzles each, chained by piping
+segments that reference the nozzles) measures:
+1. model -> dict (JsonSerializer.model_to_dict vs model_to_dict)
+2. model -> JSON bytes, the TransactionManager snapshot path
+   (model_to_dict + json.dumps + encode vs dumps per format)
+3. model -> indented JSON text, the persistence path (vs streaming iter_json)
+4. bytes -> model (json.loads + dict_to_model vs loads)
+
+Usage:
+    python scripts/benchmarks/bench_dexpi_serialization.py [component_count ...]
+"""
+
+import gc
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from pydexpi.dexpi_classes.dexpiModel import ConceptualModel, DexpiModel
+from pydexpi.dexpi_classes.equipment import CentrifugalPump, Nozzle
+from pydexpi.dexpi_classes.metaData import MetaData
+from pydexpi.dexpi_classes.piping import Pipe, PipingNetworkSegment, PipingNetworkSystem
+from pydexpi.loaders import JsonSerializer
+
+from src.core import dexpi_serialization as ds
+
+
+def build_model(component_count: int) -> DexpiModel:
+    """Plant with component_count pumps chained pump-to-pump by pipes."""
+    conceptual = ConceptualModel(metaData=MetaData(projectName="Bench", drawingNumber="B-001"))
+    pumps = []
+    for i in range(component_count):
+        pumps.append(CentrifugalPump(
+            tagName=f"P-{i:05d}",
+            nozzles=[Nozzle(subTagName="N1"), Nozzle(subTagName="N2")],
+        ))
+    segments = []
+    for upstream, downstream in zip(pumps, pumps[1:]):
+        source, target = upstream.nozzles[1], downstream.nozzles[0]
+        segments.append(PipingNetworkSegment(
+            connections=[Pipe(sourceItem=source, targetItem=target)],
+            sourceItem=source,
+            targetItem=target,
+        ))
+    conceptual.taggedPlantItems.extend(pumps)
+    conceptual.pipingNetworkSystems.append(PipingNetworkSystem(segments=segments))
+    return DexpiModel(conceptualModel=conceptual)
+
+
+def _time(fn, repeat: int = 3) -> float:
+    # Like timeit, keep the cyclic GC out of the measurement
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best * 1000
+
+
+def run(component_count: int) -> None:
+    model = build_model(component_count)
+    serializer = JsonSerializer()
+    snapshot = json.dumps(serializer.model_to_dict(model)).encode("utf-8")
+
+    rows = [
+        ("to dict", lambda: serializer.model_to_dict(model), "model_to_dict",
+         lambda: ds.model_to_dict(model)),
+        ("snapshot bytes", lambda: json.dumps(serializer.model_to_dict(model)).encode("utf-8"),
+         "dumps json", lambda: ds.dumps(model, "json")),
+        ("indented file", lambda: json.dumps(serializer.model_to_dict(model), indent=4, ensure_ascii=False),
+         "iter_json", lambda: "".join(ds.iter_json(model, indent=4))),
+        ("restore", lambda: serializer.dict_to_model(json.loads(snapshot)),
+         "loads", lambda: ds.loads(snapshot)),
+    ]
+    for fmt in ("orjson", "msgpack"):
+        if fmt in ds.SERIALIZATION_FORMATS and getattr(ds, f"{fmt}_available")():
+            rows.append(("snapshot bytes", rows[1][1], f"dumps {fmt}", lambda fmt=fmt: ds.dumps(model, fmt)))
+            encoded = ds.dumps(model, fmt)
+            rows.append(("restore", rows[3][1], f"loads {fmt}", lambda fmt=fmt, encoded=encoded: ds.loads(encoded, fmt)))
+
+    print(f"\n{component_count} components, snapshot {len(snapshot) / 1e6:.1f} MB")
+    print(f"  {'operation':<16} {'pydexpi':>11} {'fast path':<14} {'':>11} {'speedup':>8}")
+    for name, baseline_fn, label, fast_fn in rows:
+        baseline_ms = _time(baseline_fn)
+        fast_ms = _time(fast_fn)
+        print(f"  {name:<16} {baseline_ms:9.1f}ms {label:<14} {fast_ms:9.1f}ms "
+              f"{baseline_ms / fast_ms:7.1f}x")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 5000]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark template expression and expansion condition evaluation.
+
+Compares, after checking both give the same results:
+1. Before: the text-substitution + eval() paths that
+   ParameterSubstitutionEngine._evaluate_expression and
+   PfdExpansionEngine._evaluate_condition used (reproduced below)
+2. After: the same methods on compiled, cached restricted-AST expressions
+   (src/templates/expressions.py)
+
+Conditions are every equipment condition in the registered process templates,
+evaluated with their defaults and with each parameter overridden.
+
+Usage:
+    python scripts/benchmarks/bench_expressions.py [repeat]
+"""
+
+import gc
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.template_system import TemplateLoader
+from src.templates import ParameterSubstitutionEngine
+from src.tools.pfd_expansion_engine import PfdExpansionEngine
+
+TEMPLATE_DIR = project_root / "src" / "config" / "process_templates"
+
+CONDITION_TOKEN_PATTERN = re.compile(r"\$\{([^}|]+)(?:\|([^}]+))?\}")
+TRUTHY_CONDITION_VALUES = {"true", "yes", "1", "on"}
+
+EXPRESSIONS = [
+    ("index + 1", {"index": 4}),
+    ("pump_count * 2", {"pump_count": 3}),
+    ("pump_count - 1", {"pump_count": 3}),
+    ("flow_rate / pump_count", {"flow_rate": 300.0, "pump_count": 3}),
+    ("control_type == 'flow'", {"control_type": "flow"}),
+    ("pump_count > 2 and control_type != 'manual'", {"pump_count": 3, "control_type": "flow"}),
+]
+
+
+def _legacy_evaluate_expression(expr, params):
+    """ParameterSubstitutionEngine._evaluate_expression before compiled expressions."""
+    safe_dict = {'__builtins__': {}, **params}
+    try:
+        return eval(expr, safe_dict)
+    except Exception as e:
+        raise ValueError(f"Failed to evaluate expression '{expr}': {e}")
+
+
+def _legacy_coerce(raw_value):
+    value = raw_value.strip()
+    if not value:
+        return ""
+    if (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
+        return value[1:-1]
+    if value.lower() in {"true", "false"}:
+        return value.lower() == "true"
+    if re.fullmatch(r"-?\d+", value):
+        return int(value)
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _legacy_resolve(match, parameters):
+    name = match.group(1).strip()
+    if name in parameters:
+        return parameters[name]
+    if match.group(2) is None:
+        raise ValueError(f"Parameter '{name}' without a default")
+    return _legacy_coerce(match.group(2))
+
+
+def _legacy_evaluate_condition(condition, parameters):
+    """PfdExpansionEngine._evaluate_condition before compiled expressions."""
+    if not condition:
+        return True
+    condition = condition.strip()
+    token_only = CONDITION_TOKEN_PATTERN.fullmatch(condition)
+    if token_only:
+        value = _legacy_resolve(token_only, parameters)
+        if isinstance(value, str):
+            return value.strip().lower() in TRUTHY_CONDITION_VALUES
+        return bool(value)
+    resolved = CONDITION_TOKEN_PATTERN.sub(lambda m: repr(_legacy_resolve(m, parameters)), condition)
+    if '==' in resolved or '!=' in resolved:
+        return bool(eval(resolved, {"__builtins__": {}}, dict(parameters)))
+    raise ValueError(f"Unsupported condition format: '{condition}'")
+
+
+def _library_conditions():
+    """(condition, parameters) cases from the registered process templates."""
+    loader = TemplateLoader(str(TEMPLATE_DIR))
+    cases = []
+    for key, filename in loader.registry.items():
+        if not (TEMPLATE_DIR / filename).exists():
+            continue
+        template = loader.load_template(key)
+        parameters = {name: spec.default for name, spec in template.parameters.items()}
+        for eq in template.per_train_equipment + template.shared_equipment:
+            if not eq.condition:
+                continue
+            cases.append((eq.condition, parameters))
+            for name in parameters:
+                cases.append((eq.condition, {**parameters, name: "manual"}))
+    return cases
+
+
+def _time(fn, repeat):
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        return (time.perf_counter() - start) / repeat
+    finally:
+        gc.enable()
+
+
+def run(repeat: int) -> None:
+    logging.disable(logging.WARNING)
+    engine = ParameterSubstitutionEngine()
+    expansion = PfdExpansionEngine()
+    conditions = _library_conditions()
+
+    for expr, params in EXPRESSIONS:
+        assert engine._evaluate_expression(expr, params) == _legacy_evaluate_expression(expr, params), expr
+    for condition, params in conditions:
+        assert expansion._evaluate_condition(condition, params) == _legacy_evaluate_condition(condition, params), condition
+
+    def expressions_before():
+        for expr, params in EXPRESSIONS:
+            _legacy_evaluate_expression(expr, params)
+
+    def expressions_after():
+        for expr, params in EXPRESSIONS:
+            engine._evaluate_expression(expr, params)
+
+    def conditions_before():
+        for condition, params in conditions:
+            _legacy_evaluate_condition(condition, params)
+
+    def conditions_after():
+        for condition, params in conditions:
+            expansion._evaluate_condition(condition, params)
+
+    for label, before, after, count in (
+        ("expressions", expressions_before, expressions_after, len(EXPRESSIONS)),
+        ("conditions", conditions_before, conditions_after, len(conditions)),
+    ):
+        before_s = _time(before, repeat)
+        after_s = _time(after, repeat)
+        print(f"{label:12s} ({count:4d})  before {before_s / count * 1e6:6.2f}us  "
+              f"after {after_s / count * 1e6:6.2f}us  {before_s / after_s:5.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
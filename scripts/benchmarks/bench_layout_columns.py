@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark pydantic LayoutMetadata against the columnar ColumnarLayout.
+
+For synthetic ELK-style layouts (grid of nodes, one routed edge with two
+bend points and two ports per node) measures:
+1. build from the layout file dict (LayoutStore._dict_to_layout vs from_dict)
+2. copy (deepcopy vs ColumnarLayout.copy)
+3. serialize (LayoutMetadata.to_dict vs ColumnarLayout.to_dict)
+4. translate + bounding box
+
+Usage:
+    python scripts/benchmarks/bench_layout_columns.py [node_count ...]
+"""
+
+import gc
+import sys
+import time
+from copy import deepcopy
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.layout_store import LayoutStore
+from src.models.layout_columns import ColumnarLayout
+
+
+def _layout_dict(node_count: int) -> dict:
+    width = int(node_count ** 0.5) + 1
+    positions = {}
+    port_layouts = {}
+    edges = {}
+    for i in range(node_count):
+        x, y = (i % width) * 120.0, (i // width) * 80.0
+        node_id = f"N-{i:05d}"
+        positions[node_id] = [x, y]
+        for side, px in (("WEST", 0.0), ("EAST", 40.0)):
+            port_id = f"{node_id}_{side.lower()}"
+            port_layouts[port_id] = {"id": port_id, "x": px, "y": 12.0, "side": side}
+        if i:
+            edges[f"e{i}"] = {
+                "sections": [{
+                    "startPoint": [x - 80.0, y + 12.0],
+                    "endPoint": [x, y + 12.0],
+                    "bendPoints": [[x - 40.0, y + 12.0], [x - 40.0, y + 6.0]],
+                }],
+                "source_port": f"N-{i - 1:05d}_east",
+                "target_port": f"{node_id}_west",
+            }
+    return {"algorithm": "elk", "positions": positions, "port_layouts": port_layouts,
+            "edges": edges}
+
+
+def _time(fn, repeat: int = 3) -> float:
+    # Like timeit, keep the cyclic GC out of the measurement
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best * 1000
+
+
+def run(node_count: int) -> None:
+    data = _layout_dict(node_count)
+    store = LayoutStore()
+
+    layout = store._dict_to_layout(data)
+    columnar = ColumnarLayout.from_dict(data)
+
+    rows = [
+        ("build", lambda: store._dict_to_layout(data), lambda: ColumnarLayout.from_dict(data)),
+        ("copy", lambda: deepcopy(layout), columnar.copy),
+        ("serialize", layout.to_dict, columnar.to_dict),
+        ("translate + bbox", None, lambda: columnar.translate(10, 10).bounding_box()),
+        ("pydantic view", None, columnar.to_layout),
+    ]
+
+    print(f"\n{node_count} nodes, {len(data['edges'])} edges, {len(data['port_layouts'])} ports")
+    print(f"  {'operation':<20} {'pydantic':>12} {'columnar':>12} {'speedup':>9}")
+    for name, pydantic_fn, columnar_fn in rows:
+        columnar_ms = _time(columnar_fn)
+        if pydantic_fn is None:
+            print(f"  {name:<20} {'-':>12} {columnar_ms:10.2f}ms {'-':>9}")
+            continue
+        pydantic_ms = _time(pydantic_fn)
+        print(f"  {name:<20} {pydantic_ms:10.2f}ms {columnar_ms:10.2f}ms "
+              f"{pydantic_ms / columnar_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark OperationRegistry.execute overhead on a model_tx_apply-sized batch.
+
+Measures, for a batch of 1,000 dexpi_add_equipment operations:
+1. Compiled parameter validation alone (per call)
+2. registry.execute with a no-op handler (dispatch + validation overhead)
+3. Uncompiled jsonschema.validate per call (the naive alternative)
+4. get_schema() memoized vs rebuilt
+
+Usage:
+    python scripts/benchmarks/bench_operation_registry.py [batch_size]
+"""
+
+import asyncio
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import jsonschema
+
+from src.registry.operation_registry import OperationRegistry, OperationResult
+from src.registry.operations.dexpi_operations import DEXPI_ADD_EQUIPMENT
+from src.utils.schema_validation import fastjsonschema_available
+
+
+def _noop_handler(model, params):
+    return OperationResult(success=True, message="noop")
+
+
+def _report(label: str, seconds: float, calls: int) -> None:
+    print(f"  {label:<40} {seconds * 1000:9.2f} ms total  {seconds / calls * 1e6:8.2f} us/call")
+
+
+async def main(batch_size: int = 1000) -> None:
+    registry = OperationRegistry()
+    registry.register(replace(DEXPI_ADD_EQUIPMENT, handler=_noop_handler))
+
+    batch = [
+        {
+            "equipment_type": "CentrifugalPump",
+            "tag_name": f"P-{i:04d}",
+            "specifications": {"design_flow": i},
+            "nozzles": [{"subTagName": "N1"}, {"subTagName": "N2"}],
+        }
+        for i in range(batch_size)
+    ]
+    schema = DEXPI_ADD_EQUIPMENT.input_schema
+    validator = registry._validators[DEXPI_ADD_EQUIPMENT.name]
+
+    backend = "fastjsonschema" if fastjsonschema_available() else "jsonschema (cached)"
+    print(f"Batch of {batch_size} operations, validator backend: {backend}")
+
+    start = time.perf_counter()
+    for params in batch:
+        validator(params)
+    _report("compiled validation", time.perf_counter() - start, batch_size)
+
+    start = time.perf_counter()
+    for params in batch:
+        await registry.execute(None, DEXPI_ADD_EQUIPMENT.name, params)
+    _report("registry.execute (no-op handler)", time.perf_counter() - start, batch_size)
+
+    start = time.perf_counter()
+    for params in batch:
+        jsonschema.validate(params, schema)
+    _report("uncompiled jsonschema.validate", time.perf_counter() - start, batch_size)
+
+    rounds = 100
+    start = time.perf_counter()
+    for _ in range(rounds):
+        registry._schema_cache.clear()
+        registry.get_schema()
+    _report("get_schema() rebuilt", time.perf_counter() - start, rounds)
+
+    registry.get_schema()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        registry.get_schema()
+    _report("get_schema() memoized", time.perf_counter() - start, rounds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Benchmark BFD process type resolution and unit sequence numbering.
+
+Compares, after checking both give the same results:
+1. Before: resolve_process_type / get_fuzzy_matches re-reading the hierarchy
+   and alias JSON and walking the tree per call, and generate_semantic_id /
+   get_next_sequence_number scanning every flowsheet node (reproduced below)
+2. After: the cached ProcessIndex and per-flowsheet sequence counters
+   (src/utils/process_resolver.py)
+
+The hierarchy is generated (categories x subcategories x processes) into a
+temporary file; "suggest" repeats the same misspelled queries, as a client
+retrying an unknown process type does; "add units" is the resolve + ID +
+sequence + add_node path of sfiles_add_unit in BFD mode, building a
+flowsheet of N units.
+
+Usage:
+    python scripts/benchmarks/bench_process_resolver.py [units]
+"""
+
+import gc
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from difflib import get_close_matches
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import networkx as nx
+
+from src.utils import process_resolver
+
+ALIASES_PATH = project_root / "src" / "config" / "process_aliases.json"
+TREATMENT = ["Preliminary", "Primary", "Secondary", "Tertiary", "Sludge", "Odor", "Reuse", "Chemical"]
+STAGES = ["Screening", "Clarification", "Aeration", "Filtration", "Thickening", "Digestion"]
+UNITS = ["Tank", "Basin", "Reactor", "Filter", "Clarifier", "Press", "Screen"]
+
+
+def _hierarchy():
+    hierarchy = {}
+    for c, treatment in enumerate(TREATMENT):
+        category = hierarchy[f"{treatment} Treatment"] = {}
+        for s, stage in enumerate(STAGES):
+            subcategory = category[f"{treatment} {stage}"] = {}
+            for u, unit in enumerate(UNITS):
+                subcategory[f"{treatment} {stage} {unit}"] = {
+                    "area_number": 100 * (c + 1) + 10 * s + u,
+                    "process_unit_id": unit[:2].upper(),
+                }
+    return hierarchy
+
+
+class _Flowsheet:
+    def __init__(self):
+        self.state = nx.DiGraph()
+
+
+def _legacy_load_hierarchy(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _legacy_names(hierarchy):
+    """get_all_process_names before the index."""
+    names = []
+    for category, subcategories in hierarchy.items():
+        names.append(category)
+        if isinstance(subcategories, dict):
+            for subcat, processes in subcategories.items():
+                names.append(subcat)
+                if isinstance(processes, dict):
+                    for process_name, details in processes.items():
+                        if isinstance(details, dict):
+                            names.append(process_name)
+    return names
+
+
+def _legacy_details(name, details, category, subcat):
+    return {
+        'canonical_name': name,
+        'area_number': details['area_number'],
+        'process_unit_id': details.get('process_unit_id', 'TK'),
+        'category': category,
+        'subcategory': subcat
+    }
+
+
+def _legacy_find(hierarchy, query):
+    """find_in_hierarchy before the index: a walk of the whole tree."""
+    for category, subcategories in hierarchy.items():
+        if category == query and isinstance(subcategories, dict):
+            for subcat, details in subcategories.items():
+                if isinstance(details, dict) and 'area_number' in details:
+                    return _legacy_details(category, details, category, subcat)
+        if isinstance(subcategories, dict):
+            for subcat, processes in subcategories.items():
+                if subcat == query and isinstance(processes, dict):
+                    for process_name, details in processes.items():
+                        if isinstance(details, dict) and 'area_number' in details:
+                            return _legacy_details(subcat, details, category, subcat)
+                if isinstance(processes, dict):
+                    for process_name, details in processes.items():
+                        if process_name == query and isinstance(details, dict) and 'area_number' in details:
+                            return dict(_legacy_details(process_name, details, category, subcat),
+                                        process_name=process_name)
+    return None
+
+
+def _legacy_resolve(path, query, allow_custom=False):
+    """resolve_process_type before the cached index."""
+    hierarchy = _legacy_load_hierarchy(path)
+    with open(ALIASES_PATH, 'r') as f:
+        aliases = json.load(f)
+    found = _legacy_find(hierarchy, query)
+    if found:
+        return found
+    if query in aliases:
+        found = _legacy_find(hierarchy, aliases[query])
+        if found:
+            return found
+    for name in _legacy_names(hierarchy):
+        if name.lower() == query.lower():
+            found = _legacy_find(hierarchy, name)
+            if found:
+                return found
+    matches = get_close_matches(query, _legacy_names(hierarchy), n=3, cutoff=0.7)
+    if matches and not allow_custom:
+        return None
+    if allow_custom:
+        return {'canonical_name': query, 'area_number': 900, 'process_unit_id': 'CUS',
+                'category': 'Custom', 'subcategory': 'User Defined', 'is_custom': True}
+    return None
+
+
+def _legacy_suggestions(path, query):
+    return get_close_matches(query, _legacy_names(_legacy_load_hierarchy(path)), n=3)
+
+
+def _legacy_semantic_id(flowsheet, base_name):
+    normalized = ''.join(word.capitalize() for word in re.findall(r'[a-zA-Z0-9]+', base_name))
+    existing_count = 0
+    for node_id in flowsheet.state.nodes():
+        if node_id.startswith(normalized):
+            match = re.search(r'-(\d+)$', node_id)
+            if match:
+                existing_count = max(existing_count, int(match.group(1)))
+    return f"{normalized}-{existing_count + 1:02d}"
+
+
+def _legacy_next_sequence(flowsheet, area_number, process_unit_id):
+    existing = [data.get('sequence_number', 0) for _, data in flowsheet.state.nodes(data=True)
+                if data.get('area_number') == area_number and data.get('process_unit_id') == process_unit_id]
+    return max(existing, default=0) + 1
+
+
+def _add_units(queries, resolve, semantic_id, next_sequence, register):
+    flowsheet = _Flowsheet()
+    for query in queries:
+        info = resolve(query)
+        node_id = semantic_id(flowsheet, info['canonical_name'])
+        seq = next_sequence(flowsheet, info['area_number'], info['process_unit_id'])
+        flowsheet.state.add_node(node_id, area_number=info['area_number'],
+                                 process_unit_id=info['process_unit_id'], sequence_number=seq)
+        register(flowsheet, node_id)
+    return sorted(flowsheet.state.nodes(data='sequence_number'))
+
+
+def _time(fn, repeat=3):
+    """Best wall time of fn() over repeat runs, GC disabled."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def run(units: int) -> None:
+    hierarchy = _hierarchy()
+    path = Path(tempfile.mkdtemp()) / "process_units_hierarchy.json"
+    path.write_text(json.dumps(hierarchy))
+    process_resolver._find_hierarchy_path = lambda: str(path)
+
+    names = _legacy_names(hierarchy)
+    lookups = names[::7] + ["AT", "PC", "primary aeration tank", "Secndary Aeraton Tank", "Unknown"]
+    typos = [name[:-2] for name in names[::25]]
+    processes = [name for name in names if _legacy_find(hierarchy, name)]
+    queries = [processes[(i * 37) % len(processes)] for i in range(units)]
+
+    for query in lookups:
+        assert process_resolver.resolve_process_type(query) == _legacy_resolve(path, query), query
+    for query in typos:
+        after = process_resolver.get_fuzzy_matches(query, process_resolver.load_process_hierarchy())
+        assert after == _legacy_suggestions(path, query), query
+    before_units = _add_units(queries, lambda q: _legacy_resolve(path, q),
+                              _legacy_semantic_id, _legacy_next_sequence, lambda fs, node: None)
+    after_units = _add_units(queries, process_resolver.resolve_process_type,
+                             process_resolver.generate_semantic_id,
+                             process_resolver.get_next_sequence_number, process_resolver.register_unit)
+    assert before_units == after_units
+
+    cases = (
+        ("resolve", len(lookups),
+         lambda: [_legacy_resolve(path, q) for q in lookups],
+         lambda: [process_resolver.resolve_process_type(q) for q in lookups]),
+        ("suggest", len(typos),
+         lambda: [_legacy_suggestions(path, q) for q in typos],
+         lambda: [process_resolver.get_fuzzy_matches(q, process_resolver.load_process_hierarchy())
+                  for q in typos]),
+        ("add units", units,
+         lambda: _add_units(queries, lambda q: _legacy_resolve(path, q),
+                            _legacy_semantic_id, _legacy_next_sequence, lambda fs, node: None),
+         lambda: _add_units(queries, process_resolver.resolve_process_type,
+                            process_resolver.generate_semantic_id,
+                            process_resolver.get_next_sequence_number, process_resolver.register_unit)),
+    )
+    print(f"hierarchy: {len(names)} names in {os.path.getsize(path)} bytes")
+    for label, count, before, after in cases:
+        before_s = _time(before)
+        after_s = _time(after)
+        print(f"{label:10s} ({count:4d})  before {before_s / count * 1e6:8.1f}us  "
+              f"after {after_s / count * 1e6:7.1f}us  {before_s / after_s:6.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
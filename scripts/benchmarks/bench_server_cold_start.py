@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark server cold start: process start to first list_tools response.
+
+Each run starts a fresh interpreter that imports src.server, validates
+dependencies, creates the server and answers a ListToolsRequest through
+the registered MCP handler. Measured:
+1. Without a tool catalog: every tool module is imported and asked for
+   its tools (the cost of every start before the catalog existed)
+2. With a current tool catalog: the list is read from the catalog and
+   no tool module is imported
+
+Usage:
+    python scripts/benchmarks/bench_server_cold_start.py [repeat]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+
+_COLD_START = """
+import time
+start = time.perf_counter()
+import asyncio, json, logging, sys
+logging.disable(logging.INFO)
+sys.path.insert(0, {root!r})
+from mcp import types
+import src.server as server_module
+server_module.validate_dependencies()
+server = server_module.EngineeringDrawingMCPServer()
+handler = server.server.request_handlers[types.ListToolsRequest]
+result = asyncio.run(handler(types.ListToolsRequest(method="tools/list")))
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "tools": len(result.root.tools),
+    "tool_modules": sorted(m for m in sys.modules if m.startswith("src.tools.") and m != "src.tools.tool_catalog"),
+}}))
+"""
+
+
+def cold_start(catalog: Path) -> dict:
+    """Run one fresh server process using the given catalog file."""
+    env = dict(os.environ, TOOL_CATALOG_PATH=str(catalog), PYTHONWARNINGS="ignore")
+    completed = subprocess.run(
+        [sys.executable, "-c", _COLD_START.format(root=str(project_root))],
+        check=True, capture_output=True, text=True, env=env,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = Path(tmp) / "tool_catalog.json"
+        uncached = []
+        for _ in range(repeat):
+            catalog.unlink(missing_ok=True)
+            uncached.append(cold_start(catalog))
+        cached = [cold_start(catalog) for _ in range(repeat)]
+
+    uncached_ms = min(r["seconds"] for r in uncached) * 1000
+    cached_ms = min(r["seconds"] for r in cached) * 1000
+    print(f"{cached[0]['tools']} tools")
+    print(f"  no catalog   {uncached_ms:8.0f}ms  ({len(uncached[0]['tool_modules'])} tool modules imported)")
+    print(f"  catalog      {cached_ms:8.0f}ms  ({len(cached[0]['tool_modules'])} tool modules imported)  "
+          f"{uncached_ms / cached_ms:5.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
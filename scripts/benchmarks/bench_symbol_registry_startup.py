@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark SymbolRegistry startup: JSON catalog vs compiled snapshot.
+
+Copies merged_catalog.json into a temporary assets directory, compiles a
+snapshot there and measures:
+1. SymbolRegistry construction from the JSON catalog (parse, build
+   SymbolInfo/geometry, build search indices)
+2. SymbolRegistry construction from the snapshot (hash check + unpickle)
+3. Both again in a fresh interpreter (first construction, imports excluded)
+
+Usage:
+    python scripts/benchmarks/bench_symbol_registry_startup.py [repeat]
+"""
+
+import gc
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.symbols import SymbolRegistry
+
+ASSETS_DIR = project_root / "src" / "visualization" / "symbols" / "assets"
+
+_COLD_START = """
+import sys, time
+sys.path.insert(0, {root!r})
+from pathlib import Path
+from src.core.symbols import SymbolRegistry
+start = time.perf_counter()
+SymbolRegistry(Path({assets!r}), use_snapshot={use_snapshot})
+print(time.perf_counter() - start)
+"""
+
+
+def _time(fn, repeat: int) -> float:
+    # Like timeit, keep the cyclic GC out of the measurement
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best * 1000
+
+
+def _cold_start(assets_dir: Path, use_snapshot: bool, repeat: int) -> float:
+    code = _COLD_START.format(root=str(project_root), assets=str(assets_dir), use_snapshot=use_snapshot)
+    times = [
+        float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+        for _ in range(repeat)
+    ]
+    return min(times) * 1000
+
+
+def run(repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        assets_dir = Path(tmp)
+        shutil.copy(ASSETS_DIR / "merged_catalog.json", assets_dir)
+        header = SymbolRegistry(assets_dir, use_snapshot=False).compile_snapshot()
+        snapshot_size = (assets_dir / "merged_catalog.snapshot").stat().st_size
+
+        print(f"{header['symbols']} symbols, catalog "
+              f"{(assets_dir / 'merged_catalog.json').stat().st_size / 1e3:.0f} KB, "
+              f"snapshot {snapshot_size / 1e3:.0f} KB")
+        json_ms = _time(lambda: SymbolRegistry(assets_dir, use_snapshot=False), repeat)
+        snapshot_ms = _time(lambda: SymbolRegistry(assets_dir), repeat)
+        print(f"  in-process    json {json_ms:8.1f}ms  snapshot {snapshot_ms:8.1f}ms  "
+              f"{json_ms / snapshot_ms:5.1f}x")
+
+        cold_json = _cold_start(assets_dir, False, repeat)
+        cold_snapshot = _cold_start(assets_dir, True, repeat)
+        print(f"  fresh process  json {cold_json:8.1f}ms  snapshot {cold_snapshot:8.1f}ms  "
+              f"{cold_json / cold_snapshot:5.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
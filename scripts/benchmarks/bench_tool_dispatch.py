@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-call tool routing and argument validation overhead.
+
+Compares, for every listed tool with a minimal valid argument set:
+1. Before: jsonschema.validate() against the tool's input schema (what
+   mcp's call_tool wrapper runs per call) plus the startswith/in chain
+   handle_call_tool used to pick a handler
+2. After: EngineeringDrawingMCPServer.dispatch_tool() routing-table lookup
+   plus the compiled schema checker
+
+Tool code itself is replaced by a no-op, so only the dispatch overhead is
+measured.
+
+Usage:
+    python scripts/benchmarks/bench_tool_dispatch.py [calls_per_tool]
+"""
+
+import asyncio
+import gc
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import jsonschema
+
+from src.server import EngineeringDrawingMCPServer
+
+_PREFIX_ROUTES = (
+    ("dexpi_", "dexpi_tools"), ("sfiles_", "sfiles_tools"), ("bfd_", "bfd_tools"),
+    ("project_", "project_tools"), ("validate_", "validation_tools"), ("schema_", "schema_tools"),
+    ("graph_", "graph_tools"), ("search_", "search_tools"), ("visualize_", "visualization_tools"),
+    ("layout_", "layout_tools"),
+)
+
+
+def _chain_route(name: str) -> str:
+    """The handler selection handle_call_tool used before the routing table."""
+    if name.startswith("model_tx_"):
+        return "transaction_tools"
+    elif name in ["model_create", "model_load", "model_save", "model_combine"]:
+        return "model_tools"
+    elif name in ["model_batch_apply", "rules_apply", "graph_connect"]:
+        return "batch_tools"
+    elif name == "graph_modify":
+        return "graph_modify_tools"
+    elif name.startswith("template_") or name == "area_deploy":
+        return "template_tools"
+    elif name == "query_model_statistics":
+        return "search_tools"
+    for prefix, attr in _PREFIX_ROUTES:
+        if name.startswith(prefix):
+            return attr
+    raise ValueError(f"Unknown tool: {name}")
+
+
+def _minimal_arguments(schema: dict) -> dict:
+    """Smallest argument dict satisfying the schema's required properties."""
+    samples = {"string": "x", "integer": 1, "number": 1.0, "boolean": True, "array": [], "object": {}}
+    arguments = {}
+    for name in schema.get("required", []):
+        spec = schema.get("properties", {}).get(name, {})
+        if "enum" in spec:
+            arguments[name] = spec["enum"][0]
+        else:
+            kind = spec.get("type", "string")
+            arguments[name] = samples[kind[0] if isinstance(kind, list) else kind]
+    return arguments
+
+
+def run(calls: int) -> None:
+    logging.disable(logging.INFO)
+    server = EngineeringDrawingMCPServer()
+    tools = server.get_tools()
+    cases = [(tool.name, tool.inputSchema, _minimal_arguments(tool.inputSchema)) for tool in tools]
+
+    async def noop(arguments):
+        return {"ok": True}
+
+    async def before():
+        for name, schema, arguments in cases:
+            for _ in range(calls):
+                try:
+                    jsonschema.validate(instance=arguments, schema=schema)
+                except jsonschema.ValidationError:
+                    continue
+                _chain_route(name)
+                await noop(arguments)
+
+    async def after():
+        for name, _, arguments in cases:
+            for _ in range(calls):
+                await server.dispatch_tool(name, arguments)
+
+    # Compile validators and bind every tool to the no-op
+    invalid = []
+    for name, _, arguments in cases:
+        server._bound[name] = noop
+        if server._compile_checker(name)(arguments) is not None:
+            invalid.append(name)
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        asyncio.run(before())
+        before_s = time.perf_counter() - start
+        start = time.perf_counter()
+        asyncio.run(after())
+        after_s = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    total = calls * len(cases)
+    print(f"{len(cases)} tools x {calls} calls ({len(invalid)} sample argument sets rejected)")
+    print(f"  before  {before_s / total * 1e6:8.1f}us/call")
+    print(f"  after   {after_s / total * 1e6:8.1f}us/call  {before_s / after_s:5.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
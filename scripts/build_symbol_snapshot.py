@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Compile the merged symbol catalog into a binary snapshot.
+
+SymbolRegistry loads src/visualization/symbols/assets/merged_catalog.snapshot
+instead of parsing merged_catalog.json when the snapshot matches the
+catalog. Run this after regenerating the catalog (merge_symbol_libraries.py
+runs it automatically); a stale snapshot is ignored, never used.
+
+Usage:
+    python scripts/build_symbol_snapshot.py [--check]
+
+Exit codes:
+    0: Snapshot written (or current with --check)
+    1: --check and the snapshot is missing or stale
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.symbol_snapshot import load_snapshot
+from src.core.symbols import SymbolRegistry
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--check", action="store_true", help="Only report whether the snapshot is current")
+    args = parser.parse_args()
+
+    registry = SymbolRegistry(use_snapshot=False)
+    if args.check:
+        if load_snapshot(registry.catalog_path, registry.snapshot_path) is None:
+            print(f"Snapshot missing or stale: {registry.snapshot_path}")
+            return 1
+        print(f"Snapshot current: {registry.snapshot_path}")
+        return 0
+
+    header = registry.compile_snapshot()
+    print(f"Wrote {registry.snapshot_path} ({header['symbols']} symbols, catalog {header['catalog_sha256'][:12]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
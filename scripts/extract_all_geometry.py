@@ -13,6 +13,7 @@ NOTE: Uses the consolidated svg_parser module to avoid code duplication.
 Usage:
     python scripts/extract_all_geometry.py          # Extract only missing geometry
     python scripts/extract_all_geometry.py --force  # Re-extract all geometry
+    python scripts/extract_all_geometry.py --incremental  # Refresh all, re-parse changed SVGs only
 """
 
 import argparse
@@ -20,14 +21,14 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 # Add project root to path for imports
 script_dir = Path(__file__).parent
 project_root = script_dir.parent
 sys.path.insert(0, str(project_root))
 
-from src.core.svg_parser import extract_svg_metadata
+from src.core.svg_manifest import SVGManifest
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -58,10 +59,28 @@ def find_svg_for_symbol(symbol_id: str, source_file: str, assets_dir: Path) -> O
     return None
 
 
+def apply_geometry(data: Dict[str, Any], metadata: Dict[str, Any], file_hash: str) -> None:
+    """Write extracted SVG geometry (SVGMetadata.to_dict() layout) into a catalog entry."""
+    data["bounding_box"] = metadata["bounding_box"]
+    data["anchor_point"] = metadata["anchor_point"]
+    if metadata["ports"]:
+        data["ports"] = metadata["ports"]
+    data["scalable"] = metadata["scalable"]
+    data["rotatable"] = metadata["rotatable"]
+    # Update file hash if not present in provenance
+    if "provenance" not in data:
+        data["provenance"] = {}
+    data["provenance"]["file_hash"] = file_hash
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Extract geometry from SVG files")
     parser.add_argument("--force", action="store_true", help="Re-extract all geometry, even if already present")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Refresh all geometry, re-parsing only SVGs changed since the last run")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes used to parse SVG files (default: CPU count)")
     args = parser.parse_args()
 
     assets_dir = project_root / "src" / "visualization" / "symbols" / "assets"
@@ -82,15 +101,16 @@ def main():
     if args.force:
         logger.info("Force mode: Re-extracting all geometry")
 
-    # Process each symbol
+    # Collect the symbols to (re-)extract
     extracted = 0
     already_have = 0
     no_svg = 0
     failed = 0
 
+    targets = []
     for symbol_id, data in symbols.items():
-        # Skip if already has geometry (unless --force)
-        if data.get("bounding_box") and not args.force:
+        # Skip if already has geometry (unless --force or --incremental)
+        if data.get("bounding_box") and not (args.force or args.incremental):
             already_have += 1
             continue
 
@@ -101,41 +121,28 @@ def main():
         if not svg_path:
             no_svg += 1
             continue
-
-        # Extract geometry using the consolidated svg_parser module
-        metadata = extract_svg_metadata(svg_path, include_hash=True)
-        if metadata:
-            data["bounding_box"] = {
-                "x": metadata.bounding_box.x,
-                "y": metadata.bounding_box.y,
-                "width": metadata.bounding_box.width,
-                "height": metadata.bounding_box.height
-            }
-            data["anchor_point"] = {
-                "x": metadata.anchor_point.x,
-                "y": metadata.anchor_point.y
-            }
-            if metadata.ports:
-                data["ports"] = [
-                    {
-                        "id": p.id,
-                        "position": {"x": p.x, "y": p.y},
-                        "direction": p.direction,
-                        "type": p.type,
-                        "flow_direction": p.flow_direction
-                    }
-                    for p in metadata.ports
-                ]
-            data["scalable"] = metadata.scalable
-            data["rotatable"] = metadata.rotatable
-            if metadata.file_hash:
-                # Update file hash if not present in provenance
-                if "provenance" not in data:
-                    data["provenance"] = {}
-                data["provenance"]["file_hash"] = metadata.file_hash
-            extracted += 1
-        else:
+        targets.append((data, svg_path))
+
+    # Extract geometry using the consolidated svg_parser module. The SVG
+    # manifest re-parses only files changed since the last run (all files
+    # with --force), spread over a process pool.
+    manifest = SVGManifest(assets_dir)
+    records = manifest.refresh(
+        sorted({svg_path for _, svg_path in targets}),
+        metadata=True,
+        workers=args.workers,
+        force=args.force,
+    )
+    manifest.save()
+    logger.info(f"Parsed {manifest.stats['parsed']} SVG files, reused {manifest.stats['reused']}")
+
+    for data, svg_path in targets:
+        record = records[svg_path.relative_to(assets_dir).as_posix()]
+        if record.metadata is None:
             failed += 1
+            continue
+        apply_geometry(data, record.metadata, record.sha256)
+        extracted += 1
 
     # Save updated catalog
     logger.info("Saving updated catalog...")
@@ -12,34 +12,52 @@ Modules:
 - conversion_engine: Unified SFILES↔DEXPI conversion logic
 """
 
-from .equipment import (
-    EquipmentRegistry,
-    EquipmentFactory,
-    EquipmentDefinition,
-    EquipmentCategory,
-    get_registry as get_equipment_registry,
-    get_factory as get_equipment_factory
-)
-from .symbols import (
-    SymbolRegistry,
-    SymbolInfo,
-    SymbolSource,
-    SymbolCategory,
-    get_registry as get_symbol_registry
-)
-from .conversion import (
-    ConversionEngine,
-    SfilesModel,
-    SfilesUnit,
-    SfilesStream,
-    get_engine as get_conversion_engine
-)
-from .layout_store import (
-    LayoutStore,
-    LayoutNotFoundError,
-    OptimisticLockError,
-    create_layout_store,
-)
+import importlib
+
+# Exported name -> (submodule, attribute). Submodules are imported on first
+# access, so importing a light module such as src.core.model_store does not
+# load pyDEXPI's class tree through the equipment registry.
+_EXPORTS = {
+    # Equipment
+    'EquipmentRegistry': ('equipment', 'EquipmentRegistry'),
+    'EquipmentFactory': ('equipment', 'EquipmentFactory'),
+    'EquipmentDefinition': ('equipment', 'EquipmentDefinition'),
+    'EquipmentCategory': ('equipment', 'EquipmentCategory'),
+    'get_equipment_registry': ('equipment', 'get_registry'),
+    'get_equipment_factory': ('equipment', 'get_factory'),
+    # Symbols
+    'SymbolRegistry': ('symbols', 'SymbolRegistry'),
+    'SymbolInfo': ('symbols', 'SymbolInfo'),
+    'SymbolSource': ('symbols', 'SymbolSource'),
+    'SymbolCategory': ('symbols', 'SymbolCategory'),
+    'get_symbol_registry': ('symbols', 'get_registry'),
+    # Conversion
+    'ConversionEngine': ('conversion', 'ConversionEngine'),
+    'SfilesModel': ('conversion', 'SfilesModel'),
+    'SfilesUnit': ('conversion', 'SfilesUnit'),
+    'SfilesStream': ('conversion', 'SfilesStream'),
+    'get_conversion_engine': ('conversion', 'get_engine'),
+    # Layout
+    'LayoutStore': ('layout_store', 'LayoutStore'),
+    'LayoutSnapshot': ('layout_store', 'LayoutSnapshot'),
+    'LayoutNotFoundError': ('layout_store', 'LayoutNotFoundError'),
+    'OptimisticLockError': ('layout_store', 'OptimisticLockError'),
+    'create_layout_store': ('layout_store', 'create_layout_store'),
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Equipment
@@ -63,6 +81,7 @@ __all__ = [
     'get_conversion_engine',
     # Layout
     'LayoutStore',
+    'LayoutSnapshot',
     'LayoutNotFoundError',
     'OptimisticLockError',
     'create_layout_store',
@@ -0,0 +1,505 @@
+"""
+Graph metric planning and execution for engineering model graphs.
+
+GraphTools used to compute every requested metric independently, converting
+the graph with ``to_undirected()`` and recomputing betweenness, degrees and
+connectivity once per metric. This module provides:
+
+- GraphMetricContext: lazily computed structures shared by all metrics of
+  one request (undirected view, SCCs, weak components, degree maps,
+  betweenness), optionally backed by NumPy/SciPy sparse arrays for large
+  graphs.
+- MetricPlanner: resolves requested metrics to MetricSpecs, precomputes the
+  structures needed by more than one metric, and runs the independent
+  metrics serially or concurrently on a process pool.
+- TOPOLOGY_ANALYSES / GRAPH_METRICS: the metric sets served by the
+  graph_analyze_topology and graph_calculate_metrics tools.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+from ..optional_deps import numpy_available, scipy_available
+
+logger = logging.getLogger(__name__)
+
+# Graphs with at least this many nodes use the NumPy/SciPy array backend
+SPARSE_BACKEND_MIN_NODES = 1000
+
+# Graphs with at least this many nodes run heavy metrics on the process pool
+PARALLEL_MIN_NODES = 2000
+
+# Structures that can be shared between metrics (GraphMetricContext attributes)
+SHARED_STRUCTURES = (
+    "undirected",
+    "degree",
+    "in_degree",
+    "out_degree",
+    "weak_component_count",
+    "scc_count",
+    "is_dag",
+    "betweenness",
+)
+
+
+@dataclass
+class GraphArrays:
+    """Integer-indexed edge arrays for a graph.
+
+    Attributes:
+        nodes: Node identifiers in graph iteration order
+        src: Source node index per edge (parallel edges repeated)
+        dst: Target node index per edge
+        adjacency: SciPy CSR adjacency matrix, or None without SciPy
+    """
+    nodes: List[Hashable]
+    src: Any
+    dst: Any
+    adjacency: Any = None
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "GraphArrays":
+        """Build edge arrays (and CSR adjacency when SciPy is present)."""
+        import numpy as np
+
+        nodes = list(graph.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        edge_count = graph.number_of_edges()
+        src = np.fromiter((index[u] for u, _ in graph.edges()), dtype=np.int64, count=edge_count)
+        dst = np.fromiter((index[v] for _, v in graph.edges()), dtype=np.int64, count=edge_count)
+
+        adjacency = None
+        if scipy_available():
+            from scipy.sparse import csr_matrix
+
+            n = len(nodes)
+            adjacency = csr_matrix(
+                (np.ones(edge_count, dtype=np.int8), (src, dst)), shape=(n, n)
+            )
+        return cls(nodes=nodes, src=src, dst=dst, adjacency=adjacency)
+
+    def _as_map(self, values: Any) -> Dict[Hashable, int]:
+        return dict(zip(self.nodes, values.tolist(), strict=True))
+
+    def in_degree(self) -> Dict[Hashable, int]:
+        import numpy as np
+        return self._as_map(np.bincount(self.dst, minlength=len(self.nodes)))
+
+    def out_degree(self) -> Dict[Hashable, int]:
+        import numpy as np
+        return self._as_map(np.bincount(self.src, minlength=len(self.nodes)))
+
+    def degree(self) -> Dict[Hashable, int]:
+        import numpy as np
+        n = len(self.nodes)
+        return self._as_map(
+            np.bincount(self.src, minlength=n) + np.bincount(self.dst, minlength=n)
+        )
+
+    def component_count(self, connection: str) -> int:
+        """Count 'weak' or 'strong' components (requires SciPy adjacency)."""
+        from scipy.sparse.csgraph import connected_components
+
+        count, _ = connected_components(self.adjacency, directed=True, connection=connection)
+        return int(count)
+
+
+class GraphMetricContext:
+    """Structures shared between metrics computed on the same graph.
+
+    Every structure is computed on first access and cached, so metrics that
+    need the undirected view or betweenness centrality share one computation.
+    The context is picklable with its cached values, which is how
+    precomputed structures reach process-pool workers.
+    """
+
+    def __init__(self, graph: nx.DiGraph, use_sparse: Optional[bool] = None):
+        """Initialize context.
+
+        Args:
+            graph: Graph to analyze (not modified)
+            use_sparse: Force (True) or disable (False) the array backend.
+                        None selects it for graphs with at least
+                        SPARSE_BACKEND_MIN_NODES nodes when NumPy is available.
+        """
+        self.graph = graph
+        if use_sparse is None:
+            use_sparse = graph.number_of_nodes() >= SPARSE_BACKEND_MIN_NODES
+        if use_sparse and not numpy_available():
+            logger.debug("NumPy unavailable, using NetworkX backend for graph metrics")
+            use_sparse = False
+        self.use_sparse = use_sparse
+
+    @cached_property
+    def arrays(self) -> GraphArrays:
+        return GraphArrays.from_graph(self.graph)
+
+    @property
+    def _sparse_adjacency(self) -> bool:
+        return self.use_sparse and self.arrays.adjacency is not None
+
+    @cached_property
+    def undirected(self) -> nx.Graph:
+        return self.graph.to_undirected()
+
+    @cached_property
+    def degree(self) -> Dict[Hashable, int]:
+        if self.use_sparse:
+            return self.arrays.degree()
+        return dict(self.graph.degree())
+
+    @cached_property
+    def in_degree(self) -> Dict[Hashable, int]:
+        if self.use_sparse:
+            return self.arrays.in_degree()
+        return dict(self.graph.in_degree())
+
+    @cached_property
+    def out_degree(self) -> Dict[Hashable, int]:
+        if self.use_sparse:
+            return self.arrays.out_degree()
+        return dict(self.graph.out_degree())
+
+    @cached_property
+    def weak_component_count(self) -> int:
+        if self._sparse_adjacency:
+            return self.arrays.component_count("weak")
+        return nx.number_weakly_connected_components(self.graph)
+
+    @cached_property
+    def scc_count(self) -> int:
+        if self._sparse_adjacency:
+            return self.arrays.component_count("strong")
+        return nx.number_strongly_connected_components(self.graph)
+
+    @cached_property
+    def is_weakly_connected(self) -> bool:
+        return self.weak_component_count == 1
+
+    @cached_property
+    def is_dag(self) -> bool:
+        # Acyclic iff every SCC is a single node and there are no self-loops
+        return (
+            self.scc_count == self.graph.number_of_nodes()
+            and nx.number_of_selfloops(self.graph) == 0
+        )
+
+    @cached_property
+    def betweenness(self) -> Dict[Hashable, float]:
+        return nx.betweenness_centrality(self.graph)
+
+
+def _node_order(graph: nx.DiGraph) -> Dict[Hashable, int]:
+    return {node: i for i, node in enumerate(graph.nodes())}
+
+
+def _rotate_cycle(cycle: List[Hashable], order: Dict[Hashable, int]) -> List[Hashable]:
+    """Rotate a cycle to start at its earliest node in graph order.
+
+    NetworkX picks cycle start nodes by set iteration, which differs between
+    processes for string node ids; rotating keeps results reproducible.
+    """
+    start = min(range(len(cycle)), key=lambda i: order[cycle[i]])
+    return cycle[start:] + cycle[:start]
+
+
+def top_nodes(scores: Dict, n: int) -> List[Tuple[str, float]]:
+    """Get top n nodes by score."""
+    sorted_nodes = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    return sorted_nodes[:n]
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """A named metric and the shared structures it reads.
+
+    Attributes:
+        name: Metric name as used in tool arguments
+        compute: Module-level function taking a GraphMetricContext
+        requires: Shared structures (see SHARED_STRUCTURES) the metric reads
+        heavy: True if worth running on the process pool
+    """
+    name: str
+    compute: Callable[[GraphMetricContext], Any]
+    requires: FrozenSet[str] = frozenset()
+    heavy: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Topology analyses (graph_analyze_topology)
+# ---------------------------------------------------------------------------
+
+def analyze_paths(ctx: GraphMetricContext) -> Dict:
+    """Analyze path characteristics."""
+    if not ctx.is_weakly_connected:
+        return {"connected": False}
+
+    # Find longest path (for DAGs)
+    if ctx.is_dag:
+        longest_path = nx.dag_longest_path(ctx.graph)
+        return {
+            "is_dag": True,
+            "longest_path_length": len(longest_path) - 1,
+            "longest_path_nodes": longest_path[:10]  # First 10 nodes
+        }
+    return {
+        "is_dag": False,
+        "has_cycles": True
+    }
+
+
+def analyze_cycles(ctx: GraphMetricContext) -> Dict:
+    """Analyze cycles in the graph."""
+    if ctx.graph.number_of_nodes() > 100:
+        return {"status": "Graph too large for cycle analysis"}
+
+    cycles = []
+    if not ctx.is_dag:
+        order = _node_order(ctx.graph)
+        cycles = [_rotate_cycle(c, order) for c in nx.simple_cycles(ctx.graph)]
+
+    return {
+        "cycle_count": len(cycles),
+        "cycles": cycles[:20],  # Limit to 20 cycles
+        "max_cycle_length": max(len(c) for c in cycles) if cycles else 0,
+        "min_cycle_length": min(len(c) for c in cycles) if cycles else 0
+    }
+
+
+def find_bottlenecks(ctx: GraphMetricContext) -> Dict:
+    """Find bottleneck nodes."""
+    # Articulation points are defined on the undirected version
+    articulation_points = list(nx.articulation_points(ctx.undirected))
+
+    return {
+        "high_betweenness_nodes": top_nodes(ctx.betweenness, 10),
+        "articulation_points": articulation_points[:20]
+    }
+
+
+def analyze_communities(ctx: GraphMetricContext) -> Dict:
+    """Analyze clustering (community structure) in the graph."""
+    communities = list(nx.community.greedy_modularity_communities(ctx.undirected))
+    largest = []
+    if communities:
+        # Report members in graph order; frozenset order varies by process
+        order = _node_order(ctx.graph)
+        largest = sorted(communities[0], key=order.__getitem__)[:20]
+
+    return {
+        "number_of_communities": len(communities),
+        "community_sizes": [len(c) for c in communities],
+        "largest_community": largest
+    }
+
+
+def analyze_degree_centrality(ctx: GraphMetricContext) -> Dict:
+    """Analyze node degree centrality."""
+    return {
+        "highest_degree": top_nodes(ctx.degree, 5),
+        "highest_in_degree": top_nodes(ctx.in_degree, 5),
+        "highest_out_degree": top_nodes(ctx.out_degree, 5)
+    }
+
+
+TOPOLOGY_ANALYSES: Dict[str, MetricSpec] = {
+    spec.name: spec for spec in (
+        MetricSpec("paths", analyze_paths,
+                   frozenset({"weak_component_count", "scc_count", "is_dag"})),
+        MetricSpec("cycles", analyze_cycles, frozenset({"scc_count", "is_dag"}), heavy=True),
+        MetricSpec("bottlenecks", find_bottlenecks,
+                   frozenset({"betweenness", "undirected"}), heavy=True),
+        MetricSpec("clustering", analyze_communities, frozenset({"undirected"}), heavy=True),
+        MetricSpec("centrality", analyze_degree_centrality,
+                   frozenset({"degree", "in_degree", "out_degree"})),
+    )
+}
+
+
+# ---------------------------------------------------------------------------
+# Graph metrics (graph_calculate_metrics)
+# ---------------------------------------------------------------------------
+
+def basic_metrics(ctx: GraphMetricContext) -> Dict:
+    """Size, density and connectivity metrics."""
+    graph = ctx.graph
+    results = {
+        "nodes": graph.number_of_nodes(),
+        "edges": graph.number_of_edges(),
+        "density": nx.density(graph),
+        "is_connected": ctx.is_weakly_connected,
+        "is_dag": ctx.is_dag,
+        "number_of_components": ctx.weak_component_count
+    }
+    if ctx.is_weakly_connected:
+        results["diameter"] = nx.diameter(ctx.undirected)
+    return results
+
+
+def centrality_metrics(ctx: GraphMetricContext) -> Dict:
+    """Degree, betweenness and closeness centrality leaders."""
+    return {
+        "degree": top_nodes(ctx.degree, 5),
+        "betweenness": top_nodes(ctx.betweenness, 5),
+        "closeness": top_nodes(nx.closeness_centrality(ctx.graph), 5)
+    }
+
+
+def clustering_metrics(ctx: GraphMetricContext) -> Dict:
+    """Clustering coefficient and transitivity on the undirected view."""
+    return {
+        "average_clustering": nx.average_clustering(ctx.undirected),
+        "transitivity": nx.transitivity(ctx.undirected)
+    }
+
+
+def efficiency_metrics(ctx: GraphMetricContext) -> Dict:
+    """Global and local efficiency on the undirected view."""
+    return {
+        "global_efficiency": nx.global_efficiency(ctx.undirected),
+        "local_efficiency": nx.local_efficiency(ctx.undirected)
+    }
+
+
+GRAPH_METRICS: Dict[str, MetricSpec] = {
+    spec.name: spec for spec in (
+        MetricSpec("basic", basic_metrics,
+                   frozenset({"weak_component_count", "scc_count", "is_dag", "undirected"}),
+                   heavy=True),
+        MetricSpec("centrality", centrality_metrics,
+                   frozenset({"degree", "betweenness"}), heavy=True),
+        MetricSpec("clustering", clustering_metrics, frozenset({"undirected"}), heavy=True),
+        MetricSpec("efficiency", efficiency_metrics, frozenset({"undirected"}), heavy=True),
+    )
+}
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_metric_executor() -> ProcessPoolExecutor:
+    """Get the process-wide metric executor, creating it on first use.
+
+    Workers are started with the 'spawn' method so the pool is safe to use
+    from the server's event loop thread.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=max(1, min(4, os.cpu_count() or 1)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(shutdown_metric_executor)
+        return _executor
+
+
+def shutdown_metric_executor() -> None:
+    """Shut down the process-wide metric executor if it was started."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _compute_metric(spec: MetricSpec, ctx: GraphMetricContext) -> Any:
+    """Process-pool entry point (module level so it is picklable)."""
+    return spec.compute(ctx)
+
+
+class MetricPlanner:
+    """Plans and executes a set of metrics over one graph.
+
+    Example:
+        >>> planner = MetricPlanner(GRAPH_METRICS)
+        >>> results = planner.run(graph, ["basic", "clustering"])
+    """
+
+    def __init__(self, specs: Dict[str, MetricSpec],
+                 parallel_min_nodes: int = PARALLEL_MIN_NODES):
+        """Initialize planner.
+
+        Args:
+            specs: Available metrics by name (iteration order is output order)
+            parallel_min_nodes: Node count from which heavy metrics run on
+                                the process pool when parallel is not forced
+        """
+        self.specs = specs
+        self.parallel_min_nodes = parallel_min_nodes
+
+    def plan(self, requested: Sequence[str]) -> List[MetricSpec]:
+        """Resolve requested names ('all' expands) to specs in canonical order.
+
+        Unknown names are ignored, matching the previous tool behavior.
+        """
+        if "all" in requested:
+            return list(self.specs.values())
+        return [spec for name, spec in self.specs.items() if name in requested]
+
+    @staticmethod
+    def shared_structures(plan: Sequence[MetricSpec]) -> List[str]:
+        """Structures read by more than one planned metric."""
+        counts: Dict[str, int] = {}
+        for spec in plan:
+            for structure in spec.requires:
+                counts[structure] = counts.get(structure, 0) + 1
+        return [s for s in SHARED_STRUCTURES if counts.get(s, 0) > 1]
+
+    def run(self, graph: nx.DiGraph, requested: Sequence[str],
+            parallel: Optional[bool] = None,
+            executor: Optional[Executor] = None,
+            use_sparse: Optional[bool] = None) -> Dict[str, Any]:
+        """Compute requested metrics.
+
+        Args:
+            graph: Graph to analyze
+            requested: Metric names, or ["all"]
+            parallel: Force (True) or disable (False) process-pool execution.
+                      None enables it for graphs with at least
+                      parallel_min_nodes nodes and two or more heavy metrics.
+            executor: Executor to use instead of the process-wide pool
+            use_sparse: Passed to GraphMetricContext
+
+        Returns:
+            Dict mapping metric name to its result, in canonical order
+        """
+        plan = self.plan(requested)
+        ctx = GraphMetricContext(graph, use_sparse=use_sparse)
+
+        heavy = [spec for spec in plan if spec.heavy]
+        if parallel is None:
+            parallel = (
+                len(heavy) > 1 and graph.number_of_nodes() >= self.parallel_min_nodes
+            )
+
+        if not parallel or len(heavy) < 2:
+            return {spec.name: spec.compute(ctx) for spec in plan}
+
+        # Compute shared structures once, then ship them with the context
+        for structure in self.shared_structures(plan):
+            getattr(ctx, structure)
+
+        pool = executor if executor is not None else get_metric_executor()
+        futures = {spec.name: pool.submit(_compute_metric, spec, ctx) for spec in heavy}
+        results = {}
+        for spec in plan:
+            if spec.name in futures:
+                results[spec.name] = futures[spec.name].result()
+            else:
+                results[spec.name] = spec.compute(ctx)
+        return results
@@ -0,0 +1,242 @@
+"""
+Bounded, resumable path search between graph nodes.
+
+``nx.all_simple_paths`` without a cutoff can enumerate an exponential number
+of paths before a caller gets to slice the result, which hangs the server on
+recycle-heavy plants. This module provides:
+
+- SimplePathIterator: iterative DFS over simple paths that can stop at a
+  deadline and resume later from the same stack.
+- KShortestPathIterator: Yen's k-shortest simple paths (via
+  ``nx.shortest_simple_paths``), yielding paths in increasing length.
+- PathCursorStore: bounded store of in-progress searches so clients can
+  fetch further pages without recomputing earlier paths.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, List, Optional, Tuple
+
+import networkx as nx
+
+# Defaults for graph_find_paths
+DEFAULT_MAX_PATHS = 100
+DEFAULT_TIME_BUDGET_MS = 2000
+
+# Deadline is checked every this many DFS steps
+_DEADLINE_CHECK_INTERVAL = 256
+
+
+class SimplePathIterator:
+    """Resumable DFS enumeration of simple paths from source to target.
+
+    Call next_path() repeatedly; it returns None when the deadline passes
+    (state is kept, call again to continue) or when the search is exhausted
+    (``exhausted`` is then True). Parallel edges do not produce duplicate
+    paths.
+    """
+
+    def __init__(self, graph: nx.DiGraph, source: Hashable, target: Hashable,
+                 cutoff: Optional[int] = None):
+        """Initialize iterator.
+
+        Args:
+            graph: Graph to search (must not be mutated while iterating)
+            source: Start node
+            target: End node
+            cutoff: Maximum path length in edges (None = unbounded)
+        """
+        self._graph = graph
+        self._target = target
+        self._cutoff = cutoff if cutoff is not None else max(len(graph) - 1, 0)
+        self._path: List[Hashable] = [source]
+        self._on_path = {source}
+        self._stack = [iter(graph.successors(source))]
+        self.exhausted = source == target or self._cutoff < 1
+        if self.exhausted:
+            self._stack = []
+
+    def next_path(self, deadline: Optional[float] = None) -> Optional[List[Hashable]]:
+        """Advance to the next path.
+
+        Args:
+            deadline: time.monotonic() value after which to pause
+
+        Returns:
+            Next path as a node list, or None on pause/exhaustion
+        """
+        steps = 0
+        while self._stack:
+            steps += 1
+            if (deadline is not None and steps % _DEADLINE_CHECK_INTERVAL == 0
+                    and time.monotonic() > deadline):
+                return None
+
+            child = next(self._stack[-1], None)
+            if child is None:
+                self._stack.pop()
+                self._on_path.discard(self._path.pop())
+                continue
+            if child in self._on_path:
+                continue
+            if child == self._target:
+                return self._path + [child]
+            if len(self._path) < self._cutoff:
+                self._path.append(child)
+                self._on_path.add(child)
+                self._stack.append(iter(self._graph.successors(child)))
+
+        self.exhausted = True
+        return None
+
+
+class KShortestPathIterator:
+    """Yen's k-shortest simple paths, yielded in increasing hop count."""
+
+    def __init__(self, graph: nx.DiGraph, source: Hashable, target: Hashable):
+        # shortest_simple_paths does not accept multigraphs; simple paths over
+        # nodes are the same on the collapsed graph
+        if graph.is_multigraph():
+            graph = nx.DiGraph(graph)
+        self._paths = nx.shortest_simple_paths(graph, source, target)
+        self.exhausted = False
+
+    def next_path(self, deadline: Optional[float] = None) -> Optional[List[Hashable]]:
+        """Return the next shortest path, or None when exhausted.
+
+        Each step is a bounded shortest-path computation, so the deadline is
+        enforced by the caller between paths.
+        """
+        if self.exhausted:
+            return None
+        try:
+            return next(self._paths)
+        except (StopIteration, nx.NetworkXNoPath):
+            self.exhausted = True
+            return None
+
+
+def collect_paths(iterator: Any, max_paths: int,
+                  time_budget_ms: Optional[int]) -> Tuple[List[List[Hashable]], str]:
+    """Pull up to max_paths paths from an iterator within a time budget.
+
+    Returns:
+        (paths, stopped_reason) where stopped_reason is "exhausted",
+        "max_paths" or "time_budget"
+    """
+    deadline = None
+    if time_budget_ms is not None:
+        deadline = time.monotonic() + time_budget_ms / 1000.0
+
+    paths: List[List[Hashable]] = []
+    while len(paths) < max_paths:
+        path = iterator.next_path(deadline)
+        if path is not None:
+            paths.append(path)
+        elif iterator.exhausted:
+            return paths, "exhausted"
+        else:
+            return paths, "time_budget"
+        if deadline is not None and time.monotonic() > deadline:
+            return paths, "exhausted" if iterator.exhausted else "time_budget"
+    return paths, "max_paths"
+
+
+@dataclass
+class PathCursor:
+    """An in-progress path search that can be continued."""
+    cursor_id: str
+    model_id: str
+    source: Hashable
+    target: Hashable
+    path_type: str
+    max_length: Optional[int]
+    graph: nx.DiGraph
+    iterator: Any
+    graph_signature: int
+    returned: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+    def matches(self, model_id: str, source: Hashable, target: Hashable,
+                path_type: str, max_length: Optional[int]) -> bool:
+        return (self.model_id, self.source, self.target, self.path_type, self.max_length) == (
+            model_id, source, target, path_type, max_length
+        )
+
+    def is_stale(self, graph: nx.DiGraph) -> bool:
+        """True if the model's current graph differs from the searched one.
+
+        Args:
+            graph: The model's graph now. DEXPI graphs are rebuilt from the
+                model, so this may be a new object with the same structure;
+                SFILES graphs are the same object, mutated in place.
+        """
+        if graph_signature(graph) != self.graph_signature:
+            return True
+        return graph is not self.graph and graph_signature(self.graph) != self.graph_signature
+
+
+def graph_signature(graph: nx.DiGraph) -> int:
+    """Structural fingerprint of a graph: nodes and successors in adjacency order.
+
+    networkx keeps no mutation counter, and node/edge counts miss a removal
+    followed by an addition, so this hashes the adjacency itself. It is
+    O(V + E), small next to the path enumeration it guards.
+    """
+    return hash(tuple((node, tuple(neighbors)) for node, neighbors in graph.adjacency()))
+
+
+class PathCursorStore:
+    """Bounded LRU store of path cursors with idle expiry.
+
+    Thread-safe. Cursors are dropped when exhausted, when the store is full
+    (least recently used first) or after ttl_seconds without use.
+    """
+
+    def __init__(self, max_cursors: int = 64, ttl_seconds: float = 600.0):
+        self.max_cursors = max_cursors
+        self.ttl_seconds = ttl_seconds
+        self._cursors: "OrderedDict[str, PathCursor]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs: Any) -> PathCursor:
+        """Create and register a cursor (kwargs as for PathCursor, minus id)."""
+        cursor = PathCursor(
+            cursor_id=f"paths-{uuid.uuid4().hex[:12]}",
+            graph_signature=graph_signature(kwargs["graph"]),
+            **kwargs,
+        )
+        with self._lock:
+            self._expire()
+            self._cursors[cursor.cursor_id] = cursor
+            while len(self._cursors) > self.max_cursors:
+                self._cursors.popitem(last=False)
+        return cursor
+
+    def get(self, cursor_id: str) -> Optional[PathCursor]:
+        """Get a live cursor by id, refreshing its LRU position."""
+        with self._lock:
+            self._expire()
+            cursor = self._cursors.get(cursor_id)
+            if cursor is not None:
+                cursor.last_used = time.monotonic()
+                self._cursors.move_to_end(cursor_id)
+            return cursor
+
+    def discard(self, cursor_id: str) -> None:
+        with self._lock:
+            self._cursors.pop(cursor_id, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cursors)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        expired = [cid for cid, c in self._cursors.items()
+                   if now - c.last_used > self.ttl_seconds]
+        for cid in expired:
+            del self._cursors[cid]
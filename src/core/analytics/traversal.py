@@ -0,0 +1,148 @@
+"""
+Indexed graph traversal for connectivity queries.
+
+Provides:
+- TagIndex: tag/tagName -> node lookup that revalidates itself when the
+  underlying graph is mutated in place (SFILES flowsheets mutate their
+  graph without going through the model store).
+- traverse_connected: deque-based BFS that walks upstream and downstream in
+  one pass, with opt-in node payload projections and the attributes of the
+  edge through which each node was reached.
+"""
+
+from collections import deque
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+import networkx as nx
+
+# Node attributes that hold a component tag, in lookup priority order
+TAG_ATTRIBUTES = ("tag", "tagName")
+
+DIRECTIONS = ("upstream", "downstream")
+
+
+class TagIndex:
+    """Index of graph nodes by tag attribute.
+
+    Resolution matches the previous linear scan: an exact node id wins,
+    otherwise the first node (in graph order) whose ``tag`` or ``tagName``
+    equals the identifier. Hits are verified against the live node data and
+    misses trigger a rebuild, so in-place graph edits are never served stale.
+    """
+
+    def __init__(self, graph: nx.DiGraph):
+        self.graph = graph
+        self._index: Dict[Any, Hashable] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rebuild the index from the current graph."""
+        index: Dict[Any, Hashable] = {}
+        for node, data in self.graph.nodes(data=True):
+            for key in TAG_ATTRIBUTES:
+                value = data.get(key)
+                if value is not None and isinstance(value, Hashable):
+                    index.setdefault(value, node)
+        self._index = index
+
+    def _lookup(self, identifier: Any) -> Optional[Hashable]:
+        node = self._index.get(identifier)
+        if node is None or node not in self.graph:
+            return None
+        data = self.graph.nodes[node]
+        if any(data.get(key) == identifier for key in TAG_ATTRIBUTES):
+            return node
+        return None
+
+    def resolve(self, identifier: Any) -> Optional[Hashable]:
+        """Resolve a node id or tag to a node, or None if absent."""
+        if identifier in self.graph:
+            return identifier
+        node = self._lookup(identifier)
+        if node is None:
+            self.rebuild()
+            node = self._lookup(identifier)
+        return node
+
+
+def project_node_data(data: Dict[str, Any], fields: Optional[Sequence[str]]) -> Optional[Dict]:
+    """Project node attributes.
+
+    Args:
+        data: Node attribute dict
+        fields: Attribute names to include, ["*"] for all, None for none
+
+    Returns:
+        Projected copy, or None when no payload was requested
+    """
+    if fields is None:
+        return None
+    if "*" in fields:
+        return dict(data)
+    return {field: data[field] for field in fields if field in data}
+
+
+def _neighbors(graph: nx.DiGraph, node: Hashable, direction: str):
+    """Yield (neighbor, source, target, edge_attrs) for one direction."""
+    adjacency = graph.pred[node] if direction == "upstream" else graph.succ[node]
+    multigraph = graph.is_multigraph()
+    for neighbor, attrs in adjacency.items():
+        if multigraph:
+            # First parallel edge represents the connection
+            attrs = next(iter(attrs.values()), {})
+        if direction == "upstream":
+            yield neighbor, neighbor, node, attrs
+        else:
+            yield neighbor, node, neighbor, attrs
+
+
+def traverse_connected(graph: nx.DiGraph, start: Hashable, direction: str = "both",
+                       max_depth: int = 3, node_fields: Optional[Sequence[str]] = None,
+                       include_edges: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+    """Breadth-first search from start in one or both directions.
+
+    Both directions share a single deque, so each node is expanded once per
+    direction and appears at its minimum depth.
+
+    Args:
+        graph: Graph to traverse
+        start: Start node (must exist)
+        direction: "upstream", "downstream" or "both"
+        max_depth: Maximum hop count from start
+        node_fields: Node payload projection (see project_node_data)
+        include_edges: Include the attributes of the discovering edge
+
+    Returns:
+        {"upstream": [...], "downstream": [...]} with entries
+        {"node", "depth"[, "data"][, "edge"]} in BFS order
+
+    Raises:
+        ValueError: If direction is not one of the above
+    """
+    if direction != "both" and direction not in DIRECTIONS:
+        raise ValueError(f"Invalid direction {direction!r}; expected 'upstream', 'downstream' or 'both'")
+    directions = DIRECTIONS if direction == "both" else (direction,)
+    connected: Dict[str, List[Dict[str, Any]]] = {d: [] for d in DIRECTIONS}
+    visited = {d: {start} for d in directions}
+    queue = deque((start, 0, d) for d in directions)
+
+    while queue:
+        node, depth, current = queue.popleft()
+        if depth >= max_depth:
+            continue
+        seen = visited[current]
+        for neighbor, source, target, attrs in _neighbors(graph, node, current):
+            if neighbor in seen:
+                continue
+            seen.add(neighbor)
+
+            entry: Dict[str, Any] = {"node": neighbor, "depth": depth + 1}
+            data = project_node_data(graph.nodes[neighbor], node_fields)
+            if data is not None:
+                entry["data"] = data
+            if include_edges:
+                entry["edge"] = {"source": source, "target": target, "attributes": dict(attrs)}
+            connected[current].append(entry)
+            queue.append((neighbor, depth + 1, current))
+
+    return connected
@@ -0,0 +1,66 @@
+"""Per-class field plans for pyDEXPI models.
+
+pyDEXPI tags every field with an ``attribute_category`` (composition,
+reference or data) in its ``json_schema_extra``. Serializers and model
+walkers that read the tag field by field pay for it on every element;
+field_plan() reads it once per class.
+
+Usage:
+    from src.core.dexpi_fields import field_plan
+
+    for name in field_plan(type(element)).child_fields:
+        ...
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+from pydexpi.dexpi_classes.pydantic_classes import DexpiBaseModel
+
+ATTRIBUTE_CATEGORIES = ("composition", "reference", "data")
+
+
+class FieldPlan(NamedTuple):
+    """Field names of a pyDEXPI class grouped by attribute category."""
+
+    # True for DexpiBaseModel subclasses, which carry an "id" field
+    has_id: bool
+    composition: Tuple[str, ...]
+    reference: Tuple[str, ...]
+    data: Tuple[str, ...]
+    # Composition fields plus uncategorized ones (id, uri), in field order:
+    # what model_toolkit.get_all_instances_in_model descends into
+    child_fields: Tuple[str, ...]
+    # Data fields plus uncategorized ones, in field order
+    text_fields: Tuple[str, ...]
+
+    @property
+    def sections(self) -> Tuple[Tuple[str, ...], ...]:
+        """Field names per ATTRIBUTE_CATEGORIES entry."""
+        return self.composition, self.reference, self.data
+
+
+@lru_cache(maxsize=None)
+def field_plan(cls: type) -> FieldPlan:
+    """FieldPlan of a pyDEXPI class, computed once per class."""
+    sections = {category: [] for category in ATTRIBUTE_CATEGORIES}
+    child_fields = []
+    text_fields = []
+    for name, field in cls.model_fields.items():
+        category = (field.json_schema_extra or {}).get("attribute_category")
+        if category in sections:
+            sections[category].append(name)
+        if name.startswith('_'):
+            continue
+        if category in (None, "composition"):
+            child_fields.append(name)
+        if category in (None, "data"):
+            text_fields.append(name)
+    return FieldPlan(
+        has_id=issubclass(cls, DexpiBaseModel),
+        composition=tuple(sections["composition"]),
+        reference=tuple(sections["reference"]),
+        data=tuple(sections["data"]),
+        child_fields=tuple(child_fields),
+        text_fields=tuple(text_fields),
+    )
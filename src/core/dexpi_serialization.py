@@ -0,0 +1,338 @@
+"""Fast serialization of DEXPI models.
+
+pyDEXPI's ``JsonSerializer.model_to_dict`` scans every field's
+``json_schema_extra`` three times per element, and callers then run
+``json.dumps`` over the resulting dict. This module produces the same
+document with far less work:
+
+- model_to_dict(): same dict as ``JsonSerializer.model_to_dict``, using
+  the per-class field plan of dexpi_fields.field_plan()
+- iter_json() / dump(): iterative streaming writer that emits JSON text in
+  chunks without building the dict; output is identical to
+  ``json.dumps(model_to_dict(model), indent=..., ensure_ascii=False)``
+- dumps() / loads(): bytes in one of SERIALIZATION_FORMATS. "orjson" and
+  "msgpack" are optional (``pip install .[serialization]``); "msgpack" is a
+  compact binary encoding for in-memory snapshots. orjson cannot represent
+  NaN or Infinity (it writes null), so an "orjson" dump of a model holding
+  non-finite floats is written with json instead; loads() reads either.
+
+Decoding always goes through pyDEXPI's ``DictToDexpiDecoder``, so anything
+written here loads with ``JsonSerializer`` and vice versa (msgpack aside).
+"""
+
+import importlib.util
+import json
+import math
+from datetime import datetime
+from enum import Enum
+from json.encoder import encode_basestring
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from pydexpi.dexpi_classes.pydantic_classes import DexpiBaseModel, DexpiDataTypeBaseModel
+from pydexpi.loaders.json_serializer import DictToDexpiDecoder
+
+from .dexpi_fields import ATTRIBUTE_CATEGORIES, field_plan
+
+SERIALIZATION_FORMATS = ("json", "orjson", "msgpack")
+
+# Streaming writer buffers this many characters before yielding a chunk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def orjson_available() -> bool:
+    """Check if orjson is available."""
+    return importlib.util.find_spec("orjson") is not None
+
+
+def msgpack_available() -> bool:
+    """Check if msgpack is available."""
+    return importlib.util.find_spec("msgpack") is not None
+
+
+def fastest_format() -> str:
+    """Fastest installed format for bytes that only this process reads back."""
+    if msgpack_available():
+        return "msgpack"
+    if orjson_available():
+        return "orjson"
+    return "json"
+
+
+def model_to_dict(model: DexpiBaseModel) -> Dict[str, Any]:
+    """Convert a DEXPI model to the dict ``JsonSerializer.model_to_dict`` returns."""
+    return _element_to_dict(model)
+
+
+def _element_to_dict(element: Any) -> Dict[str, Any]:
+    plan = field_plan(type(element))
+    composition, reference, data = plan.sections
+    result = {"uri": element.uri}
+    if plan.has_id:
+        result["id"] = element.id
+    if composition:
+        values = {}
+        for name in composition:
+            value = getattr(element, name)
+            if value is None:
+                values[name] = None
+            elif isinstance(value, list):
+                values[name] = [_element_to_dict(item) for item in value]
+            else:
+                values[name] = _element_to_dict(value)
+        result["composition"] = values
+    if reference:
+        values = {}
+        for name in reference:
+            value = getattr(element, name)
+            if value is None:
+                values[name] = None
+            elif isinstance(value, list):
+                values[name] = [item.id for item in value]
+            else:
+                values[name] = value.id
+        result["reference"] = values
+    if data:
+        values = {}
+        for name in data:
+            value = getattr(element, name)
+            if isinstance(value, list):
+                values[name] = [_data_value(item) for item in value]
+            else:
+                values[name] = _data_value(value)
+        result["data"] = values
+    return result
+
+
+def _data_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, DexpiDataTypeBaseModel):
+        return _element_to_dict(value)
+    if isinstance(value, datetime):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Unsupported data type: {type(value)}")
+
+
+def iter_json(model: DexpiBaseModel, indent: Optional[int] = None) -> Iterator[str]:
+    """Stream a DEXPI model as JSON text chunks.
+
+    Walks the model with an explicit work stack instead of recursion, so
+    deep models do not hit the recursion limit and no intermediate dict is
+    built.
+
+    Args:
+        model: DEXPI model
+        indent: Indentation as in json.dumps (None = single line)
+
+    Yields:
+        JSON text chunks of roughly STREAM_CHUNK_SIZE characters
+    """
+    item_sep = "," if indent is not None else ", "
+    newline = (lambda depth: "\n" + " " * (indent * depth)) if indent is not None else (lambda depth: "")
+
+    buffer: List[str] = []
+    size = 0
+    # Work items: str to emit, or (value, depth, kind) to expand
+    stack: List[Any] = [(model, 0, "element")]
+    while stack:
+        item = stack.pop()
+        if item.__class__ is str:
+            buffer.append(item)
+            size += len(item)
+            if size >= STREAM_CHUNK_SIZE:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+            continue
+
+        value, depth, kind = item
+        if kind == "element":
+            stack.extend(reversed(_element_parts(value, depth, item_sep, newline)))
+        elif kind == "section":
+            element, names, section = value
+            if not names:
+                stack.append("{}")
+                continue
+            parts = ["{"]
+            for i, name in enumerate(names):
+                if i:
+                    parts.append(item_sep)
+                parts.append(f"{newline(depth + 1)}{encode_basestring(name)}: ")
+                parts.extend(_value_parts(getattr(element, name), depth + 1, section, item_sep, newline))
+            parts.append(newline(depth) + "}")
+            stack.extend(reversed(parts))
+    if buffer:
+        yield "".join(buffer)
+
+
+def _element_parts(element: Any, depth: int, item_sep: str, newline) -> List[Any]:
+    plan = field_plan(type(element))
+    inner = newline(depth + 1)
+    parts = ["{", f'{inner}"uri": {_scalar(element.uri)}']
+    if plan.has_id:
+        parts.append(f'{item_sep}{inner}"id": {_scalar(element.id)}')
+    for section, names in zip(ATTRIBUTE_CATEGORIES, plan.sections, strict=True):
+        if names:
+            parts.append(f'{item_sep}{inner}"{section}": ')
+            parts.append(((element, names, section), depth + 1, "section"))
+    parts.append(newline(depth) + "}")
+    return parts
+
+
+def _value_parts(value: Any, depth: int, section: str, item_sep: str, newline) -> List[Any]:
+    if value is None:
+        return ["null"]
+    if isinstance(value, list):
+        if not value:
+            return ["[]"]
+        parts = ["["]
+        for i, item in enumerate(value):
+            if i:
+                parts.append(item_sep)
+            parts.append(newline(depth + 1))
+            parts.extend(_single_value_parts(item, depth + 1, section))
+        parts.append(newline(depth) + "]")
+        return parts
+    return _single_value_parts(value, depth, section)
+
+
+def _single_value_parts(value: Any, depth: int, section: str) -> List[Any]:
+    if section == "reference":
+        return [_scalar(value.id)]
+    if section == "composition" or isinstance(value, DexpiDataTypeBaseModel):
+        return [(value, depth, "element")]
+    if isinstance(value, datetime):
+        return [_scalar(str(value))]
+    if value is None or isinstance(value, (str, int, float, Enum)):
+        return [_scalar(value)]
+    raise TypeError(f"Unsupported data type: {type(value)}")
+
+
+def _scalar(value: Any) -> str:
+    """Encode a scalar exactly like json.dumps(ensure_ascii=False)."""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "Infinity" if value > 0 else "-Infinity"
+        return float.__repr__(value)
+    if isinstance(value, Enum):
+        return _scalar(value.value)
+    raise TypeError(f"Unsupported data type: {type(value)}")
+
+
+def dump(model: DexpiBaseModel, fp: TextIO, indent: Optional[int] = None) -> None:
+    """Stream a DEXPI model as JSON into a text file object."""
+    for chunk in iter_json(model, indent=indent):
+        fp.write(chunk)
+
+
+def to_json(model: DexpiBaseModel, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """DEXPI model as a JSON string (same text as JsonSerializer.save with indent=4)."""
+    return json.dumps(model_to_dict(model), indent=indent, ensure_ascii=False, sort_keys=sort_keys)
+
+
+def dumps(model: DexpiBaseModel, format: str = "json") -> bytes:
+    """Serialize a DEXPI model to compact bytes.
+
+    Args:
+        model: DEXPI model
+        format: One of SERIALIZATION_FORMATS
+
+    Returns:
+        Encoded model
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If the format's package is not installed
+    """
+    _check_format(format)
+    data = model_to_dict(model)
+    if format == "orjson" and not _has_non_finite(data):
+        import orjson
+        return orjson.dumps(data)
+    if format == "msgpack":
+        import msgpack
+        return msgpack.packb(data, use_bin_type=True)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes, format: str = "json") -> DexpiBaseModel:
+    """Deserialize bytes written by dumps() (or any JSON model file).
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If the format's package is not installed
+    """
+    _check_format(format)
+    if format == "msgpack":
+        import msgpack
+        model_dict = msgpack.unpackb(data, raw=False)
+    else:
+        model_dict = _loads_json(data)
+    return DictToDexpiDecoder().dict_to_dexpi_element(model_dict)
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON with orjson when installed, else (or on NaN/Infinity) json."""
+    if orjson_available():
+        import orjson
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals from the json writers; genuine syntax
+            # errors are raised again by json.loads below
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Whether a model_to_dict() result holds a NaN or infinite float."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+
+def _check_format(format: str) -> None:
+    if format not in SERIALIZATION_FORMATS:
+        raise ValueError(
+            f"Unknown serialization format: {format}. Valid formats: {list(SERIALIZATION_FORMATS)}"
+        )
+    if format == "orjson" and not orjson_available():
+        raise ImportError("The orjson format requires orjson. Install with: pip install .[serialization]")
+    if format == "msgpack" and not msgpack_available():
+        raise ImportError("The msgpack format requires msgpack. Install with: pip install .[serialization]")
+
+
+__all__ = [
+    "SERIALIZATION_FORMATS",
+    "dump",
+    "dumps",
+    "fastest_format",
+    "iter_json",
+    "loads",
+    "model_to_dict",
+    "msgpack_available",
+    "orjson_available",
+    "to_json",
+]
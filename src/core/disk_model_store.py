@@ -0,0 +1,361 @@
+"""
+Disk-backed ModelStore with a bounded in-memory working set.
+
+DiskModelStore keeps every model as a pickled blob in a SQLite database
+together with its ModelMetadata, and holds at most ``max_resident`` models
+in memory. Storing a model only makes it resident: it is pickled when it
+leaves the working set (the least recently used model is written back and
+evicted when the set is full), on flush() and on close(). An evicted model
+is read back on next access.
+Snapshots are stored in the database as well, so they do not count
+against the working set.
+
+It is a drop-in replacement for InMemoryModelStore (same CRUD, lifecycle
+hook, snapshot, LazyModel and dict-like behaviour): the server picks the
+backend through create_model_store() and the MODEL_STORE_* environment
+variables.
+
+Pickle (protocol 5) is the codec: it round-trips pyDEXPI models and SFILES
+flowsheets alike and decodes DEXPI models an order of magnitude faster
+than the JSON decoder. Unpickling runs code named by the blob, so the
+database is a trust boundary: it must be private to the server that writes
+it. Never open one from an untrusted source or point MODEL_STORE_PATH at a
+directory other users can write to; a tampered file executes code when a
+model is loaded.
+
+Note: references returned by get() stay valid while the model is
+resident. Code that mutates a model in place after it was evicted changes
+a detached copy, so mutate through edit() or update().
+
+Usage:
+    from src.core.disk_model_store import DiskModelStore
+    from src.core.model_store import ModelType
+
+    store = DiskModelStore(ModelType.DEXPI, path="/var/lib/engineering/dexpi.sqlite",
+                           max_resident=16)
+    store.create("model-123", model)
+    store.flush()   # write resident models and metadata
+    store.close()
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import tempfile
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TypeVar
+
+from .model_store import InMemoryModelStore, LazyModel, ModelMetadata, ModelType, Snapshot
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_MAX_RESIDENT = 32
+
+_PICKLE_PROTOCOL = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    model_id TEXT PRIMARY KEY,
+    model_type TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    data BLOB NOT NULL,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    model_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    label TEXT,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_model ON snapshots (model_id, seq);
+"""
+
+
+def _encode(model: Any) -> bytes:
+    return pickle.dumps(model, protocol=_PICKLE_PROTOCOL)
+
+
+class _DiskModels(MutableMapping):
+    """Model mapping over the models table with an LRU set of resident models.
+
+    LazyModel placeholders are kept in memory until the store resolves them.
+    Callers hold the store lock.
+    """
+
+    def __init__(self, store: "DiskModelStore", max_resident: int):
+        self._store = store
+        self._max_resident = max_resident
+        # model_id -> sha256 of the stored blob (None: not written yet), in creation order
+        self._index: Dict[str, Optional[str]] = {}
+        self._resident: "OrderedDict[str, Any]" = OrderedDict()
+        self._placeholders: Dict[str, LazyModel] = {}
+        self.loads = 0
+        self.evictions = 0
+
+    def load_index(self) -> None:
+        for model_id, sha in self._store._conn.execute("SELECT model_id, sha256 FROM models ORDER BY rowid"):
+            self._index[model_id] = sha
+
+    def __getitem__(self, model_id: str) -> Any:
+        if model_id in self._placeholders:
+            return self._placeholders[model_id]
+        if model_id in self._resident:
+            self._resident.move_to_end(model_id)
+            return self._resident[model_id]
+        if model_id not in self._index:
+            raise KeyError(model_id)
+        (data,) = self._store._conn.execute(
+            "SELECT data FROM models WHERE model_id = ?", (model_id,)
+        ).fetchone()
+        model = pickle.loads(data)
+        self.loads += 1
+        self._make_resident(model_id, model)
+        return model
+
+    def __setitem__(self, model_id: str, model: Any) -> None:
+        if isinstance(model, LazyModel):
+            self._resident.pop(model_id, None)
+            self._placeholders[model_id] = model
+            self._index.setdefault(model_id, None)
+            return
+        self._placeholders.pop(model_id, None)
+        # Written back on eviction, flush() or close(): tools store a model
+        # again after every in-place edit, so pickling here would re-encode
+        # it on each change
+        self._index.setdefault(model_id, None)
+        self._make_resident(model_id, model)
+
+    def __delitem__(self, model_id: str) -> None:
+        if model_id not in self._index:
+            raise KeyError(model_id)
+        del self._index[model_id]
+        self._resident.pop(model_id, None)
+        self._placeholders.pop(model_id, None)
+        with self._store._conn:
+            self._store._conn.execute("DELETE FROM models WHERE model_id = ?", (model_id,))
+
+    def __contains__(self, model_id: object) -> bool:
+        return model_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def is_resident(self, model_id: str) -> bool:
+        if model_id in self._placeholders:
+            return self._placeholders[model_id].loaded
+        return model_id in self._resident
+
+    def resident_ids(self) -> List[str]:
+        return list(self._resident)
+
+    def placeholder_ids(self) -> List[str]:
+        return list(self._placeholders)
+
+    def write_back(self) -> None:
+        """Write resident models that changed since they were last stored."""
+        for model_id, model in self._resident.items():
+            self._write(model_id, model)
+
+    def _make_resident(self, model_id: str, model: Any) -> None:
+        self._resident[model_id] = model
+        self._resident.move_to_end(model_id)
+        while len(self._resident) > self._max_resident:
+            cold_id, cold_model = self._resident.popitem(last=False)
+            # Models are mutated in place, so write back before dropping
+            self._write(cold_id, cold_model)
+            self.evictions += 1
+            logger.debug(f"Evicted {self._store.model_type.value} model: {cold_id}")
+
+    def _write(self, model_id: str, model: Any) -> None:
+        data = _encode(model)
+        sha = hashlib.sha256(data).hexdigest()
+        if self._index.get(model_id) == sha:
+            return
+        metadata = self._store._metadata.get(model_id)
+        with self._store._conn:
+            self._store._conn.execute(
+                "INSERT INTO models (model_id, model_type, sha256, data, metadata) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (model_id) DO UPDATE SET "
+                "sha256 = excluded.sha256, data = excluded.data, metadata = excluded.metadata",
+                (model_id, self._store.model_type.value, sha, data,
+                 json.dumps(metadata.to_dict()) if metadata else None),
+            )
+        self._index[model_id] = sha
+
+
+class _SnapshotLog:
+    """Append-only view of one model's snapshots in the snapshots table."""
+
+    def __init__(self, conn: sqlite3.Connection, model_id: str):
+        self._conn = conn
+        self._model_id = model_id
+
+    def append(self, snapshot: Snapshot) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO snapshots (model_id, timestamp, label, data) VALUES (?, ?, ?, ?)",
+                (self._model_id, snapshot.timestamp.isoformat(), snapshot.label, _encode(snapshot.state)),
+            )
+
+    def __iter__(self) -> Iterator[Snapshot]:
+        rows = self._conn.execute(
+            "SELECT timestamp, label, data FROM snapshots WHERE model_id = ? ORDER BY seq",
+            (self._model_id,),
+        ).fetchall()
+        for timestamp, label, data in rows:
+            yield Snapshot(
+                model_id=self._model_id,
+                timestamp=datetime.fromisoformat(timestamp),
+                state=pickle.loads(data),
+                label=label,
+            )
+
+
+class _DiskSnapshots:
+    """Snapshot lists per model, stored in the snapshots table."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __getitem__(self, model_id: str) -> _SnapshotLog:
+        return _SnapshotLog(self._conn, model_id)
+
+    def __setitem__(self, model_id: str, snapshots: List[Snapshot]) -> None:
+        self.pop(model_id)
+        log = self[model_id]
+        for snapshot in snapshots:
+            log.append(snapshot)
+
+    def get(self, model_id: str, default: Any = None) -> _SnapshotLog:
+        return self[model_id]
+
+    def pop(self, model_id: str, default: Any = None) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM snapshots WHERE model_id = ?", (model_id,))
+        return default
+
+
+class DiskModelStore(InMemoryModelStore[T]):
+    """SQLite-backed ModelStore keeping a bounded LRU working set in memory.
+
+    Example:
+        store = DiskModelStore(ModelType.SFILES, max_resident=8)
+        store["flowsheet-1"] = flowsheet
+        len(store.resident_ids())  # at most 8
+    """
+
+    def __init__(
+        self,
+        model_type: ModelType,
+        path: Optional[str] = None,
+        max_resident: int = DEFAULT_MAX_RESIDENT
+    ):
+        """Open (or create) the store database.
+
+        Args:
+            model_type: Type of models this store holds (DEXPI or SFILES)
+            path: SQLite database file. Models and metadata in an existing
+                file are available again. Without a path, a temporary
+                database is used and removed on close().
+            max_resident: Maximum number of models kept in memory
+
+        Raises:
+            ValueError: If max_resident is < 1
+        """
+        if max_resident < 1:
+            raise ValueError(f"max_resident must be >= 1, got {max_resident}")
+        super().__init__(model_type)
+
+        self._tempdir = None
+        if path is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix=f"{model_type.value}-store-")
+            path = str(Path(self._tempdir.name) / "models.sqlite")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._models = _DiskModels(self, max_resident)
+        self._snapshots = _DiskSnapshots(self._conn)
+        self._models.load_index()
+        for model_id, metadata in self._conn.execute("SELECT model_id, metadata FROM models"):
+            if metadata:
+                self._metadata[model_id] = ModelMetadata.from_dict(json.loads(metadata))
+            else:
+                now = datetime.now()
+                self._metadata[model_id] = ModelMetadata(model_id, model_type, now, now)
+
+        self._closed = False
+        atexit.register(self.close)
+        logger.debug(f"Opened {model_type.value} disk store at {self.path} ({len(self._models)} models)")
+
+    def is_loaded(self, model_id: str) -> bool:
+        """Check whether a model is in memory (resident and not a pending LazyModel).
+
+        Raises:
+            KeyError: If model_id doesn't exist
+        """
+        with self._lock:
+            if model_id not in self._models:
+                raise KeyError(f"Model {model_id} not found")
+            return self._models.is_resident(model_id)
+
+    def resident_ids(self) -> List[str]:
+        """IDs of the models currently in memory, least recently used first."""
+        with self._lock:
+            return self._models.resident_ids()
+
+    def stats(self) -> Dict[str, Any]:
+        """Working set statistics."""
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "models": len(self._models),
+                "resident": len(self._models.resident_ids()),
+                "max_resident": self._models._max_resident,
+                "loads": self._models.loads,
+                "evictions": self._models.evictions,
+            }
+
+    def flush(self) -> None:
+        """Write resident models and all metadata to the database."""
+        with self._lock:
+            self._models.write_back()
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE models SET metadata = ? WHERE model_id = ?",
+                    [(json.dumps(metadata.to_dict()), model_id) for model_id, metadata in self._metadata.items()],
+                )
+
+    def close(self) -> None:
+        """Flush and close the database (a temporary database is deleted)."""
+        with self._lock:
+            if self._closed:
+                return
+            self.flush()
+            self._conn.close()
+            self._closed = True
+            if self._tempdir is not None:
+                self._tempdir.cleanup()
+        atexit.unregister(self.close)
+
+    def _lazy_ids(self) -> List[str]:
+        return self._models.placeholder_ids()
+
+
+__all__ = ["DEFAULT_MAX_RESIDENT", "DiskModelStore"]
@@ -0,0 +1,210 @@
+"""Binary layout sidecar: packed coordinate arrays, memory-mapped on load.
+
+Large layouts are slow to open from ``{model}.layout.json``: the JSON is
+parsed in full and then rebuilt entry by entry into pydantic models. The
+sidecar ``{model}.layout.bin`` stores the same content as a
+``ColumnarLayout``:
+
+    magic        8 bytes   b"PIDLAYB\\x00"
+    version      uint32    FORMAT_VERSION (little-endian)
+    header_len   uint32    length of the JSON header
+    header       JSON      layout header, id/string columns, sparse entries,
+                           array manifest {name: [dtype, shape, offset]} and
+                           the size/mtime of the JSON file it was written with
+    arrays       raw       little-endian, each aligned to ARRAY_ALIGNMENT
+
+Arrays are read with ``np.frombuffer`` over a read-only ``mmap``, so pages
+are only loaded when a column is touched. That laziness is kept only by
+``LayoutStore.read_columnar``; ``LayoutStore.load_from_file`` builds the
+full LayoutMetadata from the columns right away. The JSON file stays the source of
+truth: a sidecar whose recorded source stat no longer matches the JSON file
+(edited by hand, checked out from git) is stale and ignored.
+
+Requires NumPy (``pip install .[analytics]``).
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.models.layout_columns import ColumnarLayout
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PIDLAYB\x00"
+FORMAT_VERSION = 1
+ARRAY_ALIGNMENT = 64
+SIDECAR_SUFFIX = ".bin"
+
+_PREAMBLE = struct.Struct("<8sII")
+
+_ARRAY_FIELDS = (
+    "node_xy",
+    "port_xy",
+    "port_size",
+    "port_index",
+    "label_box",
+    "label_rotation",
+    "edge_section_ptr",
+    "edge_endpoints",
+    "section_points",
+    "bend_ptr",
+    "bend_points",
+)
+
+_STRING_FIELDS = (
+    "node_ids",
+    "port_ids",
+    "port_side",
+    "label_ids",
+    "label_text",
+    "label_origin",
+    "label_kind",
+    "edge_ids",
+    "edge_source_port",
+    "edge_target_port",
+    "section_ids",
+)
+
+
+class SidecarFormatError(ValueError):
+    """Raised when a sidecar file is not a readable layout sidecar."""
+
+
+def sidecar_path(json_path: Path) -> Path:
+    """Sidecar path for a ``*.layout.json`` file."""
+    return json_path.with_suffix(SIDECAR_SUFFIX)
+
+
+def source_stat(json_path: Path) -> Dict[str, int]:
+    """Size and mtime of the JSON file a sidecar was written with."""
+    stat = json_path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def write_sidecar(columns: ColumnarLayout, path: Path, source: Dict[str, int]) -> Path:
+    """Write a sidecar atomically (temp file + rename).
+
+    Args:
+        columns: Layout content
+        path: Sidecar path
+        source: source_stat() of the JSON file written alongside
+
+    Returns:
+        Path to the sidecar
+    """
+    arrays = {}
+    manifest = {}
+    offset = 0
+    for name in _ARRAY_FIELDS:
+        array = np.ascontiguousarray(getattr(columns, name))
+        array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        offset = _align(offset)
+        manifest[name] = [array.dtype.str, list(array.shape), offset]
+        arrays[name] = array
+        offset += array.nbytes
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "source": source,
+        "header": columns.header,
+        "strings": {name: getattr(columns, name) for name in _STRING_FIELDS},
+        "port_anchor": {str(i): list(anchor) for i, anchor in columns.port_anchor.items()},
+        "edge_labels": {str(i): labels for i, labels in columns.edge_labels.items()},
+        "arrays": manifest,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name in _ARRAY_FIELDS:
+            f.seek(data_start + manifest[name][2])
+            f.write(arrays[name].tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_sidecar(path: Path) -> Optional[Tuple[ColumnarLayout, Dict[str, int]]]:
+    """Memory-map a sidecar as a ColumnarLayout.
+
+    Returns:
+        (columns, source_stat) or None for another format version
+
+    Raises:
+        SidecarFormatError: If the file is not a layout sidecar or is corrupt
+    """
+    with open(path, "rb") as f:
+        header, data_start = _read_header(f, path)
+        if header is None:
+            return None
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        arrays = {}
+        for name in _ARRAY_FIELDS:
+            dtype, shape, offset = header["arrays"][name]
+            dtype = np.dtype(dtype)
+            count = int(np.prod(shape))
+            start = data_start + offset
+            if start + count * dtype.itemsize > len(buffer):
+                raise SidecarFormatError(f"Truncated layout sidecar: {path} ({name})")
+            arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=start).reshape(shape)
+
+        layout_header = header["header"]
+        if layout_header.get("page_size") is not None:
+            layout_header["page_size"] = tuple(layout_header["page_size"])
+
+        columns = ColumnarLayout(
+            header=layout_header,
+            port_anchor={int(i): tuple(anchor) for i, anchor in header["port_anchor"].items()},
+            edge_labels={int(i): labels for i, labels in header["edge_labels"].items()},
+            **header["strings"],
+            **arrays,
+        )
+        return columns, header["source"]
+    except SidecarFormatError:
+        raise
+    except (KeyError, TypeError, ValueError) as e:
+        raise SidecarFormatError(f"Malformed layout sidecar header: {path} ({e!r})") from e
+
+
+def _read_header(f, path: Path) -> Tuple[Optional[Dict[str, Any]], int]:
+    preamble = f.read(_PREAMBLE.size)
+    if len(preamble) < _PREAMBLE.size:
+        raise SidecarFormatError(f"Truncated layout sidecar: {path}")
+    magic, version, header_len = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise SidecarFormatError(f"Not a layout sidecar (bad magic): {path}")
+    if version != FORMAT_VERSION:
+        logger.info(f"Ignoring layout sidecar {path}: format version {version}")
+        return None, 0
+    try:
+        header = json.loads(f.read(header_len).decode("utf-8"))
+    except ValueError as e:
+        raise SidecarFormatError(f"Malformed layout sidecar header: {path} ({e})") from e
+    return header, _align(_PREAMBLE.size + header_len)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "SIDECAR_SUFFIX",
+    "SidecarFormatError",
+    "read_sidecar",
+    "sidecar_path",
+    "source_stat",
+    "write_sidecar",
+]
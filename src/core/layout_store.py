@@ -35,12 +35,16 @@ import json
 import logging
 import threading
 import uuid
+from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
+from src.core.optional_deps import numpy_available
 from src.models.layout_metadata import (
+    BoundingBox,
     LayoutMetadata,
     ModelReference,
     NodePosition,
@@ -50,8 +54,18 @@ from src.models.layout_metadata import (
     LabelPosition,
 )
 
+if TYPE_CHECKING:
+    from src.models.layout_columns import ColumnarLayout
+
 logger = logging.getLogger(__name__)
 
+# Layouts kept per (model_type, model_id); every layout_compute call adds one
+DEFAULT_MAX_LAYOUTS_PER_MODEL = 10
+
+# Layouts with at least this many entries (positions + ports + edges + labels)
+# get a binary sidecar next to the JSON file by default
+BINARY_SIDECAR_MIN_ELEMENTS = 5000
+
 
 class OptimisticLockError(Exception):
     """Raised when etag mismatch indicates concurrent modification."""
@@ -74,12 +88,74 @@ class LayoutNotFoundError(Exception):
         super().__init__(f"Layout {layout_id} not found")
 
 
+# LayoutMetadata fields holding arbitrary nested JSON-like values
+_FREE_FORM_FIELDS = frozenset({"layout_options", "parameters"})
+
+
+def _read_only(value: Any) -> Any:
+    """Read-only copy of a nested JSON-like value (dicts, lists, sets)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_read_only(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+class LayoutSnapshot:
+    """Read-only view of a stored layout revision.
+
+    The store never mutates a layout once it is stored: update() replaces it
+    and patch() publishes a new revision that shares unchanged entries. Entry
+    models, ModelReference and BoundingBox are frozen and hold tuples, so a
+    snapshot can be shared without copying and keeps showing the revision it
+    was taken from. Attribute reads are delegated to the layout: entry dicts
+    are wrapped in read-only mappings and the free-form layout_options and
+    parameters dicts are returned as read-only copies.
+    """
+
+    __slots__ = ("_layout",)
+
+    def __init__(self, layout: LayoutMetadata):
+        object.__setattr__(self, "_layout", layout)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "touch":
+            raise AttributeError("Layout snapshots are read-only; use LayoutStore.patch()")
+        value = getattr(self._layout, name)
+        if name in _FREE_FORM_FIELDS:
+            return _read_only(value)
+        if isinstance(value, dict):
+            return MappingProxyType(value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "Layout snapshots are read-only; use LayoutStore.patch() or update()"
+        )
+
+    def thaw(self) -> LayoutMetadata:
+        """Return an editable deep copy of the snapshot."""
+        return deepcopy(self._layout)
+
+    def __repr__(self) -> str:
+        return (
+            f"LayoutSnapshot(layout_id={self._layout.layout_id!r}, "
+            f"version={self._layout.version})"
+        )
+
+
 class LayoutStore:
     """Thread-safe storage for layout metadata with file persistence.
 
     Provides in-memory caching with optional file-based persistence.
     Supports etag-based optimistic concurrency for safe updates.
 
+    Stored layouts are treated as immutable revisions: get_snapshot() shares
+    them without copying and patch() applies deltas copy-on-write, replacing
+    only the changed dict entries.
+
     Example:
         store = LayoutStore()
 
@@ -96,11 +172,58 @@ class LayoutStore:
         store.save_to_file(layout_id, "/projects/plant", "reactor_pid")
     """
 
-    def __init__(self):
-        """Initialize the layout store."""
+    def __init__(
+        self,
+        max_layouts_per_model: Optional[int] = DEFAULT_MAX_LAYOUTS_PER_MODEL,
+    ):
+        """Initialize the layout store.
+
+        Args:
+            max_layouts_per_model: Retention limit per model reference. When a
+                model has more layouts, the least recently saved/updated ones
+                are evicted. None keeps every layout.
+        """
+        if max_layouts_per_model is not None and max_layouts_per_model < 1:
+            raise ValueError("max_layouts_per_model must be at least 1 or None")
+        self.max_layouts_per_model = max_layouts_per_model
         self._layouts: Dict[str, LayoutMetadata] = {}
+        # (model_type, model_id) -> layout IDs, least to most recently written
+        self._model_index: Dict[Tuple[str, str], "OrderedDict[str, None]"] = {}
+        self._model_keys: Dict[str, Tuple[str, str]] = {}
         self._lock = threading.RLock()
 
+    def _publish(self, layout_id: str, layout: LayoutMetadata) -> None:
+        """Store a layout revision and refresh the model index (lock held)."""
+        self._layouts[layout_id] = layout
+        self._unindex(layout_id)
+        if layout.model_ref is None:
+            return
+
+        key = (layout.model_ref.type, layout.model_ref.model_id)
+        ids = self._model_index.setdefault(key, OrderedDict())
+        ids[layout_id] = None
+        self._model_keys[layout_id] = key
+
+        if self.max_layouts_per_model is not None:
+            while len(ids) > self.max_layouts_per_model:
+                evicted, _ = ids.popitem(last=False)
+                del self._layouts[evicted]
+                del self._model_keys[evicted]
+                logger.debug(
+                    f"Evicted layout {evicted} (retention {self.max_layouts_per_model} "
+                    f"per model {key[0]}:{key[1]})"
+                )
+
+    def _unindex(self, layout_id: str) -> None:
+        """Remove a layout from the model index (lock held)."""
+        key = self._model_keys.pop(layout_id, None)
+        if key is None:
+            return
+        ids = self._model_index[key]
+        ids.pop(layout_id, None)
+        if not ids:
+            del self._model_index[key]
+
     def save(
         self,
         layout: LayoutMetadata,
@@ -141,7 +264,7 @@ class LayoutStore:
             object.__setattr__(stored, "updated_at", now)
             object.__setattr__(stored, "etag", stored.compute_etag())
 
-            self._layouts[layout_id] = stored
+            self._publish(layout_id, stored)
             logger.debug(f"Saved layout {layout_id} (etag: {stored.etag[:8]}...)")
 
             return layout_id
@@ -166,6 +289,23 @@ class LayoutStore:
             layout = self._layouts[layout_id]
             return deepcopy(layout) if copy else layout
 
+    def get_snapshot(self, layout_id: str) -> LayoutSnapshot:
+        """Retrieve a read-only snapshot of a layout without copying.
+
+        Args:
+            layout_id: Layout identifier
+
+        Returns:
+            LayoutSnapshot of the current revision
+
+        Raises:
+            LayoutNotFoundError: If layout not found
+        """
+        with self._lock:
+            if layout_id not in self._layouts:
+                raise LayoutNotFoundError(layout_id)
+            return LayoutSnapshot(self._layouts[layout_id])
+
     def update(
         self,
         layout_id: str,
@@ -208,13 +348,88 @@ class LayoutStore:
             if stored.model_ref is None and current.model_ref is not None:
                 object.__setattr__(stored, "model_ref", current.model_ref)
 
-            self._layouts[layout_id] = stored
+            self._publish(layout_id, stored)
             logger.debug(
                 f"Updated layout {layout_id} v{stored.version} (etag: {stored.etag[:8]}...)"
             )
 
             return stored.etag
 
+    def patch(
+        self,
+        layout_id: str,
+        changes: Mapping[str, Mapping[str, Any]],
+        expected_etag: Optional[str] = None,
+    ) -> str:
+        """Apply position/edge/port/rotation deltas to a layout.
+
+        Only the changed entries are rebuilt: the new revision shares every
+        other entry with the previous one, so no deep copy is made and the
+        etag is recomputed from the changed entry digests only. Snapshots
+        taken before the patch keep showing the previous revision.
+
+        Args:
+            layout_id: Layout identifier
+            changes: Mapping of section -> {key: value}. Sections are
+                "positions" ({"x", "y"}, [x, y] or NodePosition), "edges"
+                (EdgeRoute or its dict form), "port_layouts" (PortLayout or
+                its dict form) and "rotation" (degrees). A value of None
+                removes the entry.
+            expected_etag: If provided, patch fails if current etag doesn't match
+
+        Returns:
+            New etag after the patch
+
+        Raises:
+            LayoutNotFoundError: If layout not found
+            OptimisticLockError: If expected_etag doesn't match current etag
+            ValueError: If a section is unknown, a value is invalid, or the
+                patch would remove every position
+        """
+        unknown = set(changes) - set(_PATCH_BUILDERS)
+        if unknown:
+            raise ValueError(
+                f"Unknown layout sections {sorted(unknown)}. "
+                f"Patchable sections: {sorted(_PATCH_BUILDERS)}"
+            )
+
+        with self._lock:
+            if layout_id not in self._layouts:
+                raise LayoutNotFoundError(layout_id)
+
+            current = self._layouts[layout_id]
+            if expected_etag is not None and current.etag != expected_etag:
+                raise OptimisticLockError(layout_id, expected_etag, current.etag)
+
+            update: Dict[str, Any] = {}
+            for section, entries in changes.items():
+                build = _PATCH_BUILDERS[section]
+                merged = dict(getattr(current, section))
+                for key, value in entries.items():
+                    if value is None:
+                        merged.pop(key, None)
+                    else:
+                        merged[key] = build(key, value)
+                update[section] = merged
+
+            if "positions" in update:
+                if not update["positions"]:
+                    raise ValueError("Layout must have at least one positioned node")
+                update["bounding_box"] = BoundingBox.from_positions(update["positions"])
+
+            # Shallow copy shares unchanged entries and the etag digest cache
+            stored = current.model_copy(update=update)
+            object.__setattr__(stored, "version", current.version + 1)
+            object.__setattr__(stored, "updated_at", datetime.now(timezone.utc).isoformat())
+            object.__setattr__(stored, "etag", stored.compute_etag())
+
+            self._publish(layout_id, stored)
+            logger.debug(
+                f"Patched layout {layout_id} v{stored.version} (etag: {stored.etag[:8]}...)"
+            )
+
+            return stored.etag
+
     def delete(self, layout_id: str) -> bool:
         """Delete a layout from the store.
 
@@ -229,6 +444,7 @@ class LayoutStore:
                 return False
 
             del self._layouts[layout_id]
+            self._unindex(layout_id)
             logger.debug(f"Deleted layout {layout_id}")
             return True
 
@@ -261,15 +477,29 @@ class LayoutStore:
             model_id: Model identifier
 
         Returns:
-            List of layout IDs for the model
+            List of layout IDs for the model, most recently written first
         """
         with self._lock:
-            result = []
-            for layout_id, layout in self._layouts.items():
-                if layout.model_ref is not None:
-                    if layout.model_ref.type == model_type and layout.model_ref.model_id == model_id:
-                        result.append(layout_id)
-            return result
+            ids = self._model_index.get((model_type, model_id))
+            return list(reversed(ids)) if ids else []
+
+    def get_latest_for_model(
+        self, model_type: str, model_id: str
+    ) -> Optional[LayoutSnapshot]:
+        """Get the most recently saved/updated layout for a model.
+
+        Args:
+            model_type: Model type ("dexpi" or "sfiles")
+            model_id: Model identifier
+
+        Returns:
+            LayoutSnapshot of the latest layout, or None if the model has none
+        """
+        with self._lock:
+            ids = self._model_index.get((model_type, model_id))
+            if not ids:
+                return None
+            return LayoutSnapshot(self._layouts[next(reversed(ids))])
 
     def clear(self) -> int:
         """Remove all layouts from the store.
@@ -280,6 +510,8 @@ class LayoutStore:
         with self._lock:
             count = len(self._layouts)
             self._layouts.clear()
+            self._model_index.clear()
+            self._model_keys.clear()
             logger.debug(f"Cleared {count} layouts from store")
             return count
 
@@ -293,6 +525,7 @@ class LayoutStore:
         project_path: str,
         model_name: str,
         model_type: str = "pid",
+        binary: Optional[bool] = None,
     ) -> Path:
         """Save layout to project file.
 
@@ -301,35 +534,45 @@ class LayoutStore:
         - SFILES PFD: {project_path}/pfd/{model_name}.layout.json
         - SFILES BFD: {project_path}/bfd/{model_name}.layout.json
 
+        Large layouts also get a binary sidecar ({model_name}.layout.bin, see
+        src/core/layout_sidecar.py) that load_from_file and read_columnar
+        read instead of parsing the JSON. The JSON file is always written.
+
         Args:
             layout_id: Layout ID in store
             project_path: Path to project root
             model_name: Model name (without extension)
             model_type: Directory type ("pid", "pfd", or "bfd")
+            binary: Write the binary sidecar. None (default) selects it when
+                the layout has at least BINARY_SIDECAR_MIN_ELEMENTS entries
+                and NumPy is installed.
 
         Returns:
-            Path to saved file
+            Path to saved JSON file
 
         Raises:
             LayoutNotFoundError: If layout not found
+            ImportError: If binary=True and NumPy is not installed
         """
-        layout = self.get(layout_id, copy=True)
-        return self._write_layout_file(layout, project_path, model_name, model_type)
+        layout = self.get_snapshot(layout_id)
+        return self._write_layout_file(layout, project_path, model_name, model_type, binary)
 
     def _write_layout_file(
         self,
-        layout: LayoutMetadata,
+        layout: LayoutSnapshot,
         project_path: str,
         model_name: str,
         model_type: str,
+        binary: Optional[bool] = None,
     ) -> Path:
         """Write layout to file.
 
         Args:
-            layout: LayoutMetadata to save
+            layout: Layout snapshot to save
             project_path: Project root path
             model_name: Model name
             model_type: Directory type
+            binary: Write the binary sidecar (None = select by size)
 
         Returns:
             Path to saved file
@@ -348,8 +591,31 @@ class LayoutStore:
             json.dump(data, f, indent=2, sort_keys=True)
 
         logger.info(f"Saved layout to {file_path}")
+
+        if binary is None:
+            binary = _layout_size(layout) >= BINARY_SIDECAR_MIN_ELEMENTS and numpy_available()
+        self._write_sidecar(file_path, data, binary)
         return file_path
 
+    def _write_sidecar(self, file_path: Path, data: Dict[str, Any], binary: bool) -> None:
+        """Write or remove the binary sidecar next to a layout JSON file."""
+        bin_path = file_path.with_suffix(".bin")
+        if not binary:
+            # A sidecar left from an earlier save would be stale
+            if bin_path.exists():
+                bin_path.unlink()
+            return
+
+        if not numpy_available():
+            raise ImportError(
+                "Binary layout sidecars require NumPy. Install with: pip install .[analytics]"
+            )
+        from src.core.layout_sidecar import source_stat, write_sidecar
+        from src.models.layout_columns import ColumnarLayout
+
+        write_sidecar(ColumnarLayout.from_dict(data), bin_path, source_stat(file_path))
+        logger.info(f"Saved binary layout sidecar to {bin_path}")
+
     def load_from_file(
         self,
         project_path: str,
@@ -359,6 +625,12 @@ class LayoutStore:
     ) -> str:
         """Load layout from project file into store.
 
+        A fresh binary sidecar is used when present; otherwise the JSON file
+        is parsed. Either way the store holds a fully built LayoutMetadata,
+        so the sidecar only saves the JSON parse here: the mapped columns
+        are materialized immediately. Use read_columnar() to keep them
+        memory-mapped and paged in on first access.
+
         Args:
             project_path: Path to project root
             model_name: Model name (without extension)
@@ -381,23 +653,113 @@ class LayoutStore:
         with self._lock:
             if layout_id in self._layouts:
                 # Update existing
-                self._layouts[layout_id] = layout
+                self._publish(layout_id, layout)
                 logger.debug(f"Updated layout {layout_id} from file")
             else:
                 # Create new
                 object.__setattr__(layout, "layout_id", layout_id)
-                self._layouts[layout_id] = layout
+                self._publish(layout_id, layout)
                 logger.debug(f"Loaded layout {layout_id} from file")
 
         return layout_id
 
+    def read_columnar(
+        self,
+        project_path: str,
+        model_name: str,
+        model_type: Optional[str] = None,
+    ) -> "ColumnarLayout":
+        """Read a layout file as a ColumnarLayout without building pydantic models.
+
+        With a fresh binary sidecar the coordinate columns are memory-mapped
+        and only paged in when used; ``.metadata`` materializes the pydantic
+        view on demand. Without one, the JSON file is parsed into columns.
+        Requires NumPy.
+
+        Args:
+            project_path: Path to project root
+            model_name: Model name (without extension)
+            model_type: Directory type or None to auto-detect
+
+        Returns:
+            ColumnarLayout
+
+        Raises:
+            FileNotFoundError: If layout file not found
+        """
+        from src.models.layout_columns import ColumnarLayout
+
+        file_path = self._find_layout_file(project_path, model_name, model_type)
+        columns = self._read_fresh_sidecar(file_path)
+        if columns is not None:
+            return columns
+        with open(file_path, "r") as f:
+            return ColumnarLayout.from_dict(json.load(f))
+
+    def _find_layout_file(
+        self,
+        project_path: str,
+        model_name: str,
+        model_type: Optional[str],
+    ) -> Path:
+        """Locate a layout JSON file.
+
+        Raises:
+            FileNotFoundError: If file not found
+        """
+        path = Path(project_path)
+
+        if model_type is not None:
+            file_path = path / model_type / f"{model_name}.layout.json"
+            if not file_path.exists():
+                raise FileNotFoundError(f"Layout file not found: {file_path}")
+            return file_path
+
+        # Auto-detect by searching directories
+        for dir_name in ["pid", "pfd", "bfd"]:
+            candidate = path / dir_name / f"{model_name}.layout.json"
+            if candidate.exists():
+                return candidate
+
+        raise FileNotFoundError(
+            f"Layout file for {model_name} not found in pid/, pfd/, or bfd/"
+        )
+
+    def _read_fresh_sidecar(self, file_path: Path) -> Optional["ColumnarLayout"]:
+        """Memory-map the sidecar of a layout file if it matches the JSON.
+
+        The JSON file is the source of truth, so a corrupt sidecar is
+        logged and ignored.
+
+        Returns:
+            ColumnarLayout, or None if there is no usable sidecar
+        """
+        bin_path = file_path.with_suffix(".bin")
+        if not bin_path.exists() or not numpy_available():
+            return None
+
+        from src.core.layout_sidecar import SidecarFormatError, read_sidecar, source_stat
+
+        try:
+            result = read_sidecar(bin_path)
+        except SidecarFormatError as e:
+            logger.warning(f"Ignoring corrupt layout sidecar: {e}; loading {file_path.name}")
+            return None
+        if result is None:
+            return None
+        columns, source = result
+        if source != source_stat(file_path):
+            logger.info(f"Ignoring stale layout sidecar {bin_path} (JSON changed)")
+            return None
+        return columns
+
     def _read_layout_file(
         self,
         project_path: str,
         model_name: str,
         model_type: Optional[str],
     ) -> LayoutMetadata:
-        """Read layout from file.
+        """Read layout from file (a fresh sidecar is materialized in full).
 
         Args:
             project_path: Project root path
@@ -410,25 +772,11 @@ class LayoutStore:
         Raises:
             FileNotFoundError: If file not found
         """
-        path = Path(project_path)
-        file_path: Optional[Path] = None
+        file_path = self._find_layout_file(project_path, model_name, model_type)
 
-        if model_type is not None:
-            file_path = path / model_type / f"{model_name}.layout.json"
-            if not file_path.exists():
-                raise FileNotFoundError(f"Layout file not found: {file_path}")
-        else:
-            # Auto-detect by searching directories
-            for dir_name in ["pid", "pfd", "bfd"]:
-                candidate = path / dir_name / f"{model_name}.layout.json"
-                if candidate.exists():
-                    file_path = candidate
-                    break
-
-            if file_path is None:
-                raise FileNotFoundError(
-                    f"Layout file for {model_name} not found in pid/, pfd/, or bfd/"
-                )
+        columns = self._read_fresh_sidecar(file_path)
+        if columns is not None:
+            return columns.to_layout()
 
         # Load JSON
         with open(file_path, "r") as f:
@@ -448,68 +796,22 @@ class LayoutStore:
         Returns:
             LayoutMetadata instance
         """
-        # Convert positions (may be stored as [x, y] lists)
-        positions = {}
-        for node_id, pos in data.get("positions", {}).items():
-            if isinstance(pos, list):
-                positions[node_id] = NodePosition(x=pos[0], y=pos[1])
-            elif isinstance(pos, dict):
-                positions[node_id] = NodePosition(**pos)
-            else:
-                positions[node_id] = pos
-
-        # Convert port layouts
-        port_layouts = {}
-        for port_id, port_data in data.get("port_layouts", {}).items():
-            if isinstance(port_data, dict):
-                port_layouts[port_id] = PortLayout(**port_data)
-            else:
-                port_layouts[port_id] = port_data
-
-        # Convert edge routes
-        edges = {}
-        for edge_id, edge_data in data.get("edges", {}).items():
-            if isinstance(edge_data, dict):
-                # Convert sections
-                sections = []
-                for section_data in edge_data.get("sections", []):
-                    # Convert points from lists to tuples
-                    start_point = tuple(section_data["startPoint"])
-                    end_point = tuple(section_data["endPoint"])
-                    bend_points = [tuple(bp) for bp in section_data.get("bendPoints", [])]
-                    sections.append(EdgeSection(
-                        id=section_data.get("id"),
-                        startPoint=start_point,
-                        endPoint=end_point,
-                        bendPoints=bend_points,
-                    ))
-
-                # Convert labels
-                labels = []
-                for label_data in edge_data.get("labels", []):
-                    if isinstance(label_data, dict):
-                        labels.append(LabelPosition(**label_data))
-                    else:
-                        labels.append(label_data)
-
-                edges[edge_id] = EdgeRoute(
-                    sections=sections,
-                    source_port=edge_data.get("source_port"),
-                    target_port=edge_data.get("target_port"),
-                    sourcePoint=tuple(edge_data["sourcePoint"]) if edge_data.get("sourcePoint") else None,
-                    targetPoint=tuple(edge_data["targetPoint"]) if edge_data.get("targetPoint") else None,
-                    labels=labels,
-                )
-            else:
-                edges[edge_id] = edge_data
-
-        # Convert labels
-        labels = {}
-        for label_id, label_data in data.get("labels", {}).items():
-            if isinstance(label_data, dict):
-                labels[label_id] = LabelPosition(**label_data)
-            else:
-                labels[label_id] = label_data
+        positions = {
+            node_id: _position_from_data(node_id, pos)
+            for node_id, pos in data.get("positions", {}).items()
+        }
+        port_layouts = {
+            port_id: _port_from_data(port_id, port_data)
+            for port_id, port_data in data.get("port_layouts", {}).items()
+        }
+        edges = {
+            edge_id: _edge_from_data(edge_id, edge_data)
+            for edge_id, edge_data in data.get("edges", {}).items()
+        }
+        labels = {
+            label_id: LabelPosition(**label_data) if isinstance(label_data, dict) else label_data
+            for label_id, label_data in data.get("labels", {}).items()
+        }
 
         # Convert model reference
         model_ref = None
@@ -578,18 +880,100 @@ class LayoutStore:
         return iter(self.list_ids())
 
 
+# =========================================================================
+# Entry conversion (file format and patch deltas)
+# =========================================================================
+
+
+def _layout_size(layout: Any) -> int:
+    """Number of keyed entries in a layout."""
+    return (
+        len(layout.positions) + len(layout.port_layouts)
+        + len(layout.edges) + len(layout.labels)
+    )
+
+
+def _position_from_data(node_id: str, pos: Any) -> NodePosition:
+    """Build a NodePosition from [x, y], {"x", "y"} or a NodePosition."""
+    if isinstance(pos, NodePosition):
+        return pos
+    if isinstance(pos, dict):
+        return NodePosition(**pos)
+    if isinstance(pos, (list, tuple)):
+        return NodePosition.from_list(list(pos))
+    raise ValueError(f"Invalid position for {node_id}: {pos!r}")
+
+
+def _port_from_data(port_id: str, port_data: Any) -> PortLayout:
+    """Build a PortLayout from its dict form (id defaults to the key)."""
+    if isinstance(port_data, PortLayout):
+        return port_data
+    if isinstance(port_data, dict):
+        return PortLayout(**{"id": port_id, **port_data})
+    raise ValueError(f"Invalid port layout for {port_id}: {port_data!r}")
+
+
+def _edge_from_data(edge_id: str, edge_data: Any) -> EdgeRoute:
+    """Build an EdgeRoute from its dict form (points as lists or tuples)."""
+    if isinstance(edge_data, EdgeRoute):
+        return edge_data
+    if not isinstance(edge_data, dict):
+        raise ValueError(f"Invalid edge route for {edge_id}: {edge_data!r}")
+
+    sections = [
+        EdgeSection(
+            id=section_data.get("id"),
+            startPoint=tuple(section_data["startPoint"]),
+            endPoint=tuple(section_data["endPoint"]),
+            bendPoints=[tuple(bp) for bp in section_data.get("bendPoints", [])],
+        )
+        for section_data in edge_data.get("sections", [])
+    ]
+    labels = [
+        LabelPosition(**label_data) if isinstance(label_data, dict) else label_data
+        for label_data in edge_data.get("labels", [])
+    ]
+    return EdgeRoute(
+        sections=sections,
+        source_port=edge_data.get("source_port"),
+        target_port=edge_data.get("target_port"),
+        sourcePoint=tuple(edge_data["sourcePoint"]) if edge_data.get("sourcePoint") else None,
+        targetPoint=tuple(edge_data["targetPoint"]) if edge_data.get("targetPoint") else None,
+        labels=labels,
+    )
+
+
+def _rotation_from_data(node_id: str, angle: Any) -> float:
+    return float(angle)
+
+
+# Builders for LayoutStore.patch(), keyed by layout section
+_PATCH_BUILDERS = {
+    "positions": _position_from_data,
+    "edges": _edge_from_data,
+    "port_layouts": _port_from_data,
+    "rotation": _rotation_from_data,
+}
+
+
 # Factory function
-def create_layout_store() -> LayoutStore:
+def create_layout_store(
+    max_layouts_per_model: Optional[int] = DEFAULT_MAX_LAYOUTS_PER_MODEL,
+) -> LayoutStore:
     """Create a new layout store instance.
 
+    Args:
+        max_layouts_per_model: Retention limit per model (None = unlimited)
+
     Returns:
         LayoutStore instance
     """
-    return LayoutStore()
+    return LayoutStore(max_layouts_per_model=max_layouts_per_model)
 
 
 __all__ = [
     "LayoutStore",
+    "LayoutSnapshot",
     "LayoutNotFoundError",
     "OptimisticLockError",
     "create_layout_store",
@@ -6,6 +6,7 @@ This module provides a thread-safe abstraction for model storage with:
 - Lifecycle hooks for caching, validation, and event propagation
 - Snapshot/rollback capability for transaction support
 - Metadata tracking (created_at, modified_at, access patterns)
+- Lazy placeholders (LazyModel) that deserialize on first access
 
 Week 7 Implementation: Replaces dict-based storage in server.py with
 proper abstraction supporting future persistence backends.
@@ -29,6 +30,7 @@ Usage:
 """
 
 import logging
+import os
 import threading
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
@@ -36,12 +38,15 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any, Callable, Dict, Generator, Generic, List, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+MODEL_STORE_BACKENDS = ("memory", "disk")
+
 
 # ============================================================================
 # Enums and Types
@@ -86,6 +91,19 @@ class ModelMetadata:
             "tags": self.tags
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelMetadata":
+        """Create metadata from a to_dict() result."""
+        return cls(
+            model_id=data["model_id"],
+            model_type=ModelType(data["model_type"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            modified_at=datetime.fromisoformat(data["modified_at"]),
+            access_count=data.get("access_count", 0),
+            last_accessed=datetime.fromisoformat(data["last_accessed"]) if data.get("last_accessed") else None,
+            tags=data.get("tags", {})
+        )
+
 
 @dataclass
 class Snapshot:
@@ -106,6 +124,45 @@ class Snapshot:
     label: Optional[str] = None
 
 
+class LazyModel:
+    """Placeholder for a model that is deserialized on first access.
+
+    Store a LazyModel instead of the model itself (e.g. a model indexed in a
+    project but not yet read); the store swaps in the loaded model the first
+    time it is retrieved. Loading happens once even with concurrent readers.
+    Lifecycle hooks see the placeholder in on_created.
+
+    Attributes:
+        info: Metadata available without loading (e.g. a manifest entry)
+    """
+
+    def __init__(self, loader: Callable[[], Any], info: Optional[Dict[str, Any]] = None):
+        """Initialize the placeholder.
+
+        Args:
+            loader: Zero-argument callable returning the model
+            info: Metadata available without loading
+        """
+        self._loader = loader
+        self._model: Any = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.info = info or {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self) -> Any:
+        """Return the model, calling the loader on first use."""
+        with self._lock:
+            if not self._loaded:
+                self._model = self._loader()
+                self._loaded = True
+                self._loader = None
+            return self._model
+
+
 # ============================================================================
 # Lifecycle Hooks
 # ============================================================================
@@ -163,6 +220,7 @@ class CachingHook(LifecycleHook):
     def __init__(self):
         self._graph_cache: Dict[str, Any] = {}
         self._stats_cache: Dict[str, Dict] = {}
+        self._tag_index_cache: Dict[str, Any] = {}
         self._lock = threading.Lock()
 
     def on_updated(self, model_id: str, old_model: Any, new_model: Any,
@@ -171,12 +229,14 @@ class CachingHook(LifecycleHook):
         with self._lock:
             self._graph_cache.pop(model_id, None)
             self._stats_cache.pop(model_id, None)
+            self._tag_index_cache.pop(model_id, None)
 
     def on_deleted(self, model_id: str, model: Any, metadata: ModelMetadata) -> None:
         """Invalidate caches when model is deleted."""
         with self._lock:
             self._graph_cache.pop(model_id, None)
             self._stats_cache.pop(model_id, None)
+            self._tag_index_cache.pop(model_id, None)
 
     def get_cached_graph(self, model_id: str) -> Optional[Any]:
         """Get cached graph for a model, if available."""
@@ -198,11 +258,22 @@ class CachingHook(LifecycleHook):
         with self._lock:
             self._stats_cache[model_id] = stats
 
+    def get_cached_tag_index(self, model_id: str) -> Optional[Any]:
+        """Get cached tag index for a model's graph, if available."""
+        with self._lock:
+            return self._tag_index_cache.get(model_id)
+
+    def cache_tag_index(self, model_id: str, tag_index: Any) -> None:
+        """Cache a tag index for a model's graph."""
+        with self._lock:
+            self._tag_index_cache[model_id] = tag_index
+
     def clear_all(self) -> None:
         """Clear all cached data."""
         with self._lock:
             self._graph_cache.clear()
             self._stats_cache.clear()
+            self._tag_index_cache.clear()
 
 
 # ============================================================================
@@ -446,6 +517,39 @@ class InMemoryModelStore(ModelStore[T]):
         """Get the model type for this store."""
         return self._model_type
 
+    def _resolve(self, model_id: str) -> None:
+        """Load a LazyModel placeholder in place (no-op for loaded models)."""
+        with self._lock:
+            model = self._models.get(model_id)
+        if not isinstance(model, LazyModel):
+            return
+        # Load outside the store lock so other models stay accessible
+        loaded = model.load()
+        with self._lock:
+            if self._models.get(model_id) is model:
+                self._models[model_id] = loaded
+
+    def _lazy_ids(self) -> List[str]:
+        return [mid for mid, model in self._models.items() if isinstance(model, LazyModel)]
+
+    def _resolve_all(self) -> None:
+        with self._lock:
+            lazy_ids = self._lazy_ids()
+        for model_id in lazy_ids:
+            self._resolve(model_id)
+
+    def is_loaded(self, model_id: str) -> bool:
+        """Check whether a model is in memory (False for unloaded LazyModel).
+
+        Raises:
+            KeyError: If model_id doesn't exist
+        """
+        with self._lock:
+            if model_id not in self._models:
+                raise KeyError(f"Model {model_id} not found")
+            model = self._models[model_id]
+            return not isinstance(model, LazyModel) or model.loaded
+
     def create(self, model_id: str, model: T, **kwargs) -> ModelMetadata:
         """Create a new model in the store."""
         with self._lock:
@@ -484,6 +588,7 @@ class InMemoryModelStore(ModelStore[T]):
             copy: If True, return a deep copy (safe for mutation).
                   If False (default), return live reference (faster but mutable).
         """
+        self._resolve(model_id)
         with self._lock:
             model = self._models.get(model_id)
             if model is None:
@@ -567,6 +672,7 @@ class InMemoryModelStore(ModelStore[T]):
 
     def create_snapshot(self, model_id: str, label: Optional[str] = None) -> Snapshot:
         """Create an immutable snapshot of the current model state."""
+        self._resolve(model_id)
         with self._lock:
             if model_id not in self._models:
                 raise KeyError(f"Model {model_id} not found")
@@ -635,6 +741,7 @@ class InMemoryModelStore(ModelStore[T]):
                 model.connect(...)
             # update() called automatically on exit
         """
+        self._resolve(model_id)
         with self._lock:
             if model_id not in self._models:
                 raise KeyError(f"Model {model_id} not found")
@@ -654,6 +761,7 @@ class InMemoryModelStore(ModelStore[T]):
         Note: Unlike get(), this raises KeyError if not found and
         does NOT update access metadata (to match dict behavior).
         """
+        self._resolve(model_id)
         with self._lock:
             if model_id not in self._models:
                 raise KeyError(model_id)
@@ -690,11 +798,13 @@ class InMemoryModelStore(ModelStore[T]):
 
     def items(self):
         """Return model ID, model pairs (snapshot to avoid mutation during iteration)."""
+        self._resolve_all()
         with self._lock:
             return list(self._models.items())
 
     def values(self):
         """Return all models (snapshot to avoid mutation during iteration)."""
+        self._resolve_all()
         with self._lock:
             return list(self._models.values())
 
@@ -724,3 +834,49 @@ def create_dexpi_store() -> InMemoryModelStore:
 def create_sfiles_store() -> InMemoryModelStore:
     """Create an in-memory store for SFILES models."""
     return InMemoryModelStore(ModelType.SFILES)
+
+
+def create_model_store(
+    model_type: ModelType,
+    backend: Optional[str] = None,
+    path: Optional[str] = None,
+    max_resident: Optional[int] = None
+) -> InMemoryModelStore:
+    """Create a store for the configured backend.
+
+    Unset arguments are read from the environment:
+    MODEL_STORE_BACKEND ("memory" or "disk", default "memory"),
+    MODEL_STORE_PATH (directory for the disk databases, default: a
+    temporary directory removed on exit) and MODEL_STORE_MAX_RESIDENT
+    (models kept in memory per disk store).
+
+    The disk databases hold pickled models, and loading a model unpickles
+    it: MODEL_STORE_PATH must be a directory only this server can write.
+
+    Args:
+        model_type: Type of models the store holds
+        backend: One of MODEL_STORE_BACKENDS
+        path: Directory holding "{model_type}.sqlite" (disk backend)
+        max_resident: Working set size (disk backend)
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = backend or os.environ.get("MODEL_STORE_BACKEND", "memory")
+    if backend not in MODEL_STORE_BACKENDS:
+        raise ValueError(
+            f"Unknown model store backend: {backend}. Valid backends: {list(MODEL_STORE_BACKENDS)}"
+        )
+    if backend == "memory":
+        return InMemoryModelStore(model_type)
+
+    from .disk_model_store import DEFAULT_MAX_RESIDENT, DiskModelStore
+
+    path = path or os.environ.get("MODEL_STORE_PATH")
+    if max_resident is None:
+        max_resident = int(os.environ.get("MODEL_STORE_MAX_RESIDENT", DEFAULT_MAX_RESIDENT))
+    return DiskModelStore(
+        model_type,
+        path=str(Path(path) / f"{model_type.value}.sqlite") if path else None,
+        max_resident=max_resident
+    )
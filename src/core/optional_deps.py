@@ -0,0 +1,22 @@
+"""
+Availability checks for optional dependencies shared across core modules.
+
+NumPy and SciPy come with the ``analytics`` extra (``pip install .[analytics]``).
+Modules that can use them check here before importing, so layout storage and
+graph analytics do not depend on each other to find out.
+"""
+
+import importlib.util
+
+
+def numpy_available() -> bool:
+    """Check whether NumPy is importable."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+def scipy_available() -> bool:
+    """Check whether SciPy is importable."""
+    return importlib.util.find_spec("scipy") is not None
+
+
+__all__ = ["numpy_available", "scipy_available"]
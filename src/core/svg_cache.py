@@ -0,0 +1,240 @@
+"""
+Process-wide cache of symbol SVG assets.
+
+Every consumer of a symbol used to resolve its file on disk, read it and
+parse it again. SVGAssetCache keeps the raw SVG bytes together with the
+geometry parsed from them (bounding box, anchor and ports, translated to
+the viewBox origin by svg_parser.normalize_to_viewbox) in a bounded LRU,
+shared by the whole process through get_svg_cache().
+
+Entries are keyed by (symbol_id, catalog file hash) as recorded by the
+registry in use. A cache without an explicit registry resolves
+get_registry() on every lookup, so once the global registry is replaced by
+one loaded from a rebuilt catalog, entries whose SVG changed are missed. A
+symbol without an SVG file is remembered as missing under the same key,
+so repeated lookups do not stat the asset directories again.
+
+warm_model() loads the symbols referenced by a DEXPI model up front: a
+2,000-component P&ID typically uses a few dozen distinct symbols, so
+rendering it reads each file once instead of once per component.
+
+Usage:
+    from src.core.svg_cache import get_svg_cache
+
+    cache = get_svg_cache()
+    cache.warm_model(model)
+    asset = cache.get("PP001A")
+    asset.content, asset.geometry.ports
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .svg_parser import SVGMetadata, normalize_to_viewbox, parse_svg_metadata
+from .symbols import SymbolRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class SVGAsset:
+    """A symbol's SVG file content and parsed geometry.
+
+    Attributes:
+        symbol_id: Symbol ID (e.g., "PP001A")
+        path: SVG file the asset was read from
+        file_hash: SHA-256 of content
+        content: Raw SVG bytes
+        geometry: Viewbox-normalized geometry (None if the SVG could not be parsed)
+    """
+    symbol_id: str
+    path: Path
+    file_hash: str
+    content: bytes
+    geometry: Optional[SVGMetadata]
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+
+class SVGAssetCache:
+    """Bounded LRU of SVGAssets keyed by (symbol_id, file hash).
+
+    Thread-safe; files are read outside the lock.
+    """
+
+    def __init__(self, registry: Optional[SymbolRegistry] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Create an empty cache.
+
+        Args:
+            registry: Symbol registry resolving IDs to files (default: the global registry)
+            max_entries: Maximum number of cached symbols (missing symbols included)
+
+        Raises:
+            ValueError: If max_entries is < 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self._registry = registry
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0}
+
+    @property
+    def registry(self) -> SymbolRegistry:
+        # Not memoized: follow the global registry if it is replaced
+        return self._registry if self._registry is not None else get_registry()
+
+    def get(self, symbol_id: str) -> Optional[SVGAsset]:
+        """Cached asset of a symbol, read from disk on first use.
+
+        Returns:
+            The asset, or None if the symbol has no SVG file
+        """
+        key = self._key(symbol_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return None if entry is _MISSING else entry
+            self._stats["misses"] += 1
+
+        asset = self._load(symbol_id)
+        with self._lock:
+            self._store(key, _MISSING if asset is None else asset)
+        return asset
+
+    def warm(self, symbol_ids: Iterable[str]) -> int:
+        """Load symbols that are not cached yet.
+
+        Returns:
+            Number of symbols read from disk
+        """
+        loaded = 0
+        for symbol_id in dict.fromkeys(symbol_ids):
+            key = self._key(symbol_id)
+            with self._lock:
+                if key in self._entries:
+                    continue
+            asset = self._load(symbol_id)
+            with self._lock:
+                self._store(key, _MISSING if asset is None else asset)
+            loaded += 1
+        return loaded
+
+    def warm_model(self, model: Any) -> List[str]:
+        """Load the symbols of every component class in a DEXPI model.
+
+        Each distinct pyDEXPI class is mapped to its symbol once
+        (SymbolRegistry.get_by_dexpi_class). The composition tree is walked
+        once with the shared per-class field plan (dexpi_fields.field_plan);
+        model_toolkit.get_all_instances_in_model is quadratic in model size.
+
+        Returns:
+            IDs of the referenced symbols
+        """
+        from pydantic import BaseModel
+
+        from .dexpi_fields import field_plan
+
+        classes = set()
+        stack = [model]
+        seen = set()
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            classes.add(type(obj).__name__)
+            for attr_name in field_plan(type(obj)).child_fields:
+                attr_value = getattr(obj, attr_name, None)
+                if isinstance(attr_value, BaseModel):
+                    stack.append(attr_value)
+                elif isinstance(attr_value, list):
+                    stack.extend(item for item in attr_value if isinstance(item, BaseModel))
+
+        registry = self.registry
+        symbol_ids = []
+        for class_name in sorted(classes):
+            symbol = registry.get_by_dexpi_class(class_name)
+            if symbol is not None:
+                symbol_ids.append(symbol.symbol_id)
+        loaded = self.warm(symbol_ids)
+        logger.debug(f"Warmed SVG cache for {len(symbol_ids)} symbols ({loaded} read)")
+        return symbol_ids
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), max_entries=self.max_entries)
+
+    def _key(self, symbol_id: str) -> Tuple[str, Optional[str]]:
+        symbol = self.registry.get_symbol(symbol_id)
+        return symbol_id, symbol.file_hash if symbol else None
+
+    def _load(self, symbol_id: str) -> Optional[SVGAsset]:
+        path = self.registry.get_symbol_path(symbol_id)
+        if path is None:
+            return None
+        content = path.read_bytes()
+        geometry = parse_svg_metadata(content, path, include_hash=False)
+        with self._lock:
+            self._stats["loads"] += 1
+        return SVGAsset(
+            symbol_id=symbol_id,
+            path=path,
+            file_hash=hashlib.sha256(content).hexdigest(),
+            content=content,
+            geometry=normalize_to_viewbox(geometry) if geometry else None,
+        )
+
+    def _store(self, key: Tuple[str, Optional[str]], entry: Any) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+
+# Singleton instance for global access
+_cache: Optional[SVGAssetCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_svg_cache() -> SVGAssetCache:
+    """Get the process-wide SVG asset cache.
+
+    Its size is read from SVG_CACHE_MAX_ENTRIES (default DEFAULT_MAX_ENTRIES).
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SVGAssetCache(
+                max_entries=int(os.environ.get("SVG_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+            )
+        return _cache
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "SVGAsset",
+    "SVGAssetCache",
+    "get_svg_cache",
+]
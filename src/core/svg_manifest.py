@@ -0,0 +1,205 @@
+"""
+Incremental SVG scan manifest for symbol catalog rebuilds.
+
+Rebuilding the catalog used to hash (merge_symbol_libraries.py) and parse
+(scripts/extract_all_geometry.py) all ~1,500 symbol SVGs serially. The
+manifest records, per SVG file, the (mtime, size, SHA-256) it was last
+scanned at and the geometry svg_parser extracted from it, so a rebuild
+only re-reads files whose stat changed, and only re-parses files whose
+content changed. Changed files are processed in a process pool.
+
+The manifest is derived data: it lives next to the catalog as
+``svg_manifest.json``, is git-ignored and is rebuilt when missing or
+written by another MANIFEST_VERSION.
+
+Usage:
+    from src.core.svg_manifest import SVGManifest
+
+    manifest = SVGManifest(assets_dir)
+    records = manifest.refresh(assets_dir.rglob("*.svg"), metadata=True)
+    manifest.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.svg_parser import extract_svg_metadata
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "svg_manifest.json"
+MANIFEST_VERSION = 1
+
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+
+@dataclass
+class SVGRecord:
+    """Scan result for one SVG file.
+
+    Attributes:
+        mtime_ns: File modification time when scanned
+        size: File size in bytes when scanned
+        sha256: Hash of the file content
+        parsed: Whether geometry extraction was run for this content
+        metadata: SVGMetadata.to_dict() without file_hash (None if not
+            parsed or the SVG could not be parsed)
+    """
+    mtime_ns: int
+    size: int
+    sha256: str
+    parsed: bool = False
+    metadata: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SVGRecord":
+        return cls(**data)
+
+
+def _scan_file(
+    path: str, metadata: bool, known_sha256: Optional[str]
+) -> Tuple[str, bool, Optional[Dict[str, Any]]]:
+    """Hash one SVG and extract its geometry (runs in pool workers).
+
+    Returns:
+        (sha256, parsed, metadata). parsed is False when metadata was not
+        requested or the content hash equals known_sha256, whose stored
+        metadata is still valid.
+    """
+    content = Path(path).read_bytes()
+    sha256 = hashlib.sha256(content).hexdigest()
+    if not metadata or sha256 == known_sha256:
+        return sha256, False, None
+    extracted = extract_svg_metadata(Path(path), include_hash=False)
+    if extracted is None:
+        return sha256, True, None
+    data = extracted.to_dict()
+    del data["file_hash"]
+    return sha256, True, data
+
+
+class SVGManifest:
+    """Per-file scan records of the SVGs below a root directory."""
+
+    def __init__(self, root: Path, path: Optional[Path] = None):
+        """Load the manifest (an empty one if missing or outdated).
+
+        Args:
+            root: Directory records are keyed relative to (the assets dir)
+            path: Manifest file (default: root / MANIFEST_FILENAME)
+        """
+        self.root = Path(root)
+        self.path = Path(path) if path is not None else self.root / MANIFEST_FILENAME
+        self._records = self._read()
+        self.stats = {"reused": 0, "hashed": 0, "parsed": 0}
+
+    def refresh(
+        self,
+        svg_paths: Iterable[Path],
+        metadata: bool = False,
+        workers: Optional[int] = None,
+        force: bool = False,
+    ) -> Dict[str, SVGRecord]:
+        """Bring the records of the given SVG files up to date.
+
+        A file is re-read only if its size or mtime changed (or, with
+        metadata=True, it was never parsed); it is re-parsed only if its
+        content hash changed.
+
+        Args:
+            svg_paths: SVG files below root
+            metadata: Also extract geometry (bounding box, anchor, ports)
+            workers: Pool size (default: CPU count; 1 scans in-process)
+            force: Re-read and re-parse every file
+
+        Returns:
+            Records of svg_paths keyed by path relative to root
+        """
+        results: Dict[str, SVGRecord] = {}
+        pending: List[Tuple[str, Path, os.stat_result, Optional[SVGRecord]]] = []
+        for svg_path in svg_paths:
+            svg_path = Path(svg_path)
+            key = svg_path.relative_to(self.root).as_posix()
+            stat = svg_path.stat()
+            record = None if force else self._records.get(key)
+            if (
+                record is not None
+                and (record.size, record.mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+                and (record.parsed or not metadata)
+            ):
+                results[key] = record
+                self.stats["reused"] += 1
+            else:
+                pending.append((key, svg_path, stat, record))
+
+        jobs = [
+            (str(svg_path), metadata, record.sha256 if record and record.parsed else None)
+            for _, svg_path, _, record in pending
+        ]
+        for (key, _, stat, previous), (sha256, parsed, extracted) in zip(pending, self._run(jobs, workers), strict=True):
+            record = SVGRecord(stat.st_mtime_ns, stat.st_size, sha256)
+            if parsed:
+                record.parsed, record.metadata = True, extracted
+                self.stats["parsed"] += 1
+            elif previous is not None and previous.sha256 == sha256:
+                # Touched but unchanged: the stored geometry still applies
+                record.parsed, record.metadata = previous.parsed, previous.metadata
+            self._records[key] = record
+            results[key] = record
+            self.stats["hashed"] += 1
+
+        if pending:
+            logger.info(
+                f"SVG manifest: {len(results) - len(pending)} unchanged, {len(pending)} rescanned"
+            )
+        return results
+
+    def get(self, svg_path: Path) -> Optional[SVGRecord]:
+        """Stored record of an SVG file (not refreshed)."""
+        return self._records.get(Path(svg_path).relative_to(self.root).as_posix())
+
+    def save(self) -> None:
+        """Write the manifest, dropping records of deleted files."""
+        records = {key: record for key, record in self._records.items() if (self.root / key).exists()}
+        self._records = records
+        data = {
+            "version": MANIFEST_VERSION,
+            "files": {key: asdict(record) for key, record in sorted(records.items())},
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def _run(self, jobs: List[Tuple[str, bool, Optional[str]]], workers: Optional[int]):
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(jobs) < PARALLEL_THRESHOLD:
+            return [_scan_file(*job) for job in jobs]
+        logger.info(f"Scanning {len(jobs)} SVG files with {workers} processes")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_scan_file, *zip(*jobs, strict=True), chunksize=max(1, len(jobs) // (workers * 4))))
+
+    def _read(self) -> Dict[str, SVGRecord]:
+        if not self.path.exists():
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            logger.info(f"Rebuilding SVG manifest {self.path}: version {data.get('version')}")
+            return {}
+        return {key: SVGRecord.from_dict(record) for key, record in data["files"].items()}
+
+
+__all__ = [
+    "MANIFEST_FILENAME",
+    "MANIFEST_VERSION",
+    "SVGManifest",
+    "SVGRecord",
+]
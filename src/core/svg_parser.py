@@ -13,7 +13,7 @@ import logging
 import re
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 
 from src.core.symbols import Point, BoundingBox, Port
 
@@ -71,8 +71,27 @@ def extract_svg_metadata(svg_path: Path, include_hash: bool = True) -> Optional[
         SVGMetadata object or None if extraction fails
     """
     try:
-        tree = ET.parse(svg_path)
-        root = tree.getroot()
+        content = Path(svg_path).read_bytes()
+    except OSError as e:
+        logger.debug(f"Failed to read {svg_path}: {e}")
+        return None
+    return parse_svg_metadata(content, Path(svg_path), include_hash)
+
+
+def parse_svg_metadata(content: bytes, svg_path: Path, include_hash: bool = True) -> Optional[SVGMetadata]:
+    """
+    Extract geometry metadata from SVG content already read from svg_path.
+
+    Args:
+        content: SVG file bytes
+        svg_path: File the content came from (used to infer default ports)
+        include_hash: Whether to calculate the content hash
+
+    Returns:
+        SVGMetadata object or None if extraction fails
+    """
+    try:
+        root = ET.fromstring(content)
 
         # Extract dimensions from viewBox or width/height
         bbox = _extract_bounding_box(root)
@@ -90,7 +109,7 @@ def extract_svg_metadata(svg_path: Path, include_hash: bool = True) -> Optional[
         # Calculate file hash (SHA-256 for consistency with merged_catalog.json)
         file_hash = None
         if include_hash:
-            file_hash = hashlib.sha256(svg_path.read_bytes()).hexdigest()
+            file_hash = hashlib.sha256(content).hexdigest()
 
         return SVGMetadata(
             bounding_box=bbox,
@@ -106,6 +125,25 @@ def extract_svg_metadata(svg_path: Path, include_hash: bool = True) -> Optional[
         return None
 
 
+def normalize_to_viewbox(metadata: SVGMetadata) -> SVGMetadata:
+    """
+    Translate geometry so the viewBox origin is (0, 0).
+
+    Symbols drawn with a negative or offset viewBox then share one
+    coordinate frame: the bounding box spans (0, 0)-(width, height) and
+    anchor and ports are relative to its top-left corner.
+    """
+    dx, dy = metadata.bounding_box.x, metadata.bounding_box.y
+    if dx == 0 and dy == 0:
+        return metadata
+    return replace(
+        metadata,
+        bounding_box=BoundingBox(0.0, 0.0, metadata.bounding_box.width, metadata.bounding_box.height),
+        anchor_point=Point(metadata.anchor_point.x - dx, metadata.anchor_point.y - dy),
+        ports=[replace(port, x=port.x - dx, y=port.y - dy) for port in metadata.ports],
+    )
+
+
 def _extract_bounding_box(root: ET.Element) -> BoundingBox:
     """Extract bounding box from SVG root element."""
     # Try viewBox first
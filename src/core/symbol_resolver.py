@@ -13,9 +13,8 @@ Design Philosophy:
 
 import logging
 from typing import Dict, List, Optional, Tuple
-from difflib import SequenceMatcher
 
-from src.core.symbols import SymbolRegistry, SymbolInfo, get_registry
+from src.core.symbols import SymbolRegistry, SymbolInfo, SymbolCategory, get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +56,13 @@ class SymbolResolver:
         """
         self.registry = registry or get_registry()
         self._actuated_cache: Optional[Dict[str, str]] = None
+        # (dexpi_class, category) → best (symbol, confidence) before thresholding
+        self._fuzzy_cache: Dict[Tuple[str, Optional[SymbolCategory]], Optional[Tuple[SymbolInfo, float]]] = {}
+
+    def clear_cache(self):
+        """Drop memoized lookups (call after the registry is rebuilt)."""
+        self._actuated_cache = None
+        self._fuzzy_cache.clear()
 
     def get_actuated_variant(self, symbol_id: str) -> Optional[str]:
         """
@@ -127,7 +133,8 @@ class SymbolResolver:
     def get_by_dexpi_class_fuzzy(
         self,
         dexpi_class: str,
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        category: Optional[SymbolCategory] = None
     ) -> Optional[Tuple[SymbolInfo, float]]:
         """
         Fuzzy lookup for DEXPI class with confidence metric.
@@ -138,14 +145,18 @@ class SymbolResolver:
         Strategy:
         1. Try exact match via registry.get_by_dexpi_class()
         2. Try actuated variant of exact match
-        3. Use registry.search() with Levenshtein ranking
+        3. Rank registry.search() matches with registry.search_top_k()
         4. Return (symbol, confidence) or None
 
+        Results are memoized per (dexpi_class, category); renderers resolve
+        the same few classes for every component of a drawing.
+
         Does NOT use base-class inference (catalog lacks generic "Pump", "Valve" entries).
 
         Args:
             dexpi_class: DEXPI class name to look up
             confidence_threshold: Minimum confidence (0.0-1.0) to return result
+            category: Restrict fuzzy candidates to a symbol category
 
         Returns:
             (SymbolInfo, confidence) tuple if match found above threshold, else None
@@ -159,6 +170,29 @@ class SymbolResolver:
             >>> resolver.get_by_dexpi_class_fuzzy("UnknownEquipment")
             None  # No match above threshold
         """
+        key = (dexpi_class, category)
+        if key not in self._fuzzy_cache:
+            self._fuzzy_cache[key] = self._resolve_fuzzy(dexpi_class, category)
+        best = self._fuzzy_cache[key]
+
+        if best is None:
+            return None
+        best_symbol, best_confidence = best
+        if best_confidence >= confidence_threshold:
+            return best
+
+        logger.debug(
+            f"Best fuzzy match for {dexpi_class} below threshold: "
+            f"{best_symbol.symbol_id} (confidence: {best_confidence:.2f} < {confidence_threshold})"
+        )
+        return None
+
+    def _resolve_fuzzy(
+        self,
+        dexpi_class: str,
+        category: Optional[SymbolCategory]
+    ) -> Optional[Tuple[SymbolInfo, float]]:
+        """Best (symbol, confidence) for a DEXPI class, ignoring the threshold."""
         # Step 1: Try exact match (confidence = 1.0)
         exact = self.registry.get_by_dexpi_class(dexpi_class)
         if exact:
@@ -173,58 +207,21 @@ class SymbolResolver:
                 logger.debug(f"Custom prefix match for {dexpi_class}: {base.symbol_id}")
                 return (base, 0.95)
 
-        # Step 3: Fuzzy search using registry.search() with Levenshtein ranking
-        # Search in DEXPI class names, symbol IDs, and display names
-        candidates = self.registry.search(dexpi_class)
-
-        if not candidates:
+        # Step 3: Rank substring matches in DEXPI class names, symbol IDs and
+        # display names by Levenshtein similarity to the DEXPI class (or name)
+        ranked = self.registry.search_top_k(
+            dexpi_class, k=1, category=category, include_token_matches=False
+        )
+        if not ranked:
             logger.debug(f"No fuzzy matches found for {dexpi_class}")
             return None
 
-        # Rank candidates by Levenshtein similarity
-        ranked = []
-        for candidate in candidates:
-            # Compare against DEXPI class if available
-            if candidate.dexpi_class:
-                ratio = self._levenshtein_ratio(dexpi_class, candidate.dexpi_class)
-            else:
-                # Fallback to symbol name comparison
-                ratio = self._levenshtein_ratio(dexpi_class, candidate.name)
-
-            ranked.append((candidate, ratio))
-
-        # Sort by confidence (descending)
-        ranked.sort(key=lambda x: x[1], reverse=True)
-
-        # Return best match if above threshold
         best_symbol, best_confidence = ranked[0]
-        if best_confidence >= confidence_threshold:
-            logger.debug(
-                f"Fuzzy match for {dexpi_class}: {best_symbol.symbol_id} "
-                f"(confidence: {best_confidence:.2f})"
-            )
-            return (best_symbol, best_confidence)
-
         logger.debug(
-            f"Best fuzzy match for {dexpi_class} below threshold: "
-            f"{best_symbol.symbol_id} (confidence: {best_confidence:.2f} < {confidence_threshold})"
+            f"Fuzzy match for {dexpi_class}: {best_symbol.symbol_id} "
+            f"(confidence: {best_confidence:.2f})"
         )
-        return None
-
-    def _levenshtein_ratio(self, s1: str, s2: str) -> float:
-        """
-        Calculate Levenshtein similarity ratio (0.0 to 1.0).
-
-        Uses Python's difflib.SequenceMatcher for efficient comparison.
-
-        Args:
-            s1: First string
-            s2: Second string
-
-        Returns:
-            Similarity ratio (1.0 = identical, 0.0 = completely different)
-        """
-        return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
+        return ranked[0]
 
     def validate_mapping(
         self,
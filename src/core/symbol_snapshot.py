@@ -0,0 +1,170 @@
+"""
+Precompiled binary snapshot of the symbol catalog.
+
+SymbolRegistry startup parses merged_catalog.json, builds every SymbolInfo
+with its geometry and then its search indices. The snapshot stores that
+finished registry state, so loading it is a single unpickle.
+
+File layout:
+    MAGIC (8 bytes) | header length (uint32 LE) | JSON header | pickle payload
+
+The header records SNAPSHOT_VERSION, a fingerprint of the symbol dataclass
+fields, the SHA-256 of the catalog it was compiled from and the SHA-256 of
+the payload. load_snapshot() returns None (and the registry falls back to
+the JSON catalog) when the snapshot is missing, was compiled from another
+catalog or by an incompatible version, fails its payload hash, or cannot
+be parsed or unpickled.
+
+Build it after regenerating the catalog:
+    python scripts/build_symbol_snapshot.py
+"""
+
+import gc
+import hashlib
+import json
+import logging
+import os
+import pickle
+import struct
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "merged_catalog.snapshot"
+SNAPSHOT_VERSION = 1
+MAGIC = b"SYMSNAP\0"
+
+_HEADER_LENGTH = struct.Struct("<I")
+_PICKLE_PROTOCOL = 5
+
+
+def schema_fingerprint() -> str:
+    """Fingerprint of the classes stored in a snapshot.
+
+    A snapshot pickled before a dataclass field was added or renamed would
+    restore objects without it, and one pickled before an enum member was
+    renamed or removed cannot be unpickled, so such snapshots are treated
+    as stale.
+    """
+    from .symbols import BoundingBox, Point, Port, SymbolCategory, SymbolInfo, SymbolSource
+
+    layout = {cls.__name__: [f.name for f in fields(cls)] for cls in (SymbolInfo, Port, BoundingBox, Point)}
+    layout.update({cls.__name__: [[m.name, m.value] for m in cls] for cls in (SymbolCategory, SymbolSource)})
+    return hashlib.sha256(json.dumps(layout, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def write_snapshot(state: Dict[str, Any], catalog_path: Path, snapshot_path: Path) -> Dict[str, Any]:
+    """Write registry state compiled from catalog_path.
+
+    Args:
+        state: Registry attributes to restore (symbols and indices)
+        catalog_path: Catalog the state was built from
+        snapshot_path: Output file (written atomically)
+
+    Returns:
+        The snapshot header
+    """
+    payload = pickle.dumps(state, protocol=_PICKLE_PROTOCOL)
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "schema": schema_fingerprint(),
+        "catalog_sha256": file_sha256(catalog_path),
+        "payload_sha256": hashlib.sha256(payload).hexdigest(),
+        "symbols": len(state.get("_symbols", {})),
+    }
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+
+    snapshot_path = Path(snapshot_path)
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        f.write(payload)
+    os.replace(tmp_path, snapshot_path)
+    logger.info(f"Wrote symbol snapshot {snapshot_path} ({header['symbols']} symbols, {len(payload)} bytes)")
+    return header
+
+
+def read_header(snapshot_path: Path) -> Optional[Dict[str, Any]]:
+    """Header of a snapshot file (None if it is not a snapshot)."""
+    with open(snapshot_path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            return None
+        (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+        return json.loads(f.read(length))
+
+
+def load_snapshot(catalog_path: Path, snapshot_path: Path) -> Optional[Dict[str, Any]]:
+    """Load registry state if the snapshot matches the catalog.
+
+    Args:
+        catalog_path: Current catalog file
+        snapshot_path: Snapshot file
+
+    Returns:
+        Registry state, or None if the snapshot is missing or unusable
+    """
+    snapshot_path = Path(snapshot_path)
+    if not snapshot_path.exists():
+        logger.debug(f"No symbol snapshot at {snapshot_path}")
+        return None
+
+    data = snapshot_path.read_bytes()
+    if not data.startswith(MAGIC):
+        logger.warning(f"Ignoring symbol snapshot {snapshot_path}: not a snapshot file")
+        return None
+    try:
+        offset = len(MAGIC)
+        (length,) = _HEADER_LENGTH.unpack_from(data, offset)
+        offset += _HEADER_LENGTH.size
+        header = json.loads(data[offset:offset + length])
+        if not isinstance(header, dict):
+            raise ValueError("header is not an object")
+    except (struct.error, ValueError) as e:
+        logger.warning(f"Ignoring symbol snapshot {snapshot_path}: corrupt header ({e}); loading JSON catalog")
+        return None
+    payload = memoryview(data)[offset + length:]
+
+    reason = None
+    if header.get("version") != SNAPSHOT_VERSION:
+        reason = f"version {header.get('version')} != {SNAPSHOT_VERSION}"
+    elif header.get("schema") != schema_fingerprint():
+        reason = "symbol classes changed"
+    elif header.get("catalog_sha256") != file_sha256(catalog_path):
+        reason = f"{Path(catalog_path).name} changed"
+    elif header.get("payload_sha256") != hashlib.sha256(payload).hexdigest():
+        reason = "payload hash mismatch"
+    if reason:
+        logger.info(f"Symbol snapshot {snapshot_path} is stale ({reason}); loading JSON catalog")
+        return None
+
+    # Unpickling allocates ~100k objects; with a large heap (a fully
+    # imported server) the collections they trigger dominate the load
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(payload)
+    except (pickle.UnpicklingError, AttributeError, ImportError, EOFError, TypeError, ValueError) as e:
+        # Classes the payload refers to changed in a way the schema
+        # fingerprint does not cover (moved or renamed classes)
+        logger.warning(f"Ignoring symbol snapshot {snapshot_path}: cannot unpickle ({e!r}); loading JSON catalog")
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+__all__ = [
+    "SNAPSHOT_FILENAME",
+    "SNAPSHOT_VERSION",
+    "load_snapshot",
+    "read_header",
+    "write_snapshot",
+]
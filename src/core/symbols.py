@@ -15,15 +15,34 @@ Week 6 Extension: Added geometry support for rendering:
 - Port: Connection point with direction and flow type
 """
 
+import heapq
 import json
 import logging
+import re
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+from .symbol_snapshot import SNAPSHOT_FILENAME, load_snapshot, write_snapshot
+
 logger = logging.getLogger(__name__)
 
+# Length of the character n-grams indexed for substring search
+NGRAM_SIZE = 3
+
+_TOKEN_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def _tokens(text: str) -> Set[str]:
+    """Lowercase word tokens, splitting camelCase (CentrifugalPump -> centrifugal, pump)."""
+    return {token.lower() for token in _TOKEN_PATTERN.findall(text)}
+
 
 class CatalogNotFoundError(FileNotFoundError):
     """Raised when merged symbol catalog is missing in strict mode."""
@@ -150,11 +169,19 @@ class SymbolRegistry:
     Consolidates data from NOAKADEXPI and DISCDEXPI libraries.
     """
 
-    def __init__(self, assets_dir: Optional[Path] = None):
+    # Attributes restored from a compiled snapshot (see symbol_snapshot.py)
+    _SNAPSHOT_STATE = (
+        "_symbols", "_dexpi_map", "_category_map", "_source_map", "_search_fields",
+        "_rank_text", "_ngram_index", "_token_index", "_order",
+    )
+
+    def __init__(self, assets_dir: Optional[Path] = None, use_snapshot: bool = True):
         """Initialize registry with symbol data.
 
         Args:
             assets_dir: Directory containing symbol assets
+            use_snapshot: Load the compiled snapshot (merged_catalog.snapshot)
+                when it matches the catalog, instead of parsing the JSON
 
         Raises:
             CatalogNotFoundError: If merged_catalog.json is missing
@@ -167,10 +194,50 @@ class SymbolRegistry:
         self._symbols: Dict[str, SymbolInfo] = {}
         self._dexpi_map: Dict[str, List[str]] = {}  # DEXPI class → symbol IDs
         self._category_map: Dict[SymbolCategory, List[str]] = {}  # Category → symbol IDs
+        self._source_map: Dict[SymbolSource, Set[str]] = {}  # Source or original source → symbol IDs
+        self._search_fields: Dict[str, Tuple[str, ...]] = {}  # Symbol ID → lowercase searchable fields
+        self._rank_text: Dict[str, str] = {}  # Symbol ID → lowercase DEXPI class (or name) for ranking
+        self._ngram_index: Dict[str, Set[str]] = {}  # Lowercase n-gram → symbol IDs
+        self._token_index: Dict[str, Set[str]] = {}  # Lowercase word token → symbol IDs
+        self._order: Dict[str, int] = {}  # Symbol ID → catalog position
+        self._path_cache: Dict[str, Path] = {}  # Symbol ID → resolved SVG file
 
         # Load symbol data - FAIL LOUDLY if catalog missing
-        self._load_merged_catalog()
-        self._build_indices()
+        if not (use_snapshot and self._load_snapshot()):
+            self._load_merged_catalog()
+            self._build_indices()
+
+    @property
+    def catalog_path(self) -> Path:
+        return self.assets_dir / "merged_catalog.json"
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.assets_dir / SNAPSHOT_FILENAME
+
+    def _load_snapshot(self) -> bool:
+        """Restore symbols and indices from the compiled snapshot if it is current."""
+        if not self.catalog_path.exists():
+            return False
+        state = load_snapshot(self.catalog_path, self.snapshot_path)
+        if state is None:
+            return False
+        for name in self._SNAPSHOT_STATE:
+            setattr(self, name, state[name])
+        logger.info(f"Loaded {len(self._symbols)} symbols from {self.snapshot_path.name}")
+        return True
+
+    def compile_snapshot(self, snapshot_path: Optional[Path] = None) -> Dict:
+        """Write this registry's symbols and indices as a binary snapshot.
+
+        Args:
+            snapshot_path: Output file (default: next to the catalog)
+
+        Returns:
+            Snapshot header (version, hashes, symbol count)
+        """
+        state = {name: getattr(self, name) for name in self._SNAPSHOT_STATE}
+        return write_snapshot(state, self.catalog_path, snapshot_path or self.snapshot_path)
 
     def _load_merged_catalog(self):
         """Load the merged symbol catalog.
@@ -178,7 +245,7 @@ class SymbolRegistry:
         Raises:
             CatalogNotFoundError: If catalog file is missing
         """
-        catalog_path = self.assets_dir / "merged_catalog.json"
+        catalog_path = self.catalog_path
 
         if not catalog_path.exists():
             # FAIL LOUDLY - no fallbacks
@@ -321,13 +388,26 @@ class SymbolRegistry:
         return prefix_map.get(prefix, SymbolCategory.UNKNOWN)
 
     def _build_indices(self):
-        """Build lookup indices for efficient searching."""
+        """Build lookup indices for efficient searching.
+
+        Besides the DEXPI class and category maps, precomputes lowercase
+        search fields, posting lists per source, and n-gram and word-token
+        indexes so search() and search_top_k() never scan the catalog.
+        """
         # Clear indices
         self._dexpi_map.clear()
         self._category_map.clear()
+        self._source_map.clear()
+        self._search_fields.clear()
+        self._rank_text.clear()
+        self._ngram_index.clear()
+        self._token_index.clear()
+        self._order.clear()
 
         # Build indices
-        for symbol_id, symbol in self._symbols.items():
+        for position, (symbol_id, symbol) in enumerate(self._symbols.items()):
+            self._order[symbol_id] = position
+
             # DEXPI class index
             if symbol.dexpi_class:
                 if symbol.dexpi_class not in self._dexpi_map:
@@ -339,6 +419,59 @@ class SymbolRegistry:
                 self._category_map[symbol.category] = []
             self._category_map[symbol.category].append(symbol_id)
 
+            # Source index (a merged symbol is also found under its original source)
+            for source in {symbol.source, symbol.original_source} - {None}:
+                self._source_map.setdefault(source, set()).add(symbol_id)
+
+            # Text indices
+            fields = [symbol.symbol_id, symbol.name]
+            if symbol.dexpi_class:
+                fields.append(symbol.dexpi_class)
+            if symbol.tags:
+                fields.extend(symbol.tags)
+            self._search_fields[symbol_id] = tuple(text.lower() for text in fields)
+            self._rank_text[symbol_id] = (symbol.dexpi_class or symbol.name).lower()
+            for text in fields:
+                for gram in _ngrams(text.lower()):
+                    self._ngram_index.setdefault(gram, set()).add(symbol_id)
+                for token in _tokens(text):
+                    self._token_index.setdefault(token, set()).add(symbol_id)
+
+    def _filtered_ids(
+        self,
+        category: Optional[SymbolCategory],
+        source: Optional[SymbolSource]
+    ) -> Optional[Set[str]]:
+        """Symbol IDs passing the category/source filters (None = no filter)."""
+        allowed = None
+        if category:
+            allowed = set(self._category_map.get(category, []))
+        if source:
+            by_source = self._source_map.get(source, set())
+            allowed = by_source if allowed is None else allowed & by_source
+        return allowed
+
+    def _substring_matches(self, query_lower: str, allowed: Optional[Set[str]]) -> List[str]:
+        """IDs of symbols with query_lower in a search field, in catalog order."""
+        if len(query_lower) >= NGRAM_SIZE:
+            # Every n-gram of the query must occur in the symbol's fields
+            postings = sorted(
+                (self._ngram_index.get(gram, set()) for gram in _ngrams(query_lower)),
+                key=len
+            )
+            candidates = set.intersection(*postings)
+            if allowed is not None:
+                candidates &= allowed
+        else:
+            candidates = allowed if allowed is not None else self._search_fields.keys()
+
+        matches = [
+            symbol_id for symbol_id in candidates
+            if any(query_lower in field for field in self._search_fields[symbol_id])
+        ]
+        matches.sort(key=self._order.__getitem__)
+        return matches
+
     def get_symbol(self, symbol_id: str) -> Optional[SymbolInfo]:
         """
         Get symbol information by ID.
@@ -408,26 +541,68 @@ class SymbolRegistry:
         Returns:
             List of matching symbols
         """
-        query_lower = query.lower()
-        results = []
+        allowed = self._filtered_ids(category, source)
+        return [self._symbols[sid] for sid in self._substring_matches(query.lower(), allowed)]
 
-        for symbol in self._symbols.values():
-            # Apply filters
-            if category and symbol.category != category:
-                continue
-            if source and symbol.source != source and symbol.original_source != source:
-                continue
+    def search_top_k(
+        self,
+        query: str,
+        k: int = 10,
+        category: Optional[SymbolCategory] = None,
+        source: Optional[SymbolSource] = None,
+        include_token_matches: bool = True
+    ) -> List[Tuple[SymbolInfo, float]]:
+        """
+        Search for symbols and rank them by similarity to the query.
+
+        Candidates are the search() matches plus, if include_token_matches,
+        symbols sharing a word token with the query (e.g. "Custom Ball
+        Valve" finds "BallValve"). Each is scored by the SequenceMatcher
+        ratio between the query and its DEXPI class (or name), ignoring case.
+
+        Args:
+            query: Search term
+            k: Maximum number of results
+            category: Filter by category
+            source: Filter by source
+            include_token_matches: Also rank symbols sharing a word token
 
-            # Check matches
-            if (
-                query_lower in symbol.symbol_id.lower() or
-                query_lower in symbol.name.lower() or
-                (symbol.dexpi_class and query_lower in symbol.dexpi_class.lower()) or
-                (symbol.tags and any(query_lower in tag.lower() for tag in symbol.tags))
-            ):
-                results.append(symbol)
+        Returns:
+            Up to k (symbol, score) pairs, best first; ties keep catalog order
+            (empty if k <= 0)
+        """
+        if k <= 0:
+            return []
+
+        query_lower = query.lower()
+        allowed = self._filtered_ids(category, source)
+        candidates = self._substring_matches(query_lower, allowed)
+        if include_token_matches:
+            seen = set(candidates)
+            extra = set()
+            for token in _tokens(query):
+                extra |= self._token_index.get(token, set())
+            extra -= seen
+            if allowed is not None:
+                extra &= allowed
+            candidates.extend(sorted(extra, key=self._order.__getitem__))
+
+        matcher = SequenceMatcher(None, query_lower)
+        best: List[Tuple[float, int, str]] = []  # min-heap of (score, -position, id)
+        for symbol_id in candidates:
+            matcher.set_seq2(self._rank_text[symbol_id])
+            entry_floor = best[0][0] if len(best) == k else -1.0
+            # Cheap upper bounds first: skip candidates that cannot enter the top k
+            if matcher.real_quick_ratio() < entry_floor or matcher.quick_ratio() < entry_floor:
+                continue
+            item = (matcher.ratio(), -self._order[symbol_id], symbol_id)
+            if len(best) < k:
+                heapq.heappush(best, item)
+            elif item > best[0]:
+                heapq.heapreplace(best, item)
 
-        return results
+        best.sort(reverse=True)
+        return [(self._symbols[symbol_id], score) for score, _, symbol_id in best]
 
     def get_statistics(self) -> Dict:
         """Get statistics about the symbol library."""
@@ -466,6 +641,16 @@ class SymbolRegistry:
         Returns:
             Path to SVG file if found, None otherwise
         """
+        # Files found once are not looked up on disk again
+        cached = self._path_cache.get(symbol_id)
+        if cached is not None:
+            return cached
+        path = self._find_symbol_path(symbol_id)
+        if path is not None:
+            self._path_cache[symbol_id] = path
+        return path
+
+    def _find_symbol_path(self, symbol_id: str) -> Optional[Path]:
         # Get symbol info
         symbol = self.get_symbol(symbol_id)
         if symbol and symbol.file_path:
@@ -15,11 +15,12 @@ import asyncio
 import copy
 import json
 import logging
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from pydexpi.dexpi_classes.dexpiModel import DexpiModel
 from pydexpi.dexpi_classes.dexpiBaseModels import DexpiBaseModel
@@ -28,6 +29,7 @@ from pydexpi.loaders.ml_graph_loader import MLGraphLoader
 from pydexpi.toolkits import model_toolkit as mt
 
 from ..adapters.sfiles_adapter import get_flowsheet_class
+from ..core import dexpi_serialization
 from ..registry.operation_registry import get_operation_registry
 
 logger = logging.getLogger(__name__)
@@ -73,20 +75,64 @@ class OperationRecord:
     success: bool = False
     result: Optional[Any] = None
     error: Optional[str] = None
+    duration_ms: Optional[float] = None
 
 
 @dataclass
 class StructuralDiff:
-    """Structural differences between model states."""
+    """Structural differences between model states.
+
+    The lists keep insertion order for responses; record_* methods keep
+    private sets alongside them so membership checks stay O(1) across large
+    batches. A set is rebuilt from its list when the list length differs
+    from the length it was last synced at, which picks up appends and
+    removals made directly on a list. Other direct edits (replacing an item
+    in place or the whole list) are not supported once record_* is in use.
+    """
     added: List[str] = field(default_factory=list)      # Added component IDs
     removed: List[str] = field(default_factory=list)    # Removed component IDs
     modified: List[str] = field(default_factory=list)   # Modified component IDs
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        self._added: Set[str] = set(self.added)
+        self._removed: Set[str] = set(self.removed)
+        self._modified: Set[str] = set(self.modified)
+        # List lengths the sets were last synced at (lists may hold duplicates)
+        self._synced = {"added": len(self.added), "removed": len(self.removed),
+                        "modified": len(self.modified)}
+
     def is_empty(self) -> bool:
         """Check if diff has any changes."""
         return not (self.added or self.removed or self.modified)
 
+    def _index(self, kind: str) -> Set[str]:
+        items = getattr(self, kind)
+        if len(items) != self._synced[kind]:
+            setattr(self, f"_{kind}", set(items))
+            self._synced[kind] = len(items)
+        return getattr(self, f"_{kind}")
+
+    def _record(self, kind: str, component_id: str) -> None:
+        index = self._index(kind)
+        if component_id not in index:
+            index.add(component_id)
+            getattr(self, kind).append(component_id)
+            self._synced[kind] += 1
+
+    def record_added(self, component_id: str) -> None:
+        """Track an added component (once)."""
+        self._record("added", component_id)
+
+    def record_removed(self, component_id: str) -> None:
+        """Track a removed component (once)."""
+        self._record("removed", component_id)
+
+    def record_modified(self, component_id: str) -> None:
+        """Track a modified component, unless it was added in this diff."""
+        if component_id not in self._index("added"):
+            self._record("modified", component_id)
+
 
 @dataclass
 class ValidationResult:
@@ -105,6 +151,15 @@ class CommitResult:
     validation: Optional[ValidationResult] = None
 
 
+@dataclass
+class BatchApplyResult:
+    """Result of applying a batch of operations in one transaction call."""
+    transaction_id: str
+    records: List[OperationRecord]
+    total_ms: float
+    post_validation_ms: float = 0.0
+
+
 @dataclass
 class Transaction:
     """Represents an active transaction."""
@@ -278,6 +333,8 @@ class TransactionManager:
         # Initialize serializers
         self.json_serializer = JsonSerializer()
         self.graph_loader = MLGraphLoader()
+        # DEXPI snapshots never leave the process: use the fastest encoding
+        self.snapshot_format = dexpi_serialization.fastest_format()
 
         # Initialize operation registry
         self.registry = get_operation_registry()
@@ -383,61 +440,86 @@ class TransactionManager:
             OperationExecutionError: If operation fails
         """
         async with self._lock:
-            # Get transaction
-            transaction = self._get_transaction(transaction_id)
-
-            if transaction.status != TransactionStatus.ACTIVE:
-                raise TransactionNotActive(
-                    f"Transaction {transaction_id} is not active (status: {transaction.status.value})"
-                )
-
-            # Get working model
+            transaction = self._get_active(transaction_id)
             working_model = self._get_working_model(transaction)
 
-            # Record operation attempt
-            op_record = OperationRecord(
-                operation=operation_name,
-                params=params,
-                timestamp=datetime.now(datetime.UTC) if hasattr(datetime, 'UTC') else datetime.utcnow()
+            op_record = await self._execute_operation(
+                transaction, working_model, operation_name, params, executor=executor
             )
+            return op_record.result
 
-            try:
-                # Execute operation via registry or custom executor
-                if executor:
-                    # Custom executor provided - use it
-                    result = executor(working_model, params)
-                elif self.registry.exists(operation_name):
-                    # Use operation registry (default path)
-                    result = await self.registry.execute(
-                        model=working_model,
-                        operation_name=operation_name,
-                        params=params,
-                        enable_validation=True
-                    )
-                else:
-                    # Fallback for unregistered operations
-                    result = {"status": "success", "message": f"Operation {operation_name} applied (unregistered)"}
+    async def apply_batch(
+        self,
+        transaction_id: str,
+        operations: List[Dict[str, Any]]
+    ) -> BatchApplyResult:
+        """
+        Apply a batch of operations under a single lock acquisition.
 
-                op_record.result = result
-                op_record.success = True
+        Compared to calling apply() per operation, the batch fetches the
+        working model once and defers operation post-validation hooks until
+        every operation has run. Pre-validation hooks still run inline
+        because later operations may depend on earlier ones. Each record
+        carries its own duration_ms.
 
-                # Update working model cache
-                transaction._working_model = working_model
+        Args:
+            transaction_id: Transaction identifier
+            operations: [{"operation": str, "params": dict}, ...]
 
-                # Update diff using operation's DiffMetadata if available
-                self._update_diff(transaction, operation_name, params, result)
+        Returns:
+            BatchApplyResult with one OperationRecord per operation
 
-                return result
+        Raises:
+            TransactionNotFound: If transaction doesn't exist
+            TransactionNotActive: If transaction not in ACTIVE state
+            OperationExecutionError: On the first failing operation or
+                deferred post-validation failure (earlier operations stay
+                applied to the working model, as with apply())
+        """
+        started = time.perf_counter()
 
-            except Exception as e:
-                op_record.error = str(e)
-                op_record.success = False
-                raise OperationExecutionError(
-                    f"Operation {operation_name} failed: {e}"
-                ) from e
+        async with self._lock:
+            transaction = self._get_active(transaction_id)
+            working_model = self._get_working_model(transaction)
 
-            finally:
-                transaction.operations.append(op_record)
+            records = []
+            for index, op in enumerate(operations):
+                try:
+                    record = await self._execute_operation(
+                        transaction,
+                        working_model,
+                        op["operation"],
+                        op["params"],
+                        defer_post_validation=True
+                    )
+                except OperationExecutionError as e:
+                    raise OperationExecutionError(
+                        f"Batch operation {index} failed: {e}"
+                    ) from e
+                records.append(record)
+
+            # Deferred post-validation against the final working model
+            validation_started = time.perf_counter()
+            for index, record in enumerate(records):
+                if not self.registry.exists(record.operation):
+                    continue
+                try:
+                    self.registry.validate_post(record.operation, working_model, record.result)
+                except Exception as e:
+                    record.success = False
+                    record.error = str(e)
+                    raise OperationExecutionError(
+                        f"Batch operation {index} ({record.operation}) failed "
+                        f"post-validation: {e}"
+                    ) from e
+            post_validation_ms = (time.perf_counter() - validation_started) * 1000
+
+        return BatchApplyResult(
+            transaction_id=transaction_id,
+            records=records,
+            total_ms=(time.perf_counter() - started) * 1000,
+            post_validation_ms=post_validation_ms
+        )
 
     async def commit(
         self,
@@ -617,6 +699,79 @@ class TransactionManager:
             raise TransactionNotFound(f"Transaction {transaction_id} not found")
         return self.transactions[transaction_id]
 
+    def _get_active(self, transaction_id: str) -> Transaction:
+        """Get transaction by ID, requiring ACTIVE status."""
+        transaction = self._get_transaction(transaction_id)
+        if transaction.status != TransactionStatus.ACTIVE:
+            raise TransactionNotActive(
+                f"Transaction {transaction_id} is not active (status: {transaction.status.value})"
+            )
+        return transaction
+
+    async def _execute_operation(
+        self,
+        transaction: Transaction,
+        working_model: Model,
+        operation_name: str,
+        params: Dict[str, Any],
+        executor: Optional[callable] = None,
+        defer_post_validation: bool = False
+    ) -> OperationRecord:
+        """
+        Execute one operation against the working model and record it.
+
+        Caller must hold self._lock.
+
+        Raises:
+            OperationExecutionError: If the operation fails
+        """
+        op_record = OperationRecord(
+            operation=operation_name,
+            params=params,
+            timestamp=datetime.now(datetime.UTC) if hasattr(datetime, 'UTC') else datetime.utcnow()
+        )
+        started = time.perf_counter()
+
+        try:
+            # Execute operation via registry or custom executor
+            if executor:
+                # Custom executor provided - use it
+                result = executor(working_model, params)
+            elif self.registry.exists(operation_name):
+                # Use operation registry (default path)
+                result = await self.registry.execute(
+                    model=working_model,
+                    operation_name=operation_name,
+                    params=params,
+                    enable_validation=True,
+                    run_post_validation=not defer_post_validation
+                )
+            else:
+                # Fallback for unregistered operations
+                result = {"status": "success", "message": f"Operation {operation_name} applied (unregistered)"}
+
+            op_record.result = result
+            op_record.success = True
+
+            # Update working model cache
+            transaction._working_model = working_model
+
+            # Update diff using operation's DiffMetadata if available
+            self._update_diff(transaction, operation_name, params, result)
+
+            return op_record
+
+        except Exception as e:
+            op_record.error = str(e)
+            op_record.success = False
+            raise OperationExecutionError(
+                f"Operation {operation_name} failed: {e}"
+            ) from e
+
+        finally:
+            op_record.duration_ms = (time.perf_counter() - started) * 1000
+            transaction.operations.append(op_record)
+
     def _get_active_transaction(self, model_id: str) -> Optional[Transaction]:
         """Get active transaction for model, if any."""
         for tx in self.transactions.values():
@@ -669,11 +824,7 @@ class TransactionManager:
             Serialized model bytes
         """
         if model_type == ModelType.DEXPI:
-            # Use JsonSerializer for DEXPI (pydexpi.loaders)
-            import json
-            model_dict = self.json_serializer.model_to_dict(model)
-            json_str = json.dumps(model_dict)
-            return json_str.encode('utf-8')
+            return dexpi_serialization.dumps(model, self.snapshot_format)
         else:
             # Use SFILES canonical format
             # Call convert_to_sfiles() which populates model.sfiles
@@ -697,11 +848,7 @@ class TransactionManager:
             Deserialized model
         """
         if model_type == ModelType.DEXPI:
-            # Deserialize DEXPI JSON
-            import json
-            json_str = snapshot.decode('utf-8')
-            model_dict = json.loads(json_str)
-            return self.json_serializer.dict_to_model(model_dict)
+            return dexpi_serialization.loads(snapshot, self.snapshot_format)
         else:
             # Deserialize SFILES
             Flowsheet = get_flowsheet_class()
@@ -800,16 +947,14 @@ class TransactionManager:
         if diff_metadata:
             component_id = params.get("tag_name", params.get("component_id", "unknown"))
 
-            if diff_metadata.tracks_additions and component_id not in transaction.diff.added:
-                transaction.diff.added.append(component_id)
+            if diff_metadata.tracks_additions:
+                transaction.diff.record_added(component_id)
 
-            if diff_metadata.tracks_removals and component_id not in transaction.diff.removed:
-                transaction.diff.removed.append(component_id)
+            if diff_metadata.tracks_removals:
+                transaction.diff.record_removed(component_id)
 
-            if diff_metadata.tracks_modifications and \
-               component_id not in transaction.diff.modified and \
-               component_id not in transaction.diff.added:
-                transaction.diff.modified.append(component_id)
+            if diff_metadata.tracks_modifications:
+                transaction.diff.record_modified(component_id)
 
             # Use custom diff calculator if provided
             if diff_metadata.diff_calculator:
@@ -825,21 +970,17 @@ class TransactionManager:
             if "add" in operation_name or "create" in operation_name:
                 # Track as addition
                 component_id = params.get("tag_name", "unknown")
-                if component_id not in transaction.diff.added:
-                    transaction.diff.added.append(component_id)
+                transaction.diff.record_added(component_id)
 
             elif "delete" in operation_name or "remove" in operation_name:
                 # Track as removal
                 component_id = params.get("tag_name", params.get("component_id", "unknown"))
-                if component_id not in transaction.diff.removed:
-                    transaction.diff.removed.append(component_id)
+                transaction.diff.record_removed(component_id)
 
             else:
                 # Track as modification
                 component_id = params.get("tag_name", params.get("component_id", "unknown"))
-                if component_id not in transaction.diff.modified and \
-                   component_id not in transaction.diff.added:
-                    transaction.diff.modified.append(component_id)
+                transaction.diff.record_modified(component_id)
 
     def _cleanup_transaction(self, transaction_id: str) -> None:
         """
@@ -0,0 +1,597 @@
+"""Columnar (NumPy-backed) representation of layout metadata.
+
+``LayoutMetadata`` holds one pydantic object per node, port, label and edge
+section, so a large P&ID layout costs tens of thousands of objects to build,
+copy and dump. ``ColumnarLayout`` stores the same content as id lists plus
+coordinate arrays:
+
+- nodes: ``node_ids`` + ``node_xy`` (n, 2)
+- ports: ``port_ids`` + ``port_xy`` / ``port_size`` (m, 2), side, index
+- labels: ``label_ids`` + ``label_box`` (k, 4) as x, y, width, height
+- edges: CSR-style buffers. ``edge_section_ptr`` slices ``section_points``
+  (start x, start y, end x, end y) per edge and ``bend_ptr`` slices
+  ``bend_points`` per section.
+
+Geometry operations (bounding box, translate, scale, hit-testing) are
+vectorized. ``metadata`` builds a ``LayoutMetadata`` view lazily for code
+that expects the pydantic API, and ``to_dict``/``from_dict`` read and write
+the ``LayoutMetadata.to_dict`` file format without going through pydantic.
+
+Coordinates are float64 so values round-trip exactly through JSON and the
+etag of a converted layout is unchanged.
+
+Requires NumPy (``pip install .[analytics]``).
+"""
+
+from copy import deepcopy
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .layout_metadata import (
+    BoundingBox,
+    EdgeRoute,
+    LabelPosition,
+    LayoutMetadata,
+)
+
+COORD_DTYPE = np.float64
+
+# Scalar LayoutMetadata fields carried through unchanged
+HEADER_FIELDS = (
+    "layout_id",
+    "model_ref",
+    "model_revision",
+    "version",
+    "etag",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "algorithm",
+    "layout_options",
+    "page_size",
+    "units",
+    "origin",
+    "rotation",
+    "bounding_box",
+    "parameters",
+    "timestamp",
+)
+
+_PORT_DEFAULT_SIZE = (8.0, 8.0)
+
+
+def _points(values: Sequence, width: int) -> np.ndarray:
+    """Build an (n, width) coordinate array, empty-safe."""
+    array = np.asarray(values, dtype=COORD_DTYPE)
+    return array.reshape(-1, width)
+
+
+def _pair(point: Optional[Sequence[float]]) -> Tuple[float, float]:
+    """Edge endpoint as a pair, NaN for absent."""
+    if point is None:
+        return (np.nan, np.nan)
+    return (point[0], point[1])
+
+
+@dataclass
+class ColumnarLayout:
+    """Columnar layout content (see module docstring for the layout).
+
+    Instances are treated as immutable: geometry operations return new
+    layouts, and the lazy ``metadata`` view is cached per instance.
+    """
+
+    header: Dict[str, Any]
+
+    node_ids: List[str]
+    node_xy: np.ndarray
+
+    port_ids: List[str] = field(default_factory=list)
+    port_xy: np.ndarray = field(default_factory=lambda: _points([], 2))
+    port_size: np.ndarray = field(default_factory=lambda: _points([], 2))
+    port_side: List[str] = field(default_factory=list)
+    port_index: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    port_anchor: Dict[int, Tuple[float, float]] = field(default_factory=dict)
+
+    label_ids: List[str] = field(default_factory=list)
+    label_box: np.ndarray = field(default_factory=lambda: _points([], 4))
+    label_rotation: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=COORD_DTYPE))
+    label_text: List[str] = field(default_factory=list)
+    label_origin: List[str] = field(default_factory=list)
+    label_kind: List[str] = field(default_factory=list)
+
+    edge_ids: List[str] = field(default_factory=list)
+    edge_section_ptr: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    edge_source_port: List[Optional[str]] = field(default_factory=list)
+    edge_target_port: List[Optional[str]] = field(default_factory=list)
+    edge_endpoints: np.ndarray = field(default_factory=lambda: _points([], 4))
+    edge_labels: Dict[int, List[Dict[str, Any]]] = field(default_factory=dict)
+    section_ids: List[Optional[str]] = field(default_factory=list)
+    section_points: np.ndarray = field(default_factory=lambda: _points([], 4))
+    bend_ptr: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    bend_points: np.ndarray = field(default_factory=lambda: _points([], 2))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_layout(cls, layout: LayoutMetadata) -> "ColumnarLayout":
+        """Convert a LayoutMetadata to columnar form."""
+        header = {name: getattr(layout, name) for name in HEADER_FIELDS}
+        header["model_ref"] = layout.model_ref.model_dump() if layout.model_ref else None
+        header["bounding_box"] = (
+            layout.bounding_box.model_dump() if layout.bounding_box else None
+        )
+        header["layout_options"] = deepcopy(layout.layout_options)
+        header["rotation"] = dict(layout.rotation)
+
+        builder = _ColumnBuilder()
+        for node_id, pos in layout.positions.items():
+            builder.add_node(node_id, pos.x, pos.y)
+        for port_id, port in layout.port_layouts.items():
+            builder.add_port(port_id, port.model_dump())
+        for label_id, label in layout.labels.items():
+            builder.add_label(label_id, label.model_dump())
+        for edge_id, edge in layout.edges.items():
+            builder.add_edge(
+                edge_id,
+                [
+                    (s.id, s.startPoint, s.endPoint, s.bendPoints)
+                    for s in edge.sections
+                ],
+                edge.source_port,
+                edge.target_port,
+                edge.sourcePoint,
+                edge.targetPoint,
+                [label.model_dump() for label in edge.labels],
+            )
+        return builder.build(header)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnarLayout":
+        """Build from the ``LayoutMetadata.to_dict`` / layout file format.
+
+        Raises:
+            ValueError: If positions are missing or malformed
+        """
+        positions = data.get("positions")
+        if not positions:
+            raise ValueError("Layout must have at least one positioned node")
+
+        header = {name: data.get(name) for name in HEADER_FIELDS}
+        header["version"] = data.get("version", 1)
+        header["layout_options"] = deepcopy(data.get("layout_options", {}))
+        header["units"] = data.get("units", "mm")
+        header["origin"] = data.get("origin", "top-left")
+        header["rotation"] = dict(data.get("rotation", {}))
+        page_size = data.get("page_size")
+        header["page_size"] = tuple(page_size) if page_size else (841.0, 594.0)
+        if "algorithm" not in data:
+            raise ValueError("Layout data is missing 'algorithm'")
+
+        builder = _ColumnBuilder()
+        for node_id, pos in positions.items():
+            if isinstance(pos, dict):
+                builder.add_node(node_id, pos["x"], pos["y"])
+            else:
+                if len(pos) != 2:
+                    raise ValueError(
+                        f"Position must be [x, y], got {len(pos)} elements for {node_id}"
+                    )
+                builder.add_node(node_id, pos[0], pos[1])
+        for port_id, port in data.get("port_layouts", {}).items():
+            builder.add_port(port_id, port)
+        for label_id, label in data.get("labels", {}).items():
+            builder.add_label(label_id, label)
+        for edge_id, edge in data.get("edges", {}).items():
+            builder.add_edge(
+                edge_id,
+                [
+                    (s.get("id"), s["startPoint"], s["endPoint"], s.get("bendPoints", []))
+                    for s in edge.get("sections", [])
+                ],
+                edge.get("source_port"),
+                edge.get("target_port"),
+                edge.get("sourcePoint"),
+                edge.get("targetPoint"),
+                [LabelPosition(**label).model_dump() for label in edge.get("labels", [])],
+            )
+        return builder.build(header)
+
+    # ------------------------------------------------------------------
+    # Views and serialization
+    # ------------------------------------------------------------------
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_ids)
+
+    def node_position(self, node_id: str) -> Tuple[float, float]:
+        """Position of one node.
+
+        Raises:
+            KeyError: If the node is not in the layout
+        """
+        x, y = self.node_xy[self._node_index[node_id]]
+        return float(x), float(y)
+
+    @cached_property
+    def _node_index(self) -> Dict[str, int]:
+        return {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    def edge_points(self, edge_id: str) -> List[Tuple[float, float]]:
+        """All points of an edge route (same as EdgeRoute.get_all_points)."""
+        record = self._edge_records()[self.edge_ids.index(edge_id)]
+        return EdgeRoute.model_validate(record).get_all_points()
+
+    @cached_property
+    def metadata(self) -> LayoutMetadata:
+        """LayoutMetadata view, built on first access."""
+        return self.to_layout()
+
+    def to_layout(self) -> LayoutMetadata:
+        """Build a new LayoutMetadata with the same content.
+
+        The whole layout is validated in a single ``model_validate`` call,
+        which pydantic-core runs natively; that is faster than constructing
+        each entry model from Python.
+        """
+        data = dict(self.header)
+        data["layout_options"] = deepcopy(data["layout_options"])
+        data["rotation"] = dict(data["rotation"])
+        data["positions"] = {
+            node_id: {"x": x, "y": y}
+            for node_id, (x, y) in zip(self.node_ids, self.node_xy.tolist(), strict=True)
+        }
+        data["port_layouts"] = dict(zip(self.port_ids, self._port_records(), strict=True))
+        data["labels"] = dict(zip(self.label_ids, self._label_records(), strict=True))
+        data["edges"] = dict(zip(self.edge_ids, self._edge_records(), strict=True))
+        return LayoutMetadata.model_validate(data)
+
+    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
+        """Serialize to the ``LayoutMetadata.to_dict`` format.
+
+        Args:
+            exclude_none: If True, exclude None values from output
+
+        Returns:
+            Dictionary with sorted top-level keys
+        """
+        data = {name: value for name, value in self.header.items()}
+        data["layout_options"] = deepcopy(data["layout_options"])
+        data["rotation"] = dict(data["rotation"])
+        if data["bounding_box"] is None:
+            data["bounding_box"] = self.bounding_box().model_dump()
+
+        data["positions"] = dict(zip(self.node_ids, self.node_xy.tolist(), strict=True))
+        data["port_layouts"] = {
+            port_id: _drop_none(record, exclude_none)
+            for port_id, record in zip(self.port_ids, self._port_records(), strict=True)
+        }
+        data["labels"] = dict(zip(self.label_ids, self._label_records(), strict=True))
+        data["edges"] = dict(zip(self.edge_ids, self._edge_records(exclude_none), strict=True))
+
+        if exclude_none:
+            data = {k: v for k, v in data.items() if v is not None}
+        return dict(sorted(data.items()))
+
+    def copy(self) -> "ColumnarLayout":
+        """Deep copy (array buffers are copied, not shared)."""
+        return self._replace(
+            header=deepcopy(self.header),
+            node_ids=list(self.node_ids),
+            node_xy=self.node_xy.copy(),
+            port_ids=list(self.port_ids),
+            port_xy=self.port_xy.copy(),
+            port_size=self.port_size.copy(),
+            port_side=list(self.port_side),
+            port_index=self.port_index.copy(),
+            port_anchor=dict(self.port_anchor),
+            label_ids=list(self.label_ids),
+            label_box=self.label_box.copy(),
+            label_rotation=self.label_rotation.copy(),
+            label_text=list(self.label_text),
+            label_origin=list(self.label_origin),
+            label_kind=list(self.label_kind),
+            edge_ids=list(self.edge_ids),
+            edge_section_ptr=self.edge_section_ptr.copy(),
+            edge_source_port=list(self.edge_source_port),
+            edge_target_port=list(self.edge_target_port),
+            edge_endpoints=self.edge_endpoints.copy(),
+            edge_labels=deepcopy(self.edge_labels),
+            section_ids=list(self.section_ids),
+            section_points=self.section_points.copy(),
+            bend_ptr=self.bend_ptr.copy(),
+            bend_points=self.bend_points.copy(),
+        )
+
+    # ------------------------------------------------------------------
+    # Vectorized geometry
+    # ------------------------------------------------------------------
+
+    def bounding_box(self) -> BoundingBox:
+        """Bounding box of node positions (as BoundingBox.from_positions)."""
+        min_x, min_y = self.node_xy.min(axis=0).tolist()
+        max_x, max_y = self.node_xy.max(axis=0).tolist()
+        return BoundingBox.model_construct(min_x=min_x, max_x=max_x, min_y=min_y, max_y=max_y)
+
+    def translate(self, dx: float, dy: float) -> "ColumnarLayout":
+        """Shift absolute geometry by (dx, dy).
+
+        Node positions, edge sections, bend points, edge endpoints and edge
+        labels move. Ports and node labels are positioned relative to their
+        node and are unchanged. The stored bounding box and etag are reset.
+        """
+        offset = np.array([dx, dy], dtype=COORD_DTYPE)
+        return self._transform(lambda xy: xy + offset)
+
+    def scale(self, factor: float, origin: Tuple[float, float] = (0.0, 0.0)) -> "ColumnarLayout":
+        """Scale absolute geometry about origin (see translate for scope)."""
+        center = np.asarray(origin, dtype=COORD_DTYPE)
+        return self._transform(lambda xy: (xy - center) * factor + center)
+
+    def hit_test(self, x: float, y: float, radius: float) -> List[str]:
+        """Node ids within radius of (x, y), nearest first."""
+        distance = np.hypot(self.node_xy[:, 0] - x, self.node_xy[:, 1] - y)
+        hits = np.flatnonzero(distance <= radius)
+        order = hits[np.argsort(distance[hits], kind="stable")]
+        return [self.node_ids[i] for i in order.tolist()]
+
+    def nodes_in_rect(self, min_x: float, min_y: float,
+                      max_x: float, max_y: float) -> List[str]:
+        """Node ids whose position lies inside the rectangle (inclusive)."""
+        xy = self.node_xy
+        mask = (xy[:, 0] >= min_x) & (xy[:, 0] <= max_x) & (xy[:, 1] >= min_y) & (xy[:, 1] <= max_y)
+        return [self.node_ids[i] for i in np.flatnonzero(mask).tolist()]
+
+    def edges_in_rect(self, min_x: float, min_y: float,
+                      max_x: float, max_y: float) -> List[str]:
+        """Edge ids with any section point or bend point inside the rectangle."""
+        def inside(xy: np.ndarray) -> np.ndarray:
+            return (xy[:, 0] >= min_x) & (xy[:, 0] <= max_x) & (xy[:, 1] >= min_y) & (xy[:, 1] <= max_y)
+
+        section_hit = inside(self.section_points[:, :2]) | inside(self.section_points[:, 2:])
+        if len(self.bend_points):
+            bend_section = np.repeat(np.arange(len(self.section_ids)), np.diff(self.bend_ptr))
+            section_hit[bend_section[inside(self.bend_points)]] = True
+        section_edge = np.repeat(np.arange(len(self.edge_ids)), np.diff(self.edge_section_ptr))
+        return [self.edge_ids[i] for i in np.unique(section_edge[section_hit]).tolist()]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _replace(self, **changes: Any) -> "ColumnarLayout":
+        # dataclasses.replace re-runs __init__, so cached views are not copied
+        return replace(self, **changes)
+
+    def _transform(self, fn) -> "ColumnarLayout":
+        header = dict(self.header)
+        header["bounding_box"] = None
+        header["etag"] = None
+
+        edge_labels = {}
+        for i, labels in self.edge_labels.items():
+            moved = []
+            for label in labels:
+                (x, y), = fn(np.array([[label["x"], label["y"]]], dtype=COORD_DTYPE)).tolist()
+                moved.append({**label, "x": x, "y": y})
+            edge_labels[i] = moved
+
+        sections = self.section_points
+        return self._replace(
+            header=header,
+            node_xy=fn(self.node_xy),
+            edge_endpoints=np.hstack([fn(self.edge_endpoints[:, :2]), fn(self.edge_endpoints[:, 2:])]),
+            edge_labels=edge_labels,
+            section_points=np.hstack([fn(sections[:, :2]), fn(sections[:, 2:])]),
+            bend_points=fn(self.bend_points),
+        )
+
+    def _port_records(self) -> List[Dict[str, Any]]:
+        records = []
+        xy = self.port_xy.tolist()
+        size = self.port_size.tolist()
+        index = self.port_index.tolist()
+        for i, port_id in enumerate(self.port_ids):
+            records.append({
+                "id": port_id,
+                "x": xy[i][0],
+                "y": xy[i][1],
+                "width": size[i][0],
+                "height": size[i][1],
+                "side": self.port_side[i],
+                "index": index[i],
+                "anchor": self.port_anchor.get(i),
+            })
+        return records
+
+    def _label_records(self) -> List[Dict[str, Any]]:
+        box = self.label_box.tolist()
+        rotation = self.label_rotation.tolist()
+        return [
+            {
+                "x": box[i][0],
+                "y": box[i][1],
+                "width": box[i][2],
+                "height": box[i][3],
+                "text": self.label_text[i],
+                "rotation": rotation[i],
+                "rotation_origin": self.label_origin[i],
+                "kind": self.label_kind[i],
+            }
+            for i in range(len(self.label_ids))
+        ]
+
+    def _edge_records(self, exclude_none: bool = False) -> List[Dict[str, Any]]:
+        """Per-edge dicts in ``EdgeRoute.model_dump`` shape.
+
+        Buffers are converted with one ``tolist()`` each and sliced as Python
+        lists, which is much cheaper than slicing arrays per edge.
+        """
+        section_ptr = self.edge_section_ptr.tolist()
+        bend_ptr = self.bend_ptr.tolist()
+        points = self.section_points.tolist()
+        bends = [tuple(p) for p in self.bend_points.tolist()]
+        endpoints = self.edge_endpoints.tolist()
+
+        records = []
+        for i in range(len(self.edge_ids)):
+            sections = []
+            for s in range(section_ptr[i], section_ptr[i + 1]):
+                sx, sy, ex, ey = points[s]
+                section = {
+                    "id": self.section_ids[s],
+                    "startPoint": (sx, sy),
+                    "endPoint": (ex, ey),
+                    "bendPoints": bends[bend_ptr[s]:bend_ptr[s + 1]],
+                }
+                if exclude_none and section["id"] is None:
+                    del section["id"]
+                sections.append(section)
+
+            px, py, tx, ty = endpoints[i]
+            record = {
+                "sections": sections,
+                "source_port": self.edge_source_port[i],
+                "target_port": self.edge_target_port[i],
+                # NaN marks an absent endpoint (NaN != NaN)
+                "sourcePoint": (px, py) if px == px else None,
+                "targetPoint": (tx, ty) if tx == tx else None,
+                "labels": [dict(label) for label in self.edge_labels.get(i, [])],
+            }
+            records.append(_drop_none(record, exclude_none))
+        return records
+
+
+def _drop_none(record: Dict[str, Any], exclude_none: bool) -> Dict[str, Any]:
+    if not exclude_none:
+        return record
+    return {k: v for k, v in record.items() if v is not None}
+
+
+class _ColumnBuilder:
+    """Accumulates Python lists and converts them to arrays once."""
+
+    _SIDES = frozenset({"NORTH", "SOUTH", "EAST", "WEST"})
+
+    def __init__(self):
+        self.node_ids: List[str] = []
+        self.node_xy: List[Tuple[float, float]] = []
+        self.port_ids: List[str] = []
+        self.port_xy: List[Tuple[float, float]] = []
+        self.port_size: List[Tuple[float, float]] = []
+        self.port_side: List[str] = []
+        self.port_index: List[int] = []
+        self.port_anchor: Dict[int, Tuple[float, float]] = {}
+        self.label_ids: List[str] = []
+        self.label_box: List[Tuple[float, float, float, float]] = []
+        self.label_rotation: List[float] = []
+        self.label_text: List[str] = []
+        self.label_origin: List[str] = []
+        self.label_kind: List[str] = []
+        self.edge_ids: List[str] = []
+        self.edge_section_ptr: List[int] = [0]
+        self.edge_source_port: List[Optional[str]] = []
+        self.edge_target_port: List[Optional[str]] = []
+        self.edge_endpoints: List[Tuple[float, float, float, float]] = []
+        self.edge_labels: Dict[int, List[Dict[str, Any]]] = {}
+        self.section_ids: List[Optional[str]] = []
+        self.section_points: List[Tuple[float, float, float, float]] = []
+        self.bend_ptr: List[int] = [0]
+        self.bend_points: List[Sequence[float]] = []
+
+    def add_node(self, node_id: str, x: float, y: float) -> None:
+        self.node_ids.append(node_id)
+        self.node_xy.append((x, y))
+
+    def add_port(self, port_id: str, port: Dict[str, Any]) -> None:
+        side = port["side"]
+        if side not in self._SIDES:
+            raise ValueError(f"Port {port_id} has invalid side {side!r}")
+        index = len(self.port_ids)
+        self.port_ids.append(port.get("id", port_id))
+        self.port_xy.append((port["x"], port["y"]))
+        self.port_size.append((
+            port.get("width", _PORT_DEFAULT_SIZE[0]),
+            port.get("height", _PORT_DEFAULT_SIZE[1]),
+        ))
+        self.port_side.append(side)
+        self.port_index.append(port.get("index", 0))
+        anchor = port.get("anchor")
+        if anchor is not None:
+            self.port_anchor[index] = (float(anchor[0]), float(anchor[1]))
+
+    def add_label(self, label_id: str, label: Dict[str, Any]) -> None:
+        self.label_ids.append(label_id)
+        self.label_box.append((
+            label["x"], label["y"], label.get("width", 0.0), label.get("height", 0.0)
+        ))
+        self.label_rotation.append(label.get("rotation", 0.0))
+        self.label_text.append(label.get("text", ""))
+        self.label_origin.append(label.get("rotation_origin", "center"))
+        self.label_kind.append(label.get("kind", "node"))
+
+    def add_edge(self, edge_id: str, sections, source_port, target_port,
+                 source_point, target_point, labels: List[Dict[str, Any]]) -> None:
+        index = len(self.edge_ids)
+        self.edge_ids.append(edge_id)
+        for section_id, start, end, bends in sections:
+            self.section_ids.append(section_id)
+            self.section_points.append((start[0], start[1], end[0], end[1]))
+            self.bend_points.extend(bends)
+            self.bend_ptr.append(len(self.bend_points))
+        self.edge_section_ptr.append(len(self.section_ids))
+        self.edge_source_port.append(source_port)
+        self.edge_target_port.append(target_port)
+        self.edge_endpoints.append(_pair(source_point) + _pair(target_point))
+        if labels:
+            self.edge_labels[index] = [
+                {**label, "x": float(label["x"]), "y": float(label["y"]),
+                 "width": float(label["width"]), "height": float(label["height"]),
+                 "rotation": float(label["rotation"])}
+                for label in labels
+            ]
+
+    def build(self, header: Dict[str, Any]) -> ColumnarLayout:
+        return ColumnarLayout(
+            header=header,
+            node_ids=self.node_ids,
+            node_xy=_points(self.node_xy, 2),
+            port_ids=self.port_ids,
+            port_xy=_points(self.port_xy, 2),
+            port_size=_points(self.port_size, 2),
+            port_side=self.port_side,
+            port_index=np.asarray(self.port_index, dtype=np.int64),
+            port_anchor=self.port_anchor,
+            label_ids=self.label_ids,
+            label_box=_points(self.label_box, 4),
+            label_rotation=np.asarray(self.label_rotation, dtype=COORD_DTYPE),
+            label_text=self.label_text,
+            label_origin=self.label_origin,
+            label_kind=self.label_kind,
+            edge_ids=self.edge_ids,
+            edge_section_ptr=np.asarray(self.edge_section_ptr, dtype=np.int64),
+            edge_source_port=self.edge_source_port,
+            edge_target_port=self.edge_target_port,
+            edge_endpoints=_points(self.edge_endpoints, 4),
+            edge_labels=self.edge_labels,
+            section_ids=self.section_ids,
+            section_points=_points(self.section_points, 4),
+            bend_ptr=np.asarray(self.bend_ptr, dtype=np.int64),
+            bend_points=_points(self.bend_points, 2),
+        )
+
+
+__all__ = [
+    "COORD_DTYPE",
+    "ColumnarLayout",
+]
@@ -22,9 +22,12 @@ import hashlib
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+
+if TYPE_CHECKING:
+    from .layout_columns import ColumnarLayout
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,8 @@ class NodePosition(BaseModel):
         y: Vertical coordinate
     """
 
+    model_config = {"frozen": True}
+
     x: float = Field(..., description="Horizontal coordinate")
     y: float = Field(..., description="Vertical coordinate")
 
@@ -80,6 +85,8 @@ class BoundingBox(BaseModel):
         height: Computed height (max_y - min_y)
     """
 
+    model_config = {"frozen": True}
+
     min_x: float = Field(..., description="Minimum x coordinate")
     max_x: float = Field(..., description="Maximum x coordinate")
     min_y: float = Field(..., description="Minimum y coordinate")
@@ -141,6 +148,8 @@ class LabelPosition(BaseModel):
     Used for node labels, edge labels (line numbers), and port labels.
     """
 
+    model_config = {"frozen": True}
+
     x: float = Field(..., description="X coordinate of label")
     y: float = Field(..., description="Y coordinate of label")
     width: float = Field(default=0.0, description="Label width (for bounding)")
@@ -163,16 +172,18 @@ class EdgeSection(BaseModel):
     and optional bend points for orthogonal routing.
     """
 
+    model_config = {"frozen": True}
+
     id: Optional[str] = Field(default=None, description="Section ID (ELK may omit)")
     startPoint: Tuple[float, float] = Field(..., description="Start point (x, y)")
     endPoint: Tuple[float, float] = Field(..., description="End point (x, y)")
-    bendPoints: List[Tuple[float, float]] = Field(
-        default_factory=list, description="Bend points for orthogonal routing"
+    bendPoints: Tuple[Tuple[float, float], ...] = Field(
+        default_factory=tuple, description="Bend points for orthogonal routing"
     )
 
     def get_all_points(self) -> List[Tuple[float, float]]:
         """Get all points in order: start -> bends -> end."""
-        return [self.startPoint] + self.bendPoints + [self.endPoint]
+        return [self.startPoint, *self.bendPoints, self.endPoint]
 
 
 class EdgeRoute(BaseModel):
@@ -182,8 +193,10 @@ class EdgeRoute(BaseModel):
     plus metadata about source/target ports and labels.
     """
 
-    sections: List[EdgeSection] = Field(
-        default_factory=list, description="Edge sections (segments)"
+    model_config = {"frozen": True}
+
+    sections: Tuple[EdgeSection, ...] = Field(
+        default_factory=tuple, description="Edge sections (segments)"
     )
     source_port: Optional[str] = Field(
         default=None, description="Source port ID"
@@ -197,8 +210,8 @@ class EdgeRoute(BaseModel):
     targetPoint: Optional[Tuple[float, float]] = Field(
         default=None, description="Overall edge end point"
     )
-    labels: List[LabelPosition] = Field(
-        default_factory=list, description="Edge labels (line numbers, etc.)"
+    labels: Tuple[LabelPosition, ...] = Field(
+        default_factory=tuple, description="Edge labels (line numbers, etc.)"
     )
 
     def get_all_points(self) -> List[Tuple[float, float]]:
@@ -220,6 +233,8 @@ class PortLayout(BaseModel):
     are computed by ELK based on constraints like side and order.
     """
 
+    model_config = {"frozen": True}
+
     id: str = Field(..., description="Port ID")
     x: float = Field(..., description="X position relative to parent node")
     y: float = Field(..., description="Y position relative to parent node")
@@ -243,7 +258,7 @@ class ModelReference(BaseModel):
     """
 
     # Allow model_id field name
-    model_config = {"protected_namespaces": ()}
+    model_config = {"protected_namespaces": (), "frozen": True}
 
     type: Literal["dexpi", "sfiles"] = Field(
         ..., description="Model type"
@@ -251,6 +266,36 @@ class ModelReference(BaseModel):
     model_id: str = Field(..., description="Model ID in the store")
 
 
+# Keyed LayoutMetadata collections hashed entry by entry for the etag
+ETAG_SECTIONS = ("edges", "labels", "port_layouts", "positions", "rotation")
+
+
+def _entry_digest(section: str, key: str, value: Any) -> int:
+    """SHA-256 digest of one layout entry as an integer."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    payload = json.dumps([section, key, value], sort_keys=True, separators=(",", ":"))
+    return int.from_bytes(hashlib.sha256(payload.encode()).digest(), "big")
+
+
+def _legacy_etag(layout: "LayoutMetadata") -> str:
+    """Etag of layouts saved before per-entry digests (SHA-256 of the whole canonical JSON)."""
+    canonical = {
+        "algorithm": layout.algorithm,
+        "edges": {k: v.model_dump() for k, v in sorted(layout.edges.items())},
+        "labels": {k: v.model_dump() for k, v in sorted(layout.labels.items())},
+        "layout_options": dict(sorted(layout.layout_options.items())),
+        "origin": layout.origin,
+        "page_size": list(layout.page_size),
+        "port_layouts": {k: v.model_dump() for k, v in sorted(layout.port_layouts.items())},
+        "positions": {k: v.model_dump() for k, v in sorted(layout.positions.items())},
+        "rotation": dict(sorted(layout.rotation.items())),
+        "units": layout.units,
+    }
+    canonical_json = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical_json.encode()).hexdigest()
+
+
 class LayoutMetadata(BaseModel):
     """Layout metadata for a graph with positioned nodes.
 
@@ -362,6 +407,9 @@ class LayoutMetadata(BaseModel):
         default=None, description="DEPRECATED: Use created_at/updated_at instead"
     )
 
+    # Per-entry etag digests: (section, key) -> (entry object, digest)
+    _etag_digests: Dict[Tuple[str, str], Tuple[Any, int]] = PrivateAttr(default_factory=dict)
+
     @field_validator("positions")
     @classmethod
     def validate_positions_not_empty(
@@ -373,7 +421,7 @@ class LayoutMetadata(BaseModel):
         return v
 
     def model_post_init(self, __context) -> None:
-        """Compute bounding box and etag if not provided."""
+        """Compute bounding box and etag if not provided, re-stamp legacy etags."""
         # Auto-compute bounding box
         if self.bounding_box is None and self.positions:
             object.__setattr__(
@@ -390,45 +438,60 @@ class LayoutMetadata(BaseModel):
         # Auto-compute etag if not provided
         if self.etag is None:
             object.__setattr__(self, "etag", self.compute_etag())
+        else:
+            etag = self.compute_etag()
+            if self.etag != etag and self.etag == _legacy_etag(self):
+                # Saved before per-entry etags: re-stamp with the current algorithm
+                object.__setattr__(self, "etag", etag)
 
-    def compute_etag(self) -> str:
+    def compute_etag(self, full: bool = False) -> str:
         """Compute SHA-256 etag from canonical content (excludes timestamps).
 
-        The etag is computed from a canonical JSON representation of:
-        - positions, port_layouts, edges, labels, rotation
-        - layout_options, algorithm
-        - page_size, units, origin
+        Each entry of positions, port_layouts, edges, labels and rotation is
+        hashed on its own (SHA-256 of ``[section, key, value]`` as canonical
+        JSON) and the entry digests are XOR-combined. The etag is the SHA-256
+        of the canonical header (algorithm, layout_options, page_size, units,
+        origin) plus that aggregate. Timestamps are excluded so etag only
+        changes on content changes.
 
-        Timestamps are excluded so etag only changes on content changes.
+        Entry digests are cached against the entry object, so after an
+        update only entries that were added or replaced are rehashed. Entries
+        are expected to be replaced rather than mutated in place (as
+        layout_update and LayoutStore do); pass ``full=True`` to ignore the
+        cache after in-place edits.
+
+        Args:
+            full: Rehash every entry instead of reusing cached digests
 
         Returns:
             64-character hex string (SHA-256 hash)
         """
-        # Build canonical content dict (sorted keys, no timestamps)
-        canonical = {
+        cache = {} if full else self._etag_digests
+        digests: Dict[Tuple[str, str], Tuple[Any, int]] = {}
+        aggregate = 0
+
+        for section in ETAG_SECTIONS:
+            for key, value in getattr(self, section).items():
+                cached = cache.get((section, key))
+                if cached is not None and cached[0] is value:
+                    digest = cached[1]
+                else:
+                    digest = _entry_digest(section, key, value)
+                digests[(section, key)] = (value, digest)
+                aggregate ^= digest
+
+        self._etag_digests = digests
+
+        header = {
             "algorithm": self.algorithm,
-            "edges": {
-                k: v.model_dump() for k, v in sorted(self.edges.items())
-            },
-            "labels": {
-                k: v.model_dump() for k, v in sorted(self.labels.items())
-            },
-            "layout_options": dict(sorted(self.layout_options.items())),
+            "layout_options": self.layout_options,
             "origin": self.origin,
             "page_size": list(self.page_size),
-            "port_layouts": {
-                k: v.model_dump() for k, v in sorted(self.port_layouts.items())
-            },
-            "positions": {
-                k: v.model_dump() for k, v in sorted(self.positions.items())
-            },
-            "rotation": dict(sorted(self.rotation.items())),
             "units": self.units,
         }
-
-        # Serialize to canonical JSON (sorted, no spaces)
-        canonical_json = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(canonical_json.encode()).hexdigest()
+        header_json = json.dumps(header, sort_keys=True, separators=(",", ":"))
+        payload = header_json.encode() + aggregate.to_bytes(32, "big")
+        return hashlib.sha256(payload).hexdigest()
 
     def touch(self) -> None:
         """Update timestamps and recompute etag after modification."""
@@ -510,6 +573,16 @@ class LayoutMetadata(BaseModel):
         # Sort top-level keys
         return dict(sorted(data.items()))
 
+    def to_columnar(self) -> "ColumnarLayout":
+        """Convert to the NumPy-backed columnar representation.
+
+        Returns:
+            ColumnarLayout with the same content (requires NumPy)
+        """
+        from .layout_columns import ColumnarLayout
+
+        return ColumnarLayout.from_layout(self)
+
 
 class LayoutCollection(BaseModel):
     """Collection of multiple layouts for the same graph.
@@ -4,6 +4,7 @@ This module provides the infrastructure for loading, resolving, and composing
 process templates with component system and equipment library references.
 """
 
+import hashlib
 import re
 import yaml
 import json
@@ -11,6 +12,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from pydantic import BaseModel, Field, field_validator
 from ..models.port_spec import CardinalDirection
+from ..utils.template_cache import get_template_cache, parse_yaml
 
 
 class PortDefinition(BaseModel):
@@ -98,13 +100,23 @@ class ProcessTemplate(BaseModel):
 
 
 class TemplateLoader:
-    """Loads and resolves templates with component composition."""
+    """Loads and resolves templates with component composition.
+
+    YAML files and resolved templates come from the process-wide compiled
+    template cache (src/utils/template_cache.py): loaders are cheap to
+    create, and a file is read again only after it changed on disk.
+    """
 
     def __init__(self, base_path: str = "src/config/process_templates"):
         self.base_path = Path(base_path)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Pick up changes to the equipment library, components and registry."""
         self.equipment_library = self._load_equipment_library()
         self.components = self._load_components()
         self.registry = self._load_registry()
+        self._dependencies = self._dependency_digest()
 
     def _load_equipment_library(self) -> Dict[str, Any]:
         """Load equipment library from YAML."""
@@ -112,9 +124,8 @@ class TemplateLoader:
         if not lib_path.exists():
             return {}
 
-        with open(lib_path, 'r') as f:
-            data = yaml.safe_load(f)
-            return data.get('equipment', {})
+        data = get_template_cache().load("yaml", lib_path, parse_yaml)
+        return data.get('equipment', {})
 
     def _load_components(self) -> Dict[str, Any]:
         """Load all component definitions."""
@@ -124,11 +135,10 @@ class TemplateLoader:
             return components
 
         for comp_file in comp_dir.glob("*.yaml"):
-            with open(comp_file, 'r') as f:
-                comp_data = yaml.safe_load(f)
-                comp_id = comp_data.get('id')
-                if comp_id:
-                    components[comp_id] = comp_data
+            comp_data = get_template_cache().load("yaml", comp_file, parse_yaml)
+            comp_id = comp_data.get('id')
+            if comp_id:
+                components[comp_id] = comp_data
 
         return components
 
@@ -138,12 +148,28 @@ class TemplateLoader:
         if not registry_path.exists():
             return {}
 
-        with open(registry_path, 'r') as f:
-            data = yaml.safe_load(f)
-            return data.get('templates', {})
+        data = get_template_cache().load("yaml", registry_path, parse_yaml)
+        return data.get('templates', {})
+
+    def _dependency_digest(self) -> str:
+        """Digest of the library and component files resolved templates are built from."""
+        cache = get_template_cache()
+        digest = hashlib.sha256()
+        paths = [self.base_path.parent / "equipment_library.yaml"]
+        paths.extend(sorted((self.base_path / "components").glob("*.yaml")))
+        for path in paths:
+            digest.update(f"{path}\0{cache.digest('yaml', path)}\n".encode())
+        return digest.hexdigest()
 
     def load_template(self, process_unit_id: str, area_number: Optional[int] = None) -> ProcessTemplate:
-        """Load and resolve template for process unit."""
+        """Load and resolve template for process unit.
+
+        The resolved template is compiled once per template file content
+        (and library/component content); each call returns a copy the
+        caller may modify.
+        """
+        self.refresh()
+
         # Find template file from registry
         template_key = process_unit_id
         if area_number:
@@ -159,9 +185,18 @@ class TemplateLoader:
         if not template_file.exists():
             raise FileNotFoundError(f"Template file not found: {template_file}")
 
-        # Load raw template
-        with open(template_file, 'r') as f:
-            raw_template = yaml.safe_load(f)
+        compiled = get_template_cache().load(
+            "process_template", template_file, self._compile_template,
+            variant=self._dependencies
+        )
+        template = compiled.model_copy(deep=True)
+        template.source_file = str(template_file)
+
+        return template
+
+    def _compile_template(self, content: bytes, template_file: Path) -> ProcessTemplate:
+        """Resolve a raw template: components, equipment refs, connection DSL, parameters."""
+        raw_template = yaml.safe_load(content)
 
         # Resolve components
         if 'components' in raw_template:
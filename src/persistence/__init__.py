@@ -1,5 +1,6 @@
 """Project persistence module for engineering MCP server."""
 
+from .git_queue import GitCommitQueue
 from .project_persistence import ProjectPersistence
 
-__all__ = ["ProjectPersistence"]
\ No newline at end of file
+__all__ = ["GitCommitQueue", "ProjectPersistence"]
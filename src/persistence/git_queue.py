@@ -0,0 +1,313 @@
+"""Background git commit queue for project persistence.
+
+Saving a model used to run ``git add`` and ``git commit`` as blocking
+subprocesses inside the async tool handler, so a burst of saves serialized
+on git and stalled the event loop. GitCommitQueue moves commits to a worker
+thread: saves are queued per project, and everything queued for a project
+within ``window`` seconds of its first save is committed together.
+
+Backends:
+- "subprocess" (default): the git CLI, honouring the user's git config
+- "dulwich": in-process commits via dulwich (``pip install .[git]``),
+  no fork per commit
+- "auto": dulwich when installed, otherwise subprocess
+"""
+
+import atexit
+import importlib.util
+import logging
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMMIT_WINDOW = 2.0
+GIT_BACKENDS = ("subprocess", "dulwich")
+
+# Upper bound on waiting for queued commits at interpreter exit
+EXIT_FLUSH_TIMEOUT = 30.0
+
+
+def dulwich_available() -> bool:
+    """Check if dulwich is available for in-process commits."""
+    return importlib.util.find_spec("dulwich") is not None
+
+
+def resolve_backend(backend: str) -> str:
+    """Resolve "auto" and check that the backend can be used.
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If "dulwich" is requested but not installed
+    """
+    if backend == "auto":
+        return "dulwich" if dulwich_available() else "subprocess"
+    if backend not in GIT_BACKENDS:
+        raise ValueError(f"Unknown git backend: {backend}. Valid backends: {list(GIT_BACKENDS)}")
+    if backend == "dulwich" and not dulwich_available():
+        raise ImportError(
+            "The dulwich git backend requires dulwich. Install with: pip install .[git]"
+        )
+    return backend
+
+
+def commit_files(
+    project_path: Path,
+    files: Sequence[Path],
+    message: str,
+    backend: str = "subprocess",
+) -> None:
+    """Stage files and commit them.
+
+    Args:
+        project_path: Project root (git work tree)
+        files: Files to stage, inside project_path
+        message: Commit message
+        backend: "subprocess" or "dulwich"
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails
+    """
+    project_path = Path(project_path)
+    # Make paths relative to project root
+    rel_files = [str(Path(f).relative_to(project_path)) for f in files]
+
+    if backend == "dulwich":
+        from dulwich import porcelain
+        porcelain.add(str(project_path), paths=[str(project_path / f) for f in rel_files])
+        porcelain.commit(str(project_path), message=message.encode("utf-8"))
+        return
+
+    subprocess.run(
+        ["git", "add"] + rel_files,
+        cwd=project_path,
+        check=True,
+        capture_output=True
+    )
+    subprocess.run(
+        ["git", "commit", "-m", message],
+        cwd=project_path,
+        check=True,
+        capture_output=True
+    )
+
+
+@dataclass
+class _PendingCommit:
+    """Saves queued for one project."""
+
+    files: Dict[str, None] = field(default_factory=dict)  # ordered set
+    messages: List[str] = field(default_factory=list)
+    deadline: float = 0.0
+    first_seq: int = 0
+
+    def commit_message(self) -> str:
+        if len(self.messages) == 1:
+            return self.messages[0]
+        body = "\n".join(f"- {message}" for message in self.messages)
+        return f"Save {len(self.messages)} changes\n\n{body}"
+
+
+class GitCommitQueue:
+    """Coalesces project saves into batched git commits on a worker thread.
+
+    The worker thread is started on the first enqueue and flushed at
+    interpreter exit.
+    """
+
+    def __init__(self, window: float = DEFAULT_COMMIT_WINDOW, backend: str = "subprocess"):
+        """Initialize the queue.
+
+        Args:
+            window: Seconds to collect saves for a project before committing
+            backend: "subprocess", "dulwich" or "auto"
+
+        Raises:
+            ValueError: If window is negative or the backend is unknown
+            ImportError: If the dulwich backend is not installed
+        """
+        if window < 0:
+            raise ValueError(f"Commit window must be >= 0, got {window}")
+        self.window = window
+        self.backend = resolve_backend(backend)
+
+        self._cond = threading.Condition()
+        self._pending: Dict[Path, _PendingCommit] = {}
+        self._running: Optional[_PendingCommit] = None
+        self._seq = 0
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._commits = 0
+        self._saves_committed = 0
+        self._failures = 0
+        self._last_commit: Optional[Dict[str, Any]] = None
+        self._last_error: Optional[Dict[str, Any]] = None
+
+    def enqueue(self, project_path: Path, files: Sequence[Optional[Path]], message: str) -> None:
+        """Queue files for the next commit of a project.
+
+        Args:
+            project_path: Project root path
+            files: Files to add (None entries are ignored)
+            message: Commit message for this save
+
+        Raises:
+            RuntimeError: If the queue has been closed
+        """
+        project_path = Path(project_path)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GitCommitQueue is closed")
+            self._seq += 1
+            batch = self._pending.get(project_path)
+            if batch is None:
+                batch = _PendingCommit(
+                    deadline=time.monotonic() + self.window, first_seq=self._seq
+                )
+                self._pending[project_path] = batch
+            for f in files:
+                if f is not None:
+                    batch.files[str(f)] = None
+            batch.messages.append(message)
+            self._ensure_worker()
+            self._cond.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Commit everything queued so far and wait for it.
+
+        Blocks the calling thread; from async code use
+        ``await asyncio.to_thread(queue.flush)``.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            status() after the flush, with "flushed" False on timeout
+        """
+        with self._cond:
+            target = self._seq
+            for batch in self._pending.values():
+                batch.deadline = 0.0
+            self._cond.notify_all()
+            flushed = self._cond.wait_for(lambda: not self._outstanding(target), timeout)
+            status = self._status()
+        status["flushed"] = flushed
+        return status
+
+    def status(self) -> Dict[str, Any]:
+        """Queue state: pending saves per project and commit counters."""
+        with self._cond:
+            return self._status()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush pending commits and stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            for batch in self._pending.values():
+                batch.deadline = 0.0
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def _status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "backend": self.backend,
+            "window": self.window,
+            "pending": {
+                str(path): {
+                    "saves": len(batch.messages),
+                    "files": len(batch.files),
+                    "commit_in": round(max(batch.deadline - now, 0.0), 3),
+                }
+                for path, batch in self._pending.items()
+            },
+            "committing": self._running is not None,
+            "commits": self._commits,
+            "saves_committed": self._saves_committed,
+            "failures": self._failures,
+            "last_commit": self._last_commit,
+            "last_error": self._last_error,
+        }
+
+    def _outstanding(self, seq: int) -> bool:
+        if self._running is not None and self._running.first_seq <= seq:
+            return True
+        return any(batch.first_seq <= seq for batch in self._pending.values())
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        self._worker = threading.Thread(target=self._run, name="git-commit-queue", daemon=True)
+        self._worker.start()
+        atexit.register(self.close, EXIT_FLUSH_TIMEOUT)
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                if not self._pending:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    continue
+
+                now = time.monotonic()
+                path, batch = min(self._pending.items(), key=lambda item: item[1].deadline)
+                if batch.deadline > now:
+                    self._cond.wait(batch.deadline - now)
+                    continue
+
+                del self._pending[path]
+                self._running = batch
+                self._cond.release()
+                try:
+                    error = self._commit(path, batch)
+                finally:
+                    self._cond.acquire()
+                self._running = None
+                self._record(path, batch, error)
+                self._cond.notify_all()
+
+    def _commit(self, project_path: Path, batch: _PendingCommit) -> Optional[str]:
+        message = batch.commit_message()
+        try:
+            commit_files(project_path, list(batch.files), message, self.backend)
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode("utf-8", "replace").strip() if e.stderr else ""
+            logger.warning(f"Git commit failed: {e} {stderr}")
+            return stderr or str(e)
+        except Exception as e:
+            logger.warning(f"Git operation failed: {e}")
+            return str(e)
+        logger.info(f"Committed to git: {message.splitlines()[0]}")
+        return None
+
+    def _record(self, project_path: Path, batch: _PendingCommit, error: Optional[str]) -> None:
+        entry = {
+            "project_path": str(project_path),
+            "saves": len(batch.messages),
+            "files": len(batch.files),
+        }
+        if error is None:
+            self._commits += 1
+            self._saves_committed += len(batch.messages)
+            self._last_commit = entry
+        else:
+            self._failures += 1
+            self._last_error = {**entry, "error": error}
+
+
+__all__ = [
+    "DEFAULT_COMMIT_WINDOW",
+    "GIT_BACKENDS",
+    "GitCommitQueue",
+    "commit_files",
+    "dulwich_available",
+    "resolve_backend",
+]
@@ -0,0 +1,288 @@
+"""Project manifest: a metadata index of the models saved in a project.
+
+Listing or searching a project used to mean deserializing every model.
+The manifest keeps one entry per model file (size, mtime, content hash,
+component counts, tags) in ``{project}/.model_index.json`` and refreshes
+only the entries whose file size or mtime changed since the last scan.
+Entries are built from the raw JSON document, never from pyDEXPI/SFILES
+objects, so indexing is cheap.
+
+The index is derived data: it is git-ignored and rebuilt when missing,
+unreadable or written by another MANIFEST_VERSION. A model file that
+cannot be parsed gets an entry with an ``error`` and no counts or tags,
+so one bad file does not break listing or searching the project.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".model_index.json"
+MANIFEST_VERSION = 1
+
+# Project directory -> model type of the JSON files it holds
+DIAGRAM_DIRS = {"pid": "dexpi", "pfd": "sfiles", "bfd": "sfiles"}
+
+# Sidecar JSON files next to the models, not models themselves
+SIDECAR_SUFFIXES = (".meta.json", ".layout.json")
+
+# DEXPI data attributes indexed as searchable tags
+TAG_FIELDS = ("tagName", "lineNumber")
+
+
+@dataclass
+class ManifestEntry:
+    """Index record for one model file.
+
+    Attributes:
+        name: Model name (file stem)
+        diagram: Project directory ("pid", "pfd" or "bfd")
+        model_type: "dexpi" or "sfiles"
+        path: Model file path relative to the project root
+        size: File size in bytes
+        mtime_ns: File modification time
+        sha256: Hash of the file content
+        counts: Component counts by kind
+        tags: Sorted tag names (DEXPI tags and line numbers, SFILES units)
+        info: Descriptive fields (project name, drawing number, flowsheet type)
+        error: Why the file could not be indexed (None if it was)
+    """
+    name: str
+    diagram: str
+    model_type: str
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    counts: Dict[str, int] = field(default_factory=dict)
+    tags: List[str] = field(default_factory=list)
+    info: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.diagram}/{self.name}"
+
+    def to_dict(self, include_tags: bool = True) -> Dict[str, Any]:
+        """Convert entry to dictionary (tags replaced by tag_count if excluded)."""
+        data = asdict(self)
+        if not include_tags:
+            data["tag_count"] = len(data.pop("tags"))
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ManifestEntry":
+        return cls(**data)
+
+
+class ProjectManifest:
+    """Metadata index of a project's models, refreshed by file stat."""
+
+    def __init__(self, project_path: str):
+        """Initialize the manifest for a project (nothing is read yet).
+
+        Args:
+            project_path: Path to project root
+        """
+        self.project_path = Path(project_path)
+        self.index_path = self.project_path / MANIFEST_FILENAME
+        self._entries: Optional[Dict[str, ManifestEntry]] = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> Dict[str, ManifestEntry]:
+        """Bring the index up to date with the model files on disk.
+
+        Only files whose size or mtime changed are re-read.
+
+        Returns:
+            Entries keyed by "{diagram}/{name}"
+        """
+        with self._lock:
+            entries = self._entries if self._entries is not None else self._read_index()
+            current = {}
+            changed = False
+            for diagram, model_type, file_path in self._model_files():
+                stat = file_path.stat()
+                key = f"{diagram}/{file_path.name[:-len('.json')]}"
+                entry = entries.get(key)
+                if entry is None or (entry.size, entry.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                    entry = self._index_file(diagram, model_type, file_path, stat)
+                    changed = True
+                current[key] = entry
+            if changed or current.keys() != entries.keys():
+                self._write_index(current)
+            self._entries = current
+            return dict(current)
+
+    def entries(self, model_type: Optional[str] = None) -> List[ManifestEntry]:
+        """Refreshed entries, optionally filtered by model type ("dexpi"/"sfiles")."""
+        return [
+            entry for entry in self.refresh().values()
+            if model_type is None or entry.model_type == model_type
+        ]
+
+    def get(self, name: str, model_type: Optional[str] = None) -> Optional[ManifestEntry]:
+        """Entry for a model name (the first directory match in pid, pfd, bfd order)."""
+        for entry in self.entries(model_type):
+            if entry.name == name:
+                return entry
+        return None
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        model_type: Optional[str] = None,
+    ) -> List[Tuple[ManifestEntry, List[str]]]:
+        """Find models by name, descriptive fields or tags.
+
+        Args:
+            query: Case-insensitive substring of the name, info values or tags
+            tag: Exact tag name
+            model_type: "dexpi" or "sfiles" to restrict the search
+
+        Returns:
+            (entry, matching tags) pairs
+        """
+        needle = query.lower() if query else None
+        results = []
+        for entry in self.entries(model_type):
+            if tag is not None and tag not in entry.tags:
+                continue
+            matched_tags = [tag] if tag is not None else []
+            if needle is not None:
+                matched_tags = [t for t in (matched_tags or entry.tags) if needle in t.lower()]
+                described = needle in entry.name.lower() or any(
+                    needle in str(value).lower() for value in entry.info.values() if value is not None
+                )
+                if not matched_tags and not described:
+                    continue
+            results.append((entry, matched_tags))
+        return results
+
+    def _model_files(self):
+        for diagram, model_type in DIAGRAM_DIRS.items():
+            directory = self.project_path / diagram
+            if not directory.is_dir():
+                continue
+            for file_path in sorted(directory.glob("*.json")):
+                if not file_path.name.endswith(SIDECAR_SUFFIXES):
+                    yield diagram, model_type, file_path
+
+    def _index_file(self, diagram: str, model_type: str, file_path: Path, stat) -> ManifestEntry:
+        content = file_path.read_bytes()
+        counts, tags, info, error = {}, [], {}, None
+        try:
+            data = json.loads(content)
+            if model_type == "dexpi":
+                counts, tags, info = _summarize_dexpi(data)
+            else:
+                counts, tags, info = _summarize_sfiles(data)
+        except (ValueError, KeyError, TypeError, AttributeError, IndexError) as e:
+            # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
+            error = f"{type(e).__name__}: {e}"
+            logger.warning(f"Cannot index model file {file_path} ({error})")
+        return ManifestEntry(
+            name=file_path.name[:-len(".json")],
+            diagram=diagram,
+            model_type=model_type,
+            path=str(file_path.relative_to(self.project_path)),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=hashlib.sha256(content).hexdigest(),
+            counts=counts,
+            tags=tags,
+            info=info,
+            error=error,
+        )
+
+    def _read_index(self) -> Dict[str, ManifestEntry]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                logger.info(f"Rebuilding model index {self.index_path}: version {data.get('version')}")
+                return {}
+            return {key: ManifestEntry.from_dict(entry) for key, entry in data["models"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # A truncated or hand-edited index is rebuilt from the model files
+            logger.warning(
+                f"Model index {self.index_path} is unreadable ({type(e).__name__}: {e}); rebuilding"
+            )
+            return {}
+
+    def _write_index(self, entries: Dict[str, ManifestEntry]) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "models": {key: entry.to_dict() for key, entry in sorted(entries.items())},
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+
+def _summarize_dexpi(data: Dict[str, Any]) -> Tuple[Dict[str, int], List[str], Dict[str, Any]]:
+    """Counts, tags and metadata of a DEXPI model document."""
+    conceptual = (data.get("composition") or {}).get("conceptualModel") or {}
+    parts = conceptual.get("composition") or {}
+    meta = ((parts.get("metaData") or {}).get("data")) or {}
+
+    tags = set()
+    elements = 0
+    # Iterative walk over the element tree
+    stack = [data]
+    while stack:
+        element = stack.pop()
+        if "id" in element:
+            elements += 1
+        values = element.get("data")
+        if values:
+            for name in TAG_FIELDS:
+                if values.get(name):
+                    tags.add(str(values[name]))
+        for child in (element.get("composition") or {}).values():
+            if isinstance(child, list):
+                stack.extend(child)
+            elif child is not None:
+                stack.append(child)
+
+    systems = parts.get("pipingNetworkSystems") or []
+    counts = {
+        "equipment": len(parts.get("taggedPlantItems") or []),
+        "piping_systems": len(systems),
+        "piping_segments": sum(len((s.get("composition") or {}).get("segments") or []) for s in systems),
+        "instrumentation": len(parts.get("processInstrumentationFunctions") or []),
+        "elements": elements,
+    }
+    info = {
+        "project_name": meta.get("projectName"),
+        "drawing_number": meta.get("drawingNumber"),
+    }
+    return counts, sorted(tags), info
+
+
+def _summarize_sfiles(data: Dict[str, Any]) -> Tuple[Dict[str, int], List[str], Dict[str, Any]]:
+    """Counts, tags and metadata of a saved SFILES flowsheet state."""
+    nodes = data.get("nodes") or []
+    counts = {"nodes": len(nodes), "edges": len(data.get("edges") or [])}
+    tags = sorted(str(node[0]) for node in nodes)
+    info = {"flowsheet_type": data.get("type"), "description": data.get("description")}
+    return counts, tags, info
+
+
+__all__ = [
+    "DIAGRAM_DIRS",
+    "MANIFEST_FILENAME",
+    "ManifestEntry",
+    "ProjectManifest",
+]
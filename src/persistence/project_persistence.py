@@ -1,15 +1,21 @@
 """Git-based project persistence for DEXPI and SFILES models."""
 
+import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Iterable
 import logging
 import subprocess
+import threading
 
 from pydexpi.loaders import JsonSerializer
 from ..adapters.sfiles_adapter import get_flowsheet_class
+from ..core import dexpi_serialization
+from .git_queue import GitCommitQueue, commit_files
+from .project_manifest import MANIFEST_FILENAME, SIDECAR_SUFFIXES, ManifestEntry, ProjectManifest
 
 # Safe import with helpful error messages
 Flowsheet = get_flowsheet_class()
@@ -17,6 +23,48 @@ import networkx as nx
 
 logger = logging.getLogger(__name__)
 
+# Files save_dexpi can write, in commit order
+DEXPI_ARTIFACTS = ("json", "meta", "graphml", "html", "layout")
+DEFAULT_DEXPI_ARTIFACTS = ("json", "meta", "graphml", "html")
+
+_DEXPI_ARTIFACT_SUFFIXES = {
+    "json": ".json",
+    "meta": ".meta.json",
+    "graphml": ".graphml",
+    "html": ".html",
+    "layout": ".layout.json",
+}
+
+# Input hashes of the artifacts last written for a model. Not a .json file
+# so list_models does not pick it up as a model.
+ARTIFACT_MANIFEST_SUFFIX = ".artifacts"
+
+ARTIFACT_WORKERS = 4
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _shared_once(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """Thread-safe memoized fn(): every call gets the first call's result or error."""
+    lock = threading.Lock()
+    outcome: List[Any] = []
+
+    def call() -> Any:
+        with lock:
+            if not outcome:
+                try:
+                    outcome.append((fn(), None))
+                except Exception as e:
+                    outcome.append((None, e))
+        value, error = outcome[0]
+        if error is not None:
+            raise error
+        return value
+
+    return call
+
 
 def canonical_json_dump(data: Any, file_path: Path, **kwargs) -> None:
     """Write JSON with sorted keys for deterministic output.
@@ -33,9 +81,16 @@ def canonical_json_dump(data: Any, file_path: Path, **kwargs) -> None:
 class ProjectPersistence:
     """Manages git-based persistence for engineering projects."""
     
-    def __init__(self):
-        """Initialize the persistence manager."""
+    def __init__(self, commit_queue: Optional[GitCommitQueue] = None):
+        """Initialize the persistence manager.
+
+        Args:
+            commit_queue: Queue for batched background git commits. Without
+                one, saves commit synchronously.
+        """
         self.json_serializer = JsonSerializer()
+        self.commit_queue = commit_queue
+        self._manifests: Dict[str, ProjectManifest] = {}
     
     def init_project(self, project_path: str, project_name: str, description: str = "") -> Dict[str, Any]:
         """Initialize a new git project with standard structure.
@@ -81,6 +136,10 @@ Created: {metadata['created']}
 """
         with open(path / "README.md", "w") as f:
             f.write(readme_content)
+
+        # The model index is derived data, rebuilt from the model files
+        with open(path / ".gitignore", "w") as f:
+            f.write(f"{MANIFEST_FILENAME}\n{MANIFEST_FILENAME}.tmp\n")
         
         # Initialize git repo
         try:
@@ -101,136 +160,240 @@ Created: {metadata['created']}
         model: Any,
         project_path: str,
         model_name: str,
-        commit_message: Optional[str] = None
-    ) -> Dict[str, str]:
+        commit_message: Optional[str] = None,
+        artifacts: Optional[Iterable[str]] = None,
+        layout: Optional[Any] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
         """Save DEXPI model to project.
-        
+
+        Each output file is an artifact that can be selected individually
+        (see DEXPI_ARTIFACTS). Selected artifacts are generated concurrently;
+        GraphML and HTML share one graph build. An artifact whose inputs
+        hash the same as when it was last written is skipped; the hashes
+        are kept in ``{model_name}.artifacts``. Only the inputs are hashed:
+        an artifact file edited by hand is not detected and stays as is
+        until its inputs change or the save is forced.
+
         Args:
             model: DEXPI model object
             project_path: Path to project root
             model_name: Name for the model (without extension)
             commit_message: Optional git commit message
-            
+            artifacts: Artifacts to write (default: DEFAULT_DEXPI_ARTIFACTS)
+            layout: LayoutMetadata to write as ``{model_name}.layout.json``
+                (required for the "layout" artifact)
+            force: Regenerate selected artifacts even if unchanged (also
+                restores artifact files edited by hand)
+
         Returns:
-            Dict with paths to saved files
+            Dict with paths to saved files (None for artifacts not written)
+            and "skipped" listing unchanged artifacts
+
+        Raises:
+            ValueError: If an unknown artifact is selected, or "layout"
+                without a layout
         """
+        selected = self._select_artifacts(artifacts, layout)
+
         path = Path(project_path)
         pid_dir = path / "pid"
         pid_dir.mkdir(exist_ok=True)
-        
-        # Save model as JSON
-        json_path = pid_dir / f"{model_name}.json"
-        self.json_serializer.save(model, str(pid_dir), model_name)
-        
-        # Save metadata
-        meta_path = pid_dir / f"{model_name}.meta.json"
+
+        paths = {
+            name: pid_dir / f"{model_name}{suffix}"
+            for name, suffix in _DEXPI_ARTIFACT_SUFFIXES.items()
+        }
+        manifest_path = pid_dir / f"{model_name}{ARTIFACT_MANIFEST_SUFFIX}"
+        manifest = self._read_manifest(manifest_path)
+
+        # Model JSON is the input of json/graphml/html; serialize it once
+        # Same text as JsonSerializer.save, streamed without the intermediate dict
+        model_json = "".join(dexpi_serialization.iter_json(model, indent=4))
+        model_hash = _sha256(model_json)
         metadata = {
             "name": model_name,
             "type": "DEXPI P&ID",
-            "created": datetime.now().isoformat(),
             "project_name": model.conceptualModel.metaData.projectName if model.conceptualModel and model.conceptualModel.metaData else None,
             "drawing_number": model.conceptualModel.metaData.drawingNumber if model.conceptualModel and model.conceptualModel.metaData else None
         }
-        canonical_json_dump(metadata, meta_path)
-        
-        # Export GraphML (sanitized) and raster/vector images for human auditing
-        graphml_path = None
-        png_path = None
+        hashes = {
+            "json": model_hash,
+            "meta": _sha256(json.dumps(metadata, sort_keys=True)),
+            "graphml": model_hash,
+            "html": model_hash,
+            "layout": (layout.etag or layout.compute_etag()) if layout is not None else None,
+        }
+
+        pending = [
+            name for name in selected
+            if force or manifest.get(name) != hashes[name] or not paths[name].exists()
+        ]
+        skipped = [name for name in selected if name not in pending]
+
+        generators = {
+            "json": lambda: self._write_text(paths["json"], model_json),
+            "meta": lambda: canonical_json_dump(
+                {**metadata, "created": datetime.now().isoformat()}, paths["meta"]
+            ),
+            "layout": lambda: canonical_json_dump(layout.to_dict(exclude_none=True), paths["layout"]),
+        }
+        # Built by whichever of graphml/html runs first; a build failure
+        # only drops those two artifacts
+        plant_graph = _shared_once(lambda: self._build_plant_graph(model))
+        generators["graphml"] = lambda: self._write_dexpi_graphml(plant_graph(), paths["graphml"])
+        generators["html"] = lambda: self._write_dexpi_html(plant_graph(), model, paths["html"], model_name)
+
+        written = self._run_artifacts({name: generators[name] for name in pending})
+        for name in written:
+            manifest[name] = hashes[name]
+
+        if written:
+            canonical_json_dump(manifest, manifest_path)
+
+            # Git commit
+            if commit_message is None:
+                commit_message = f"Save DEXPI model: {model_name}"
+
+            self._git_add_commit(
+                path, [paths[name] for name in written] + [manifest_path], commit_message
+            )
+
+        result = {
+            name: str(paths[name]) if name in written or name in skipped else None
+            for name in DEXPI_ARTIFACTS
+        }
+        result["skipped"] = skipped
+        return result
+
+    def _select_artifacts(self, artifacts: Optional[Iterable[str]], layout: Optional[Any]) -> List[str]:
+        """Validate an artifact selection.
+
+        Raises:
+            ValueError: If an artifact is unknown, or "layout" has no layout
+        """
+        selected = list(DEFAULT_DEXPI_ARTIFACTS if artifacts is None else artifacts)
+        unknown = sorted(set(selected) - set(DEXPI_ARTIFACTS))
+        if unknown:
+            raise ValueError(
+                f"Unknown artifacts: {unknown}. Valid artifacts: {list(DEXPI_ARTIFACTS)}"
+            )
+        if "layout" in selected and layout is None:
+            raise ValueError("The 'layout' artifact requires a layout to save")
+        return [name for name in DEXPI_ARTIFACTS if name in selected]
+
+    def _read_manifest(self, manifest_path: Path) -> Dict[str, str]:
+        """Read artifact hashes written by a previous save.
+
+        The file only holds skip hints: a missing or unreadable one yields
+        {}, so every selected artifact is rewritten.
+        """
+        if not manifest_path.exists():
+            return {}
         try:
-            # Use unified converter for GraphML (handles attribute sanitization)
-            from ..converters.graph_converter import UnifiedGraphConverter
-            converter = UnifiedGraphConverter()
-            graphml_content = converter.dexpi_to_graphml(model, include_msr=True)
-            graphml_path = pid_dir / f"{model_name}.graphml"
-            with open(graphml_path, "w", encoding="utf-8") as f:
-                f.write(graphml_content)
-        except Exception as e:
-            logger.warning(f"DEXPI GraphML export failed: {e}")
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
+            logger.warning(f"Artifact manifest {manifest_path} is unreadable ({e}); rewriting artifacts")
+            return {}
+        if not isinstance(manifest, dict):
+            logger.warning(f"Artifact manifest {manifest_path} is not a mapping; rewriting artifacts")
+            return {}
+        return manifest
 
-        # Interactive HTML visualization with hover details
-        html_path = None
+    def _run_artifacts(self, generators: Dict[str, Callable[[], Any]]) -> List[str]:
+        """Run artifact generators concurrently.
+
+        JSON, metadata and layout failures propagate. GraphML and HTML are
+        auditing aids: their failures are logged and the artifact is left out.
+
+        Returns:
+            Names of the artifacts written, in DEXPI_ARTIFACTS order
+        """
+        if not generators:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(generators), ARTIFACT_WORKERS)) as pool:
+            futures = {name: pool.submit(fn) for name, fn in generators.items()}
+
+        written = []
+        for name in DEXPI_ARTIFACTS:
+            if name not in futures:
+                continue
+            error = futures[name].exception()
+            if error is None:
+                written.append(name)
+            elif name in ("graphml", "html"):
+                logger.warning(f"DEXPI {name} export failed: {error}")
+            else:
+                raise error
+        return written
+
+    def _write_text(self, file_path: Path, content: str) -> None:
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def _build_plant_graph(self, model: Any) -> nx.DiGraph:
+        """Build the plant graph shared by the GraphML and HTML artifacts."""
+        from pydexpi.loaders.ml_graph_loader import MLGraphLoader
         try:
-            from pydexpi.loaders.ml_graph_loader import MLGraphLoader
-            loader = MLGraphLoader(plant_model=model)
-            # Ensure graph is parsed using the correct API
-            try:
-                loader.dexpi_to_graph()
-            except AttributeError as e:
-                raise AttributeError(
-                    "MLGraphLoader does not have dexpi_to_graph() method. "
-                    "The pyDEXPI API may have changed. "
-                    "Update project_persistence.py to use the correct method. "
-                    f"Error: {e}"
-                ) from e
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to parse DEXPI model to graph for visualization. "
-                    f"Model may be malformed or MLGraphLoader encountered an error. "
-                    f"Error: {e}"
-                ) from e
-            
-            # Enhance node data with specifications for hover
-            for node_id in loader.plant_graph.nodes():
-                node_data = loader.plant_graph.nodes[node_id]
-                # The node already has 'dexpi_class' and other attributes
-                # We can enhance the hover information by building a better text
-                dexpi_class = node_data.get('dexpi_class', 'Unknown')
-                hover_text = f"<b>{node_id}</b><br>Type: {dexpi_class}<br>"
-                
-                # Add any additional attributes that aren't internal
-                for key, value in node_data.items():
-                    if key not in ['dexpi_class', 'id', 'pos'] and value is not None:
-                        hover_text += f"{key}: {value}<br>"
-                
-                # Store enhanced hover text
-                node_data['hover_text'] = hover_text
-            
-            # Generate interactive Plotly figure
-            fig = loader.draw_process_plotly()
-            
-            # Update figure to use our enhanced hover text
-            for trace in fig.data:
-                if hasattr(trace, 'marker') and trace.marker.size == 10:  # Node trace
-                    # Build hover text array matching node order
-                    hover_texts = []
-                    for node in loader.plant_graph.nodes():
-                        hover_texts.append(loader.plant_graph.nodes[node].get('hover_text', node))
-                    trace.hovertext = hover_texts
-                    trace.hoverinfo = 'text'
-            
-            # Save as self-contained HTML with export capabilities
-            html_path = pid_dir / f"{model_name}.html"
-            fig.write_html(
-                str(html_path),
-                include_plotlyjs='inline',  # Fully self-contained
-                config={
-                    'displayModeBar': True,
-                    'toImageButtonOptions': {
-                        'format': 'svg',  # Can be png, svg, jpeg
-                        'filename': model_name,
-                        'height': 800,
-                        'width': 1200,
-                        'scale': 1
-                    }
-                }
-            )
-            logger.info(f"DEXPI HTML visualization saved: {html_path}")
+            return MLGraphLoader().dexpi_to_graph(model)
         except Exception as e:
-            logger.warning(f"DEXPI HTML export failed: {e}")
-        
-        # Git commit
-        if commit_message is None:
-            commit_message = f"Save DEXPI model: {model_name}"
-        
-        self._git_add_commit(path, [json_path, meta_path, graphml_path, html_path], commit_message)
+            raise RuntimeError(
+                f"Failed to parse DEXPI model to graph. "
+                f"Model may be malformed or MLGraphLoader encountered an error. "
+                f"Error: {e}"
+            ) from e
+
+    def _write_dexpi_graphml(self, graph: nx.DiGraph, graphml_path: Path) -> None:
+        """Export GraphML (sanitized) for human auditing."""
+        from ..converters.graph_converter import UnifiedGraphConverter
+        graphml_content = UnifiedGraphConverter().networkx_to_graphml(graph)
+        self._write_text(graphml_path, graphml_content)
+
+    def _write_dexpi_html(self, graph: nx.DiGraph, model: Any, html_path: Path, model_name: str) -> None:
+        """Write the interactive Plotly visualization with hover details."""
+        from pydexpi.loaders.ml_graph_loader import MLGraphLoader
+
+        # draw_process_plotly adds node positions; keep the shared graph intact
+        loader = MLGraphLoader(plant_graph=graph.copy(), plant_model=model)
+
+        # Enhanced hover text: node id, class and any non-internal attributes
+        hover_texts = []
+        for node_id, node_data in loader.plant_graph.nodes(data=True):
+            dexpi_class = node_data.get('dexpi_class', 'Unknown')
+            hover_text = f"<b>{node_id}</b><br>Type: {dexpi_class}<br>"
+            for key, value in node_data.items():
+                if key not in ['dexpi_class', 'id', 'pos'] and value is not None:
+                    hover_text += f"{key}: {value}<br>"
+            hover_texts.append(hover_text)
+
+        # Generate interactive Plotly figure
+        fig = loader.draw_process_plotly()
+
+        for trace in fig.data:
+            if hasattr(trace, 'marker') and trace.marker.size == 10:  # Node trace
+                trace.hovertext = hover_texts
+                trace.hoverinfo = 'text'
+
+        # Save as self-contained HTML with export capabilities
+        fig.write_html(
+            str(html_path),
+            include_plotlyjs='inline',  # Fully self-contained
+            config={
+                'displayModeBar': True,
+                'toImageButtonOptions': {
+                    'format': 'svg',  # Can be png, svg, jpeg
+                    'filename': model_name,
+                    'height': 800,
+                    'width': 1200,
+                    'scale': 1
+                }
+            }
+        )
+        logger.info(f"DEXPI HTML visualization saved: {html_path}")
 
-        return {
-            "json": str(json_path),
-            "meta": str(meta_path),
-            "graphml": str(graphml_path) if graphml_path else None,
-            "html": str(html_path) if html_path else None
-        }
-    
     def load_dexpi(self, project_path: str, model_name: str) -> Any:
         """Load DEXPI model from project.
         
@@ -246,7 +409,7 @@ Created: {metadata['created']}
         
         # Load model from JSON
         try:
-            model = self.json_serializer.load(str(pid_dir), model_name)
+            model = dexpi_serialization.loads((pid_dir / f"{model_name}.json").read_bytes())
         except (KeyError, Exception) as e:
             # Handle missing references - try loading raw JSON and converting
             import json
@@ -554,56 +717,85 @@ Created: {metadata['created']}
         pid_dir = path / "pid"
         if pid_dir.exists():
             for json_file in pid_dir.glob("*.json"):
-                if not json_file.name.endswith(".meta.json"):
+                if not json_file.name.endswith(SIDECAR_SUFFIXES):
                     models["pid"].append(json_file.stem)
         
         # List BFD flowsheets
         bfd_dir = path / "bfd"
         if bfd_dir.exists():
             for json_file in bfd_dir.glob("*.json"):
-                if not json_file.name.endswith(".meta.json"):
+                if not json_file.name.endswith(SIDECAR_SUFFIXES):
                     models["bfd"].append(json_file.stem)
         
         # List PFD flowsheets
         pfd_dir = path / "pfd"
         if pfd_dir.exists():
             for json_file in pfd_dir.glob("*.json"):
-                if not json_file.name.endswith(".meta.json"):
+                if not json_file.name.endswith(SIDECAR_SUFFIXES):
                     models["pfd"].append(json_file.stem)
         
         return models
     
+    def manifest(self, project_path: str) -> ProjectManifest:
+        """Model index of a project (cached per project path)."""
+        key = str(Path(project_path).resolve())
+        if key not in self._manifests:
+            self._manifests[key] = ProjectManifest(key)
+        return self._manifests[key]
+
+    def list_model_details(self, project_path: str) -> List[ManifestEntry]:
+        """List all models in a project with index metadata, without loading them.
+
+        Args:
+            project_path: Path to project root
+
+        Returns:
+            Manifest entries (size, counts, tags, hash, mtime) in pid, pfd, bfd order
+        """
+        return self.manifest(project_path).entries()
+
+    def search_models(
+        self,
+        project_path: str,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        model_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search a project's models by name, metadata or tag, without loading them.
+
+        Args:
+            project_path: Path to project root
+            query: Case-insensitive substring of name, project/drawing info or tags
+            tag: Exact tag name (equipment tag, line number or SFILES unit)
+            model_type: "dexpi" or "sfiles"
+
+        Returns:
+            Matching entries (without the full tag list) with their matched tags
+        """
+        return [
+            {**entry.to_dict(include_tags=False), "matched_tags": matched}
+            for entry, matched in self.manifest(project_path).search(query, tag, model_type)
+        ]
+
     def _git_add_commit(self, project_path: Path, files: List[Path], message: str):
         """Add files and commit to git.
-        
+
+        With a commit queue the commit is queued and made in the background.
+
         Args:
             project_path: Project root path
             files: List of file paths to add
             message: Commit message
         """
+        # Filter out None values
+        files = [f for f in files if f is not None]
+
+        if self.commit_queue is not None:
+            self.commit_queue.enqueue(project_path, files, message)
+            return
+
         try:
-            # Filter out None values
-            files = [f for f in files if f is not None]
-            
-            # Make paths relative to project root
-            rel_files = [str(Path(f).relative_to(project_path)) for f in files]
-            
-            # Git add
-            subprocess.run(
-                ["git", "add"] + rel_files,
-                cwd=project_path,
-                check=True,
-                capture_output=True
-            )
-            
-            # Git commit
-            subprocess.run(
-                ["git", "commit", "-m", message],
-                cwd=project_path,
-                check=True,
-                capture_output=True
-            )
-            
+            commit_files(project_path, files, message)
             logger.info(f"Committed to git: {message}")
         except subprocess.CalledProcessError as e:
             logger.warning(f"Git commit failed: {e}")
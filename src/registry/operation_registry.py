@@ -11,6 +11,9 @@ Provides:
 - Version management and deprecation
 - Discoverability via schema_query
 - Validation hooks (pre/post-operation)
+- Full JSON Schema parameter validation with validators compiled once at
+  registration (fastjsonschema code generation when installed, cached
+  jsonschema validators otherwise)
 - Diff metadata integration with TransactionManager
 
 Note on Operation Naming:
@@ -29,11 +32,14 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 from pydexpi.dexpi_classes.dexpiModel import DexpiModel
 
+from ..utils.schema_validation import compile_schema_checker
+
 logger = logging.getLogger(__name__)
 
 # Type aliases
 Model = Union[DexpiModel, Any]  # Any for Flowsheet
 JSONSchema = Dict[str, Any]
+ParamValidator = Callable[[Dict[str, Any]], None]
 
 
 # ============================================================================
@@ -153,6 +159,41 @@ class SchemaValidationError(OperationRegistryError):
     pass
 
 
+# ============================================================================
+# Schema Validator Compilation
+# ============================================================================
+
+def compile_param_validator(schema: JSONSchema, operation_name: str) -> ParamValidator:
+    """
+    Build the parameter validator for an operation.
+
+    Args:
+        schema: Operation input schema
+        operation_name: Operation name (for error messages)
+
+    Returns:
+        Callable raising SchemaValidationError on invalid params
+
+    Raises:
+        InvalidOperationDescriptor: If the schema itself is invalid
+    """
+    try:
+        check = compile_schema_checker(schema)
+    except Exception as e:
+        raise InvalidOperationDescriptor(
+            f"Invalid input schema for operation '{operation_name}': {e}"
+        ) from e
+
+    def validate(params: Dict[str, Any]) -> None:
+        message = check(params)
+        if message is not None:
+            raise SchemaValidationError(
+                f"Invalid parameters for operation '{operation_name}': {message}"
+            )
+
+    return validate
+
+
 # ============================================================================
 # Operation Registry
 # ============================================================================
@@ -169,6 +210,12 @@ class OperationRegistry:
         self._operations: Dict[str, OperationDescriptor] = {}
         self._version_index: Dict[str, List[str]] = {}
         self._category_index: Dict[OperationCategory, List[str]] = {}
+        self._alias_index: Dict[str, str] = {}
+        self._validators: Dict[str, ParamValidator] = {}
+
+        # Memoized schema/docs, invalidated on registration
+        self._schema_cache: Dict[str, JSONSchema] = {}
+        self._docs_cache: Dict[str, Dict[str, Any]] = {}
 
         logger.info("OperationRegistry initialized")
 
@@ -196,12 +243,23 @@ class OperationRegistry:
                 f"Operation '{operation.name}' already registered"
             )
 
+        # Compile parameter validator once
+        if operation.input_schema:
+            self._validators[operation.name] = compile_param_validator(
+                operation.input_schema, operation.name
+            )
+
         # Register
         self._operations[operation.name] = operation
 
         # Update indices
         self._version_index.setdefault(operation.version, []).append(operation.name)
         self._category_index.setdefault(operation.category, []).append(operation.name)
+        for alias in operation.metadata.replaces:
+            self._alias_index.setdefault(alias, operation.name)
+
+        self._schema_cache.clear()
+        self._docs_cache.clear()
 
         logger.info(
             f"Registered operation: {operation.name} "
@@ -240,11 +298,11 @@ class OperationRegistry:
         if name in self._operations:
             return self._operations[name]
 
-        # Try to find by alias (check metadata.replaces)
-        for op_name, op in self._operations.items():
-            if op.metadata and op.metadata.replaces and name in op.metadata.replaces:
-                logger.info(f"Resolved alias '{name}' to operation '{op_name}'")
-                return op
+        # Try to find by alias (metadata.replaces)
+        op_name = self._alias_index.get(name)
+        if op_name is not None:
+            logger.info(f"Resolved alias '{name}' to operation '{op_name}'")
+            return self._operations[op_name]
 
         raise OperationNotFound(f"Operation '{name}' not found")
 
@@ -287,16 +345,7 @@ class OperationRegistry:
 
     def exists(self, name: str) -> bool:
         """Check if operation exists (by name or alias)."""
-        # Check direct name
-        if name in self._operations:
-            return True
-
-        # Check aliases
-        for op in self._operations.values():
-            if op.metadata and op.metadata.replaces and name in op.metadata.replaces:
-                return True
-
-        return False
+        return name in self._operations or name in self._alias_index
 
     # ========================================================================
     # Execution
@@ -307,7 +356,8 @@ class OperationRegistry:
         model: Model,
         operation_name: str,
         params: Dict[str, Any],
-        enable_validation: bool = True
+        enable_validation: bool = True,
+        run_post_validation: bool = True
     ) -> OperationResult:
         """
         Execute an operation with validation.
@@ -317,6 +367,8 @@ class OperationRegistry:
             operation_name: Name of operation to execute
             params: Operation parameters
             enable_validation: Run pre/post validation hooks
+            run_post_validation: Run the post hook now; batch callers pass
+                False and call validate_post() once the batch is done
 
         Returns:
             OperationResult
@@ -330,8 +382,9 @@ class OperationRegistry:
         operation = self.get(operation_name)
 
         # Validate parameters against schema
-        if operation.input_schema:
-            self._validate_params(params, operation.input_schema, operation_name)
+        validator = self._validators.get(operation.name)
+        if validator is not None:
+            validator(params)
 
         # Pre-validation
         if enable_validation and operation.validation_hooks and operation.validation_hooks.pre:
@@ -353,15 +406,32 @@ class OperationRegistry:
                 result = await result
 
         # Post-validation
-        if enable_validation and operation.validation_hooks and operation.validation_hooks.post:
+        if enable_validation and run_post_validation:
+            self.validate_post(operation_name, model, result)
+
+        return result
+
+    def validate_post(self, operation_name: str, model: Model, result: Any) -> None:
+        """
+        Run an operation's post-validation hook, if it has one.
+
+        Args:
+            operation_name: Name of the executed operation
+            model: Model after execution
+            result: Result returned by the handler
+
+        Raises:
+            OperationNotFound: If operation doesn't exist
+            SchemaValidationError: If post-validation fails
+        """
+        operation = self.get(operation_name)
+        if operation.validation_hooks and operation.validation_hooks.post:
             post_result = operation.validation_hooks.post(model, result)
             if not post_result.is_valid:
                 raise SchemaValidationError(
                     f"Post-validation failed for {operation_name}: {post_result.errors}"
                 )
 
-        return result
-
     # ========================================================================
     # Schema Generation
     # ========================================================================
@@ -370,12 +440,19 @@ class OperationRegistry:
         """
         Generate JSON Schema for schema_query tool.
 
+        The result is memoized per tool until the next registration; callers
+        must treat it as read-only.
+
         Args:
             for_tool: Tool to generate schema for
 
         Returns:
             JSON Schema for the tool
         """
+        cached = self._schema_cache.get(for_tool)
+        if cached is not None:
+            return cached
+
         # Generate enum of all operation names
         operation_names = list(self._operations.keys())
 
@@ -392,16 +469,21 @@ class OperationRegistry:
                 "required": ["operation", "params"]
             })
 
-        return {
+        schema = {
             "type": "object",
             "oneOf": schemas,
             "description": f"Operations available for {for_tool}"
         }
+        self._schema_cache[for_tool] = schema
+        return schema
 
     def get_operation_docs(self, operation_name: str) -> Dict[str, Any]:
         """
         Get documentation for an operation.
 
+        Memoized per operation until the next registration; callers must
+        treat the result as read-only.
+
         Args:
             operation_name: Name of operation
 
@@ -413,7 +495,11 @@ class OperationRegistry:
         """
         operation = self.get(operation_name)
 
-        return {
+        cached = self._docs_cache.get(operation.name)
+        if cached is not None:
+            return cached
+
+        docs = {
             "name": operation.name,
             "version": operation.version,
             "category": operation.category.value,
@@ -425,6 +511,8 @@ class OperationRegistry:
                 "tags": operation.metadata.tags if operation.metadata else [],
             }
         }
+        self._docs_cache[operation.name] = docs
+        return docs
 
     # ========================================================================
     # Internal Helpers
@@ -459,34 +547,6 @@ class OperationRegistry:
                 f"Invalid version format: {operation.version} (expected: X.Y.Z)"
             )
 
-    def _validate_params(
-        self,
-        params: Dict[str, Any],
-        schema: JSONSchema,
-        operation_name: str
-    ) -> None:
-        """
-        Validate parameters against JSON schema.
-
-        Args:
-            params: Parameters to validate
-            schema: JSON schema to validate against
-            operation_name: Operation name (for error messages)
-
-        Raises:
-            SchemaValidationError: If validation fails
-        """
-        # Simple validation - check required fields
-        required = schema.get("required", [])
-        for field in required:
-            if field not in params:
-                raise SchemaValidationError(
-                    f"Missing required parameter '{field}' for operation '{operation_name}'"
-                )
-
-        # Could add more sophisticated JSON Schema validation here
-        # using jsonschema library, but keeping simple for now
-
 
 # ============================================================================
 # Singleton
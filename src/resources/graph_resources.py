@@ -9,6 +9,7 @@ from mcp.types import TextContent
 from pydexpi.dexpi_classes.dexpiModel import DexpiModel
 from pydexpi.loaders import JsonSerializer
 from ..adapters.sfiles_adapter import get_flowsheet_class
+from ..core import dexpi_serialization
 
 # Safe import with helpful error messages
 Flowsheet = get_flowsheet_class()
@@ -154,19 +155,8 @@ class GraphResourceProvider:
         model = self.dexpi_models[model_id]
         
         if format_type == "json":
-            # Export as JSON
-            import tempfile
-            import os
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                self.json_serializer.save(model, f.name)
-                temp_path = f.name
-            
-            with open(temp_path, 'r') as f:
-                content = f.read()
-            
-            os.unlink(temp_path)
-            return content
+            # Export as JSON (same text as JsonSerializer.save)
+            return "".join(dexpi_serialization.iter_json(model, indent=4))
         
         elif format_type == "graphml":
             # Export as GraphML
@@ -1,9 +1,13 @@
 """Main MCP server implementation for engineering drawings."""
 
 import asyncio
+import importlib
+import importlib.util
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import uuid4
 
 from mcp import Resource, Tool, server
@@ -11,29 +15,45 @@ from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.types import TextContent
 
-from .core.model_store import InMemoryModelStore, ModelType, CachingHook
-from .tools.dexpi_tools import DexpiTools
-from .tools.sfiles_tools import SfilesTools
-from .tools.bfd_tools import BfdTools
-from .tools.project_tools import ProjectTools
-from .tools.validation_tools import ValidationTools
-from .tools.schema_tools import SchemaTools
-from .tools.graph_tools import GraphTools
-from .tools.search_tools import SearchTools
-from .tools.batch_tools import BatchTools
-from .tools.template_tools import TemplateTools
-from .tools.graph_modify_tools import GraphModifyTools
-from .tools.model_tools import ModelTools
-from .tools.transaction_tools import TransactionTools
-from .tools.visualization_tools import VisualizationTools
-from .tools.layout_tools import LayoutTools
-from .resources.graph_resources import GraphResourceProvider
-from .converters.graph_converter import UnifiedGraphConverter
+from .core.model_store import InMemoryModelStore, ModelType, CachingHook, create_model_store
+from .tools.tool_catalog import catalog_path, load_catalog, save_catalog, source_fingerprint
+from .utils.response import error_response
+from .utils.schema_validation import SchemaChecker, compile_schema_checker
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tool handler attribute -> (module under src/tools, class, routing method),
+# in list_tools order (Phase 4 unified tools first). Modules are imported
+# on first use; the routing method is called as method(tool_name, arguments).
+TOOL_HANDLERS = {
+    "model_tools": ("model_tools", "ModelTools", "handle_tool"),
+    "transaction_tools": ("transaction_tools", "TransactionTools", "handle_tool"),
+    # Existing tools (maintained for backward compatibility)
+    "dexpi_tools": ("dexpi_tools", "DexpiTools", "handle_tool"),
+    "sfiles_tools": ("sfiles_tools", "SfilesTools", "handle_tool"),
+    "bfd_tools": ("bfd_tools", "BfdTools", "execute"),
+    "project_tools": ("project_tools", "ProjectTools", "handle_tool"),
+    "validation_tools": ("validation_tools", "ValidationTools", "handle_tool"),
+    "schema_tools": ("schema_tools", "SchemaTools", "handle_tool"),
+    "graph_tools": ("graph_tools", "GraphTools", "handle_tool"),
+    "search_tools": ("search_tools", "SearchTools", "handle_tool"),
+    "batch_tools": ("batch_tools", "BatchTools", "handle_tool"),
+    "template_tools": ("template_tools", "TemplateTools", "handle_tool_call"),
+    "graph_modify_tools": ("graph_modify_tools", "GraphModifyTools", "handle_tool"),
+    "visualization_tools": ("visualization_tools", "VisualizationTools", "handle_tool"),
+    "layout_tools": ("layout_tools", "LayoutTools", "handle_tool"),
+}
+
+
+ToolHandler = Callable[[dict], Awaitable[dict]]
+
+
+def _tool_class(attr: str) -> type:
+    module_name, class_name, _ = TOOL_HANDLERS[attr]
+    return getattr(importlib.import_module(f".tools.{module_name}", __package__), class_name)
+
 
 def validate_dependencies():
     """
@@ -42,25 +62,23 @@ def validate_dependencies():
     Raises:
         ImportError: If critical dependencies are missing
     """
-    from .adapters.sfiles_adapter import validate_sfiles_available
-
     logger.info("Validating dependencies...")
 
+    # Located, not imported: both load on first use by a tool, so startup
+    # does not pay for pyDEXPI's class tree and SFILES2's plotting stack.
     # Check SFILES2 (Flowsheet_Class)
-    if not validate_sfiles_available():
+    if importlib.util.find_spec("Flowsheet_Class") is None:
         logger.error("✗ SFILES2 (Flowsheet_Class) not available")
         logger.error("Install with: pip install git+https://github.com/process-intelligence-research/SFILES2.git")
         raise ImportError("SFILES2 required but not installed")
 
     logger.info("✓ SFILES2 (Flowsheet_Class) available")
 
-    # Check pyDEXPI (implicitly checked by imports, but good to log)
-    try:
-        import pydexpi
-        logger.info("✓ pyDEXPI available")
-    except ImportError:
+    # Check pyDEXPI
+    if importlib.util.find_spec("pydexpi") is None:
         logger.error("✗ pyDEXPI not available")
-        raise
+        raise ImportError("pyDEXPI required but not installed")
+    logger.info("✓ pyDEXPI available")
 
     logger.info("✓ All dependencies validated")
 
@@ -72,7 +90,10 @@ class EngineeringDrawingMCPServer:
         """Initialize the MCP server with ModelStore-backed storage.
 
         Uses InMemoryModelStore for thread-safe storage with lifecycle hooks,
-        metadata tracking, and snapshot/rollback support.
+        metadata tracking, and snapshot/rollback support. Set
+        MODEL_STORE_BACKEND=disk to use DiskModelStore, which keeps only
+        MODEL_STORE_MAX_RESIDENT models per store in memory (see
+        create_model_store).
         """
         # Phase 7: Replace dict storage with ModelStore abstraction
         # ModelStore provides backward-compatible dict-like access while adding:
@@ -80,8 +101,8 @@ class EngineeringDrawingMCPServer:
         # - Lifecycle hooks for caching and events
         # - Snapshot/rollback for transaction support
         # - Metadata tracking (created_at, modified_at, access_count)
-        self.dexpi_models: InMemoryModelStore = InMemoryModelStore(ModelType.DEXPI)
-        self.flowsheets: InMemoryModelStore = InMemoryModelStore(ModelType.SFILES)
+        self.dexpi_models: InMemoryModelStore = create_model_store(ModelType.DEXPI)
+        self.flowsheets: InMemoryModelStore = create_model_store(ModelType.SFILES)
 
         # Phase 7+: CachingHook for graph/stats cache invalidation
         # Shared hook registered with both stores to auto-invalidate cached graphs
@@ -93,133 +114,199 @@ class EngineeringDrawingMCPServer:
         # Note: Operation registry is initialized defensively in TransactionManager
         # No need to call register_all_operations() here - avoids duplicate registration
 
-        # Initialize tool handlers with both stores for cross-conversion
-        self.dexpi_tools = DexpiTools(self.dexpi_models, self.flowsheets)
-        self.sfiles_tools = SfilesTools(self.flowsheets, self.dexpi_models)
-        self.bfd_tools = BfdTools(self.flowsheets)
-        self.project_tools = ProjectTools(self.dexpi_models, self.flowsheets)
-        self.validation_tools = ValidationTools(self.dexpi_models, self.flowsheets)
-        self.schema_tools = SchemaTools()
-        self.graph_tools = GraphTools(self.dexpi_models, self.flowsheets, self.caching_hook)
-        self.search_tools = SearchTools(self.dexpi_models, self.flowsheets)
-        self.batch_tools = BatchTools(
-            self.dexpi_tools,
-            self.sfiles_tools,
-            self.dexpi_models,
-            self.flowsheets
-        )
-        self.template_tools = TemplateTools(self.dexpi_models, self.flowsheets)
-        self.graph_modify_tools = GraphModifyTools(
-            self.dexpi_models,
-            self.flowsheets,
-            self.dexpi_tools,
-            self.sfiles_tools,
-            self.search_tools
-        )
-        self.layout_tools = LayoutTools(self.dexpi_models, self.flowsheets)
-        # Wire VisualizationTools with shared LayoutStore for use_layout support
-        self.visualization_tools = VisualizationTools(
-            self.dexpi_models,
-            self.flowsheets,
-            layout_store=self.layout_tools.layout_store
-        )
-
-        # Phase 4: Unified model and transaction tools
-        self.model_tools = ModelTools(
-            self.dexpi_models,
-            self.flowsheets,
-            self.dexpi_tools,
-            self.sfiles_tools
-        )
-        self.transaction_tools = TransactionTools(
-            self.dexpi_models,
-            self.flowsheets
-        )
+        # Tool handlers (with both stores for cross-conversion), converters
+        # and resources are created on first use, see __getattr__. The heavy
+        # subsystems (pyDEXPI, visualization, layout, templates) are only
+        # imported when a tool that needs them is called.
+        self._lazy_factories: Dict[str, Callable[[], Any]] = {
+            "dexpi_tools": lambda: _tool_class("dexpi_tools")(self.dexpi_models, self.flowsheets),
+            "sfiles_tools": lambda: _tool_class("sfiles_tools")(self.flowsheets, self.dexpi_models),
+            "bfd_tools": lambda: _tool_class("bfd_tools")(self.flowsheets),
+            "validation_tools": lambda: _tool_class("validation_tools")(self.dexpi_models, self.flowsheets),
+            "schema_tools": lambda: _tool_class("schema_tools")(),
+            "graph_tools": lambda: _tool_class("graph_tools")(
+                self.dexpi_models, self.flowsheets, self.caching_hook
+            ),
+            "search_tools": lambda: _tool_class("search_tools")(
+                self.dexpi_models, self.flowsheets, self.caching_hook
+            ),
+            "batch_tools": lambda: _tool_class("batch_tools")(
+                self.dexpi_tools,
+                self.sfiles_tools,
+                self.dexpi_models,
+                self.flowsheets
+            ),
+            "template_tools": lambda: _tool_class("template_tools")(self.dexpi_models, self.flowsheets),
+            "graph_modify_tools": lambda: _tool_class("graph_modify_tools")(
+                self.dexpi_models,
+                self.flowsheets,
+                self.dexpi_tools,
+                self.sfiles_tools,
+                self.search_tools
+            ),
+            "layout_tools": lambda: _tool_class("layout_tools")(self.dexpi_models, self.flowsheets),
+            "project_tools": lambda: _tool_class("project_tools")(
+                self.dexpi_models,
+                self.flowsheets,
+                layout_store=self.layout_tools.layout_store
+            ),
+            # Wire VisualizationTools with shared LayoutStore for use_layout support
+            "visualization_tools": lambda: _tool_class("visualization_tools")(
+                self.dexpi_models,
+                self.flowsheets,
+                layout_store=self.layout_tools.layout_store
+            ),
+            # Phase 4: Unified model and transaction tools
+            "model_tools": lambda: _tool_class("model_tools")(
+                self.dexpi_models,
+                self.flowsheets,
+                self.dexpi_tools,
+                self.sfiles_tools,
+                persistence=self.project_tools.persistence
+            ),
+            "transaction_tools": lambda: _tool_class("transaction_tools")(
+                self.dexpi_models,
+                self.flowsheets
+            ),
+            # Converters and resources
+            "graph_converter": self._create_graph_converter,
+            "resource_provider": self._create_resource_provider,
+        }
+        # Tool list and routing table (tool name -> handler attribute),
+        # built once by _load_tools()
+        self._tools: Optional[List[Tool]] = None
+        self._routes: Dict[str, str] = {}
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        # Tool name -> bound routing method and compiled argument checker,
+        # filled on first call of each tool
+        self._bound: Dict[str, ToolHandler] = {}
+        self._checkers: Dict[str, SchemaChecker] = {}
 
-        # Initialize converters and resources
-        self.graph_converter = UnifiedGraphConverter()
-        self.resource_provider = GraphResourceProvider(
-            self.dexpi_models, 
-            self.flowsheets,
-            self.graph_converter
-        )
-        
         # Create MCP server instance
         self.server = Server("engineering-mcp")
         
         # Register handlers
         self._register_handlers()
     
+    def __getattr__(self, name: str) -> Any:
+        """Create a lazily initialized tool handler, converter or resource provider."""
+        factories = self.__dict__.get("_lazy_factories")
+        if factories is None or name not in factories:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = factories[name]()
+        setattr(self, name, value)
+        logger.debug(f"Initialized {name}")
+        return value
+
+    def _create_graph_converter(self):
+        from .converters.graph_converter import UnifiedGraphConverter
+        return UnifiedGraphConverter()
+
+    def _create_resource_provider(self):
+        from .resources.graph_resources import GraphResourceProvider
+        return GraphResourceProvider(
+            self.dexpi_models,
+            self.flowsheets,
+            self.graph_converter
+        )
+
+    def get_tools(self) -> List[Tool]:
+        """All tool definitions, built once per process.
+
+        The list comes from the tool catalog (see tools/tool_catalog.py)
+        when it matches the current sources; otherwise every handler is
+        created, asked for its tools, and the catalog is rewritten.
+        """
+        if self._tools is None:
+            self._load_tools()
+        return list(self._tools)
+
+    def _load_tools(self) -> None:
+        path = catalog_path()
+        fingerprint = source_fingerprint()
+        entries = load_catalog(path, fingerprint, TOOL_HANDLERS)
+        if entries is None:
+            entries = [
+                (attr, tool)
+                for attr in TOOL_HANDLERS
+                for tool in getattr(self, attr).get_tools()
+            ]
+            save_catalog(entries, path, fingerprint)
+        for attr, tool in entries:
+            if tool.name in self._routes:
+                raise ValueError(
+                    f"Tool {tool.name} is defined by both {self._routes[tool.name]} and {attr}"
+                )
+            self._routes[tool.name] = attr
+            self._schemas[tool.name] = tool.inputSchema
+        self._tools = [tool for _, tool in entries]
+
+    async def dispatch_tool(self, name: str, arguments: dict) -> dict:
+        """Validate arguments against the tool's input schema and run the tool.
+
+        Routing is a table lookup; the schema check uses a validator
+        compiled once per tool, so invalid calls never reach tool code.
+
+        Returns:
+            The tool's response, or an error response with code
+            UNKNOWN_TOOL or INVALID_ARGUMENTS
+        """
+        check = self._checkers.get(name) or self._compile_checker(name)
+        if check is None:
+            return error_response(
+                f"Unknown tool: {name}",
+                code="UNKNOWN_TOOL",
+                details={"tool": name}
+            )
+        message = check(arguments)
+        if message is not None:
+            return error_response(
+                f"Invalid arguments for {name}: {message}",
+                code="INVALID_ARGUMENTS",
+                details={"tool": name}
+            )
+        handler = self._bound.get(name) or self._bind(name)
+        return await handler(arguments)
+
+    def _compile_checker(self, name: str) -> Optional[SchemaChecker]:
+        """Compile a tool's argument checker, or None if no listed tool has this name."""
+        if self._tools is None:
+            self._load_tools()
+        if name not in self._schemas:
+            return None
+        check = self._checkers[name] = compile_schema_checker(self._schemas[name])
+        return check
+
+    def _bind(self, name: str) -> ToolHandler:
+        """Bind a tool's routing method, creating its handler on first use."""
+        attr = self._routes[name]
+        handler = self._bound[name] = partial(getattr(getattr(self, attr), TOOL_HANDLERS[attr][2]), name)
+        return handler
+
     def _register_handlers(self):
         """Register all MCP handlers."""
         
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List all available tools."""
-            tools = []
-            # Phase 4: Unified tools first (recommended)
-            tools.extend(self.model_tools.get_tools())
-            tools.extend(self.transaction_tools.get_tools())
-            # Existing tools (maintained for backward compatibility)
-            tools.extend(self.dexpi_tools.get_tools())
-            tools.extend(self.sfiles_tools.get_tools())
-            tools.extend(self.bfd_tools.get_tools())
-            tools.extend(self.project_tools.get_tools())
-            tools.extend(self.validation_tools.get_tools())
-            tools.extend(self.schema_tools.get_tools())
-            tools.extend(self.graph_tools.get_tools())
-            tools.extend(self.search_tools.get_tools())
-            tools.extend(self.batch_tools.get_tools())
-            tools.extend(self.template_tools.get_tools())
-            tools.extend(self.graph_modify_tools.get_tools())
-            tools.extend(self.visualization_tools.get_tools())
-            tools.extend(self.layout_tools.get_tools())
-            return tools
+            return self.get_tools()
         
-        @self.server.call_tool()
+        # Arguments are checked by dispatch_tool with compiled validators;
+        # mcp versions that validate themselves would re-check every call
+        if "validate_input" in inspect.signature(self.server.call_tool).parameters:
+            call_tool = self.server.call_tool(validate_input=False)
+        else:
+            call_tool = self.server.call_tool()
+
+        @call_tool
         async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             """Route tool calls to appropriate handlers."""
             try:
-                # Phase 4: Unified tools (priority routing)
-                if name.startswith("model_tx_"):
-                    result = await self.transaction_tools.handle_tool(name, arguments)
-                elif name in ["model_create", "model_load", "model_save", "model_combine"]:
-                    result = await self.model_tools.handle_tool(name, arguments)
-                # Check explicit batch tools first (before prefix matching)
-                elif name in ["model_batch_apply", "rules_apply", "graph_connect"]:
-                    result = await self.batch_tools.handle_tool(name, arguments)
-                elif name == "graph_modify":
-                    result = await self.graph_modify_tools.handle_tool(name, arguments)
-                elif name.startswith("template_") or name == "area_deploy":
-                    result = await self.template_tools.handle_tool_call(name, arguments)
-                elif name.startswith("dexpi_"):
-                    result = await self.dexpi_tools.handle_tool(name, arguments)
-                elif name.startswith("sfiles_"):
-                    result = await self.sfiles_tools.handle_tool(name, arguments)
-                elif name.startswith("bfd_"):
-                    result = await self.bfd_tools.execute(name, arguments)
-                elif name.startswith("project_"):
-                    result = await self.project_tools.handle_tool(name, arguments)
-                elif name.startswith("validate_"):
-                    result = await self.validation_tools.handle_tool(name, arguments)
-                elif name.startswith("schema_"):
-                    result = await self.schema_tools.handle_tool(name, arguments)
-                elif name.startswith("graph_"):
-                    result = await self.graph_tools.handle_tool(name, arguments)
-                elif name.startswith("search_") or name == "query_model_statistics":
-                    result = await self.search_tools.handle_tool(name, arguments)
-                elif name.startswith("visualize_"):
-                    result = await self.visualization_tools.handle_tool(name, arguments)
-                elif name.startswith("layout_"):
-                    result = await self.layout_tools.handle_tool(name, arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                
+                result = await self.dispatch_tool(name, arguments or {})
                 return [TextContent(type="text", text=json.dumps(result, indent=2))]
             
             except Exception as e:
                 logger.error(f"Error executing tool {name}: {e}")
-                from .utils.response import error_response
                 error_result = error_response(
                     message=str(e),
                     code="TOOL_EXECUTION_ERROR",
@@ -240,7 +327,10 @@ class EngineeringDrawingMCPServer:
     async def run(self):
         """Run the MCP server."""
         from mcp.server.stdio import stdio_server
-        
+
+        # Build (or load) the tool list before the first request
+        self.get_tools()
+
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
@@ -4,6 +4,7 @@ Template system for parametric model construction.
 Provides thin wrapper over pyDEXPI's DexpiPattern with parameter substitution.
 """
 
+from .expressions import CompiledExpression, ExpressionError, compile_expression
 from .substitution_engine import ParameterSubstitutionEngine
 from .parametric_template import (
     ParametricTemplate,
@@ -16,6 +17,9 @@ from .parametric_template import (
 )
 
 __all__ = [
+    'CompiledExpression',
+    'ExpressionError',
+    'compile_expression',
     'ParameterSubstitutionEngine',
     'ParametricTemplate',
     'ValidationResult',
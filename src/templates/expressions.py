@@ -0,0 +1,366 @@
+"""
+Safe compiled expressions for templates and expansion rules.
+
+Template expressions (``${index + 1}``, ``${pump_count * 2}``) and PFD
+expansion conditions (``${cover_type|none} != 'none'``) used to be
+evaluated by substituting parameter values into the expression text and
+running ``eval`` on the result, once per use. This module parses each
+expression once into a restricted AST, compiles it into a tree of
+closures and caches the result by expression string.
+
+Supported:
+- literals (numbers, strings, True/False/None, lists, tuples, sets)
+- parameter names, ``${name}`` and ``${name|default}`` placeholders
+- arithmetic (+ - * / // % **; % on numbers only), unary - + not, and/or
+- comparisons (== != < <= > >= in, not in, is, is not), conditional
+  expressions, subscripts (``flows[0]``)
+- calls to SAFE_FUNCTIONS (min, max, abs, round, int, float, str, len, bool)
+
+Anything else (attribute access, other calls, comprehensions, lambdas,
+dunder names) is rejected at compile time with ExpressionError, so an
+expression can only read the parameters it is evaluated against.
+
+Usage:
+    from src.templates.expressions import compile_expression
+
+    expression = compile_expression("${train_count|1} > 1 and aeration == 'fine'")
+    expression.evaluate({"aeration": "fine"})
+"""
+
+import ast
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Tuple
+
+# ${name} or ${name|default}
+PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}|]+)(?:\|([^}]+))?\}")
+
+SAFE_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "min": min, "max": max, "abs": abs, "round": round,
+    "int": int, "float": float, "str": str, "len": len, "bool": bool,
+}
+
+# Guards against expressions that would exhaust memory or CPU
+MAX_EXPRESSION_LENGTH = 1000
+MAX_EXPONENT = 128
+MAX_SEQUENCE_LENGTH = 10_000
+MAX_INTEGER_BITS = 4096
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is invalid, unsafe or fails to evaluate."""
+    pass
+
+
+def coerce_literal(raw_value: str) -> Any:
+    """Value of a placeholder default: quoted string, bool, int, float or bare string."""
+    value = raw_value.strip()
+    if not value:
+        return ""
+
+    if (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
+        return value[1:-1]
+
+    lowered = value.lower()
+    if lowered in {"true", "false"}:
+        return lowered == "true"
+
+    if re.fullmatch(r"-?\d+", value):
+        return int(value)
+
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """An expression parsed and compiled once.
+
+    Attributes:
+        source: Expression text
+        names: Parameter names the expression reads (placeholders included)
+    """
+    source: str
+    names: FrozenSet[str]
+    _evaluate: Evaluator
+
+    def evaluate(self, variables: Mapping[str, Any]) -> Any:
+        """
+        Evaluate against parameter values.
+
+        Raises:
+            ExpressionError: If a referenced parameter is missing (and has no
+                placeholder default) or an operation fails
+        """
+        try:
+            return self._evaluate(variables)
+        except ExpressionError:
+            raise
+        except (TypeError, ValueError, ArithmeticError, LookupError) as e:
+            raise ExpressionError(f"Failed to evaluate expression '{self.source}': {e}") from e
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(source: str) -> CompiledExpression:
+    """
+    Parse and compile an expression (cached by expression string).
+
+    Raises:
+        ExpressionError: If the expression is too long, not valid syntax or
+            uses anything outside the supported subset
+    """
+    if len(source) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"Expression longer than {MAX_EXPRESSION_LENGTH} characters")
+
+    # Placeholders become reserved names; user names may not use the prefix
+    placeholders: List[Tuple[str, str]] = []
+
+    def placeholder(match: re.Match) -> str:
+        name = match.group(1).strip()
+        if not name:
+            raise ExpressionError(f"Invalid parameter placeholder in '{source}' (missing name)")
+        placeholders.append((name, match.group(2)))
+        return f" {_PLACEHOLDER_PREFIX}{len(placeholders) - 1} "
+
+    if _PLACEHOLDER_PREFIX in source:
+        raise ExpressionError(f"Names starting with '{_PLACEHOLDER_PREFIX}' are reserved: '{source}'")
+    text = PLACEHOLDER_PATTERN.sub(placeholder, source).strip()
+
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid expression '{source}': {e.msg}") from e
+
+    compiler = _Compiler(source, placeholders)
+    evaluate = compiler.compile(tree.body)
+    return CompiledExpression(source=source, names=frozenset(compiler.names), _evaluate=evaluate)
+
+
+def evaluate_expression(source: str, variables: Mapping[str, Any]) -> Any:
+    """Compile (cached) and evaluate an expression."""
+    return compile_expression(source).evaluate(variables)
+
+
+_PLACEHOLDER_PREFIX = "__placeholder_"
+
+_BINARY_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+}
+
+_UNARY_OPERATORS: Dict[type, Callable[[Any], Any]] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Not: operator.not_,
+}
+
+_COMPARISONS: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+
+def _multiply(left: Any, right: Any) -> Any:
+    for sequence, count in ((left, right), (right, left)):
+        if isinstance(sequence, (str, list, tuple)) and isinstance(count, int):
+            if len(sequence) * count > MAX_SEQUENCE_LENGTH:
+                raise ExpressionError(f"Sequence repetition longer than {MAX_SEQUENCE_LENGTH}")
+    if isinstance(left, int) and isinstance(right, int):
+        if abs(left).bit_length() + abs(right).bit_length() > MAX_INTEGER_BITS:
+            raise ExpressionError(f"Integer product larger than {MAX_INTEGER_BITS} bits")
+    return left * right
+
+
+def _power(base: Any, exponent: Any) -> Any:
+    if isinstance(exponent, (int, float)) and abs(exponent) > MAX_EXPONENT:
+        raise ExpressionError(f"Exponent larger than {MAX_EXPONENT}")
+    # Nested powers stay under MAX_EXPONENT at every level, so bound the result too
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+        if abs(base).bit_length() * exponent > MAX_INTEGER_BITS:
+            raise ExpressionError(f"Integer power larger than {MAX_INTEGER_BITS} bits")
+    return base ** exponent
+
+
+def _modulo(left: Any, right: Any) -> Any:
+    # % on a string is printf formatting ('%0200000000d' % 1); only numbers here
+    if isinstance(left, (str, bytes)):
+        raise ExpressionError("String formatting with % is not supported")
+    return left % right
+
+
+_BINARY_OPERATORS[ast.Mult] = _multiply
+_BINARY_OPERATORS[ast.Mod] = _modulo
+_BINARY_OPERATORS[ast.Pow] = _power
+
+
+class _Compiler:
+    """Turns a restricted AST into nested closures."""
+
+    def __init__(self, source: str, placeholders: List[Tuple[str, str]]):
+        self.source = source
+        self.placeholders = placeholders
+        self.names: List[str] = []
+
+    def reject(self, node: ast.AST) -> ExpressionError:
+        return ExpressionError(f"Unsupported syntax in expression '{self.source}': {type(node).__name__}")
+
+    def compile(self, node: ast.AST) -> Evaluator:
+        handler = getattr(self, f"_compile_{type(node).__name__}", None)
+        if handler is None:
+            raise self.reject(node)
+        return handler(node)
+
+    def _compile_Constant(self, node: ast.Constant) -> Evaluator:
+        value = node.value
+        if not isinstance(value, (str, int, float, bool, type(None))):
+            raise self.reject(node)
+        return lambda variables: value
+
+    def _compile_Name(self, node: ast.Name) -> Evaluator:
+        name = node.id
+        if name.startswith(_PLACEHOLDER_PREFIX):
+            return self._compile_placeholder(*self.placeholders[int(name[len(_PLACEHOLDER_PREFIX):])])
+        if name.startswith("__"):
+            raise ExpressionError(f"Dunder names are not allowed in expression '{self.source}': {name}")
+        self.names.append(name)
+        source = self.source
+
+        def load(variables: Mapping[str, Any]) -> Any:
+            try:
+                return variables[name]
+            except KeyError:
+                raise ExpressionError(f"Expression '{source}' references unknown parameter '{name}'") from None
+        return load
+
+    def _compile_placeholder(self, name: str, default_raw: Any) -> Evaluator:
+        self.names.append(name)
+        source = self.source
+        if default_raw is None:
+            def load(variables: Mapping[str, Any]) -> Any:
+                try:
+                    return variables[name]
+                except KeyError:
+                    raise ExpressionError(
+                        f"Expression '{source}' references parameter '{name}' without a default "
+                        "and it was not provided."
+                    ) from None
+            return load
+
+        default = coerce_literal(default_raw)
+        return lambda variables: variables[name] if name in variables else default
+
+    def _compile_sequence(self, node: Any, factory: Callable[[Any], Any]) -> Evaluator:
+        items = [self.compile(item) for item in node.elts]
+        return lambda variables: factory(item(variables) for item in items)
+
+    def _compile_List(self, node: ast.List) -> Evaluator:
+        return self._compile_sequence(node, list)
+
+    def _compile_Tuple(self, node: ast.Tuple) -> Evaluator:
+        return self._compile_sequence(node, tuple)
+
+    def _compile_Set(self, node: ast.Set) -> Evaluator:
+        return self._compile_sequence(node, set)
+
+    def _compile_BinOp(self, node: ast.BinOp) -> Evaluator:
+        op = _BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise self.reject(node.op)
+        left, right = self.compile(node.left), self.compile(node.right)
+        return lambda variables: op(left(variables), right(variables))
+
+    def _compile_UnaryOp(self, node: ast.UnaryOp) -> Evaluator:
+        op = _UNARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise self.reject(node.op)
+        operand = self.compile(node.operand)
+        return lambda variables: op(operand(variables))
+
+    def _compile_BoolOp(self, node: ast.BoolOp) -> Evaluator:
+        values = [self.compile(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            def evaluate(variables: Mapping[str, Any]) -> Any:
+                result = True
+                for value in values:
+                    result = value(variables)
+                    if not result:
+                        return result
+                return result
+        else:
+            def evaluate(variables: Mapping[str, Any]) -> Any:
+                result = False
+                for value in values:
+                    result = value(variables)
+                    if result:
+                        return result
+                return result
+        return evaluate
+
+    def _compile_Compare(self, node: ast.Compare) -> Evaluator:
+        operands = [self.compile(node.left)] + [self.compile(comparator) for comparator in node.comparators]
+        ops = []
+        for op in node.ops:
+            compare = _COMPARISONS.get(type(op))
+            if compare is None:
+                raise self.reject(op)
+            ops.append(compare)
+
+        if len(ops) == 1:
+            compare, left, right = ops[0], operands[0], operands[1]
+            return lambda variables: compare(left(variables), right(variables))
+
+        def evaluate(variables: Mapping[str, Any]) -> bool:
+            left = operands[0](variables)
+            for compare, operand in zip(ops, operands[1:], strict=True):
+                right = operand(variables)
+                if not compare(left, right):
+                    return False
+                left = right
+            return True
+        return evaluate
+
+    def _compile_IfExp(self, node: ast.IfExp) -> Evaluator:
+        test, body, orelse = self.compile(node.test), self.compile(node.body), self.compile(node.orelse)
+        return lambda variables: body(variables) if test(variables) else orelse(variables)
+
+    def _compile_Subscript(self, node: ast.Subscript) -> Evaluator:
+        if isinstance(node.slice, ast.Slice):
+            raise self.reject(node.slice)
+        value, index = self.compile(node.value), self.compile(node.slice)
+        return lambda variables: value(variables)[index(variables)]
+
+    def _compile_Call(self, node: ast.Call) -> Evaluator:
+        if not isinstance(node.func, ast.Name) or node.func.id not in SAFE_FUNCTIONS or node.keywords:
+            raise ExpressionError(
+                f"Only calls to {', '.join(sorted(SAFE_FUNCTIONS))} are allowed in expression '{self.source}'"
+            )
+        function = SAFE_FUNCTIONS[node.func.id]
+        args = [self.compile(arg) for arg in node.args]
+        return lambda variables: function(*(arg(variables) for arg in args))
+
+
+__all__ = [
+    "CompiledExpression",
+    "ExpressionError",
+    "PLACEHOLDER_PATTERN",
+    "SAFE_FUNCTIONS",
+    "coerce_literal",
+    "compile_expression",
+    "evaluate_expression",
+]
@@ -8,14 +8,33 @@ import logging
 import yaml
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydexpi.dexpi_classes.dexpiModel import DexpiModel
 
+from ..utils.template_cache import get_template_cache
 from .substitution_engine import ParameterSubstitutionEngine
 
 logger = logging.getLogger(__name__)
 
+# Parameter types a template schema may declare ("string" when omitted)
+PARAMETER_TYPES = frozenset({"string", "integer", "number", "boolean", "array", "object"})
+
+
+def _resolve_component_class(component_type: Optional[str]) -> Optional[type]:
+    """pyDEXPI class for a component type: equipment first, then piping, then instrumentation."""
+    from pydexpi.dexpi_classes import equipment as eq_module
+    from pydexpi.dexpi_classes import piping as piping_module
+    from pydexpi.dexpi_classes import instrumentation as inst_module
+
+    if not component_type:
+        return None
+    for module in [eq_module, piping_module, inst_module]:
+        component_class = getattr(module, component_type, None)
+        if component_class:
+            return component_class
+    return None
+
 
 # ==============================================================================
 # Result Types
@@ -67,6 +86,39 @@ class TemplateLoadError(TemplateError):
 # ParametricTemplate Class
 # ==============================================================================
 
+def _value_errors(param_name: str, param_schema: Dict[str, Any], value: Any) -> List[str]:
+    """Type, range and enum errors of one parameter value."""
+    errors = []
+
+    # Type check
+    expected_type = param_schema.get("type")
+    if expected_type == "integer" and not isinstance(value, int):
+        errors.append(f"Parameter {param_name} must be integer, got {type(value).__name__}")
+
+    elif expected_type == "number" and not isinstance(value, (int, float)):
+        errors.append(f"Parameter {param_name} must be number, got {type(value).__name__}")
+
+    elif expected_type == "string" and not isinstance(value, str):
+        errors.append(f"Parameter {param_name} must be string, got {type(value).__name__}")
+
+    elif expected_type == "boolean" and not isinstance(value, bool):
+        errors.append(f"Parameter {param_name} must be boolean, got {type(value).__name__}")
+
+    # Range check (for numbers)
+    if expected_type in ["integer", "number"]:
+        if "min" in param_schema and value < param_schema["min"]:
+            errors.append(f"Parameter {param_name} below minimum: {value} < {param_schema['min']}")
+
+        if "max" in param_schema and value > param_schema["max"]:
+            errors.append(f"Parameter {param_name} above maximum: {value} > {param_schema['max']}")
+
+    # Enum check
+    if "enum" in param_schema and value not in param_schema["enum"]:
+        errors.append(f"Parameter {param_name} not in allowed values: {value} not in {param_schema['enum']}")
+
+    return errors
+
+
 class ParametricTemplate:
     """
     Parametric template wrapping DexpiPattern.
@@ -108,11 +160,21 @@ class ParametricTemplate:
         except KeyError as e:
             raise TemplateLoadError(f"Missing required field in template: {e}")
 
+        self._defaults = self._compile_parameters()
+        self._component_classes = {
+            component_def.get("type"): _resolve_component_class(component_def.get("type"))
+            for component_def in self.components
+        }
+
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> "ParametricTemplate":
         """
         Load template from YAML file.
 
+        Templates are compiled once per file content through the shared
+        template cache (src/utils/template_cache.py) and the same instance
+        is returned until the file changes.
+
         Args:
             yaml_path: Path to YAML template file
 
@@ -120,19 +182,51 @@ class ParametricTemplate:
             ParametricTemplate instance
 
         Raises:
-            TemplateLoadError: If file not found or invalid YAML
+            TemplateLoadError: If file not found, invalid YAML or invalid parameter schema
         """
         try:
-            with open(yaml_path, 'r') as f:
-                template_def = yaml.safe_load(f)
-
-            return cls(template_def)
+            return get_template_cache().load(
+                f"parametric_template:{cls.__qualname__}", yaml_path,
+                lambda content, path: cls(yaml.safe_load(content))
+            )
 
         except FileNotFoundError:
             raise TemplateLoadError(f"Template file not found: {yaml_path}")
         except yaml.YAMLError as e:
             raise TemplateLoadError(f"Invalid YAML in template: {e}")
 
+    def _compile_parameters(self) -> Dict[str, Any]:
+        """
+        Check the parameter schema once at load time.
+
+        Returns:
+            Default value of every parameter that has one
+
+        Raises:
+            TemplateLoadError: If a parameter spec is malformed or its default invalid
+        """
+        for param_name, param_schema in self.parameters.items():
+            if not isinstance(param_schema, dict):
+                raise TemplateLoadError(f"Parameter {param_name} must be a mapping, got {type(param_schema).__name__}")
+            if param_schema.get("type", "string") not in PARAMETER_TYPES:
+                raise TemplateLoadError(
+                    f"Parameter {param_name} has unknown type: {param_schema['type']} "
+                    f"(expected one of {sorted(PARAMETER_TYPES)})"
+                )
+
+        # Only declared defaults are checked; required parameters have none
+        defaults = {}
+        errors = []
+        for param_name, param_schema in self.parameters.items():
+            if "default" in param_schema:
+                defaults[param_name] = param_schema["default"]
+                errors.extend(_value_errors(param_name, param_schema, param_schema["default"]))
+        if errors:
+            raise TemplateLoadError(
+                f"Invalid defaults in template '{self.name}': {', '.join(errors)}"
+            )
+        return defaults
+
     def validate_parameters(self, params: Dict[str, Any]) -> ValidationResult:
         """
         Validate provided parameters against schema.
@@ -156,33 +250,7 @@ class ParametricTemplate:
             if param_name not in params:
                 continue  # Will use default during instantiation
 
-            value = params[param_name]
-
-            # Type check
-            expected_type = param_schema.get("type")
-            if expected_type == "integer" and not isinstance(value, int):
-                errors.append(f"Parameter {param_name} must be integer, got {type(value).__name__}")
-
-            elif expected_type == "number" and not isinstance(value, (int, float)):
-                errors.append(f"Parameter {param_name} must be number, got {type(value).__name__}")
-
-            elif expected_type == "string" and not isinstance(value, str):
-                errors.append(f"Parameter {param_name} must be string, got {type(value).__name__}")
-
-            elif expected_type == "boolean" and not isinstance(value, bool):
-                errors.append(f"Parameter {param_name} must be boolean, got {type(value).__name__}")
-
-            # Range check (for numbers)
-            if expected_type in ["integer", "number"]:
-                if "min" in param_schema and value < param_schema["min"]:
-                    errors.append(f"Parameter {param_name} below minimum: {value} < {param_schema['min']}")
-
-                if "max" in param_schema and value > param_schema["max"]:
-                    errors.append(f"Parameter {param_name} above maximum: {value} > {param_schema['max']}")
-
-            # Enum check
-            if "enum" in param_schema and value not in param_schema["enum"]:
-                errors.append(f"Parameter {param_name} not in allowed values: {value} not in {param_schema['enum']}")
+            errors.extend(_value_errors(param_name, param_schema, params[param_name]))
 
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -225,11 +293,11 @@ class ParametricTemplate:
 
             # Add defaults for missing parameters
             full_params = {}
-            for param_name, param_schema in self.parameters.items():
+            for param_name in self.parameters:
                 if param_name in parameters:
                     full_params[param_name] = parameters[param_name]
-                elif "default" in param_schema:
-                    full_params[param_name] = param_schema["default"]
+                elif param_name in self._defaults:
+                    full_params[param_name] = self._defaults[param_name]
 
             logger.info(f"Instantiating template '{self.name}' ({model_type}) with parameters: {full_params}")
 
@@ -257,9 +325,6 @@ class ParametricTemplate:
 
         Directly adds components to the DEXPI model.
         """
-        from pydexpi.dexpi_classes import equipment as eq_module
-        from pydexpi.dexpi_classes import piping as piping_module
-        from pydexpi.dexpi_classes import instrumentation as inst_module
         from pydexpi.dexpi_classes.dexpiModel import ConceptualModel
 
         # Ensure model has conceptual model
@@ -285,47 +350,16 @@ class ParametricTemplate:
             if isinstance(count, str):
                 count = int(self._substitution_engine.substitute(count, full_params))
 
-            # Generate N instances
-            for i in range(count):
-                # Build context for this instance
-                instance_context = {**full_params, "index": i}
+            # Component class resolved when the template was loaded
+            component_class = self._component_classes.get(component_type)
+            if count > 0 and not component_class:
+                raise ValueError(f"Unknown component type: {component_type}")
 
-                # Generate tag
-                tag_pattern = component_def.get("tag_pattern", component_def.get("name", "ITEM"))
-                tag = self._substitution_engine.substitute(tag_pattern, instance_context)
-
-                # Substitute attributes
-                attributes = component_def.get("attributes", {})
-                substituted_attrs = {}
-                for attr_key, attr_value in attributes.items():
-                    if isinstance(attr_value, str):
-                        substituted_attrs[attr_key] = self._substitution_engine.substitute(
-                            attr_value, instance_context
-                        )
-                    else:
-                        substituted_attrs[attr_key] = attr_value
-
-                # Create component instance
-                # Try equipment first, then piping, then instrumentation
-                component_class = None
-                for module in [eq_module, piping_module, inst_module]:
-                    component_class = getattr(module, component_type, None)
-                    if component_class:
-                        break
-
-                if not component_class:
-                    raise ValueError(f"Unknown component type: {component_type}")
-
-                # Instantiate component
-                component = component_class(tagName=tag, **substituted_attrs)
-
-                # Set both tagName and tag for compatibility with different pyDEXPI tools
-                if hasattr(component, 'tag') and not getattr(component, 'tag', None):
-                    component.tag = tag
-
-                # Add to model
-                target_model.conceptualModel.taggedPlantItems.append(component)
-                instantiated_components.append(tag)
+            tags, components = self._stamp_components(component_def, component_class, count, full_params)
+
+            # Add to model
+            target_model.conceptualModel.taggedPlantItems.extend(components)
+            instantiated_components.extend(tags)
 
         return TemplateInstantiationResult(
             success=True,
@@ -340,6 +374,55 @@ class ParametricTemplate:
             }
         )
 
+    def _stamp_components(
+        self,
+        component_def: Dict[str, Any],
+        component_class: type,
+        count: int,
+        full_params: Dict[str, Any]
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        Create count instances of one component definition in a single pass.
+
+        The tag pattern and every attribute holding a ${...} placeholder are
+        compiled into render functions once; attributes without placeholders
+        are passed through unchanged. Each instance renders against
+        full_params plus its "index".
+        """
+        engine = self._substitution_engine
+        tag_pattern = component_def.get("tag_pattern", component_def.get("name", "ITEM"))
+        render_tag = engine.compile_template(tag_pattern)
+
+        constant_attrs = {}
+        rendered_attrs = []
+        for attr_key, attr_value in component_def.get("attributes", {}).items():
+            if isinstance(attr_value, str):
+                rendered_attrs.append((attr_key, engine.compile_template(attr_value)))
+            else:
+                constant_attrs[attr_key] = attr_value
+
+        tags = []
+        components = []
+        for i in range(count):
+            # Build context for this instance
+            instance_context = {**full_params, "index": i}
+
+            tag = render_tag(instance_context)
+            substituted_attrs = {attr_key: render(instance_context) for attr_key, render in rendered_attrs}
+            substituted_attrs.update(constant_attrs)
+
+            # Instantiate component
+            component = component_class(tagName=tag, **substituted_attrs)
+
+            # Set both tagName and tag for compatibility with different pyDEXPI tools
+            if hasattr(component, 'tag') and not getattr(component, 'tag', None):
+                component.tag = tag
+
+            tags.append(tag)
+            components.append(component)
+
+        return tags, components
+
     def _instantiate_sfiles(
         self,
         target_flowsheet: Any,  # Flowsheet from SFILES2
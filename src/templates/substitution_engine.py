@@ -10,12 +10,22 @@ Handles ${variable} substitution in template strings with support for:
 
 import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import BaseModel
 from pydexpi.dexpi_classes.dexpiModel import DexpiModel
-from pydexpi.toolkits import model_toolkit as mt
+
+from ..core.dexpi_fields import field_plan
+from .expressions import compile_expression
 
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER = re.compile(r'\$\{([^}]+)\}')
+
+RenderFunction = Callable[[Dict[str, Any]], str]
+
+# Bound on compiled templates kept per engine (substitute() accepts arbitrary strings)
+_MAX_COMPILED_TEMPLATES = 1024
+
 
 class ParameterSubstitutionEngine:
     """Handles parameter substitution in templates."""
@@ -24,6 +34,7 @@ class ParameterSubstitutionEngine:
         """Initialize substitution engine."""
         self.parameters: Dict[str, Any] = {}
         self._sequence_counters: Dict[str, int] = {}
+        self._compiled: Dict[str, RenderFunction] = {}
 
     def set_parameters(self, params: Dict[str, Any]) -> None:
         """
@@ -61,37 +72,79 @@ class ParameterSubstitutionEngine:
 
         # Merge parameters and context
         all_params = {**self.parameters, **(context or {})}
+        return self.compile_template(template)(all_params)
 
-        # Find all ${...} patterns
-        pattern = re.compile(r'\$\{([^}]+)\}')
-
-        def replacer(match):
-            expr = match.group(1)
-
-            try:
-                # Check for format spec (e.g., "sequence:03d")
-                if ':' in expr and not any(op in expr for op in ['==', '!=', '>=', '<=']):
-                    var_name, format_spec = expr.split(':', 1)
-                    var_name = var_name.strip()
-                    value = self._resolve_variable(var_name, all_params)
-                    return format(value, format_spec)
-
-                # Check for arithmetic/boolean expressions
-                elif any(op in expr for op in ['+', '-', '*', '/', '==', '!=', '>=', '<=', '<', '>', 'and', 'or']):
-                    result = self._evaluate_expression(expr, all_params)
-                    return str(result)
+    def compile_template(self, template: str) -> RenderFunction:
+        """
+        Compile a template string into a render function.
 
-                # Simple variable substitution
-                else:
-                    value = self._resolve_variable(expr.strip(), all_params)
-                    return str(value)
+        The string is split into literal text and placeholders once; each
+        placeholder is classified (format spec, expression or variable)
+        at compile time. Compiled templates are cached per engine, so
+        rendering the same attribute for N instances parses it once.
 
-            except Exception as e:
-                logger.warning(f"Failed to substitute '{expr}': {e}")
-                # Return original placeholder on error
-                return match.group(0)
+        Args:
+            template: Template string with ${...} placeholders
 
-        return pattern.sub(replacer, template)
+        Returns:
+            Function taking the full variable namespace (parameters and
+            context merged) and returning the substituted string, with the
+            same results and sequence side effects as substitute()
+        """
+        render = self._compiled.get(template)
+        if render is not None:
+            return render
+
+        parts: List[Any] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(template):
+            if match.start() > position:
+                parts.append(template[position:match.start()])
+            parts.append(self._compile_placeholder(match.group(0), match.group(1)))
+            position = match.end()
+        if position < len(template):
+            parts.append(template[position:])
+
+        if not parts:
+            def render(params: Dict[str, Any]) -> str:
+                return template
+        elif len(parts) == 1 and not isinstance(parts[0], str):
+            render = parts[0]
+        else:
+            def render(params: Dict[str, Any]) -> str:
+                return "".join(part if isinstance(part, str) else part(params) for part in parts)
+
+        if len(self._compiled) >= _MAX_COMPILED_TEMPLATES:
+            self._compiled.clear()
+        self._compiled[template] = render
+        return render
+
+    def _compile_placeholder(self, placeholder: str, expr: str) -> RenderFunction:
+        """Render function for one ${expr} placeholder (the placeholder itself on error)."""
+
+        def guarded(evaluate: Callable[[Dict[str, Any]], str]) -> RenderFunction:
+            def render(params: Dict[str, Any]) -> str:
+                try:
+                    return evaluate(params)
+                except Exception as e:
+                    logger.warning(f"Failed to substitute '{expr}': {e}")
+                    # Return original placeholder on error
+                    return placeholder
+            return render
+
+        # Check for format spec (e.g., "sequence:03d")
+        if ':' in expr and not any(op in expr for op in ['==', '!=', '>=', '<=']):
+            var_name, format_spec = expr.split(':', 1)
+            var_name = var_name.strip()
+            return guarded(lambda params: format(self._resolve_variable(var_name, params), format_spec))
+
+        # Check for arithmetic/boolean expressions
+        if any(op in expr for op in ['+', '-', '*', '/', '==', '!=', '>=', '<=', '<', '>', 'and', 'or']):
+            return guarded(lambda params: str(self._evaluate_expression(expr, params)))
+
+        # Simple variable substitution
+        var_name = expr.strip()
+        return guarded(lambda params: str(self._resolve_variable(var_name, params)))
 
     def substitute_dict(self, template_dict: Dict[str, Any], context: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -138,27 +191,35 @@ class ParameterSubstitutionEngine:
         """
         self.set_parameters(params)
 
-        # Walk all objects in model
-        all_objects = mt.get_all_instances_in_model(model, None)
-
-        for obj in all_objects:
-            # Substitute string attributes
-            for attr_name in dir(obj):
-                # Skip private/protected attributes
-                if attr_name.startswith('_'):
-                    continue
-
-                try:
-                    attr_value = getattr(obj, attr_name, None)
-
-                    # Only substitute string attributes
-                    if isinstance(attr_value, str) and '${' in attr_value:
-                        substituted_value = self.substitute(attr_value)
-                        setattr(obj, attr_name, substituted_value)
-
-                except (AttributeError, TypeError):
-                    # Skip attributes that can't be set
-                    continue
+        # Walk the composition tree; only data attributes can hold template
+        # strings, while dir() would visit every method and property
+        stack = [model]
+        seen = set()
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+
+            plan = field_plan(type(obj))
+            for attr_name in plan.text_fields:
+                attr_value = getattr(obj, attr_name, None)
+                if isinstance(attr_value, str) and '${' in attr_value:
+                    try:
+                        setattr(obj, attr_name, self.substitute(attr_value))
+                    except (AttributeError, TypeError):
+                        # Skip attributes that can't be set
+                        continue
+
+            children = []
+            for attr_name in plan.child_fields:
+                attr_value = getattr(obj, attr_name, None)
+                if isinstance(attr_value, BaseModel):
+                    children.append(attr_value)
+                elif isinstance(attr_value, list):
+                    children.extend(item for item in attr_value if isinstance(item, BaseModel))
+            # Pre-order, in field order, like model_toolkit.get_all_instances_in_model
+            stack.extend(reversed(children))
 
         return model
 
@@ -200,7 +261,9 @@ class ParameterSubstitutionEngine:
         """
         Evaluate arithmetic or boolean expression.
 
-        Uses safe evaluation with restricted namespace.
+        The expression is parsed once into a restricted AST and cached
+        (see expressions.compile_expression); parameters are read directly,
+        without substituting their text into the expression.
 
         Args:
             expr: Expression string
@@ -210,23 +273,10 @@ class ParameterSubstitutionEngine:
             Expression result
 
         Raises:
-            ValueError: If expression invalid or unsafe
-        """
-        # Create safe evaluation namespace
-        safe_dict = {
-            '__builtins__': {},
-            **params
-        }
-
-        # Replace ${var} with actual values in expression
-        substituted_expr = self.substitute(expr, params) if '${' in expr else expr
-
-        # Evaluate safely
-        try:
-            result = eval(substituted_expr, safe_dict)
-            return result
-        except Exception as e:
-            raise ValueError(f"Failed to evaluate expression '{expr}': {e}")
+            ExpressionError: If expression invalid, unsafe or evaluation fails
+                (a ValueError)
+        """
+        return compile_expression(expr).evaluate(params)
 
     def reset_sequence_counters(self) -> None:
         """Reset all sequence counters to zero."""
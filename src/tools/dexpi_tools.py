@@ -17,6 +17,7 @@ from pydexpi.dexpi_classes.equipment import Tank, Pump, Compressor, Nozzle, Heat
 from pydexpi.dexpi_classes.piping import PipingNetworkSegment, Pipe, PipingNode
 from pydexpi.dexpi_classes.instrumentation import ProcessInstrumentationFunction, ProcessSignalGeneratingFunction
 from .dexpi_introspector import DexpiIntrospector
+from ..core import dexpi_serialization
 from ..utils.response import success_response, error_response, validation_response, create_issue
 
 logger = logging.getLogger(__name__)
@@ -1057,10 +1058,10 @@ class DexpiTools:
         
         model = self.models[model_id]
         
-        # Use model_to_dict() to convert to dictionary, then to JSON string
+        # Convert to dictionary (same structure as JsonSerializer), then to JSON string
         import json
         
-        model_dict = self.json_serializer.model_to_dict(model)
+        model_dict = dexpi_serialization.model_to_dict(model)
         json_content = json.dumps(model_dict, indent=4, ensure_ascii=False, sort_keys=True)
         
         return success_response({
@@ -1,6 +1,7 @@
 """Graph analytics tools for engineering models."""
 
 import logging
+import time
 from typing import Any, Dict, List, Optional, Set, Tuple
 import networkx as nx
 from collections import defaultdict
@@ -9,6 +10,15 @@ from mcp import Tool
 from ..utils.response import success_response, error_response, create_issue
 from ..converters.graph_converter import UnifiedGraphConverter
 from ..core.model_store import CachingHook
+from ..core.analytics.graph_metrics import GRAPH_METRICS, TOPOLOGY_ANALYSES, MetricPlanner
+from ..core.analytics.path_search import (
+    DEFAULT_MAX_PATHS,
+    DEFAULT_TIME_BUDGET_MS,
+    KShortestPathIterator,
+    PathCursorStore,
+    SimplePathIterator,
+    collect_paths,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +41,9 @@ class GraphTools:
         self.flowsheets = flowsheets
         self.converter = UnifiedGraphConverter()
         self._caching_hook = caching_hook
+        self._topology_planner = MetricPlanner(TOPOLOGY_ANALYSES)
+        self._metrics_planner = MetricPlanner(GRAPH_METRICS)
+        self._path_cursors = PathCursorStore()
     
     def get_tools(self) -> List[Tool]:
         """Return graph analytics tools."""
@@ -66,7 +79,7 @@ class GraphTools:
             ),
             Tool(
                 name="graph_find_paths",
-                description="Find paths between nodes in the graph",
+                description="Find paths between nodes in the graph. Enumeration is bounded by max_paths and time_budget_ms; pass the returned cursor (with the same arguments) to fetch more paths",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -84,14 +97,30 @@ class GraphTools:
                         },
                         "path_type": {
                             "type": "string",
-                            "enum": ["shortest", "all_simple", "all"],
-                            "description": "Type of paths to find",
+                            "enum": ["shortest", "all_simple", "all", "k_shortest"],
+                            "description": "Type of paths to find (k_shortest yields paths in increasing length)",
                             "default": "shortest"
                         },
                         "max_length": {
                             "type": "integer",
                             "description": "Maximum path length for all_simple paths",
                             "default": 10
+                        },
+                        "max_paths": {
+                            "type": "integer",
+                            "description": "Maximum number of paths to return in this page",
+                            "default": DEFAULT_MAX_PATHS,
+                            "minimum": 1
+                        },
+                        "time_budget_ms": {
+                            "type": "integer",
+                            "description": "Stop enumerating after this many milliseconds",
+                            "default": DEFAULT_TIME_BUDGET_MS,
+                            "minimum": 1
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursor from a previous response to continue the same search"
                         }
                     },
                     "required": ["model_id", "source", "target"]
@@ -238,35 +267,23 @@ class GraphTools:
         
         graph, model_type = self._get_graph(model_id, args.get("model_type", "auto"))
         
-        if "all" in analyses:
-            analyses = ["paths", "cycles", "bottlenecks", "clustering", "centrality"]
-        
         results = {
             "model_id": model_id,
             "model_type": model_type,
             "node_count": graph.number_of_nodes(),
             "edge_count": graph.number_of_edges()
         }
-        
-        if "paths" in analyses:
-            results["paths"] = self._analyze_paths(graph)
-        
-        if "cycles" in analyses:
-            results["cycles"] = self._analyze_cycles(graph)
-        
-        if "bottlenecks" in analyses:
-            results["bottlenecks"] = self._find_bottlenecks(graph)
-        
-        if "clustering" in analyses:
-            results["clustering"] = self._analyze_clustering(graph)
-        
-        if "centrality" in analyses:
-            results["centrality"] = self._analyze_centrality(graph)
+        results.update(self._topology_planner.run(graph, analyses))
         
         return success_response(results)
     
     async def _find_paths(self, args: dict) -> dict:
-        """Find paths between nodes."""
+        """Find paths between nodes.
+
+        Enumerating path types are lazy: at most max_paths paths are produced
+        per call within time_budget_ms, and the response carries a cursor
+        that continues the same search without recomputing earlier paths.
+        """
         model_id = args["model_id"]
         source = args["source"]
         target = args["target"]
@@ -279,34 +296,96 @@ class GraphTools:
         source_node = self._find_node(graph, source)
         target_node = self._find_node(graph, target)
         
-        if not source_node:
+        if source_node is None:
             return error_response(f"Source node {source} not found", code="NODE_NOT_FOUND")
-        if not target_node:
+        if target_node is None:
             return error_response(f"Target node {target} not found", code="NODE_NOT_FOUND")
         
-        paths = []
-        
         if path_type == "shortest":
             try:
-                path = nx.shortest_path(graph, source_node, target_node)
-                paths = [path]
+                paths = [nx.shortest_path(graph, source_node, target_node)]
             except nx.NetworkXNoPath:
                 paths = []
-        
-        elif path_type == "all_simple":
-            paths = list(nx.all_simple_paths(graph, source_node, target_node, cutoff=max_length))
-        
-        else:  # all
-            paths = list(nx.all_simple_paths(graph, source_node, target_node))
-        
+            return success_response({
+                "source": source_node,
+                "target": target_node,
+                "path_count": len(paths),
+                "paths": paths,
+                "shortest_length": len(paths[0]) - 1 if paths else None
+            })
+
+        max_paths = args.get("max_paths", DEFAULT_MAX_PATHS)
+        time_budget_ms = args.get("time_budget_ms", DEFAULT_TIME_BUDGET_MS)
+        cutoff = max_length if path_type == "all_simple" else None
+
+        cursor_id = args.get("cursor")
+        if cursor_id:
+            cursor = self._path_cursors.get(cursor_id)
+            if cursor is None:
+                return error_response(
+                    f"Path cursor {cursor_id} not found or expired",
+                    code="CURSOR_NOT_FOUND"
+                )
+            if not cursor.matches(model_id, source_node, target_node, path_type, cutoff):
+                return error_response(
+                    f"Path cursor {cursor_id} belongs to a different search",
+                    code="CURSOR_MISMATCH"
+                )
+            if cursor.is_stale(graph):
+                self._path_cursors.discard(cursor_id)
+                return self._stale_cursor_error(model_id, cursor_id)
+        else:
+            if path_type == "k_shortest":
+                iterator = KShortestPathIterator(graph, source_node, target_node)
+            else:
+                iterator = SimplePathIterator(graph, source_node, target_node, cutoff=cutoff)
+            cursor = self._path_cursors.create(
+                model_id=model_id,
+                source=source_node,
+                target=target_node,
+                path_type=path_type,
+                max_length=cutoff,
+                graph=graph,
+                iterator=iterator
+            )
+
+        started = time.perf_counter()
+        try:
+            paths, stopped_reason = collect_paths(cursor.iterator, max_paths, time_budget_ms)
+        except RuntimeError:
+            # The graph changed under the suspended search ("dictionary
+            # changed size during iteration")
+            self._path_cursors.discard(cursor.cursor_id)
+            if not cursor_id:
+                raise
+            return self._stale_cursor_error(model_id, cursor_id)
+        offset = cursor.returned
+        cursor.returned += len(paths)
+
+        has_more = stopped_reason != "exhausted"
+        if not has_more:
+            self._path_cursors.discard(cursor.cursor_id)
+
         return success_response({
             "source": source_node,
             "target": target_node,
+            "path_type": path_type,
             "path_count": len(paths),
-            "paths": paths[:100],  # Limit to 100 paths
-            "shortest_length": len(paths[0]) - 1 if paths else None
+            "paths": paths,
+            "shortest_length": len(paths[0]) - 1 if paths else None,
+            "offset": offset,
+            "has_more": has_more,
+            "cursor": cursor.cursor_id if has_more else None,
+            "stopped_reason": stopped_reason,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
         })
     
+    def _stale_cursor_error(self, model_id: str, cursor_id: str) -> dict:
+        return error_response(
+            f"Graph for model {model_id} changed since cursor {cursor_id} was created",
+            code="CURSOR_STALE"
+        )
+
     async def _detect_patterns(self, args: dict) -> dict:
         """Detect common process patterns."""
         model_id = args["model_id"]
@@ -346,45 +425,7 @@ class GraphTools:
         
         graph, model_type = self._get_graph(model_id, args.get("model_type", "auto"))
         
-        if "all" in metrics:
-            metrics = ["basic", "centrality", "clustering", "efficiency"]
-        
-        results = {}
-        
-        if "basic" in metrics:
-            results["basic"] = {
-                "nodes": graph.number_of_nodes(),
-                "edges": graph.number_of_edges(),
-                "density": nx.density(graph),
-                "is_connected": nx.is_weakly_connected(graph),
-                "is_dag": nx.is_directed_acyclic_graph(graph),
-                "number_of_components": nx.number_weakly_connected_components(graph)
-            }
-            
-            if nx.is_weakly_connected(graph):
-                results["basic"]["diameter"] = nx.diameter(graph.to_undirected())
-        
-        if "centrality" in metrics:
-            results["centrality"] = {
-                "degree": self._top_nodes(dict(graph.degree()), 5),
-                "betweenness": self._top_nodes(nx.betweenness_centrality(graph), 5),
-                "closeness": self._top_nodes(nx.closeness_centrality(graph), 5)
-            }
-        
-        if "clustering" in metrics:
-            undirected = graph.to_undirected()
-            results["clustering"] = {
-                "average_clustering": nx.average_clustering(undirected),
-                "transitivity": nx.transitivity(undirected)
-            }
-        
-        if "efficiency" in metrics:
-            # Convert to undirected for efficiency calculations
-            undirected = graph.to_undirected()
-            results["efficiency"] = {
-                "global_efficiency": nx.global_efficiency(undirected),
-                "local_efficiency": nx.local_efficiency(undirected)
-            }
+        results = self._metrics_planner.run(graph, metrics)
         
         return success_response(results)
     
@@ -438,75 +479,6 @@ class GraphTools:
         
         return None
     
-    def _analyze_paths(self, graph: nx.DiGraph) -> Dict:
-        """Analyze path characteristics."""
-        if not nx.is_weakly_connected(graph):
-            return {"connected": False}
-        
-        # Find longest path (for DAGs)
-        if nx.is_directed_acyclic_graph(graph):
-            longest_path = nx.dag_longest_path(graph)
-            return {
-                "is_dag": True,
-                "longest_path_length": len(longest_path) - 1,
-                "longest_path_nodes": longest_path[:10]  # First 10 nodes
-            }
-        else:
-            return {
-                "is_dag": False,
-                "has_cycles": True
-            }
-    
-    def _analyze_cycles(self, graph: nx.DiGraph) -> Dict:
-        """Analyze cycles in the graph."""
-        if graph.number_of_nodes() > 100:
-            return {"status": "Graph too large for cycle analysis"}
-        
-        cycles = list(nx.simple_cycles(graph))
-        
-        return {
-            "cycle_count": len(cycles),
-            "cycles": cycles[:20],  # Limit to 20 cycles
-            "max_cycle_length": max(len(c) for c in cycles) if cycles else 0,
-            "min_cycle_length": min(len(c) for c in cycles) if cycles else 0
-        }
-    
-    def _find_bottlenecks(self, graph: nx.DiGraph) -> Dict:
-        """Find bottleneck nodes."""
-        betweenness = nx.betweenness_centrality(graph)
-        bottlenecks = self._top_nodes(betweenness, 10)
-        
-        # Find articulation points (for undirected version)
-        undirected = graph.to_undirected()
-        articulation_points = list(nx.articulation_points(undirected))
-        
-        return {
-            "high_betweenness_nodes": bottlenecks,
-            "articulation_points": articulation_points[:20]
-        }
-    
-    def _analyze_clustering(self, graph: nx.DiGraph) -> Dict:
-        """Analyze clustering in the graph."""
-        # Convert to undirected for clustering analysis
-        undirected = graph.to_undirected()
-        
-        # Find communities
-        communities = list(nx.community.greedy_modularity_communities(undirected))
-        
-        return {
-            "number_of_communities": len(communities),
-            "community_sizes": [len(c) for c in communities],
-            "largest_community": list(communities[0])[:20] if communities else []
-        }
-    
-    def _analyze_centrality(self, graph: nx.DiGraph) -> Dict:
-        """Analyze node centrality."""
-        return {
-            "highest_degree": self._top_nodes(dict(graph.degree()), 5),
-            "highest_in_degree": self._top_nodes(dict(graph.in_degree()), 5),
-            "highest_out_degree": self._top_nodes(dict(graph.out_degree()), 5)
-        }
-    
     def _detect_heat_integration(self, graph: nx.DiGraph) -> List[Dict]:
         """Detect heat integration patterns."""
         patterns = []
@@ -618,8 +590,3 @@ class GraphTools:
                     cascades.append(path)
         
         return cascades[:5]  # Limit results
-    
-    def _top_nodes(self, scores: Dict, n: int) -> List[Tuple[str, float]]:
-        """Get top n nodes by score."""
-        sorted_nodes = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_nodes[:n]
\ No newline at end of file
@@ -163,6 +163,12 @@ class LayoutTools:
                             "enum": ["pid", "pfd", "bfd"],
                             "description": "Model directory type",
                             "default": "pid"
+                        },
+                        "binary": {
+                            "type": "boolean",
+                            "description": "Also write a memory-mapped binary sidecar "
+                                           "(.layout.bin) for fast loading. Default: "
+                                           "automatic for large layouts"
                         }
                     },
                     "required": ["layout_id", "project_path", "model_name"]
@@ -483,7 +489,7 @@ class LayoutTools:
         include_ports = args.get("include_ports", True)
 
         try:
-            layout = self.layout_store.get(layout_id)
+            layout = self.layout_store.get_snapshot(layout_id)
         except LayoutNotFoundError:
             return error_response(f"Layout {layout_id} not found", code="NOT_FOUND")
 
@@ -583,15 +589,17 @@ class LayoutTools:
         project_path = args["project_path"]
         model_name = args["model_name"]
         model_type = args.get("model_type", "pid")
+        binary = args.get("binary")
 
         try:
             file_path = self.layout_store.save_to_file(
-                layout_id, project_path, model_name, model_type
+                layout_id, project_path, model_name, model_type, binary=binary
             )
             return success_response({
                 "layout_id": layout_id,
                 "file_path": str(file_path),
                 "model_name": model_name,
+                "binary_sidecar": file_path.with_suffix(".bin").exists(),
             })
         except LayoutNotFoundError:
             return error_response(f"Layout {layout_id} not found", code="NOT_FOUND")
@@ -609,7 +617,7 @@ class LayoutTools:
             loaded_id = self.layout_store.load_from_file(
                 project_path, model_name, model_type, layout_id
             )
-            layout = self.layout_store.get(loaded_id)
+            layout = self.layout_store.get_snapshot(loaded_id)
 
             return success_response({
                 "layout_id": loaded_id,
@@ -643,76 +651,58 @@ class LayoutTools:
             - Returns new etag/version on success
             - Partial updates supported (only provided fields are updated)
         """
-        from ..models.layout_metadata import NodePosition, EdgeRoute, EdgeSection, PortLayout
-
         layout_id = args["layout_id"]
         expected_etag = args["etag"]
 
-        try:
-            # Get current layout
-            current = self.layout_store.get(layout_id, copy=True)
-        except LayoutNotFoundError:
-            return error_response(f"Layout {layout_id} not found", code="NOT_FOUND")
+        # Collect partial updates as a patch (only provided fields are updated)
+        changes = {}
 
-        # Apply partial updates
-        updated = False
-
-        # Update positions
-        if "positions" in args and args["positions"]:
-            for node_id, pos_data in args["positions"].items():
-                current.positions[node_id] = NodePosition(x=pos_data["x"], y=pos_data["y"])
-            updated = True
-
-        # Update edges
-        if "edges" in args and args["edges"]:
-            for edge_id, edge_data in args["edges"].items():
-                sections = []
-                for section_data in edge_data.get("sections", []):
-                    sections.append(EdgeSection(
-                        id=section_data.get("id"),
-                        startPoint=tuple(section_data["startPoint"]),
-                        endPoint=tuple(section_data["endPoint"]),
-                        bendPoints=[tuple(bp) for bp in section_data.get("bendPoints", [])],
-                    ))
-                current.edges[edge_id] = EdgeRoute(
-                    sections=sections,
-                    source_port=edge_data.get("source_port"),
-                    target_port=edge_data.get("target_port"),
-                    sourcePoint=tuple(edge_data["sourcePoint"]) if edge_data.get("sourcePoint") else None,
-                    targetPoint=tuple(edge_data["targetPoint"]) if edge_data.get("targetPoint") else None,
-                )
-            updated = True
-
-        # Update port layouts
-        if "port_layouts" in args and args["port_layouts"]:
-            for port_id, port_data in args["port_layouts"].items():
-                current.port_layouts[port_id] = PortLayout(
-                    id=port_id,
-                    x=port_data["x"],
-                    y=port_data["y"],
-                    side=port_data.get("side", "EAST"),
-                    index=port_data.get("index", 0),
-                    width=port_data.get("width", 8.0),
-                    height=port_data.get("height", 8.0),
-                )
-            updated = True
+        if args.get("positions"):
+            changes["positions"] = {
+                node_id: {"x": pos_data["x"], "y": pos_data["y"]}
+                for node_id, pos_data in args["positions"].items()
+            }
 
-        # Update rotations
-        if "rotation" in args and args["rotation"]:
-            for node_id, angle in args["rotation"].items():
-                current.rotation[node_id] = float(angle)
-            updated = True
+        if args.get("edges"):
+            changes["edges"] = {
+                edge_id: {
+                    "sections": edge_data.get("sections", []),
+                    "source_port": edge_data.get("source_port"),
+                    "target_port": edge_data.get("target_port"),
+                    "sourcePoint": edge_data.get("sourcePoint"),
+                    "targetPoint": edge_data.get("targetPoint"),
+                }
+                for edge_id, edge_data in args["edges"].items()
+            }
 
-        if not updated:
+        if args.get("port_layouts"):
+            changes["port_layouts"] = {
+                port_id: {
+                    "x": port_data["x"],
+                    "y": port_data["y"],
+                    "side": port_data.get("side", "EAST"),
+                    "index": port_data.get("index", 0),
+                    "width": port_data.get("width", 8.0),
+                    "height": port_data.get("height", 8.0),
+                }
+                for port_id, port_data in args["port_layouts"].items()
+            }
+
+        if args.get("rotation"):
+            changes["rotation"] = dict(args["rotation"])
+
+        if not changes:
+            if not self.layout_store.exists(layout_id):
+                return error_response(f"Layout {layout_id} not found", code="NOT_FOUND")
             return error_response(
                 "No updates provided. Include at least one of: positions, edges, port_layouts, rotation",
                 code="NO_UPDATES"
             )
 
-        # Perform update with optimistic lock
+        # Apply patch with optimistic lock (no copies of the stored layout)
         try:
-            new_etag = self.layout_store.update(layout_id, current, expected_etag=expected_etag)
-            updated_layout = self.layout_store.get(layout_id, copy=False)
+            new_etag = self.layout_store.patch(layout_id, changes, expected_etag=expected_etag)
+            updated_layout = self.layout_store.get_snapshot(layout_id)
 
             return success_response({
                 "layout_id": layout_id,
@@ -723,6 +713,8 @@ class LayoutTools:
                 "edge_count": len(updated_layout.edges),
             })
 
+        except LayoutNotFoundError:
+            return error_response(f"Layout {layout_id} not found", code="NOT_FOUND")
         except OptimisticLockError as e:
             return error_response(
                 f"Layout was modified by another process. Expected etag {expected_etag[:16]}..., "
@@ -762,7 +754,7 @@ class LayoutTools:
             issues.append("Layout missing algorithm field")
 
         # Check etag integrity
-        computed_etag = layout.compute_etag()
+        computed_etag = layout.compute_etag(full=True)
         if layout.etag != computed_etag:
             warnings.append(f"Etag mismatch: stored {layout.etag[:16]}... vs computed {computed_etag[:16]}...")
 
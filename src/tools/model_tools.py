@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from mcp import Tool
+from ..core.model_store import InMemoryModelStore, LazyModel
+from ..persistence.project_persistence import ProjectPersistence
 from ..utils.response import success_response, error_response
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,8 @@ class ModelTools:
         dexpi_store: Dict[str, Any],
         sfiles_store: Dict[str, Any],
         dexpi_tools: Any,
-        sfiles_tools: Any
+        sfiles_tools: Any,
+        persistence: Optional[ProjectPersistence] = None
     ):
         """Initialize with model stores and existing tool handlers.
 
@@ -34,11 +37,13 @@ class ModelTools:
             sfiles_store: Dictionary storing SFILES flowsheets
             dexpi_tools: DexpiTools instance for reusing logic
             sfiles_tools: SfilesTools instance for reusing logic
+            persistence: Project persistence for the "project" load format
         """
         self.dexpi_models = dexpi_store
         self.flowsheets = sfiles_store
         self.dexpi_tools = dexpi_tools
         self.sfiles_tools = sfiles_tools
+        self.persistence = persistence or ProjectPersistence()
 
     def get_tools(self) -> List[Tool]:
         """Return unified model lifecycle tools."""
@@ -104,7 +109,7 @@ class ModelTools:
             ),
             Tool(
                 name="model_load",
-                description="Import a model from various formats (JSON, Proteus XML, SFILES string) - Replaces dexpi_import_json, dexpi_import_proteus_xml, sfiles_from_string",
+                description="Import a model from various formats (JSON, Proteus XML, SFILES string, saved project model) - Replaces dexpi_import_json, dexpi_import_proteus_xml, sfiles_from_string",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -115,7 +120,7 @@ class ModelTools:
                         },
                         "format": {
                             "type": "string",
-                            "enum": ["json", "proteus_xml", "sfiles_string"],
+                            "enum": ["json", "proteus_xml", "sfiles_string", "project"],
                             "description": "Import format"
                         },
                         "content": {
@@ -130,6 +135,19 @@ class ModelTools:
                             "type": "string",
                             "description": "Filename (for proteus_xml format only)"
                         },
+                        "project_path": {
+                            "type": "string",
+                            "description": "Project root (for project format only)"
+                        },
+                        "model_name": {
+                            "type": "string",
+                            "description": "Saved model name (for project format only)"
+                        },
+                        "lazy": {
+                            "type": "boolean",
+                            "default": True,
+                            "description": "Register the model from the project index and deserialize it on first access (for project format only)"
+                        },
                         "model_id": {
                             "type": "string",
                             "description": "Optional ID for imported model (auto-generated if not provided)"
@@ -272,10 +290,11 @@ class ModelTools:
         Args:
             args: {
                 "model_type": "dexpi" | "sfiles",
-                "format": "json" | "proteus_xml" | "sfiles_string",
+                "format": "json" | "proteus_xml" | "sfiles_string" | "project",
                 "content": str (for json/sfiles_string),
                 "directory_path": str (for proteus_xml),
                 "filename": str (for proteus_xml),
+                "project_path": str, "model_name": str, "lazy": bool (for project),
                 "model_id": str (optional)
             }
 
@@ -285,6 +304,9 @@ class ModelTools:
         model_type = args["model_type"]
         format_type = args["format"]
 
+        if format_type == "project" and model_type in ("dexpi", "sfiles"):
+            return self._load_project_model(args)
+
         if model_type == "dexpi":
             if format_type == "json":
                 if "content" not in args:
@@ -315,7 +337,7 @@ class ModelTools:
 
             else:
                 return error_response(
-                    f"Invalid format '{format_type}' for DEXPI models. Use 'json' or 'proteus_xml'",
+                    f"Invalid format '{format_type}' for DEXPI models. Use 'json', 'proteus_xml' or 'project'",
                     "INVALID_FORMAT"
                 )
 
@@ -335,7 +357,7 @@ class ModelTools:
 
             else:
                 return error_response(
-                    f"Invalid format '{format_type}' for SFILES models. Use 'sfiles_string'",
+                    f"Invalid format '{format_type}' for SFILES models. Use 'sfiles_string' or 'project'",
                     "INVALID_FORMAT"
                 )
 
@@ -345,6 +367,55 @@ class ModelTools:
                 "INVALID_MODEL_TYPE"
             )
 
+    def _load_project_model(self, args: dict) -> dict:
+        """Load a model saved in a project, lazily when the store supports it.
+
+        The project's model index provides the preview (counts, tags, size)
+        so a lazy load reads no model file; the model is deserialized the
+        first time it is retrieved from the store.
+        """
+        if "project_path" not in args or "model_name" not in args:
+            return error_response(
+                "Project import requires 'project_path' and 'model_name' parameters",
+                "MISSING_PARAMETERS"
+            )
+
+        model_type = args["model_type"]
+        project_path = args["project_path"]
+        entry = self.persistence.manifest(project_path).get(args["model_name"], model_type)
+        if entry is None:
+            return error_response(
+                f"{model_type.upper()} model '{args['model_name']}' not found in project {project_path}",
+                "MODEL_NOT_FOUND"
+            )
+        if entry.error:
+            return error_response(
+                f"{model_type.upper()} model '{entry.name}' in project {project_path} "
+                f"cannot be read: {entry.error}",
+                "INVALID_FORMAT"
+            )
+
+        if model_type == "dexpi":
+            store = self.dexpi_models
+            loader = lambda: self.persistence.load_dexpi(project_path, entry.name)
+        else:
+            store = self.flowsheets
+            loader = lambda: self.persistence.load_sfiles(project_path, entry.name, entry.diagram)
+
+        # Plain dict stores cannot resolve placeholders, so load eagerly
+        lazy = args.get("lazy", True) and isinstance(store, InMemoryModelStore)
+        model_id = args.get("model_id") or f"loaded_{entry.name}"
+        preview = entry.to_dict(include_tags=False)
+        store[model_id] = LazyModel(loader, info=preview) if lazy else loader()
+
+        return success_response({
+            "model_id": model_id,
+            "model_type": model_type,
+            "lazy": lazy,
+            "loaded": not lazy,
+            **{key: preview[key] for key in ("diagram", "path", "size", "sha256", "counts", "tag_count", "info")}
+        })
+
     async def _save_model(self, args: dict) -> dict:
         """Export a model to various formats.
 
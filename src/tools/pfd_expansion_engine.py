@@ -7,9 +7,9 @@ using the template system defined in Sprint 3.
 import re
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-CONDITION_TOKEN_PATTERN = re.compile(r"\$\{([^}|]+)(?:\|([^}]+))?\}")
 TRUTHY_CONDITION_VALUES = {"true", "yes", "1", "on"}
 
 # Import pyDEXPI equipment classes - REQUIRED dependency
@@ -56,9 +56,41 @@ except ImportError as e:
 from src.models.template_system import (
     ProcessTemplate, TemplateLoader, EquipmentSpec, ConnectionSpec
 )
+from src.templates.expressions import (
+    PLACEHOLDER_PATTERN, CompiledExpression, ExpressionError, compile_expression
+)
 from src.utils.process_resolver import generate_user_facing_tag, get_next_sequence_number
 
 
+@lru_cache(maxsize=1024)
+def _compile_condition(condition: str) -> Tuple[CompiledExpression, bool]:
+    """
+    Compile an equipment condition once.
+
+    Returns:
+        (expression, token_only): token_only conditions ("${param|default}")
+        are truthy by value; all others must be comparisons (==, !=)
+
+    Raises:
+        ValueError: If the condition is neither a placeholder nor a valid comparison
+    """
+    token_only = PLACEHOLDER_PATTERN.fullmatch(condition) is not None
+    if not token_only and '==' not in condition and '!=' not in condition:
+        # No condition operators found - fail loudly
+        raise ValueError(
+            f"Unsupported condition format: '{condition}'. "
+            f"Supported formats: '${{param|default}}', 'param == value', 'param != value'"
+        )
+    try:
+        return compile_expression(condition), token_only
+    except ExpressionError as e:
+        raise ValueError(
+            f"Invalid condition expression: '{condition}'. "
+            f"Conditions must be simple comparisons (==, !=) with valid parameter references. "
+            f"Error: {e}"
+        ) from e
+
+
 @dataclass
 class EquipmentInstance:
     """Represents an instantiated equipment from template."""
@@ -460,6 +492,9 @@ class PfdExpansionEngine:
         """
         Evaluate conditional expression for equipment inclusion.
 
+        Conditions are compiled once (see _compile_condition) and evaluated
+        against the parameter values directly.
+
         Args:
             condition: Condition string like "${do_control|true}" or "aeration_type == 'fine_bubble'"
             parameters: Parameter values
@@ -469,89 +504,20 @@ class PfdExpansionEngine:
         """
         if not condition:
             return True
-        original_condition = condition
-        condition = condition.strip()
 
-        token_only = CONDITION_TOKEN_PATTERN.fullmatch(condition)
-        if token_only:
-            value = self._resolve_condition_token(token_only, parameters, original_condition)
-            return self._condition_value_to_bool(value)
-
-        def _token_replacer(match) -> str:
-            value = self._resolve_condition_token(match, parameters, original_condition)
-            return repr(value)
-
-        resolved_condition = CONDITION_TOKEN_PATTERN.sub(_token_replacer, condition)
-
-        # Handle comparison expressions
-        if '==' in resolved_condition or '!=' in resolved_condition:
-            try:
-                result = eval(
-                    resolved_condition,
-                    {"__builtins__": {}},
-                    {k: v for k, v in parameters.items()}
-                )
-                return bool(result)
-            except (SyntaxError, NameError, TypeError) as e:
-                raise ValueError(
-                    f"Invalid condition expression: '{original_condition}'. "
-                    f"Resolved expression: '{resolved_condition}'. "
-                    f"Conditions must be simple comparisons (==, !=) with valid parameter references. "
-                    f"Error: {e}"
-                ) from e
-
-        # No condition operators found - fail loudly
-        raise ValueError(
-            f"Unsupported condition format: '{original_condition}'. "
-            f"Supported formats: '${{param|default}}', 'param == value', 'param != value'"
-        )
-
-    def _resolve_condition_token(
-        self,
-        match: re.Match,
-        parameters: Dict[str, Any],
-        condition: str
-    ) -> Any:
-        param_name = match.group(1).strip()
-        if not param_name:
-            raise ValueError(f"Invalid parameter placeholder in condition '{condition}' (missing name)")
-
-        if param_name in parameters:
-            return parameters[param_name]
-
-        default_raw = match.group(2)
-        if default_raw is None:
+        expression, token_only = _compile_condition(condition.strip())
+        try:
+            value = expression.evaluate(parameters)
+        except ExpressionError as e:
             raise ValueError(
-                f"Condition '{condition}' references parameter '{param_name}' without a default "
-                "and it was not provided."
-            )
-
-        return self._coerce_literal_value(default_raw)
+                f"Invalid condition expression: '{condition}'. "
+                f"Conditions must be simple comparisons (==, !=) with valid parameter references. "
+                f"Error: {e}"
+            ) from e
 
-    @staticmethod
-    def _coerce_literal_value(raw_value: str) -> Any:
-        value = raw_value.strip()
-        if not value:
-            return ""
-
-        if (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
-            return value[1:-1]
-
-        lowered = value.lower()
-        if lowered in {"true", "false"}:
-            return lowered == "true"
-
-        if re.fullmatch(r"-?\d+", value):
-            try:
-                return int(value)
-            except ValueError:
-                # Fall through to float parsing if int conversion somehow fails
-                pass
-
-        try:
-            return float(value)
-        except ValueError:
-            return value
+        if token_only:
+            return self._condition_value_to_bool(value)
+        return bool(value)
 
     @staticmethod
     def _condition_value_to_bool(value: Any) -> bool:
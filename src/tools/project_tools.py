@@ -1,11 +1,14 @@
 """Unified project management tools for DEXPI and SFILES models."""
 
+import asyncio
 import logging
+import os
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from mcp import Tool
-from ..persistence.project_persistence import ProjectPersistence
+from ..persistence.git_queue import DEFAULT_COMMIT_WINDOW, GitCommitQueue
+from ..persistence.project_persistence import DEXPI_ARTIFACTS, ProjectPersistence
 from ..utils.response import success_response, error_response
 
 logger = logging.getLogger(__name__)
@@ -14,16 +17,35 @@ logger = logging.getLogger(__name__)
 class ProjectTools:
     """Handles unified project operations for both DEXPI and SFILES models."""
     
-    def __init__(self, dexpi_store: Dict[str, Any], sfiles_store: Dict[str, Any]):
+    def __init__(
+        self,
+        dexpi_store: Dict[str, Any],
+        sfiles_store: Dict[str, Any],
+        layout_store: Optional[Any] = None,
+        commit_queue: Optional[GitCommitQueue] = None
+    ):
         """Initialize with references to both model stores.
         
+        Saves are committed to git in the background. By default a queue is
+        created from PROJECT_GIT_COMMIT_WINDOW (seconds) and
+        PROJECT_GIT_BACKEND ("subprocess", "dulwich" or "auto").
+        
         Args:
             dexpi_store: Dictionary storing DEXPI models
             sfiles_store: Dictionary storing SFILES flowsheets
+            layout_store: Optional LayoutStore for the "layout" save artifact
+            commit_queue: Optional GitCommitQueue for batched commits
         """
         self.dexpi_models = dexpi_store
         self.flowsheets = sfiles_store
-        self.persistence = ProjectPersistence()
+        self.layout_store = layout_store
+        if commit_queue is None:
+            commit_queue = GitCommitQueue(
+                window=float(os.environ.get("PROJECT_GIT_COMMIT_WINDOW", DEFAULT_COMMIT_WINDOW)),
+                backend=os.environ.get("PROJECT_GIT_BACKEND", "subprocess")
+            )
+        self.commit_queue = commit_queue
+        self.persistence = ProjectPersistence(commit_queue=commit_queue)
     
     def get_tools(self) -> List[Tool]:
         """Return all project management tools."""
@@ -78,6 +100,18 @@ class ProjectTools:
                         "commit_message": {
                             "type": "string",
                             "description": "Optional git commit message"
+                        },
+                        "artifacts": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": list(DEXPI_ARTIFACTS)},
+                            "description": "DEXPI only: files to write. Default: json, meta, "
+                                           "graphml, html. 'layout' saves the model's latest "
+                                           "layout. Unchanged files are skipped."
+                        },
+                        "force": {
+                            "type": "boolean",
+                            "description": "DEXPI only: rewrite selected files even if unchanged",
+                            "default": False
                         }
                     },
                     "required": ["project_path", "model_id", "model_name"]
@@ -121,6 +155,39 @@ class ProjectTools:
                             "type": "string",
                             "description": "Path to project root"
                         },
+                        "model_type": {
+                            "type": "string",
+                            "enum": ["dexpi", "sfiles", "all"],
+                            "description": "Filter by model type",
+                            "default": "all"
+                        },
+                        "details": {
+                            "type": "boolean",
+                            "description": "Include indexed metadata per model (size, component counts, tag count, hash, mtime) without loading the models",
+                            "default": False
+                        }
+                    },
+                    "required": ["project_path"]
+                }
+            ),
+            Tool(
+                name="project_search",
+                description="Search a project's models by name, project/drawing metadata or tag using the model index, without loading the models",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_path": {
+                            "type": "string",
+                            "description": "Path to project root"
+                        },
+                        "query": {
+                            "type": "string",
+                            "description": "Case-insensitive text matched against model names, metadata and tags"
+                        },
+                        "tag": {
+                            "type": "string",
+                            "description": "Exact tag (equipment tag, line number or SFILES unit name)"
+                        },
                         "model_type": {
                             "type": "string",
                             "enum": ["dexpi", "sfiles", "all"],
@@ -130,6 +197,27 @@ class ProjectTools:
                     },
                     "required": ["project_path"]
                 }
+            ),
+            Tool(
+                name="project_commit_flush",
+                description="Commit all queued project saves to git now and wait for the commits",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "timeout": {
+                            "type": "number",
+                            "description": "Seconds to wait for the commits (default: no limit)"
+                        }
+                    }
+                }
+            ),
+            Tool(
+                name="project_commit_status",
+                description="Show queued project saves and background git commit status",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
             )
         ]
     
@@ -147,7 +235,10 @@ class ProjectTools:
             "project_init": self._init_project,
             "project_save": self._save_model,
             "project_load": self._load_model,
-            "project_list": self._list_models
+            "project_list": self._list_models,
+            "project_search": self._search_models,
+            "project_commit_flush": self._commit_flush,
+            "project_commit_status": self._commit_status
         }
         
         handler = handlers.get(name)
@@ -196,11 +287,24 @@ class ProjectTools:
                     return error_response(f"DEXPI model {model_id} not found", code="MODEL_NOT_FOUND")
                 
                 model = self.dexpi_models[model_id]
+                artifacts = args.get("artifacts")
+                layout = None
+                if artifacts is not None and "layout" in artifacts:
+                    if self.layout_store is not None:
+                        layout = self.layout_store.get_latest_for_model("dexpi", model_id)
+                    if layout is None:
+                        return error_response(
+                            f"No layout computed for model {model_id}",
+                            code="LAYOUT_NOT_FOUND"
+                        )
                 saved_paths = self.persistence.save_dexpi(
                     model,
                     args["project_path"],
                     args["model_name"],
-                    args.get("commit_message")
+                    args.get("commit_message"),
+                    artifacts=artifacts,
+                    layout=layout,
+                    force=args.get("force", False)
                 )
             else:  # sfiles
                 if model_id not in self.flowsheets:
@@ -301,9 +405,50 @@ class ProjectTools:
                 "by_type": {k: len(v) for k, v in result.items()}
             }
             
-            return success_response({
+            response = {
                 "models": result,
                 "summary": summary
-            })
+            }
+            if args.get("details", False):
+                response["details"] = [
+                    entry.to_dict(include_tags=False)
+                    for entry in self.persistence.list_model_details(args["project_path"])
+                    if model_type == "all" or entry.model_type == model_type
+                ]
+
+            return success_response(response)
         except Exception as e:
-            return error_response(f"Failed to list models: {str(e)}", code="LIST_ERROR")
\ No newline at end of file
+            return error_response(f"Failed to list models: {str(e)}", code="LIST_ERROR")
+
+    async def _search_models(self, args: dict) -> dict:
+        """Search project models through the model index."""
+        if not args.get("query") and not args.get("tag"):
+            return error_response("Provide 'query' or 'tag' to search", code="MISSING_PARAMETERS")
+
+        model_type = args.get("model_type", "all")
+        try:
+            matches = self.persistence.search_models(
+                args["project_path"],
+                query=args.get("query"),
+                tag=args.get("tag"),
+                model_type=None if model_type == "all" else model_type
+            )
+        except Exception as e:
+            return error_response(f"Failed to search models: {str(e)}", code="SEARCH_ERROR")
+
+        return success_response({"matches": matches, "count": len(matches)})
+
+    async def _commit_flush(self, args: dict) -> dict:
+        """Commit queued saves and wait for git."""
+        status = await asyncio.to_thread(self.commit_queue.flush, args.get("timeout"))
+        if not status["flushed"]:
+            return error_response(
+                "Timed out waiting for queued git commits",
+                code="FLUSH_TIMEOUT",
+                details=status
+            )
+        return success_response(status)
+
+    async def _commit_status(self, args: dict) -> dict:
+        """Report background git commit queue state."""
+        return success_response(self.commit_queue.status())
@@ -8,6 +8,9 @@ import networkx as nx
 
 from mcp import Tool
 from ..utils.response import success_response, error_response
+from ..converters.graph_converter import UnifiedGraphConverter
+from ..core.model_store import CachingHook
+from ..core.analytics.traversal import TagIndex, traverse_connected
 
 # Import native pyDEXPI capabilities for attribute extraction
 try:
@@ -26,10 +29,21 @@ logger = logging.getLogger(__name__)
 class SearchTools:
     """Provides search and query capabilities for engineering models."""
     
-    def __init__(self, dexpi_models: Dict[str, Any], flowsheets: Dict[str, Any]):
-        """Initialize with model stores."""
+    def __init__(self, dexpi_models: Dict[str, Any], flowsheets: Dict[str, Any],
+                 caching_hook: Optional[CachingHook] = None):
+        """Initialize with model stores and optional caching hook.
+
+        Args:
+            dexpi_models: ModelStore or dict for DEXPI models
+            flowsheets: ModelStore or dict for SFILES flowsheets
+            caching_hook: Optional CachingHook shared with GraphTools so
+                         connectivity queries reuse cached graphs and tag
+                         indexes.
+        """
         self.dexpi_models = dexpi_models
         self.flowsheets = flowsheets
+        self.converter = UnifiedGraphConverter()
+        self._caching_hook = caching_hook
         # Use native pyDEXPI loader if available for better attribute extraction
         self.ml_loader = MLGraphLoader() if MLGraphLoader else None
     
@@ -136,6 +150,16 @@ class SearchTools:
                             "type": "integer",
                             "description": "Maximum depth to search",
                             "default": 3
+                        },
+                        "include_data": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Node attributes to include in results (['*'] for all). Omitted: no node payload"
+                        },
+                        "include_edges": {
+                            "type": "boolean",
+                            "description": "Include attributes of the connecting edge (e.g. line numbers)",
+                            "default": True
                         }
                     },
                     "required": ["node_id", "model_id"]
@@ -303,6 +327,16 @@ class SearchTools:
                             "description": "Maximum search depth (for connected query)",
                             "default": 3
                         },
+                        "include_data": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Node attributes to include (for connected query, ['*'] for all)"
+                        },
+                        "include_edges": {
+                            "type": "boolean",
+                            "description": "Include connecting edge attributes (for connected query)",
+                            "default": True
+                        },
                         "group_by": {
                             "type": "string",
                             "enum": ["type", "tag_prefix", "connection_count"],
@@ -510,89 +544,67 @@ class SearchTools:
             "results": results[:100]
         })
     
+    def _get_graph(self, model_id: str) -> Optional[nx.DiGraph]:
+        """Get the graph for a model, sharing the CachingHook graph cache."""
+        if model_id in self.flowsheets:
+            return self.flowsheets[model_id].state
+        if model_id not in self.dexpi_models:
+            return None
+
+        if self._caching_hook is not None:
+            cached_graph = self._caching_hook.get_cached_graph(model_id)
+            if cached_graph is not None:
+                return cached_graph
+
+        graph = self.converter.dexpi_to_networkx(self.dexpi_models[model_id])
+        if self._caching_hook is not None:
+            self._caching_hook.cache_graph(model_id, graph)
+        return graph
+
+    def _get_tag_index(self, model_id: str, graph: nx.DiGraph) -> TagIndex:
+        """Get the tag index for a model graph, building it if needed."""
+        if self._caching_hook is None:
+            return TagIndex(graph)
+
+        tag_index = self._caching_hook.get_cached_tag_index(model_id)
+        if tag_index is None or tag_index.graph is not graph:
+            tag_index = TagIndex(graph)
+            self._caching_hook.cache_tag_index(model_id, tag_index)
+        return tag_index
+
     async def _search_connected(self, args: dict) -> dict:
-        """Find connected components."""
+        """Find connected components.
+
+        Node payloads are opt-in via include_data; each result carries the
+        attributes of the edge through which it was reached.
+        """
         node_id = args["node_id"]
         model_id = args["model_id"]
         direction = args.get("direction", "both")
         max_depth = args.get("max_depth", 3)
-        
-        # Get the graph
-        if model_id in self.flowsheets:
-            graph = self.flowsheets[model_id].state
-        elif model_id in self.dexpi_models:
-            # Convert DEXPI to graph
-            from ..converters.graph_converter import UnifiedGraphConverter
-            converter = UnifiedGraphConverter()
-            graph = converter.dexpi_to_networkx(self.dexpi_models[model_id])
-        else:
+        if direction not in ("upstream", "downstream", "both"):
+            return error_response(
+                f"Invalid direction {direction!r}; expected 'upstream', 'downstream' or 'both'",
+                code="INVALID_DIRECTION"
+            )
+
+        graph = self._get_graph(model_id)
+        if graph is None:
             return error_response(f"Model {model_id} not found", code="MODEL_NOT_FOUND")
-        
-        # Find the node
-        target_node = None
-        for node in graph.nodes():
-            if node == node_id:
-                target_node = node
-                break
-            # Check node data for tag
-            data = graph.nodes[node]
-            if data.get('tag') == node_id or data.get('tagName') == node_id:
-                target_node = node
-                break
-        
-        if not target_node:
+
+        target_node = self._get_tag_index(model_id, graph).resolve(node_id)
+        if target_node is None:
             return error_response(f"Node {node_id} not found", code="NODE_NOT_FOUND")
-        
-        connected = {"upstream": [], "downstream": []}
-        
-        if direction in ["upstream", "both"]:
-            # BFS upstream
-            visited = set()
-            queue = [(target_node, 0)]
-            
-            while queue:
-                node, depth = queue.pop(0)
-                if depth > max_depth:
-                    continue
-                if node in visited:
-                    continue
-                visited.add(node)
-                
-                if node != target_node:
-                    connected["upstream"].append({
-                        "node": node,
-                        "depth": depth,
-                        "data": dict(graph.nodes[node])
-                    })
-                
-                for pred in graph.predecessors(node):
-                    if pred not in visited:
-                        queue.append((pred, depth + 1))
-        
-        if direction in ["downstream", "both"]:
-            # BFS downstream
-            visited = set()
-            queue = [(target_node, 0)]
-            
-            while queue:
-                node, depth = queue.pop(0)
-                if depth > max_depth:
-                    continue
-                if node in visited:
-                    continue
-                visited.add(node)
-                
-                if node != target_node:
-                    connected["downstream"].append({
-                        "node": node,
-                        "depth": depth,
-                        "data": dict(graph.nodes[node])
-                    })
-                
-                for succ in graph.successors(node):
-                    if succ not in visited:
-                        queue.append((succ, depth + 1))
-        
+
+        connected = traverse_connected(
+            graph,
+            target_node,
+            direction=direction,
+            max_depth=max_depth,
+            node_fields=args.get("include_data"),
+            include_edges=args.get("include_edges", True)
+        )
+
         return success_response({
             "source_node": target_node,
             "connected_components": connected,
@@ -17,7 +17,8 @@ from ..utils.process_resolver import (
     generate_semantic_id,
     get_next_sequence_number,
     get_fuzzy_matches,
-    load_process_hierarchy
+    load_process_hierarchy,
+    register_unit
 )
 
 logger = logging.getLogger(__name__)
@@ -464,6 +465,7 @@ class SfilesTools:
                     port_specs=port_specs_data,  # Persist BFD port metadata
                     **parameters
                 )
+                register_unit(flowsheet, semantic_id)
                 
                 return success_response({
                     "flowsheet_id": flowsheet_id,
@@ -44,7 +44,6 @@ class TemplateTools:
             template_library_path = project_root / "library" / "patterns"
 
         self.template_library_path = template_library_path
-        self._template_cache: Dict[str, ParametricTemplate] = {}
 
     def get_tools(self) -> List[Tool]:
         """Return all template tools."""
@@ -325,7 +324,10 @@ class TemplateTools:
 
     def _load_template(self, template_name: str) -> ParametricTemplate:
         """
-        Load a template by name (with caching).
+        Load a template by name.
+
+        ParametricTemplate.from_yaml serves unchanged files from the shared
+        template cache, so edits to the library are picked up without a restart.
 
         Args:
             template_name: Template name (without .yaml extension)
@@ -336,10 +338,6 @@ class TemplateTools:
         Raises:
             TemplateLoadError: If template not found or invalid
         """
-        # Check cache
-        if template_name in self._template_cache:
-            return self._template_cache[template_name]
-
         # Find template file
         template_file = self.template_library_path / f"{template_name}.yaml"
 
@@ -348,10 +346,4 @@ class TemplateTools:
                 f"Template '{template_name}' not found in {self.template_library_path}"
             )
 
-        # Load template
-        template = ParametricTemplate.from_yaml(template_file)
-
-        # Cache it
-        self._template_cache[template_name] = template
-
-        return template
+        return ParametricTemplate.from_yaml(template_file)
@@ -0,0 +1,135 @@
+"""Cached catalog of the tool definitions the server lists.
+
+Building the tool list means importing every tool module, and with them
+pyDEXPI's class tree, the visualization, layout and template subsystems.
+The catalog stores the list as JSON, each tool with the server handler
+that serves it, together with a fingerprint of the sources it was built
+from. A server whose code and data did not change answers ``list_tools``
+and routes calls without importing any tool module.
+
+The fingerprint covers the size and mtime of every source and data file
+under ``src/`` (tool schemas are built from code and from the component
+CSVs) plus the installed mcp and pyDEXPI versions. The catalog file is
+derived data, kept at TOOL_CATALOG_PATH or under the user cache directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from importlib import metadata
+from pathlib import Path
+from typing import Collection, List, Optional, Tuple
+
+from mcp import Tool
+from pydantic import ValidationError
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 2
+
+SRC_ROOT = Path(__file__).resolve().parent.parent
+
+# Files whose content can change a tool definition
+_SOURCE_SUFFIXES = (".py", ".csv", ".yaml", ".yml")
+# Directories under src/ that hold no tool-relevant sources
+_SKIPPED_DIRS = {"__pycache__", "assets", "proteus-viewer", "graphicbuilder", "node_modules"}
+_VERSIONED_PACKAGES = ("mcp", "pydexpi")
+
+
+def catalog_path() -> Path:
+    """Catalog file: TOOL_CATALOG_PATH, else $XDG_CACHE_HOME/engineering-mcp/tool_catalog.json."""
+    configured = os.environ.get("TOOL_CATALOG_PATH")
+    if configured:
+        return Path(configured)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "engineering-mcp" / "tool_catalog.json"
+
+
+def source_fingerprint(root: Path = SRC_ROOT) -> str:
+    """Fingerprint of the sources tool definitions are built from (stat only)."""
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIPPED_DIRS)
+        for filename in sorted(filenames):
+            if filename.endswith(_SOURCE_SUFFIXES):
+                path = os.path.join(dirpath, filename)
+                stat = os.stat(path)
+                digest.update(f"{os.path.relpath(path, root)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    for package in _VERSIONED_PACKAGES:
+        try:
+            version = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        digest.update(f"{package}=={version}\n".encode())
+    return digest.hexdigest()
+
+
+def load_catalog(
+    path: Path, fingerprint: str, handlers: Optional[Collection[str]] = None
+) -> Optional[List[Tuple[str, Tool]]]:
+    """(handler, tool) pairs stored at path, or None if the catalog must be rebuilt.
+
+    A missing catalog, one built from other sources, and one that cannot be
+    read or parsed (truncated, hand-edited) all return None, so the server
+    rebuilds it instead of failing to start.
+
+    Args:
+        path: Catalog file
+        fingerprint: Current source_fingerprint()
+        handlers: Known handler names; a catalog naming any other is stale
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CATALOG_VERSION or data.get("fingerprint") != fingerprint:
+            logger.info(f"Tool catalog {path} is stale; rebuilding")
+            return None
+        entries = [(entry["handler"], Tool.model_validate(entry["tool"])) for entry in data["tools"]]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, ValidationError) as e:
+        # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
+        logger.warning(f"Tool catalog {path} is unreadable ({type(e).__name__}: {e}); rebuilding")
+        return None
+    if handlers is not None:
+        unknown = {handler for handler, _ in entries} - set(handlers)
+        if unknown:
+            logger.warning(f"Tool catalog {path} names unknown handlers {sorted(unknown)}; rebuilding")
+            return None
+    return entries
+
+
+def save_catalog(entries: List[Tuple[str, Tool]], path: Path, fingerprint: str) -> None:
+    """Write the catalog atomically.
+
+    A cache directory that cannot be written is logged and skipped: the
+    server still serves the tools it just built.
+    """
+    path = Path(path)
+    data = {
+        "version": CATALOG_VERSION,
+        "fingerprint": fingerprint,
+        "tools": [
+            {"handler": handler, "tool": tool.model_dump(mode="json", exclude_none=True)}
+            for handler, tool in entries
+        ],
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write tool catalog {path}: {e}")
+
+
+__all__ = [
+    "CATALOG_VERSION",
+    "catalog_path",
+    "load_catalog",
+    "save_catalog",
+    "source_fingerprint",
+]
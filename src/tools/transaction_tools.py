@@ -216,25 +216,19 @@ class TransactionTools:
         operations = args["operations"]
 
         try:
-            # Apply each operation in sequence
-            results = []
-            for op in operations:
-                operation_name = op["operation"]
-                params = op["params"]
-
-                # TransactionManager.apply handles operation registry lookup
-                result = await self.tx_manager.apply(
-                    tx_id,
-                    operation_name=operation_name,
-                    params=params
-                )
+            # Apply the whole batch under one transaction lock
+            batch = await self.tx_manager.apply_batch(tx_id, operations)
 
+            results = []
+            for record in batch.records:
                 # Convert OperationResult to dict for JSON serialization
+                result = record.result
                 result_dict = asdict(result) if hasattr(result, '__dataclass_fields__') else result
 
                 results.append({
-                    "operation": operation_name,
-                    "result": result_dict
+                    "operation": record.operation,
+                    "result": result_dict,
+                    "duration_ms": round(record.duration_ms, 3)
                 })
 
             # Get current transaction status
@@ -244,6 +238,10 @@ class TransactionTools:
                 "transaction_id": tx_id,
                 "operations_applied": len(results),
                 "results": results,
+                "timings": {
+                    "total_ms": round(batch.total_ms, 3),
+                    "post_validation_ms": round(batch.post_validation_ms, 3)
+                },
                 "transaction_status": status
             })
 
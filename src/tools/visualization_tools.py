@@ -214,15 +214,14 @@ class VisualizationTools:
             try:
                 from ..core.layout_store import LayoutNotFoundError
 
-                # If layout_id not specified, try to find layout for this model_id
+                # If layout_id not specified, use the latest layout for this model
+                # (read-only snapshots: rendering never mutates the layout)
                 if layout_id:
-                    layout_metadata = self.layout_store.get(layout_id)
+                    layout_metadata = self.layout_store.get_snapshot(layout_id)
                 else:
-                    # Search for layouts with matching model_ref using list_by_model API
-                    matching_layouts = self.layout_store.list_by_model(model_type, model_id)
-                    if matching_layouts:
-                        layout_id = matching_layouts[0]  # Use first matching layout
-                        layout_metadata = self.layout_store.get(layout_id)
+                    layout_metadata = self.layout_store.get_latest_for_model(model_type, model_id)
+                    if layout_metadata is not None:
+                        layout_id = layout_metadata.layout_id
 
                 if layout_metadata is None:
                     return error_response(
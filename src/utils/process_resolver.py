@@ -1,13 +1,41 @@
-"""Process type resolution utilities for BFD mode."""
+"""Process type resolution utilities for BFD mode.
+
+The process units hierarchy and alias files are parsed once and kept in the
+process-wide compiled file cache (src/utils/template_cache.py), which
+revalidates them against their size and mtime on every lookup. The parsed
+hierarchy is compiled into a ProcessIndex: a flat name -> process details
+table with the same precedence as walking the tree, a case-folded table, and
+the process names bucketed by length for fuzzy suggestions.
+
+Sequence numbers for BFD units are served from per-flowsheet counters that
+are built with one scan of the flowsheet graph and then kept up to date by
+register_unit(); a counter is rebuilt whenever the graph's node count or
+newest node no longer matches what it has seen (units added or removed
+elsewhere), when the unit recorded as holding the highest sequence is gone
+or renumbered, or when a semantic ID would collide with an existing node.
+"""
 
 import json
+import math
 import os
-from typing import Dict, List, Optional, Any
-from difflib import get_close_matches
 import re
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from difflib import get_close_matches
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-def load_process_hierarchy() -> Dict[str, Any]:
-    """Load process units hierarchy from JSON file.
+from .template_cache import get_template_cache
+
+SEQUENCE_SUFFIX_PATTERN = re.compile(r'-(\d+)$')
+
+# Suggestion results kept per hierarchy index (cleared when full)
+MAX_CACHED_FUZZY_QUERIES = 1024
+
+
+def _find_hierarchy_path() -> str:
+    """Locate the process units hierarchy file.
 
     Looks for the file in the following locations (in order):
     1. src/config/process_units_hierarchy.json (relative to package)
@@ -33,7 +61,7 @@ def load_process_hierarchy() -> Dict[str, Any]:
                 f"Using legacy hierarchy path: {legacy_path}. "
                 f"Please move file to {config_dir}/process_units_hierarchy.json",
                 DeprecationWarning,
-                stacklevel=2
+                stacklevel=3
             )
             hierarchy_path = legacy_path
 
@@ -44,135 +72,214 @@ def load_process_hierarchy() -> Dict[str, Any]:
             f"  - PROCESS_HIERARCHY_PATH environment variable\n"
             f"  - ~/processeng/process_units_hierarchy.json"
         )
+    return hierarchy_path
 
-    with open(hierarchy_path, 'r') as f:
-        return json.load(f)
+
+def _hierarchy_entries(hierarchy: Dict[str, Any]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """(name, details) for every category, subcategory and process in tree order.
+
+    details is what a lookup of that name resolves to, or None when the
+    entry has no area number to resolve to.
+    """
+    for category, subcategories in hierarchy.items():
+        details = None
+        if isinstance(subcategories, dict):
+            # Top-level category match (e.g., "Preliminary Treatment")
+            # These typically don't have area numbers, so we'll use the first child
+            for subcat, subcat_details in subcategories.items():
+                if isinstance(subcat_details, dict) and 'area_number' in subcat_details:
+                    details = {
+                        'canonical_name': category,
+                        'area_number': subcat_details['area_number'],
+                        'process_unit_id': subcat_details.get('process_unit_id', 'TK'),
+                        'category': category,
+                        'subcategory': subcat
+                    }
+                    break
+        yield category, details
+
+        if not isinstance(subcategories, dict):
+            continue
+        for subcat, processes in subcategories.items():
+            details = None
+            if isinstance(processes, dict):
+                # Subcategory match (e.g., "Headworks"): first process with area number
+                for _, process_details in processes.items():
+                    if isinstance(process_details, dict) and 'area_number' in process_details:
+                        details = {
+                            'canonical_name': subcat,
+                            'area_number': process_details['area_number'],
+                            'process_unit_id': process_details.get('process_unit_id', 'TK'),
+                            'category': category,
+                            'subcategory': subcat
+                        }
+                        break
+            yield subcat, details
+
+            if not isinstance(processes, dict):
+                continue
+            for process_name, process_details in processes.items():
+                if not isinstance(process_details, dict):
+                    continue
+                details = None
+                if 'area_number' in process_details:
+                    # Specific process match (e.g., "Coarse Screening")
+                    details = {
+                        'canonical_name': process_name,
+                        'area_number': process_details['area_number'],
+                        'process_unit_id': process_details.get('process_unit_id', 'TK'),
+                        'category': category,
+                        'subcategory': subcat,
+                        'process_name': process_name
+                    }
+                yield process_name, details
+
+
+class ProcessIndex:
+    """Flattened lookup tables over a process units hierarchy.
+
+    Lookups return fresh dicts; the hierarchy itself is shared and must not
+    be modified.
+    """
+
+    def __init__(self, hierarchy: Dict[str, Any]):
+        self.hierarchy = hierarchy
+        names = []
+        self._exact: Dict[str, Dict[str, Any]] = {}
+        self._folded: Dict[str, Dict[str, Any]] = {}
+        for name, details in _hierarchy_entries(hierarchy):
+            names.append(name)
+            # The first entry in tree order that resolves wins
+            if details is not None:
+                self._exact.setdefault(name, details)
+        for name in names:
+            if name in self._exact:
+                self._folded.setdefault(name.lower(), self._exact[name])
+        self.names: Tuple[str, ...] = tuple(names)
+        # Fuzzy candidates by length: difflib rejects any candidate whose
+        # length alone bounds its ratio below the cutoff
+        by_length = sorted(names, key=len)
+        self._fuzzy_names = by_length
+        self._fuzzy_lengths = [len(name) for name in by_length]
+        self._fuzzy_results: Dict[Tuple[str, int, float], Tuple[str, ...]] = {}
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """Details for an exact category, subcategory or process name."""
+        details = self._exact.get(name)
+        return dict(details) if details is not None else None
+
+    def find_case_insensitive(self, name: str) -> Optional[Dict[str, Any]]:
+        """Details for a name compared case-insensitively."""
+        details = self._folded.get(name.lower())
+        return dict(details) if details is not None else None
+
+    def fuzzy_matches(self, query: str, n: int = 3, cutoff: float = 0.6) -> List[str]:
+        """Same result as difflib.get_close_matches over all names."""
+        key = (query, n, cutoff)
+        matches = self._fuzzy_results.get(key)
+        if matches is None:
+            matches = tuple(self._close_matches(query, n, cutoff))
+            if len(self._fuzzy_results) >= MAX_CACHED_FUZZY_QUERIES:
+                self._fuzzy_results.clear()
+            self._fuzzy_results[key] = matches
+        return list(matches)
+
+    def _close_matches(self, query: str, n: int, cutoff: float) -> List[str]:
+        candidates = self._fuzzy_names
+        if query and 0 < cutoff <= 1:
+            # ratio <= 2 * min(a, b) / (a + b), so only lengths in
+            # [cutoff * b / (2 - cutoff), b * (2 - cutoff) / cutoff] can pass
+            size = len(query)
+            low = bisect_left(self._fuzzy_lengths, math.floor(cutoff * size / (2 - cutoff)))
+            high = bisect_right(self._fuzzy_lengths, math.ceil(size * (2 - cutoff) / cutoff))
+            candidates = candidates[low:high]
+        return get_close_matches(query, candidates, n=n, cutoff=cutoff)
+
+
+def _compile_index(content: bytes, path: Path) -> ProcessIndex:
+    return ProcessIndex(json.loads(content))
+
+
+def _parse_json(content: bytes, path: Path) -> Any:
+    return json.loads(content)
+
+
+def get_process_index() -> ProcessIndex:
+    """Index of the current process units hierarchy (reloaded when the file changes)."""
+    return get_template_cache().load("process_hierarchy", _find_hierarchy_path(), _compile_index)
+
+
+def _index_for(hierarchy: Dict[str, Any]) -> ProcessIndex:
+    """The cached index when hierarchy is the loaded one, else a new index."""
+    try:
+        index = get_process_index()
+    except FileNotFoundError:
+        return ProcessIndex(hierarchy)
+    return index if index.hierarchy is hierarchy else ProcessIndex(hierarchy)
+
+
+def load_process_hierarchy() -> Dict[str, Any]:
+    """Load process units hierarchy from JSON file.
+
+    See _find_hierarchy_path for the search order. The returned dict is
+    shared between callers and must not be modified.
+    """
+    return get_process_index().hierarchy
 
 def load_process_aliases() -> Dict[str, str]:
-    """Load process aliases from JSON file."""
+    """Load process aliases from JSON file (shared, must not be modified)."""
     aliases_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "process_aliases.json")
     if not os.path.exists(aliases_path):
         return {}
-    
-    with open(aliases_path, 'r') as f:
-        return json.load(f)
+
+    return get_template_cache().load("process_aliases", aliases_path, _parse_json)
 
 def find_in_hierarchy(hierarchy: Dict[str, Any], query: str) -> Optional[Dict[str, Any]]:
     """
     Search hierarchy for process type and return its details.
     Returns: {'canonical_name': str, 'area_number': int, 'process_unit_id': str, ...}
     """
-    # Traverse hierarchy recursively
-    for category, subcategories in hierarchy.items():
-        if category == query:
-            # Top-level category match (e.g., "Preliminary Treatment")
-            # These typically don't have area numbers, so we'll use the first child
-            if isinstance(subcategories, dict):
-                for subcat, details in subcategories.items():
-                    if isinstance(details, dict) and 'area_number' in details:
-                        return {
-                            'canonical_name': category,
-                            'area_number': details['area_number'],
-                            'process_unit_id': details.get('process_unit_id', 'TK'),
-                            'category': category,
-                            'subcategory': subcat
-                        }
-        
-        if isinstance(subcategories, dict):
-            for subcat, processes in subcategories.items():
-                if subcat == query:
-                    # Subcategory match (e.g., "Headworks")
-                    if isinstance(processes, dict):
-                        # Find first process with area number
-                        for process_name, details in processes.items():
-                            if isinstance(details, dict) and 'area_number' in details:
-                                return {
-                                    'canonical_name': subcat,
-                                    'area_number': details['area_number'],
-                                    'process_unit_id': details.get('process_unit_id', 'TK'),
-                                    'category': category,
-                                    'subcategory': subcat
-                                }
-                
-                if isinstance(processes, dict):
-                    for process_name, details in processes.items():
-                        if process_name == query:
-                            # Specific process match (e.g., "Coarse Screening")
-                            if isinstance(details, dict) and 'area_number' in details:
-                                return {
-                                    'canonical_name': process_name,
-                                    'area_number': details['area_number'],
-                                    'process_unit_id': details.get('process_unit_id', 'TK'),
-                                    'category': category,
-                                    'subcategory': subcat,
-                                    'process_name': process_name
-                                }
-    
-    return None
+    return _index_for(hierarchy).find(query)
 
 def get_all_process_names(hierarchy: Dict[str, Any]) -> List[str]:
     """Extract all process names from hierarchy for fuzzy matching."""
-    names = []
-    
-    for category, subcategories in hierarchy.items():
-        names.append(category)
-        
-        if isinstance(subcategories, dict):
-            for subcat, processes in subcategories.items():
-                names.append(subcat)
-                
-                if isinstance(processes, dict):
-                    for process_name, details in processes.items():
-                        if isinstance(details, dict):
-                            names.append(process_name)
-    
-    return names
+    return list(_index_for(hierarchy).names)
 
 def get_fuzzy_matches(query: str, hierarchy: Dict[str, Any], n: int = 3, cutoff: float = 0.6) -> List[str]:
     """Get fuzzy matches for a query string."""
-    all_names = get_all_process_names(hierarchy)
-    matches = get_close_matches(query, all_names, n=n, cutoff=cutoff)
-    return matches
+    return _index_for(hierarchy).fuzzy_matches(query, n=n, cutoff=cutoff)
 
 def resolve_process_type(query: str, allow_custom: bool = False) -> Optional[Dict[str, Any]]:
     """
-    Resolve process type via exact match, aliases, or fuzzy match.
-    
+    Resolve process type via exact match, aliases, or case-insensitive match.
+
+    Fuzzy matches are never accepted: callers use get_fuzzy_matches to
+    suggest names when this returns None.
+
     Returns:
         Dict with canonical_name, area_number, process_unit_id, category, subcategory
         or None if not found and custom not allowed
     """
-    hierarchy = load_process_hierarchy()
-    aliases = load_process_aliases()
-    
+    index = get_process_index()
+
     # 1. Exact match in hierarchy
-    found = find_in_hierarchy(hierarchy, query)
+    found = index.find(query)
     if found:
         return found
-    
+
     # 2. Check aliases
+    aliases = load_process_aliases()
     if query in aliases:
-        canonical = aliases[query]
-        found = find_in_hierarchy(hierarchy, canonical)
+        found = index.find(aliases[query])
         if found:
             return found
-    
+
     # 3. Try case-insensitive match
-    query_lower = query.lower()
-    for name in get_all_process_names(hierarchy):
-        if name.lower() == query_lower:
-            found = find_in_hierarchy(hierarchy, name)
-            if found:
-                return found
-    
-    # 4. Fuzzy match (but don't auto-accept)
-    matches = get_fuzzy_matches(query, hierarchy, n=3, cutoff=0.7)
-    if matches and not allow_custom:
-        # Return None with suggestions in the error message
-        # The caller should handle this and raise an appropriate error
-        return None
-    
-    # 5. Custom process (if allowed)
+    found = index.find_case_insensitive(query)
+    if found:
+        return found
+
+    # 4. Custom process (if allowed)
     if allow_custom:
         return {
             'canonical_name': query,
@@ -212,16 +319,20 @@ def generate_semantic_id(flowsheet, base_name: str, include_sequence: bool = Tru
         # For user-facing tags, return without sequence
         return normalized
 
-    # Find existing units with similar base name
+    semantic_id = _next_semantic_id(_sequence_counters(flowsheet), normalized)
+    if semantic_id in flowsheet.state:
+        # The counters missed an edit; add_node would merge into that node
+        semantic_id = _next_semantic_id(_sequence_counters(flowsheet, rebuild=True), normalized)
+    return semantic_id
+
+def _next_semantic_id(counters: "_SequenceCounters", normalized: str) -> str:
+    # Highest sequence among existing units whose ID starts with our normalized name
     existing_count = 0
-    for node_id in flowsheet.state.nodes():
-        # Check if node starts with our normalized name
-        if node_id.startswith(normalized):
-            # Extract sequence number if present (after single hyphen)
-            match = re.search(r'-(\d+)$', node_id)
-            if match:
-                seq = int(match.group(1))
-                existing_count = max(existing_count, seq)
+    ids = counters.sequenced_ids
+    for position in range(bisect_left(ids, normalized), len(ids)):
+        if not ids[position].startswith(normalized):
+            break
+        existing_count = max(existing_count, counters.id_sequences[ids[position]])
 
     # Generate new ID with next sequence (single hyphen before number)
     sequence = existing_count + 1
@@ -257,15 +368,109 @@ def get_next_sequence_number(flowsheet, area_number: int, process_unit_id: str)
     Find next available sequence number for given area/unit type.
     E.g., if 101-BS-01 exists, return 2 for next unit.
     """
-    existing_sequences = []
+    key = (area_number, process_unit_id)
+    counters = _sequence_counters(flowsheet)
+    unit = counters.units.get(key)
+    if unit is not None and not counters.holds(flowsheet.state, unit):
+        # The unit holding the highest sequence was replaced or renumbered
+        counters = _sequence_counters(flowsheet, rebuild=True)
+        unit = counters.units.get(key)
+    return (unit[0] if unit else 0) + 1
+
+def register_unit(flowsheet, node_id: str) -> None:
+    """Update the flowsheet's sequence counters after adding node_id to it.
+
+    Call right after flowsheet.state.add_node(); otherwise the next
+    sequence lookup rescans the whole graph.
+    """
+    graph = flowsheet.state
+    with _counters_lock:
+        counters = _counters.get(graph)
+        if counters is None:
+            return
+        newest, previous = _newest_nodes(graph, 2)
+        if (counters.node_count == graph.number_of_nodes() - 1
+                and newest == node_id and previous == counters.last_node):
+            counters.add(node_id, graph.nodes[node_id])
+            counters.node_count += 1
+            counters.last_node = node_id
+        else:
+            # Not exactly one new node since the counters were current:
+            # rebuild on next lookup
+            del _counters[graph]
+
+
+def _newest_nodes(graph, count: int) -> List[Any]:
+    """The count most recently added node IDs, newest first, padded with None.
+
+    networkx keeps nodes in insertion order, so the last nodes of the graph
+    are the newest.
+    """
+    newest = list(graph)[:-count - 1:-1]
+    return newest + [None] * (count - len(newest))
+
+
+class _SequenceCounters:
+    """Highest sequence numbers in use in one flowsheet graph.
+
+    units maps (area_number, process_unit_id) to (sequence_number, node_id)
+    of the unit holding the highest sequence; sequenced_ids are the sorted
+    node IDs ending in "-<number>", with that number in id_sequences.
+
+    node_count and last_node fingerprint the graph they describe: networkx
+    appends new nodes to the end of its node dict, so any add that skipped
+    register_unit changes the last node even when a removal kept the count.
+    """
+
+    def __init__(self, graph):
+        self.node_count = 0
+        self.last_node = None
+        self.units: Dict[Tuple[Any, Any], Tuple[int, Any]] = {}
+        self.sequenced_ids: List[str] = []
+        self.id_sequences: Dict[str, int] = {}
+        for node_id, node_data in graph.nodes(data=True):
+            self.add(node_id, node_data)
+            self.node_count += 1
+            self.last_node = node_id
+
+    def describes(self, graph) -> bool:
+        """Whether no node was added or removed since the counters were current."""
+        return (self.node_count == graph.number_of_nodes()
+                and _newest_nodes(graph, 1)[0] == self.last_node)
+
+    def add(self, node_id, node_data: Dict[str, Any]) -> None:
+        key = (node_data.get('area_number'), node_data.get('process_unit_id'))
+        seq = node_data.get('sequence_number', 0)
+        current = self.units.get(key)
+        if current is None or seq > current[0]:
+            self.units[key] = (seq, node_id)
+
+        if isinstance(node_id, str) and node_id not in self.id_sequences:
+            match = SEQUENCE_SUFFIX_PATTERN.search(node_id)
+            if match:
+                self.id_sequences[node_id] = int(match.group(1))
+                self.sequenced_ids.insert(bisect_left(self.sequenced_ids, node_id), node_id)
+
+    @staticmethod
+    def holds(graph, unit: Tuple[int, Any]) -> bool:
+        """Whether the graph still has the unit recorded as holding a sequence."""
+        seq, node_id = unit
+        node_data = graph.nodes.get(node_id)
+        return node_data is not None and node_data.get('sequence_number', 0) == seq
+
+
+# Sequence counters per flowsheet graph, dropped with the graph
+_counters: "weakref.WeakKeyDictionary[Any, _SequenceCounters]" = weakref.WeakKeyDictionary()
+_counters_lock = threading.Lock()
 
-    for node_id, node_data in flowsheet.state.nodes(data=True):
-        if (node_data.get('area_number') == area_number and
-            node_data.get('process_unit_id') == process_unit_id):
-            seq = node_data.get('sequence_number', 0)
-            existing_sequences.append(seq)
 
-    return max(existing_sequences, default=0) + 1
+def _sequence_counters(flowsheet, rebuild: bool = False) -> _SequenceCounters:
+    graph = flowsheet.state
+    with _counters_lock:
+        counters = _counters.get(graph)
+        if rebuild or counters is None or not counters.describes(graph):
+            counters = _counters[graph] = _SequenceCounters(graph)
+        return counters
 
 def extract_valid_bfd_units(hierarchy: Dict[str, Any]) -> List[str]:
     """Extract all valid BFD unit types from hierarchy."""
@@ -0,0 +1,73 @@
+"""Compiled JSON Schema checkers shared by tool routing and the operation registry."""
+
+import importlib.util
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+SchemaChecker = Callable[[Dict[str, Any]], Optional[str]]
+
+
+def fastjsonschema_available() -> bool:
+    """Check whether fastjsonschema (code-generating validator) is importable."""
+    return importlib.util.find_spec("fastjsonschema") is not None
+
+
+def compile_schema_checker(schema: Dict[str, Any]) -> SchemaChecker:
+    """Compiled checker for a JSON schema (cached by canonical schema JSON).
+
+    Returns:
+        Callable returning None for a valid instance or an error message
+
+    Raises:
+        Exception: If the schema itself is invalid (fastjsonschema's
+            JsonSchemaDefinitionException or jsonschema's SchemaError)
+    """
+    return _compile_schema(json.dumps(schema, sort_keys=True))
+
+
+@lru_cache(maxsize=None)
+def _compile_schema(schema_json: str) -> SchemaChecker:
+    """
+    Compile a canonical JSON schema string into a checker.
+
+    Cached process-wide, so descriptors re-registered after
+    reset_operation_registry() reuse their compiled validators.
+
+    Returns:
+        Callable returning None for valid params or an error message
+    """
+    schema = json.loads(schema_json)
+
+    if fastjsonschema_available():
+        import fastjsonschema
+
+        validate = fastjsonschema.compile(schema, use_default=False)
+
+        def check(params: Dict[str, Any]) -> Optional[str]:
+            try:
+                validate(params)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return e.message
+            return None
+
+        return check
+
+    from jsonschema import validators
+    from jsonschema.exceptions import best_match
+
+    validator_cls = validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+
+    def check(params: Dict[str, Any]) -> Optional[str]:
+        error = best_match(validator.iter_errors(params))
+        if error is None:
+            return None
+        location = ".".join(str(p) for p in error.absolute_path)
+        return f"{location}: {error.message}" if location else error.message
+
+    return check
+
+
+__all__ = ["SchemaChecker", "compile_schema_checker", "fastjsonschema_available"]
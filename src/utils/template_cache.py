@@ -0,0 +1,137 @@
+"""
+Process-wide cache of compiled template files.
+
+Template consumers (TemplateLoader, ParametricTemplate, the template tools
+and operations) used to re-read and re-parse YAML on every load, while the
+per-instance name caches never noticed edits. CompiledFileCache keeps the
+compiled form of each file (parsed YAML, a ParametricTemplate, a resolved
+ProcessTemplate) keyed by (kind, path) and validated against the file's
+size, mtime and SHA-256:
+
+- size and mtime unchanged: the compiled value is returned after a stat,
+  without reading the file
+- stat changed, content hash unchanged (touched or re-saved): the file is
+  read and hashed once, the compiled value is kept
+- content changed: the file is compiled again
+
+A compiled value may also depend on other files (a ProcessTemplate on the
+component and equipment library YAML): callers pass a ``variant`` digest
+of those dependencies and an entry only matches the variant it was
+compiled for.
+
+Cached values are shared: callers that modify a loaded value must copy it.
+
+Usage:
+    from src.utils.template_cache import get_template_cache, parse_yaml
+
+    data = get_template_cache().load("yaml", path, parse_yaml)
+"""
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import yaml
+
+Compiler = Callable[[bytes, Path], Any]
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    sha256: str
+    variant: Optional[str]
+    value: Any
+
+
+def parse_yaml(content: bytes, path: Path) -> Any:
+    """Compiler for plain YAML documents."""
+    return yaml.safe_load(content)
+
+
+class CompiledFileCache:
+    """Compiled values of files keyed by (kind, path), invalidated on content change.
+
+    Thread-safe; files are read and compiled outside the lock.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "rehashes": 0, "compiles": 0}
+
+    def load(self, kind: str, path: Path, compile: Compiler, variant: Optional[str] = None) -> Any:
+        """Compiled value of a file, compiling it when its content changed.
+
+        Args:
+            kind: Name of the compiled form (one file can be cached as several kinds)
+            path: File to load
+            compile: Called with the file content and path on a miss
+            variant: Digest of other inputs the compiled value depends on
+
+        Returns:
+            The cached or newly compiled value
+
+        Raises:
+            FileNotFoundError: If path does not exist
+            Exception: Whatever compile raises (failures are not cached)
+        """
+        path = Path(path)
+        key = (kind, os.path.abspath(path))
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None and entry.variant == variant
+                    and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size):
+                self._stats["hits"] += 1
+                return entry.value
+
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        if entry is not None and entry.variant == variant and entry.sha256 == digest:
+            value = entry.value
+            counter = "rehashes"
+        else:
+            value = compile(content, path)
+            counter = "compiles"
+        with self._lock:
+            self._entries[key] = _Entry(stat.st_mtime_ns, len(content), digest, variant, value)
+            self._stats[counter] += 1
+        return value
+
+    def digest(self, kind: str, path: Path) -> Optional[str]:
+        """SHA-256 the cached value of a file was compiled from (None if not cached)."""
+        with self._lock:
+            entry = self._entries.get((kind, os.path.abspath(path)))
+        return entry.sha256 if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/compile counters and current size."""
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+
+# Singleton instance for global access
+_cache: Optional[CompiledFileCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> CompiledFileCache:
+    """Process-wide compiled template cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CompiledFileCache()
+    return _cache
+
+
+__all__ = ["CompiledFileCache", "get_template_cache", "parse_yaml"]
@@ -4,8 +4,10 @@ Merge NOAKADEXPI and DISCDEXPI Symbol Libraries
 Tracks provenance and handles duplicates intelligently
 """
 
+import argparse
 import json
 import logging
+import sys
 from pathlib import Path
 from typing import Dict, List, Set, Optional
 from dataclasses import dataclass, asdict
@@ -13,6 +15,13 @@ from datetime import datetime
 import hashlib
 import subprocess
 
+# Allow running this file directly (python src/visualization/symbols/merge_symbol_libraries.py)
+_project_root = Path(__file__).resolve().parents[3]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from src.core.svg_manifest import SVGManifest
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -42,12 +51,22 @@ class MergedSymbol:
 class SymbolLibraryMerger:
     """Merge NOAKA and DISC symbol libraries with intelligent deduplication."""
 
-    def __init__(self, base_path: Path = None):
-        """Initialize merger."""
+    def __init__(self, base_path: Path = None, incremental: bool = True, workers: Optional[int] = None):
+        """Initialize merger.
+
+        Args:
+            base_path: Assets directory holding the symbol repositories
+            incremental: Re-hash only SVGs whose size or mtime changed since
+                the last scan (tracked in the SVG manifest); False re-hashes all
+            workers: Processes used to hash changed SVGs (default: CPU count)
+        """
         if base_path is None:
             base_path = Path(__file__).parent / "assets"
 
         self.base_path = base_path
+        self.incremental = incremental
+        self.workers = workers
+        self.manifest = SVGManifest(base_path)
         self.noaka_path = base_path / "NOAKADEXPI"
         self.disc_path = base_path / "DISCDEXPI"
         self.merged_path = base_path / "MERGED"
@@ -103,8 +122,12 @@ class SymbolLibraryMerger:
 
         git_info = self.get_git_info(repo_path)
 
+        # Hash changed files (all files unless incremental) in parallel
+        svg_paths = list(repo_path.rglob("*.svg"))
+        records = self.manifest.refresh(svg_paths, workers=self.workers, force=not self.incremental)
+
         # Scan all SVG files
-        for svg_path in repo_path.rglob("*.svg"):
+        for svg_path in svg_paths:
             # Extract symbol ID from filename
             symbol_id = svg_path.stem
 
@@ -130,7 +153,7 @@ class SymbolLibraryMerger:
                     source_repo=repo_name,
                     commit_sha=git_info.get("commit_sha"),
                     modified_at=git_info.get("modified_at"),
-                    file_hash=self.get_file_hash(svg_path)
+                    file_hash=records[svg_path.relative_to(self.base_path).as_posix()].sha256
                 )
             )
 
@@ -162,6 +185,7 @@ class SymbolLibraryMerger:
         # Scan both repositories
         self.noaka_symbols = self.scan_repository(self.noaka_path, "NOAKADEXPI")
         self.disc_symbols = self.scan_repository(self.disc_path, "DISCDEXPI")
+        self.manifest.save()
 
         # Find unique symbols
         noaka_only = set(self.noaka_symbols.keys()) - set(self.disc_symbols.keys())
@@ -311,7 +335,14 @@ class SymbolLibraryMerger:
 
 def main():
     """Main merge function."""
-    merger = SymbolLibraryMerger()
+    parser = argparse.ArgumentParser(description="Merge NOAKADEXPI and DISCDEXPI symbol libraries")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-hash every SVG instead of only files changed since the last run")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes used to hash SVG files (default: CPU count)")
+    args = parser.parse_args()
+
+    merger = SymbolLibraryMerger(incremental=not args.full, workers=args.workers)
 
     # Merge libraries
     merger.merge_libraries()
@@ -319,6 +350,11 @@ def main():
     # Save catalog
     merger.save_merged_catalog()
 
+    # The registry ignores a snapshot compiled from another catalog
+    from src.core.symbols import SymbolRegistry
+    header = SymbolRegistry(merger.base_path, use_snapshot=False).compile_snapshot()
+    print(f"Compiled registry snapshot ({header['symbols']} symbols)")
+
     # Generate report
     report = merger.generate_difference_report()
     print(report)
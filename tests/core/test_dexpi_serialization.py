@@ -0,0 +1,117 @@
+"""Tests for fast DEXPI serialization (src/core/dexpi_serialization.py)."""
+
+import io
+import json
+from datetime import datetime
+from enum import Enum
+
+import pytest
+from pydexpi.dexpi_classes.dexpiModel import ConceptualModel, DexpiModel
+from pydexpi.dexpi_classes.equipment import CentrifugalPump, Nozzle, Tank
+from pydexpi.dexpi_classes.metaData import MetaData
+from pydexpi.dexpi_classes.piping import Pipe, PipingNetworkSegment, PipingNetworkSystem
+from pydexpi.dexpi_classes.pydantic_classes import Length, LengthUnit
+from pydexpi.loaders import JsonSerializer
+
+from src.core import dexpi_serialization as ds
+from src.core.dexpi_fields import field_plan
+
+
+@pytest.fixture
+def model():
+    conceptual = ConceptualModel(
+        metaData=MetaData(projectName="Plänt \"A\"", drawingNumber="PID-001", date=datetime(2024, 5, 1))
+    )
+    pump = CentrifugalPump(tagName="P-101", nozzles=[Nozzle(subTagName="N1"), Nozzle(subTagName="N2")])
+    tank = Tank(tagName="T-101", nozzles=[Nozzle(subTagName="N1")])
+    conceptual.taggedPlantItems.extend([pump, tank])
+    conceptual.pipingNetworkSystems.append(PipingNetworkSystem(segments=[
+        PipingNetworkSegment(
+            connections=[Pipe(sourceItem=pump.nozzles[1], targetItem=tank.nozzles[0])],
+            sourceItem=pump.nozzles[1],
+            targetItem=tank.nozzles[0],
+        )
+    ]))
+    return DexpiModel(conceptualModel=conceptual)
+
+
+def test_model_to_dict_matches_pydexpi(model):
+    assert ds.model_to_dict(model) == JsonSerializer().model_to_dict(model)
+
+
+def test_field_plan_groups_fields_by_category():
+    plan = field_plan(CentrifugalPump)
+
+    assert plan.has_id
+    assert "nozzles" in plan.composition and "nozzles" in plan.child_fields
+    assert "tagName" in plan.data and "tagName" in plan.text_fields
+    assert {"id", "uri"} <= set(plan.child_fields) & set(plan.text_fields)
+    assert not set(plan.reference) & set(plan.child_fields)
+    assert field_plan(CentrifugalPump) is plan
+
+
+@pytest.mark.parametrize("indent", [None, 4])
+def test_streaming_writer_matches_json_dumps(model, indent, monkeypatch):
+    # Small chunks exercise the chunk boundaries
+    monkeypatch.setattr(ds, "STREAM_CHUNK_SIZE", 64)
+    expected = json.dumps(JsonSerializer().model_to_dict(model), indent=indent, ensure_ascii=False)
+
+    chunks = list(ds.iter_json(model, indent=indent))
+    assert len(chunks) > 1
+    assert "".join(chunks) == expected
+
+    buffer = io.StringIO()
+    ds.dump(model, buffer, indent=indent)
+    assert buffer.getvalue() == expected
+
+
+def test_dict_and_streaming_paths_agree_on_enums(model):
+    class Grade(Enum):
+        HIGH = "P-HIGH"
+
+    pump = model.conceptualModel.taggedPlantItems[0]
+    object.__setattr__(pump, "tagName", Grade.HIGH)
+
+    data = ds.model_to_dict(model)
+    assert "P-HIGH" in json.dumps(data)
+    assert "".join(ds.iter_json(model, indent=4)) == json.dumps(data, indent=4, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("fmt", ds.SERIALIZATION_FORMATS)
+def test_round_trip(model, fmt):
+    if fmt == "orjson" and not ds.orjson_available():
+        pytest.skip("orjson not installed")
+    if fmt == "msgpack" and not ds.msgpack_available():
+        pytest.skip("msgpack not installed")
+
+    restored = ds.loads(ds.dumps(model, fmt), fmt)
+    assert ds.model_to_dict(restored) == ds.model_to_dict(model)
+    segment = restored.conceptualModel.pipingNetworkSystems[0].segments[0]
+    assert segment.targetItem is restored.conceptualModel.taggedPlantItems[1].nozzles[0]
+
+
+@pytest.mark.parametrize("fmt", ["json", "orjson"])
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_round_trip_keeps_non_finite_floats(model, fmt, value):
+    if fmt == "orjson" and not ds.orjson_available():
+        pytest.skip("orjson not installed")
+    tank = model.conceptualModel.taggedPlantItems[1]
+    tank.cylinderLength = Length(value=value, unit=LengthUnit.Metre)
+
+    restored = ds.loads(ds.dumps(model, fmt), fmt)
+    restored_value = restored.conceptualModel.taggedPlantItems[1].cylinderLength.value
+    assert restored_value == value or (value != value and restored_value != restored_value)
+
+
+def test_loads_reads_json_serializer_files(model, tmp_path):
+    JsonSerializer().save(model, tmp_path, "plant")
+    restored = ds.loads((tmp_path / "plant.json").read_bytes())
+    assert restored.conceptualModel.taggedPlantItems[0].tagName == "P-101"
+
+
+def test_unknown_format(model):
+    with pytest.raises(ValueError, match="Unknown serialization format"):
+        ds.dumps(model, "cbor")
+    if not ds.msgpack_available():
+        with pytest.raises(ImportError, match="msgpack"):
+            ds.dumps(model, "msgpack")
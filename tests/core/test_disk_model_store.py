@@ -0,0 +1,129 @@
+"""Tests for DiskModelStore working-set behaviour and store configuration.
+
+CRUD, hook and snapshot semantics are covered for both backends by
+test_model_store.py.
+"""
+
+import pytest
+
+from src.core.disk_model_store import DiskModelStore
+from src.core.model_store import (
+    InMemoryModelStore,
+    LazyModel,
+    ModelType,
+    create_model_store,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DiskModelStore(ModelType.DEXPI, path=str(tmp_path / "dexpi.sqlite"), max_resident=2)
+    yield store
+    store.close()
+
+
+def test_working_set_is_bounded(store):
+    for i in range(5):
+        store.create(f"m{i}", {"index": i})
+
+    assert store.resident_ids() == ["m3", "m4"]
+    assert not store.is_loaded("m0")
+
+    assert store.get("m0") == {"index": 0}
+    assert store.resident_ids() == ["m4", "m0"]
+    assert store.stats()["loads"] == 1
+    assert store.list_ids() == ["m0", "m1", "m2", "m3", "m4"]
+
+
+def test_in_place_changes_survive_eviction(store):
+    store.create("a", {"equipment": []})
+    store.get("a")["equipment"].append("P-101")
+
+    store.create("b", {})
+    store.create("c", {})
+    assert "a" not in store.resident_ids()
+    assert store.get("a") == {"equipment": ["P-101"]}
+
+
+def test_models_are_encoded_on_eviction_not_on_every_store(store, monkeypatch):
+    import src.core.disk_model_store as disk_model_store
+
+    encoded = []
+    original = disk_model_store._encode
+    monkeypatch.setattr(disk_model_store, "_encode", lambda model: encoded.append(model) or original(model))
+
+    store.create("a", {"value": 1})
+    for value in range(2, 6):
+        store.update("a", {"value": value})
+    assert encoded == []
+
+    store.create("b", {})
+    store.create("c", {})
+    assert encoded == [{"value": 5}]
+    assert store.get("a") == {"value": 5}
+
+
+def test_snapshots_are_not_resident(store):
+    store.create("a", {"value": 1})
+    snapshot = store.create_snapshot("a", "before")
+    store.update("a", {"value": 2})
+
+    assert [s.label for s in store.list_snapshots("a")] == ["before"]
+    store.restore_snapshot(snapshot)
+    assert store.get("a") == {"value": 1}
+
+    store.delete("a")
+    assert store.list_snapshots("a") == []
+
+
+def test_reopen_restores_models_and_metadata(tmp_path):
+    path = str(tmp_path / "dexpi.sqlite")
+    store = DiskModelStore(ModelType.DEXPI, path=path)
+    store.create("a", {"value": 1}, tags={"project": "test"})
+    store.get("a")["value"] = 2
+    store.close()
+
+    reopened = DiskModelStore(ModelType.DEXPI, path=path)
+    assert reopened.get("a") == {"value": 2}
+    assert reopened.get_metadata("a").tags == {"project": "test"}
+    reopened.close()
+
+
+def test_lazy_model_written_when_resolved(store):
+    store.create("a", LazyModel(lambda: {"value": 1}))
+    assert not store.is_loaded("a")
+
+    assert store["a"] == {"value": 1}
+    assert store.is_loaded("a")
+    store.create("b", {})
+    store.create("c", {})
+    assert store.get("a") == {"value": 1}
+
+
+def test_temporary_database_removed_on_close():
+    store = DiskModelStore(ModelType.SFILES)
+    store.create("a", {})
+    path = store.path
+    assert path.exists()
+
+    store.close()
+    assert not path.exists()
+
+
+def test_create_model_store_from_environment(tmp_path, monkeypatch):
+    monkeypatch.delenv("MODEL_STORE_BACKEND", raising=False)
+    assert type(create_model_store(ModelType.DEXPI)) is InMemoryModelStore
+
+    monkeypatch.setenv("MODEL_STORE_BACKEND", "disk")
+    monkeypatch.setenv("MODEL_STORE_PATH", str(tmp_path))
+    monkeypatch.setenv("MODEL_STORE_MAX_RESIDENT", "4")
+    store = create_model_store(ModelType.SFILES)
+    assert isinstance(store, DiskModelStore)
+    assert store.path == tmp_path / "sfiles.sqlite"
+    assert store.stats()["max_resident"] == 4
+    store.close()
+
+    with pytest.raises(ValueError, match="Unknown model store backend"):
+        create_model_store(ModelType.DEXPI, backend="lmdb")
+    with pytest.raises(ValueError, match="max_resident"):
+        DiskModelStore(ModelType.DEXPI, max_resident=0)
@@ -0,0 +1,147 @@
+"""
+Tests for graph metric planning (src/core/analytics/graph_metrics.py)
+
+Tests cover:
+1. Planner output matches direct NetworkX computation
+2. Shared structures are computed once per request
+3. Array backend (NumPy/SciPy) agrees with the NetworkX backend
+4. Process-pool execution agrees with serial execution
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import networkx as nx
+import pytest
+
+from src.core.analytics.graph_metrics import (
+    GRAPH_METRICS,
+    TOPOLOGY_ANALYSES,
+    GraphMetricContext,
+    MetricPlanner,
+    get_metric_executor,
+    shutdown_metric_executor,
+)
+
+
+@pytest.fixture
+def process_graph():
+    """Small process graph with one recycle loop."""
+    graph = nx.DiGraph()
+    graph.add_edges_from([
+        ("feed", "pump"), ("pump", "hex"), ("hex", "reactor"),
+        ("reactor", "separator"), ("separator", "product"),
+        ("separator", "recycle"), ("recycle", "pump"),
+    ])
+    return graph
+
+
+@pytest.fixture
+def random_graph():
+    """Larger random directed graph with parallel edges."""
+    graph = nx.MultiDiGraph(nx.gnp_random_graph(150, 0.03, seed=7, directed=True))
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 1)
+    return graph
+
+
+class TestMetricPlanner:
+    """Planner results and planning behavior."""
+
+    def test_basic_metrics_match_networkx(self, process_graph):
+        results = MetricPlanner(GRAPH_METRICS).run(process_graph, ["basic"])
+
+        assert list(results) == ["basic"]
+        assert results["basic"] == {
+            "nodes": 7,
+            "edges": 7,
+            "density": nx.density(process_graph),
+            "is_connected": True,
+            "is_dag": False,
+            "number_of_components": 1,
+            "diameter": nx.diameter(process_graph.to_undirected()),
+        }
+
+    def test_all_expands_in_canonical_order(self, process_graph):
+        results = MetricPlanner(TOPOLOGY_ANALYSES).run(process_graph, ["all"])
+        assert list(results) == ["paths", "cycles", "bottlenecks", "clustering", "centrality"]
+        assert results["cycles"]["cycle_count"] == 1
+        assert results["paths"] == {"is_dag": False, "has_cycles": True}
+
+    def test_unknown_metrics_are_ignored(self, process_graph):
+        assert MetricPlanner(GRAPH_METRICS).run(process_graph, ["bogus"]) == {}
+
+    def test_dag_paths(self):
+        graph = nx.DiGraph([("a", "b"), ("b", "c")])
+        results = MetricPlanner(TOPOLOGY_ANALYSES).run(graph, ["paths", "cycles"])
+        assert results["paths"]["longest_path_length"] == 2
+        assert results["cycles"]["cycle_count"] == 0
+
+    def test_shared_structures(self):
+        plan = MetricPlanner(GRAPH_METRICS).plan(["all"])
+        shared = MetricPlanner.shared_structures(plan)
+        assert "undirected" in shared
+        assert "betweenness" not in shared
+
+    def test_undirected_view_built_once(self, process_graph, monkeypatch):
+        calls = []
+        original = nx.DiGraph.to_undirected
+
+        def counting_to_undirected(self, *args, **kwargs):
+            calls.append(1)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(nx.DiGraph, "to_undirected", counting_to_undirected)
+        MetricPlanner(GRAPH_METRICS).run(process_graph, ["all"], parallel=False)
+        assert len(calls) == 1
+
+
+class TestArrayBackend:
+    """NumPy/SciPy backend agrees with NetworkX."""
+
+    def test_degrees_match(self, random_graph):
+        pytest.importorskip("numpy")
+        dense = GraphMetricContext(random_graph, use_sparse=False)
+        sparse = GraphMetricContext(random_graph, use_sparse=True)
+
+        assert sparse.degree == dense.degree
+        assert sparse.in_degree == dense.in_degree
+        assert sparse.out_degree == dense.out_degree
+
+    def test_components_match(self, random_graph):
+        pytest.importorskip("scipy")
+        dense = GraphMetricContext(random_graph, use_sparse=False)
+        sparse = GraphMetricContext(random_graph, use_sparse=True)
+
+        assert sparse.weak_component_count == dense.weak_component_count
+        assert sparse.scc_count == dense.scc_count
+        assert sparse.is_dag == dense.is_dag
+
+    def test_planner_results_match(self, random_graph):
+        pytest.importorskip("numpy")
+        planner = MetricPlanner(TOPOLOGY_ANALYSES)
+        requested = ["paths", "centrality"]
+        assert (planner.run(random_graph, requested, use_sparse=True)
+                == planner.run(random_graph, requested, use_sparse=False))
+
+
+class TestParallelExecution:
+    """Concurrent execution returns the same results as serial execution."""
+
+    def test_executor_matches_serial(self):
+        graph = nx.gnp_random_graph(60, 0.08, seed=3, directed=True)
+        planner = MetricPlanner(GRAPH_METRICS)
+        serial = planner.run(graph, ["all"], parallel=False)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = planner.run(graph, ["all"], parallel=True, executor=executor)
+        assert parallel == serial
+        assert list(parallel) == list(serial)
+
+    def test_process_pool_matches_serial(self, process_graph):
+        planner = MetricPlanner(TOPOLOGY_ANALYSES)
+        try:
+            serial = planner.run(process_graph, ["all"], parallel=False)
+            parallel = planner.run(process_graph, ["all"], parallel=True)
+            assert get_metric_executor() is get_metric_executor()
+        finally:
+            shutdown_metric_executor()
+        assert parallel == serial
@@ -10,6 +10,8 @@ Tests cover:
 6. CachingHook for derived data cache invalidation
 7. Thread safety
 8. Backward compatibility methods (__contains__, __len__, etc.)
+
+Store fixtures run every test against InMemoryModelStore and DiskModelStore.
 """
 
 import pytest
@@ -29,22 +31,35 @@ from src.core.model_store import (
     create_dexpi_store,
     create_sfiles_store,
 )
+from src.core.disk_model_store import DiskModelStore
 
 
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
-@pytest.fixture
-def dexpi_store():
-    """Create a fresh DEXPI store for testing."""
-    return InMemoryModelStore(ModelType.DEXPI)
+def _make_store(backend, model_type, tmp_path):
+    if backend == "memory":
+        return InMemoryModelStore(model_type)
+    return DiskModelStore(model_type, path=str(tmp_path / f"{model_type.value}.sqlite"))
 
 
-@pytest.fixture
-def sfiles_store():
-    """Create a fresh SFILES store for testing."""
-    return InMemoryModelStore(ModelType.SFILES)
+@pytest.fixture(params=["memory", "disk"])
+def dexpi_store(request, tmp_path):
+    """Create a fresh DEXPI store for testing (each backend)."""
+    store = _make_store(request.param, ModelType.DEXPI, tmp_path)
+    yield store
+    if request.param == "disk":
+        store.close()
+
+
+@pytest.fixture(params=["memory", "disk"])
+def sfiles_store(request, tmp_path):
+    """Create a fresh SFILES store for testing (each backend)."""
+    store = _make_store(request.param, ModelType.SFILES, tmp_path)
+    yield store
+    if request.param == "disk":
+        store.close()
 
 
 @pytest.fixture
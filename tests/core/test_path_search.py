@@ -0,0 +1,243 @@
+"""
+Tests for bounded path search (src/core/analytics/path_search.py)
+
+Tests cover:
+1. SimplePathIterator matches nx.all_simple_paths
+2. Deadline pauses and resumes without losing paths
+3. k-shortest paths ordering
+4. PathCursorStore eviction
+5. graph_find_paths paging through cursors
+"""
+
+import time
+from types import SimpleNamespace
+
+import networkx as nx
+import pytest
+
+from src.core.analytics.path_search import (
+    KShortestPathIterator,
+    PathCursorStore,
+    SimplePathIterator,
+    collect_paths,
+)
+from src.tools.graph_tools import GraphTools
+
+
+def _drain(iterator):
+    paths = []
+    while True:
+        path = iterator.next_path()
+        if path is None:
+            assert iterator.exhausted
+            return paths
+        paths.append(path)
+
+
+@pytest.fixture
+def ladder_graph():
+    """Directed ladder with recycle edges: many simple paths 0 -> 11."""
+    graph = nx.DiGraph()
+    for i in range(10):
+        graph.add_edge(i, i + 1)
+        graph.add_edge(i, i + 2)
+        graph.add_edge(i + 1, i)
+    graph.add_edge(10, 11)
+    return graph
+
+
+class TestSimplePathIterator:
+    """DFS enumeration semantics."""
+
+    def test_matches_networkx(self, ladder_graph):
+        expected = sorted(nx.all_simple_paths(ladder_graph, 0, 11))
+        assert sorted(_drain(SimplePathIterator(ladder_graph, 0, 11))) == expected
+
+    def test_cutoff_matches_networkx(self, ladder_graph):
+        expected = sorted(nx.all_simple_paths(ladder_graph, 0, 11, cutoff=8))
+        actual = _drain(SimplePathIterator(ladder_graph, 0, 11, cutoff=8))
+        assert sorted(actual) == expected
+        assert all(len(p) - 1 <= 8 for p in actual)
+
+    def test_multigraph_has_no_duplicate_paths(self):
+        graph = nx.MultiDiGraph([("a", "b"), ("a", "b"), ("b", "c")])
+        assert _drain(SimplePathIterator(graph, "a", "c")) == [["a", "b", "c"]]
+
+    def test_source_equals_target(self, ladder_graph):
+        assert _drain(SimplePathIterator(ladder_graph, 3, 3)) == []
+
+    def test_expired_deadline_pauses_and_resumes(self, ladder_graph):
+        expected = sorted(nx.all_simple_paths(ladder_graph, 0, 11))
+        iterator = SimplePathIterator(ladder_graph, 0, 11)
+
+        collected = []
+        pauses = 0
+        while not iterator.exhausted:
+            path = iterator.next_path(deadline=time.monotonic() - 1)
+            if path is None:
+                pauses += 1
+            else:
+                collected.append(path)
+
+        assert pauses > 0
+        assert sorted(collected) == expected
+
+
+class TestCollectPaths:
+    """Page collection stops at max_paths or exhaustion."""
+
+    def test_stops_at_max_paths(self, ladder_graph):
+        iterator = SimplePathIterator(ladder_graph, 0, 11)
+        first, reason = collect_paths(iterator, 5, None)
+        assert len(first) == 5
+        assert reason == "max_paths"
+
+        rest, reason = collect_paths(iterator, 10_000, None)
+        assert reason == "exhausted"
+        assert sorted(first + rest) == sorted(nx.all_simple_paths(ladder_graph, 0, 11))
+
+    def test_k_shortest_in_length_order(self, ladder_graph):
+        paths, _ = collect_paths(KShortestPathIterator(ladder_graph, 0, 11), 10, None)
+        lengths = [len(p) for p in paths]
+        assert lengths == sorted(lengths)
+        assert paths[0] == nx.shortest_path(ladder_graph, 0, 11)
+
+    def test_k_shortest_no_path(self):
+        graph = nx.DiGraph([("a", "b"), ("c", "d")])
+        paths, reason = collect_paths(KShortestPathIterator(graph, "a", "d"), 10, None)
+        assert paths == []
+        assert reason == "exhausted"
+
+
+class TestPathCursorStore:
+    """Cursor bookkeeping."""
+
+    def test_lru_eviction(self):
+        store = PathCursorStore(max_cursors=2)
+        graph = nx.DiGraph([("a", "b")])
+        cursors = [
+            store.create(model_id="m", source="a", target="b", path_type="all",
+                         max_length=None, graph=graph, iterator=None)
+            for _ in range(3)
+        ]
+        assert len(store) == 2
+        assert store.get(cursors[0].cursor_id) is None
+        assert store.get(cursors[2].cursor_id) is cursors[2]
+
+    def test_expiry(self):
+        store = PathCursorStore(ttl_seconds=0)
+        cursor = store.create(model_id="m", source="a", target="b", path_type="all",
+                              max_length=None, graph=nx.DiGraph(), iterator=None)
+        time.sleep(0.01)
+        assert store.get(cursor.cursor_id) is None
+
+
+class TestGraphFindPaths:
+    """graph_find_paths paging through the tool interface."""
+
+    @pytest.fixture
+    def graph_tools(self, ladder_graph):
+        flowsheets = {"fs": SimpleNamespace(state=ladder_graph)}
+        return GraphTools({}, flowsheets)
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_paths(self, graph_tools, ladder_graph):
+        args = {"model_id": "fs", "source": 0, "target": 11, "path_type": "all",
+                "max_paths": 7}
+        result = await graph_tools.handle_tool("graph_find_paths", args)
+        assert result["ok"]
+        data = result["data"]
+        assert data["path_count"] == 7
+        assert data["has_more"]
+
+        collected = list(data["paths"])
+        while data["has_more"]:
+            result = await graph_tools.handle_tool(
+                "graph_find_paths", {**args, "cursor": data["cursor"]}
+            )
+            data = result["data"]
+            assert data["offset"] == len(collected)
+            collected.extend(data["paths"])
+
+        assert data["cursor"] is None
+        assert sorted(collected) == sorted(nx.all_simple_paths(ladder_graph, 0, 11))
+
+    @pytest.mark.asyncio
+    async def test_cursor_mismatch(self, graph_tools):
+        args = {"model_id": "fs", "source": 0, "target": 11, "path_type": "all",
+                "max_paths": 1}
+        data = (await graph_tools.handle_tool("graph_find_paths", args))["data"]
+        result = await graph_tools.handle_tool(
+            "graph_find_paths", {**args, "target": 10, "cursor": data["cursor"]}
+        )
+        assert result["error"]["code"] == "CURSOR_MISMATCH"
+
+    @pytest.mark.asyncio
+    async def test_stale_cursor(self, graph_tools, ladder_graph):
+        args = {"model_id": "fs", "source": 0, "target": 11, "path_type": "all",
+                "max_paths": 1}
+        data = (await graph_tools.handle_tool("graph_find_paths", args))["data"]
+        ladder_graph.add_edge(5, 11)
+        result = await graph_tools.handle_tool(
+            "graph_find_paths", {**args, "cursor": data["cursor"]}
+        )
+        assert result["error"]["code"] == "CURSOR_STALE"
+
+    @pytest.mark.asyncio
+    async def test_stale_cursor_remove_and_add(self, graph_tools, ladder_graph):
+        """Removing and adding an edge keeps the counts but invalidates the cursor."""
+        args = {"model_id": "fs", "source": 0, "target": 11, "path_type": "all",
+                "max_paths": 1}
+        data = (await graph_tools.handle_tool("graph_find_paths", args))["data"]
+        u, v = next(iter(ladder_graph.edges(0)))
+        ladder_graph.remove_edge(u, v)
+        ladder_graph.add_edge(0, 11)
+        result = await graph_tools.handle_tool(
+            "graph_find_paths", {**args, "cursor": data["cursor"]}
+        )
+        assert result["error"]["code"] == "CURSOR_STALE"
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_graph(self, graph_tools, ladder_graph):
+        """A rebuilt graph (as for DEXPI models) is checked, not the cursor's own copy."""
+        args = {"model_id": "fs", "source": 0, "target": 11, "path_type": "all",
+                "max_paths": 1}
+        flowsheet = graph_tools.flowsheets["fs"]
+        data = (await graph_tools.handle_tool("graph_find_paths", args))["data"]
+
+        flowsheet.state = ladder_graph.copy()
+        result = await graph_tools.handle_tool("graph_find_paths", {**args, "cursor": data["cursor"]})
+        assert result["ok"] and result["data"]["offset"] == 1
+
+        flowsheet.state = ladder_graph.copy()
+        flowsheet.state.remove_edge(10, 11)
+        result = await graph_tools.handle_tool(
+            "graph_find_paths", {**args, "cursor": result["data"]["cursor"]}
+        )
+        assert result["error"]["code"] == "CURSOR_STALE"
+
+    @pytest.mark.asyncio
+    async def test_mutation_during_resume(self, graph_tools):
+        args = {"model_id": "fs", "source": 0, "target": 11, "path_type": "all",
+                "max_paths": 1}
+        data = (await graph_tools.handle_tool("graph_find_paths", args))["data"]
+
+        def changed(deadline=None):
+            raise RuntimeError("dictionary changed size during iteration")
+
+        graph_tools._path_cursors.get(data["cursor"]).iterator.next_path = changed
+        result = await graph_tools.handle_tool(
+            "graph_find_paths", {**args, "cursor": data["cursor"]}
+        )
+        assert result["error"]["code"] == "CURSOR_STALE"
+        assert graph_tools._path_cursors.get(data["cursor"]) is None
+
+    @pytest.mark.asyncio
+    async def test_k_shortest_mode(self, graph_tools):
+        result = await graph_tools.handle_tool("graph_find_paths", {
+            "model_id": "fs", "source": 0, "target": 11,
+            "path_type": "k_shortest", "max_paths": 3
+        })
+        data = result["data"]
+        assert data["path_count"] == 3
+        assert data["shortest_length"] == 6
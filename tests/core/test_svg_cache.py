@@ -0,0 +1,132 @@
+"""Tests for the process-wide SVG asset cache (src/core/svg_cache.py)."""
+
+import hashlib
+import json
+
+import pytest
+from pydexpi.dexpi_classes.dexpiModel import ConceptualModel, DexpiModel
+from pydexpi.dexpi_classes.equipment import CentrifugalPump
+from pydexpi.dexpi_classes.piping import GateValve, PipingNetworkSegment, PipingNetworkSystem
+
+from src.core import svg_cache, symbols
+from src.core.svg_cache import SVGAssetCache, get_svg_cache
+from src.core.symbols import SymbolRegistry
+
+SVG = b'''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="-10 -5 20 10">
+    <circle id="port_inlet" class="port" cx="-10" cy="0"/>
+</svg>'''
+
+
+def _catalog(assets, file_hash="abc"):
+    (assets / "merged_catalog.json").write_text(json.dumps({"symbols": {
+        "PP001A": {"name": "Pump", "category": "Pumps", "dexpi_class": "CentrifugalPump",
+                   "source_file": "NOAKADEXPI/PP001A.svg", "provenance": {"file_hash": file_hash}},
+        "PV001A": {"name": "Valve", "category": "Valves", "dexpi_class": "GateValve",
+                   "source_file": "NOAKADEXPI/PV001A.svg"},
+    }}))
+    return SymbolRegistry(assets, use_snapshot=False)
+
+
+@pytest.fixture
+def assets(tmp_path):
+    (tmp_path / "NOAKADEXPI").mkdir()
+    (tmp_path / "NOAKADEXPI" / "PP001A.svg").write_bytes(SVG)
+    return tmp_path
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Symbols whose SVG the cache read from disk."""
+    symbol_ids = []
+    original = SVGAssetCache._load
+
+    def load(self, symbol_id):
+        symbol_ids.append(symbol_id)
+        return original(self, symbol_id)
+
+    monkeypatch.setattr(SVGAssetCache, "_load", load)
+    return symbol_ids
+
+
+def test_asset_holds_bytes_and_normalized_geometry(assets):
+    asset = SVGAssetCache(_catalog(assets)).get("PP001A")
+
+    assert asset.content == SVG
+    assert asset.file_hash == hashlib.sha256(SVG).hexdigest()
+    bbox = asset.geometry.bounding_box
+    assert (bbox.x, bbox.y, bbox.width, bbox.height) == (0, 0, 20, 10)
+    assert (asset.geometry.anchor_point.x, asset.geometry.anchor_point.y) == (10, 5)
+    assert [(p.id, p.x, p.y) for p in asset.geometry.ports] == [("port_inlet", 0, 5)]
+
+
+def test_repeated_lookups_read_once(assets, reads):
+    cache = SVGAssetCache(_catalog(assets))
+    for _ in range(3):
+        assert cache.get("PP001A").symbol_id == "PP001A"
+        assert cache.get("PV001A") is None
+
+    assert reads == ["PP001A", "PV001A"]
+    assert cache.stats()["hits"] == 4
+
+
+def test_catalog_hash_change_invalidates(assets, reads):
+    cache = SVGAssetCache(_catalog(assets))
+    cache.get("PP001A")
+
+    cache._registry = _catalog(assets, file_hash="def")
+    cache.get("PP001A")
+    assert reads == ["PP001A", "PP001A"]
+
+
+def test_global_registry_is_followed(assets, reads, monkeypatch):
+    monkeypatch.setattr(symbols, "_registry", _catalog(assets))
+    cache = SVGAssetCache()
+    cache.get("PP001A")
+
+    monkeypatch.setattr(symbols, "_registry", _catalog(assets, file_hash="def"))
+    cache.get("PP001A")
+    assert reads == ["PP001A", "PP001A"]
+
+
+def test_lru_is_bounded(assets):
+    cache = SVGAssetCache(_catalog(assets), max_entries=1)
+    cache.get("PP001A")
+    cache.get("PV001A")
+
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["evictions"] == 1
+    with pytest.raises(ValueError, match="max_entries"):
+        SVGAssetCache(max_entries=0)
+
+
+def test_warm_model_reads_each_symbol_once(assets, reads):
+    conceptual = ConceptualModel()
+    conceptual.taggedPlantItems.extend(CentrifugalPump(tagName=f"P-{i}") for i in range(50))
+    cache = SVGAssetCache(_catalog(assets))
+
+    assert cache.warm_model(DexpiModel(conceptualModel=conceptual)) == ["PP001A"]
+    assert reads == ["PP001A"]
+    assert cache.warm(["PP001A"]) == 0
+    assert cache.get("PP001A") is not None and reads == ["PP001A"]
+
+
+def test_warm_model_finds_nested_piping_components(assets, reads):
+    segment = PipingNetworkSegment(items=[GateValve(), GateValve()])
+    conceptual = ConceptualModel(
+        taggedPlantItems=[CentrifugalPump(tagName="P-1")],
+        pipingNetworkSystems=[PipingNetworkSystem(segments=[segment])],
+    )
+    cache = SVGAssetCache(_catalog(assets))
+
+    assert cache.warm_model(DexpiModel(conceptualModel=conceptual)) == ["PP001A", "PV001A"]
+    assert reads == ["PP001A", "PV001A"]
+
+
+def test_global_cache_size_from_environment(monkeypatch):
+    monkeypatch.setattr(svg_cache, "_cache", None)
+    monkeypatch.setenv("SVG_CACHE_MAX_ENTRIES", "8")
+
+    cache = get_svg_cache()
+    assert cache.max_entries == 8
+    assert get_svg_cache() is cache
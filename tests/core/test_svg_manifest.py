@@ -0,0 +1,130 @@
+"""Tests for the incremental SVG scan manifest (src/core/svg_manifest.py)."""
+
+import hashlib
+import os
+
+import pytest
+
+from src.core import svg_manifest
+from src.core.svg_manifest import MANIFEST_FILENAME, SVGManifest
+from src.visualization.symbols.merge_symbol_libraries import SymbolLibraryMerger
+
+SVG = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} 50">
+    <circle id="port_inlet" class="port" cx="0" cy="25"/>
+</svg>'''
+
+
+@pytest.fixture
+def assets(tmp_path):
+    for repo, names in (("NOAKADEXPI", ["PP001A", "PV001A"]), ("DISCDEXPI", ["PP001A", "PT001A"])):
+        (tmp_path / repo / "Detail").mkdir(parents=True)
+        for index, name in enumerate(names):
+            (tmp_path / repo / f"{name}.svg").write_text(SVG.format(width=100 + index))
+        (tmp_path / repo / "Detail" / "PP001A_Detail.svg").write_text(SVG.format(width=80))
+    return tmp_path
+
+
+@pytest.fixture
+def scanned(monkeypatch):
+    """Paths passed to svg_parser, i.e. files actually parsed."""
+    paths = []
+    original = svg_manifest.extract_svg_metadata
+
+    def extract(path, include_hash=True):
+        paths.append(path.name)
+        return original(path, include_hash)
+
+    monkeypatch.setattr(svg_manifest, "extract_svg_metadata", extract)
+    return paths
+
+
+def _touch(path, content=None):
+    if content is not None:
+        path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_refresh_extracts_geometry(assets):
+    path = assets / "NOAKADEXPI" / "PP001A.svg"
+    records = SVGManifest(assets).refresh([path], metadata=True)
+
+    record = records["NOAKADEXPI/PP001A.svg"]
+    assert record.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert record.metadata["bounding_box"]["width"] == 100
+    assert [p["id"] for p in record.metadata["ports"]] == ["port_inlet"]
+    assert "file_hash" not in record.metadata
+
+
+def test_only_changed_files_are_reparsed(assets, scanned):
+    paths = sorted(assets.rglob("*.svg"))
+    manifest = SVGManifest(assets)
+    manifest.refresh(paths, metadata=True)
+    manifest.save()
+    assert len(scanned) == 6
+
+    scanned.clear()
+    _touch(assets / "DISCDEXPI" / "PT001A.svg")
+    _touch(assets / "NOAKADEXPI" / "PV001A.svg", SVG.format(width=250))
+
+    manifest = SVGManifest(assets)
+    records = manifest.refresh(paths, metadata=True)
+    assert scanned == ["PV001A.svg"]
+    assert manifest.stats == {"reused": 4, "hashed": 2, "parsed": 1}
+    assert records["NOAKADEXPI/PV001A.svg"].metadata["bounding_box"]["width"] == 250
+    assert records["DISCDEXPI/PT001A.svg"].metadata["bounding_box"]["width"] == 101
+
+    scanned.clear()
+    SVGManifest(assets).refresh(paths, metadata=True, force=True)
+    assert len(scanned) == 6
+
+
+def test_hash_only_records_are_parsed_on_demand(assets, scanned):
+    paths = sorted(assets.rglob("*.svg"))
+    manifest = SVGManifest(assets)
+    manifest.refresh(paths)
+    assert scanned == []
+
+    records = manifest.refresh(paths, metadata=True)
+    assert len(scanned) == 6
+    assert all(record.parsed for record in records.values())
+
+
+def test_process_pool_matches_serial_scan(assets, monkeypatch):
+    paths = sorted(assets.rglob("*.svg"))
+    serial = SVGManifest(assets, path=assets / "serial.json").refresh(paths, metadata=True, workers=1)
+
+    monkeypatch.setattr(svg_manifest, "PARALLEL_THRESHOLD", 1)
+    parallel = SVGManifest(assets, path=assets / "parallel.json").refresh(paths, metadata=True, workers=2)
+    assert parallel == serial
+
+
+def test_save_drops_deleted_files(assets):
+    manifest = SVGManifest(assets)
+    manifest.refresh(sorted(assets.rglob("*.svg")))
+    (assets / "DISCDEXPI" / "PT001A.svg").unlink()
+    manifest.save()
+
+    reloaded = SVGManifest(assets)
+    assert reloaded.get(assets / "DISCDEXPI" / "PT001A.svg") is None
+    assert reloaded.get(assets / "DISCDEXPI" / "PP001A.svg") is not None
+    assert (assets / MANIFEST_FILENAME).exists()
+
+
+def test_incremental_merge_matches_full_merge(assets):
+    def catalog(incremental):
+        merger = SymbolLibraryMerger(assets, incremental=incremental)
+        merger.merge_libraries()
+        result = merger.create_merged_catalog()
+        del result["created_at"]
+        return result, merger.manifest.stats
+
+    full, _ = catalog(incremental=False)
+    _touch(assets / "NOAKADEXPI" / "PV001A.svg")
+    incremental, stats = catalog(incremental=True)
+
+    assert incremental == full
+    assert stats["hashed"] == 1
+    assert full["symbols"]["PP001A"]["provenance"]["source_repo"] == "DISCDEXPI"
+    assert full["symbols"]["PP001A_Detail"]["category"] == "Detail"
@@ -344,6 +344,40 @@ class TestSymbolResolverEdgeCases:
             assert symbol1.symbol_id == symbol2.symbol_id == symbol3.symbol_id
 
 
+class TestSymbolResolverFuzzyCache:
+    """Test memoized fuzzy lookups keyed by (dexpi_class, category)."""
+
+    def test_fuzzy_result_cached(self, monkeypatch):
+        """Test that repeated lookups reuse the first resolution."""
+        resolver = SymbolResolver()
+        first = resolver.get_by_dexpi_class_fuzzy("BallVal", confidence_threshold=0.5)
+
+        calls = []
+        monkeypatch.setattr(resolver.registry, "search_top_k", lambda *a, **kw: calls.append(a) or [])
+        assert resolver.get_by_dexpi_class_fuzzy("BallVal", confidence_threshold=0.5) == first
+        assert calls == []
+
+    def test_threshold_applied_to_cached_result(self):
+        """Test that the threshold is applied per call, not cached."""
+        resolver = SymbolResolver()
+        low = resolver.get_by_dexpi_class_fuzzy("BallVal", confidence_threshold=0.1)
+        assert low is not None
+        assert resolver.get_by_dexpi_class_fuzzy("BallVal", confidence_threshold=low[1] + 0.01) is None
+
+    def test_category_restricts_candidates(self):
+        """Test that category is part of the cache key and filters candidates."""
+        resolver = SymbolResolver()
+        result = resolver.get_by_dexpi_class_fuzzy(
+            "BallVal", confidence_threshold=0.1, category=SymbolCategory.DETAIL
+        )
+        assert result is not None
+        assert result[0].category == SymbolCategory.DETAIL
+        assert ("BallVal", SymbolCategory.DETAIL) in resolver._fuzzy_cache
+
+        resolver.clear_cache()
+        assert resolver._fuzzy_cache == {}
+
+
 class TestSymbolResolverIntegration:
     """Integration tests with SymbolRegistry."""
 
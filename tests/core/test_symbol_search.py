@@ -0,0 +1,57 @@
+"""Tests for indexed SymbolRegistry search and ranked search_top_k."""
+
+import pytest
+
+from src.core.symbols import SymbolCategory, SymbolSource, get_registry
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return get_registry()
+
+
+def _linear_search(registry, query, category=None, source=None):
+    """Reference implementation: scan every symbol."""
+    query_lower = query.lower()
+    results = []
+    for symbol in registry._symbols.values():
+        if category and symbol.category != category:
+            continue
+        if source and symbol.source != source and symbol.original_source != source:
+            continue
+        fields = [symbol.symbol_id, symbol.name, symbol.dexpi_class or ""] + (symbol.tags or [])
+        if any(query_lower in field.lower() for field in fields):
+            results.append(symbol.symbol_id)
+    return results
+
+
+@pytest.mark.parametrize("query", ["", "p", "PV", "pump", "BallValve", "_detail", "no-such-symbol"])
+@pytest.mark.parametrize("category", [None, SymbolCategory.VALVES])
+@pytest.mark.parametrize("source", [None, SymbolSource.DISCDEXPI])
+def test_search_matches_linear_scan(registry, query, category, source):
+    found = [symbol.symbol_id for symbol in registry.search(query, category, source)]
+    assert found == _linear_search(registry, query, category, source)
+
+
+def test_search_top_k_ranked(registry):
+    results = registry.search_top_k("BallValve", k=3)
+
+    assert len(results) == 3
+    assert all(symbol.dexpi_class == "BallValve" and score == 1.0 for symbol, score in results)
+    scores = [score for _, score in registry.search_top_k("Valve", k=20)]
+    assert scores == sorted(scores, reverse=True)
+    assert registry.search_top_k("pump", k=0) == []
+
+
+def test_search_top_k_token_matches(registry):
+    query = "Custom Ball Valve"
+    assert registry.search(query) == []
+    assert registry.search_top_k(query, include_token_matches=False) == []
+
+    best, _ = registry.search_top_k(query, k=1)[0]
+    assert best.dexpi_class == "BallValve"
+
+
+def test_search_top_k_filters(registry):
+    results = registry.search_top_k("Valve", k=5, category=SymbolCategory.DETAIL)
+    assert results and all(symbol.category == SymbolCategory.DETAIL for symbol, _ in results)
@@ -0,0 +1,103 @@
+"""Tests for the compiled symbol catalog snapshot (src/core/symbol_snapshot.py)."""
+
+import enum
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.core import symbol_snapshot, symbols
+from src.core.symbols import CatalogNotFoundError, SymbolRegistry
+
+ASSETS_DIR = Path(__file__).parent.parent.parent / "src" / "visualization" / "symbols" / "assets"
+
+
+@pytest.fixture
+def assets(tmp_path):
+    shutil.copy(ASSETS_DIR / "merged_catalog.json", tmp_path)
+    SymbolRegistry(tmp_path, use_snapshot=False).compile_snapshot()
+    return tmp_path
+
+
+def test_snapshot_restores_registry(assets, monkeypatch):
+    expected = SymbolRegistry(assets, use_snapshot=False)
+
+    # Loading from the snapshot must not touch the JSON catalog loader
+    monkeypatch.setattr(SymbolRegistry, "_load_merged_catalog", lambda self: pytest.fail("parsed JSON"))
+    registry = SymbolRegistry(assets)
+
+    for name in SymbolRegistry._SNAPSHOT_STATE:
+        assert getattr(registry, name) == getattr(expected, name), name
+    assert registry.get_by_dexpi_class("BallValve").symbol_id == expected.get_by_dexpi_class("BallValve").symbol_id
+    assert registry.get_symbol("PV019A").ports == expected.get_symbol("PV019A").ports
+
+
+def test_stale_snapshot_falls_back_to_json(assets):
+    catalog_path = assets / "merged_catalog.json"
+    catalog = json.loads(catalog_path.read_text())
+    symbol_id = next(iter(catalog["symbols"]))
+    catalog["symbols"][symbol_id]["name"] = "Renamed"
+    catalog_path.write_text(json.dumps(catalog))
+
+    assert symbol_snapshot.load_snapshot(catalog_path, assets / symbol_snapshot.SNAPSHOT_FILENAME) is None
+    assert SymbolRegistry(assets).get_symbol(symbol_id).name == "Renamed"
+
+
+@pytest.mark.parametrize("change", ["version", "payload"])
+def test_incompatible_snapshot_ignored(assets, monkeypatch, change):
+    snapshot_path = assets / symbol_snapshot.SNAPSHOT_FILENAME
+    if change == "version":
+        monkeypatch.setattr(symbol_snapshot, "SNAPSHOT_VERSION", symbol_snapshot.SNAPSHOT_VERSION + 1)
+    else:
+        data = bytearray(snapshot_path.read_bytes())
+        data[-1] ^= 0xFF
+        snapshot_path.write_bytes(bytes(data))
+
+    assert symbol_snapshot.load_snapshot(assets / "merged_catalog.json", snapshot_path) is None
+    assert len(SymbolRegistry(assets)._symbols) > 0
+
+
+@pytest.mark.parametrize("header", [b"\x00\x01", b"\xff\xff\x00\x00{", b"\x05\x00\x00\x00{bad}", b"\x02\x00\x00\x00[]"])
+def test_corrupt_header_ignored(assets, header):
+    snapshot_path = assets / symbol_snapshot.SNAPSHOT_FILENAME
+    snapshot_path.write_bytes(symbol_snapshot.MAGIC + header)
+
+    assert symbol_snapshot.load_snapshot(assets / "merged_catalog.json", snapshot_path) is None
+    assert len(SymbolRegistry(assets)._symbols) > 0
+
+
+class Moved:
+    """Stands in for a symbol class that no longer exists when the snapshot is read."""
+
+
+def test_unpicklable_payload_ignored(assets, monkeypatch):
+    catalog_path = assets / "merged_catalog.json"
+    snapshot_path = assets / symbol_snapshot.SNAPSHOT_FILENAME
+    symbol_snapshot.write_snapshot({"_symbols": {"X": Moved()}}, catalog_path, snapshot_path)
+    monkeypatch.delattr(sys.modules[__name__], "Moved")
+
+    assert symbol_snapshot.load_snapshot(catalog_path, snapshot_path) is None
+    assert len(SymbolRegistry(assets)._symbols) > 0
+
+
+def test_schema_fingerprint_covers_enum_members(monkeypatch):
+    before = symbol_snapshot.schema_fingerprint()
+    members = {m.name: m.value for m in symbols.SymbolCategory if m.name != "ORIGO"}
+    monkeypatch.setattr(symbols, "SymbolCategory", enum.Enum("SymbolCategory", members))
+
+    assert symbol_snapshot.schema_fingerprint() != before
+
+
+def test_header(assets):
+    header = symbol_snapshot.read_header(assets / symbol_snapshot.SNAPSHOT_FILENAME)
+    assert header["version"] == symbol_snapshot.SNAPSHOT_VERSION
+    assert header["catalog_sha256"] == symbol_snapshot.file_sha256(assets / "merged_catalog.json")
+    assert header["symbols"] == len(SymbolRegistry(assets)._symbols)
+
+
+def test_missing_catalog_still_fails_loudly(assets):
+    (assets / "merged_catalog.json").unlink()
+    with pytest.raises(CatalogNotFoundError):
+        SymbolRegistry(assets)
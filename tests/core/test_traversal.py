@@ -0,0 +1,157 @@
+"""
+Tests for indexed traversal (src/core/analytics/traversal.py)
+
+Tests cover:
+1. TagIndex resolution and self-revalidation after in-place edits
+2. BFS depth/order semantics and payload projections
+3. search_connected through SearchTools with a shared CachingHook
+"""
+
+from types import SimpleNamespace
+
+import networkx as nx
+import pytest
+
+from src.core.analytics.traversal import TagIndex, project_node_data, traverse_connected
+from src.core.model_store import CachingHook
+from src.tools.search_tools import SearchTools
+
+
+@pytest.fixture
+def line_graph():
+    """feed -> P-101 -> E-101 -> R-101, with a recycle R-101 -> P-101."""
+    graph = nx.DiGraph()
+    graph.add_node("n1", tag="FEED", type="source")
+    graph.add_node("n2", tag="P-101", type="pump")
+    graph.add_node("n3", tagName="E-101", type="heat_exchanger")
+    graph.add_node("n4", tag="R-101", type="reactor")
+    graph.add_edge("n1", "n2", line_number="L-1")
+    graph.add_edge("n2", "n3", line_number="L-2")
+    graph.add_edge("n3", "n4", line_number="L-3")
+    graph.add_edge("n4", "n2", line_number="L-4")
+    return graph
+
+
+class TestTagIndex:
+    """Start node resolution."""
+
+    def test_resolves_id_tag_and_tag_name(self, line_graph):
+        index = TagIndex(line_graph)
+        assert index.resolve("n1") == "n1"
+        assert index.resolve("P-101") == "n2"
+        assert index.resolve("E-101") == "n3"
+        assert index.resolve("X-999") is None
+
+    def test_sees_in_place_edits(self, line_graph):
+        index = TagIndex(line_graph)
+        line_graph.add_node("n5", tag="T-101")
+        line_graph.nodes["n2"]["tag"] = "P-102"
+
+        assert index.resolve("T-101") == "n5"
+        assert index.resolve("P-102") == "n2"
+        assert index.resolve("P-101") is None
+
+
+class TestTraverseConnected:
+    """BFS semantics."""
+
+    def test_downstream_depths(self, line_graph):
+        result = traverse_connected(line_graph, "n1", direction="downstream", max_depth=3)
+        assert [(e["node"], e["depth"]) for e in result["downstream"]] == [
+            ("n2", 1), ("n3", 2), ("n4", 3)
+        ]
+        assert result["upstream"] == []
+
+    def test_max_depth_limits_results(self, line_graph):
+        result = traverse_connected(line_graph, "n1", direction="downstream", max_depth=1)
+        assert [e["node"] for e in result["downstream"]] == ["n2"]
+
+    def test_both_directions_and_edges(self, line_graph):
+        result = traverse_connected(line_graph, "n2", direction="both", max_depth=2)
+        upstream = {e["node"]: e for e in result["upstream"]}
+        assert set(upstream) == {"n1", "n4", "n3"}
+        assert upstream["n4"]["depth"] == 1
+        assert upstream["n1"]["edge"] == {
+            "source": "n1", "target": "n2", "attributes": {"line_number": "L-1"}
+        }
+        assert "data" not in upstream["n1"]
+
+    def test_payload_projection(self, line_graph):
+        result = traverse_connected(line_graph, "n1", direction="downstream",
+                                    node_fields=["type"], include_edges=False)
+        assert result["downstream"][0] == {"node": "n2", "depth": 1, "data": {"type": "pump"}}
+
+    def test_invalid_direction(self, line_graph):
+        with pytest.raises(ValueError, match="sideways"):
+            traverse_connected(line_graph, "n1", direction="sideways")
+
+    def test_project_all_fields(self):
+        data = {"tag": "P-101", "type": "pump"}
+        assert project_node_data(data, ["*"]) == data
+        assert project_node_data(data, ["*"]) is not data
+        assert project_node_data(data, None) is None
+
+    def test_multigraph_edges(self):
+        graph = nx.MultiDiGraph()
+        graph.add_edge("a", "b", line_number="L-1")
+        graph.add_edge("a", "b", line_number="L-2")
+        result = traverse_connected(graph, "a", direction="downstream")
+        assert len(result["downstream"]) == 1
+        assert result["downstream"][0]["edge"]["attributes"] == {"line_number": "L-1"}
+
+
+class TestSearchConnected:
+    """search_connected tool behavior."""
+
+    @pytest.fixture
+    def caching_hook(self):
+        return CachingHook()
+
+    @pytest.fixture
+    def search_tools(self, line_graph, caching_hook):
+        flowsheets = {"fs": SimpleNamespace(state=line_graph)}
+        return SearchTools({}, flowsheets, caching_hook)
+
+    @pytest.mark.asyncio
+    async def test_by_tag(self, search_tools, caching_hook):
+        result = await search_tools.handle_tool("search_connected", {
+            "node_id": "P-101", "model_id": "fs", "direction": "downstream",
+            "include_data": ["tag", "tagName"]
+        })
+        assert result["ok"]
+        data = result["data"]
+        assert data["source_node"] == "n2"
+        assert data["downstream_count"] == 2
+        assert data["connected_components"]["downstream"][0]["data"] == {"tagName": "E-101"}
+        assert caching_hook.get_cached_tag_index("fs") is not None
+
+    @pytest.mark.asyncio
+    async def test_unknown_node(self, search_tools):
+        result = await search_tools.handle_tool("search_connected", {
+            "node_id": "X-1", "model_id": "fs"
+        })
+        assert result["error"]["code"] == "NODE_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_invalid_direction(self, search_tools):
+        result = await search_tools.handle_tool("search_execute", {
+            "query_type": "connected", "node_id": "P-101", "model_id": "fs", "direction": "sideways"
+        })
+        assert result["error"]["code"] == "INVALID_DIRECTION"
+
+    @pytest.mark.asyncio
+    async def test_unknown_model(self, search_tools):
+        result = await search_tools.handle_tool("search_execute", {
+            "query_type": "connected", "node_id": "P-101", "model_id": "missing"
+        })
+        assert result["error"]["code"] == "MODEL_NOT_FOUND"
+
+
+class TestCachingHookTagIndex:
+    """Tag index cache invalidation."""
+
+    def test_invalidated_with_graph(self, line_graph):
+        hook = CachingHook()
+        hook.cache_tag_index("m", TagIndex(line_graph))
+        hook.on_deleted("m", None, None)
+        assert hook.get_cached_tag_index("m") is None
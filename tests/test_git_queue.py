@@ -0,0 +1,112 @@
+"""Tests for the background git commit queue (src/persistence/git_queue.py)."""
+
+import subprocess
+import time
+
+import pytest
+
+from src.persistence.git_queue import GitCommitQueue, dulwich_available
+from src.persistence.project_persistence import ProjectPersistence
+from src.tools.project_tools import ProjectTools
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    ProjectPersistence().init_project(str(tmp_path), "test")
+    return tmp_path
+
+
+def _log(repo):
+    result = subprocess.run(
+        ["git", "log", "--format=%B%x00"], cwd=repo, check=True, capture_output=True, text=True
+    )
+    return [message.strip() for message in result.stdout.split("\0") if message.strip()]
+
+
+def _write(repo, name, content="x"):
+    path = repo / name
+    path.write_text(content)
+    return path
+
+
+def test_saves_in_window_coalesce(repo):
+    queue = GitCommitQueue(window=60)
+    for i in range(3):
+        queue.enqueue(repo, [_write(repo, f"f{i}.txt")], f"Save f{i}")
+
+    status = queue.status()
+    assert status["pending"][str(repo)]["saves"] == 3
+    assert status["commits"] == 0
+
+    status = queue.flush(timeout=30)
+    assert status["flushed"] and status["pending"] == {}
+    assert status["commits"] == 1 and status["saves_committed"] == 3
+
+    log = _log(repo)
+    assert len(log) == 2
+    assert log[0].splitlines() == ["Save 3 changes", "", "- Save f0", "- Save f1", "- Save f2"]
+
+
+def test_window_elapses_without_flush(repo):
+    queue = GitCommitQueue(window=0.05)
+    queue.enqueue(repo, [_write(repo, "a.txt")], "Save a")
+
+    deadline = time.monotonic() + 30
+    while queue.status()["commits"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert _log(repo)[0] == "Save a"
+    queue.close()
+
+
+def test_persistence_saves_are_queued(repo):
+    persistence = ProjectPersistence(commit_queue=GitCommitQueue(window=60))
+    persistence._git_add_commit(repo, [_write(repo, "pid/a.json"), None], "Save a")
+    assert len(_log(repo)) == 1
+
+    persistence.commit_queue.flush(timeout=30)
+    assert _log(repo)[0] == "Save a"
+
+
+def test_failure_recorded(tmp_path):
+    queue = GitCommitQueue(window=0)
+    queue.enqueue(tmp_path, [_write(tmp_path, "a.txt")], "Save a")
+
+    status = queue.flush(timeout=30)
+    assert status["failures"] == 1
+    assert status["last_error"]["project_path"] == str(tmp_path)
+
+
+def test_closed_queue_rejects_saves(repo):
+    queue = GitCommitQueue(window=60)
+    queue.enqueue(repo, [_write(repo, "a.txt")], "Save a")
+    queue.close(timeout=30)
+
+    assert _log(repo)[0] == "Save a"
+    with pytest.raises(RuntimeError, match="closed"):
+        queue.enqueue(repo, [_write(repo, "b.txt")], "Save b")
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError, match="Unknown git backend"):
+        GitCommitQueue(backend="libgit")
+    with pytest.raises(ValueError, match=">= 0"):
+        GitCommitQueue(window=-1)
+    if not dulwich_available():
+        with pytest.raises(ImportError, match="dulwich"):
+            GitCommitQueue(backend="dulwich")
+
+
+@pytest.mark.asyncio
+async def test_project_tools_flush_and_status(repo):
+    tools = ProjectTools({}, {}, commit_queue=GitCommitQueue(window=60))
+    tools.persistence._git_add_commit(repo, [_write(repo, "a.txt")], "Save a")
+
+    status = await tools.handle_tool("project_commit_status", {})
+    assert status["ok"] and status["data"]["pending"][str(repo)]["saves"] == 1
+
+    flushed = await tools.handle_tool("project_commit_flush", {"timeout": 30})
+    assert flushed["ok"] and flushed["data"]["commits"] == 1
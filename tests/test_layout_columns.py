@@ -0,0 +1,131 @@
+"""Tests for the columnar layout representation (src/models/layout_columns.py)."""
+
+import json
+
+import pytest
+
+from src.models.layout_columns import ColumnarLayout
+from src.models.layout_metadata import (
+    EdgeRoute,
+    EdgeSection,
+    LabelPosition,
+    LayoutMetadata,
+    ModelReference,
+    NodePosition,
+    PortLayout,
+)
+
+
+def _normalize(data):
+    """JSON round-trip so tuples and lists compare equal."""
+    return json.loads(json.dumps(data, sort_keys=True))
+
+
+@pytest.fixture
+def layout():
+    return LayoutMetadata(
+        layout_id="layout_test",
+        model_ref=ModelReference(type="dexpi", model_id="plant"),
+        algorithm="elk",
+        layout_options={"elk.direction": "RIGHT"},
+        positions={
+            "P-101": NodePosition(x=10.0, y=20.0),
+            "T-101": NodePosition(x=110.5, y=-30.0),
+            "V-101": NodePosition(x=60.0, y=80.0),
+        },
+        port_layouts={
+            "P-101_out": PortLayout(id="P-101_out", x=20, y=5, side="EAST", index=1),
+            "T-101_in": PortLayout(id="T-101_in", x=0, y=5, side="WEST", anchor=(0, 5)),
+        },
+        labels={"P-101_label_0": LabelPosition(x=0, y=-10, width=30, height=8, text="P-101")},
+        edges={
+            "e1": EdgeRoute(
+                sections=[
+                    EdgeSection(startPoint=(30, 25), endPoint=(70, 25), bendPoints=[(50, 25)]),
+                    EdgeSection(id="s2", startPoint=(70, 25), endPoint=(110.5, -25),
+                                bendPoints=[(70, -25)]),
+                ],
+                source_port="P-101_out",
+                target_port="T-101_in",
+                sourcePoint=(30, 25),
+                targetPoint=(110.5, -25),
+                labels=[LabelPosition(x=50, y=20, text="L-1", kind="edge")],
+            ),
+            "e2": EdgeRoute(),
+        },
+        rotation={"T-101": 90.0},
+    )
+
+
+class TestConversion:
+    """Round-trips preserve content and etag."""
+
+    def test_to_dict_matches_layout(self, layout):
+        columnar = layout.to_columnar()
+        assert _normalize(columnar.to_dict()) == _normalize(layout.to_dict())
+        assert _normalize(columnar.to_dict(exclude_none=False)) == _normalize(
+            layout.to_dict(exclude_none=False)
+        )
+
+    def test_from_dict_round_trip(self, layout):
+        data = _normalize(layout.to_dict())
+        assert _normalize(ColumnarLayout.from_dict(data).to_dict()) == data
+
+    def test_metadata_view(self, layout):
+        view = layout.to_columnar().metadata
+        assert view.etag == layout.etag
+        assert view.compute_etag() == layout.compute_etag()
+        assert view.edges["e1"].get_all_points() == layout.edges["e1"].get_all_points()
+        assert view.positions["T-101"].to_list() == [110.5, -30.0]
+
+    def test_copy_is_independent(self, layout):
+        columnar = layout.to_columnar()
+        clone = columnar.copy()
+        clone.node_xy[0, 0] = -1.0
+        clone.header["layout_options"]["elk.direction"] = "DOWN"
+        assert columnar.node_position("P-101") == (10.0, 20.0)
+        assert columnar.header["layout_options"]["elk.direction"] == "RIGHT"
+
+    def test_from_dict_rejects_bad_port_side(self, layout):
+        data = _normalize(layout.to_dict())
+        data["port_layouts"]["T-101_in"]["side"] = "UP"
+        with pytest.raises(ValueError, match="invalid side"):
+            ColumnarLayout.from_dict(data)
+
+
+class TestGeometry:
+    """Vectorized geometry operations."""
+
+    def test_bounding_box(self, layout):
+        bbox = layout.to_columnar().bounding_box()
+        assert (bbox.min_x, bbox.max_x, bbox.min_y, bbox.max_y) == (10.0, 110.5, -30.0, 80.0)
+
+    def test_translate(self, layout):
+        moved = layout.to_columnar().translate(5, -5)
+        assert moved.node_position("P-101") == (15.0, 15.0)
+        assert moved.edge_points("e1")[0] == (35.0, 20.0)
+        assert moved.metadata.edges["e1"].labels[0].x == 55.0
+        # Node-relative geometry does not move
+        assert moved.metadata.port_layouts["P-101_out"].x == 20.0
+        # Derived fields are recomputed for the new geometry
+        assert moved.metadata.bounding_box.min_x == 15.0
+        assert moved.metadata.etag != layout.etag
+
+    def test_scale_about_origin(self, layout):
+        scaled = layout.to_columnar().scale(2.0, origin=(10.0, 20.0))
+        assert scaled.node_position("P-101") == (10.0, 20.0)
+        assert scaled.node_position("V-101") == (110.0, 140.0)
+        assert scaled.metadata.edges["e1"].sourcePoint == (50.0, 30.0)
+        assert scaled.metadata.edges["e2"].sourcePoint is None
+
+    def test_hit_test(self, layout):
+        columnar = layout.to_columnar()
+        assert columnar.hit_test(12, 22, radius=5) == ["P-101"]
+        assert columnar.hit_test(40, 60, radius=55) == ["V-101", "P-101"]
+        assert columnar.nodes_in_rect(0, 0, 100, 100) == ["P-101", "V-101"]
+
+    def test_edges_in_rect(self, layout):
+        columnar = layout.to_columnar()
+        # Only the bend point (70, -25) of section s2 lies in this rectangle
+        assert columnar.edges_in_rect(65, -30, 75, -20) == ["e1"]
+        assert columnar.edges_in_rect(500, 500, 600, 600) == []
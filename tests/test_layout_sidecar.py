@@ -0,0 +1,135 @@
+"""Tests for the binary layout sidecar (src/core/layout_sidecar.py)."""
+
+import json
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core import layout_store as layout_store_module
+from src.core.layout_sidecar import SidecarFormatError, read_sidecar
+from src.core.layout_store import create_layout_store
+from src.models.layout_metadata import (
+    EdgeRoute,
+    EdgeSection,
+    LabelPosition,
+    LayoutMetadata,
+    ModelReference,
+    NodePosition,
+    PortLayout,
+)
+
+
+@pytest.fixture
+def store():
+    store = create_layout_store()
+    store.save(
+        LayoutMetadata(
+            model_ref=ModelReference(type="dexpi", model_id="plant"),
+            algorithm="elk",
+            positions={
+                "P-101": NodePosition(x=10.0, y=20.0),
+                "T-101": NodePosition(x=110.5, y=-30.0),
+            },
+            port_layouts={
+                "P-101_out": PortLayout(id="P-101_out", x=20, y=5, side="EAST", anchor=(20, 5)),
+            },
+            labels={"P-101_label_0": LabelPosition(x=0, y=-10, text="P-101")},
+            edges={
+                "e1": EdgeRoute(
+                    sections=[EdgeSection(startPoint=(30, 25), endPoint=(110.5, -25),
+                                          bendPoints=[(70, 25), (70, -25)])],
+                    source_port="P-101_out",
+                    labels=[LabelPosition(x=50, y=20, text="L-1", kind="edge")],
+                ),
+            },
+            rotation={"T-101": 90.0},
+        ),
+        layout_id="plant_layout",
+    )
+    return store
+
+
+class TestSidecar:
+    """Sidecar writing, freshness checks and memory-mapped reads."""
+
+    def test_round_trip_matches_json(self, store, tmp_path):
+        file_path = store.save_to_file("plant_layout", str(tmp_path), "plant", binary=True)
+        assert file_path.with_suffix(".bin").exists()
+
+        from_bin = store.load_from_file(str(tmp_path), "plant", layout_id="from_bin")
+        file_path.with_suffix(".bin").unlink()
+        from_json = store.load_from_file(str(tmp_path), "plant", layout_id="from_json")
+
+        bin_data = store.get(from_bin).to_dict()
+        json_data = store.get(from_json).to_dict()
+        assert bin_data.pop("layout_id") == "from_bin"
+        assert json_data.pop("layout_id") == "from_json"
+        assert bin_data == json_data
+        assert store.get_etag(from_bin) == store.get_etag("plant_layout")
+
+    def test_read_columnar_is_memory_mapped(self, store, tmp_path):
+        store.save_to_file("plant_layout", str(tmp_path), "plant", binary=True)
+        columns = store.read_columnar(str(tmp_path), "plant")
+
+        assert not columns.node_xy.flags.writeable
+        assert columns.node_position("T-101") == (110.5, -30.0)
+        assert columns.metadata.etag == store.get_etag("plant_layout")
+
+    def test_stale_sidecar_ignored(self, store, tmp_path):
+        file_path = store.save_to_file("plant_layout", str(tmp_path), "plant", binary=True)
+        data = json.loads(file_path.read_text())
+        data["positions"]["P-101"] = [500.0, 600.0]
+        file_path.write_text(json.dumps(data))
+
+        loaded = store.load_from_file(str(tmp_path), "plant", layout_id="edited")
+        assert store.get(loaded).positions["P-101"].to_list() == [500.0, 600.0]
+
+    def test_save_without_binary_removes_sidecar(self, store, tmp_path):
+        file_path = store.save_to_file("plant_layout", str(tmp_path), "plant", binary=True)
+        store.save_to_file("plant_layout", str(tmp_path), "plant", binary=False)
+        assert file_path.exists()
+        assert not file_path.with_suffix(".bin").exists()
+
+    def test_auto_selection_by_size(self, store, tmp_path, monkeypatch):
+        file_path = store.save_to_file("plant_layout", str(tmp_path), "plant")
+        assert not file_path.with_suffix(".bin").exists()
+
+        monkeypatch.setattr(layout_store_module, "BINARY_SIDECAR_MIN_ELEMENTS", 5)
+        store.save_to_file("plant_layout", str(tmp_path), "plant")
+        assert file_path.with_suffix(".bin").exists()
+
+    def test_bad_magic_raises(self, store, tmp_path):
+        file_path = store.save_to_file("plant_layout", str(tmp_path), "plant", binary=True)
+        bin_path = file_path.with_suffix(".bin")
+        with open(bin_path, "r+b") as f:
+            f.write(b"NOTLAYOU")
+
+        with pytest.raises(SidecarFormatError, match="bad magic"):
+            read_sidecar(bin_path)
+
+    @pytest.mark.parametrize("corruption", ["magic", "header"])
+    def test_corrupt_sidecar_falls_back_to_json(self, store, tmp_path, corruption):
+        file_path = store.save_to_file("plant_layout", str(tmp_path), "plant", binary=True)
+        bin_path = file_path.with_suffix(".bin")
+        with open(bin_path, "r+b") as f:
+            if corruption == "magic":
+                f.write(b"NOTLAYOU")
+            else:
+                f.seek(16)
+                f.write(b"}garbled{")
+
+        with pytest.raises(SidecarFormatError):
+            read_sidecar(bin_path)
+        loaded = store.load_from_file(str(tmp_path), "plant", layout_id="from_json")
+        assert store.get(loaded).positions["T-101"].to_list() == [110.5, -30.0]
+        assert store.read_columnar(str(tmp_path), "plant").node_position("T-101") == (110.5, -30.0)
+
+    def test_arrays_are_aligned(self, store, tmp_path):
+        file_path = store.save_to_file("plant_layout", str(tmp_path), "plant", binary=True)
+        columns, source = read_sidecar(file_path.with_suffix(".bin"))
+
+        assert source["size"] == os.path.getsize(file_path)
+        np.testing.assert_array_equal(columns.bend_points, [[70, 25], [70, -25]])
+        assert columns.section_points.ctypes.data % 64 == 0
@@ -16,6 +16,7 @@ from typing import Dict, Any
 
 import networkx as nx
 import pytest
+from pydantic import ValidationError
 
 from src.models.layout_metadata import (
     LayoutMetadata,
@@ -160,6 +161,79 @@ class TestLayoutMetadataSchema:
         assert json.dumps(dict1, sort_keys=True) == json.dumps(dict2, sort_keys=True)
 
 
+class TestIncrementalEtag:
+    """Test per-entry etag digests stay equal to a full recompute."""
+
+    @staticmethod
+    def _layout():
+        return LayoutMetadata(
+            algorithm="elk",
+            layout_options={"elk.direction": "RIGHT"},
+            positions={f"n{i}": NodePosition(x=i * 10.0, y=i * 5.0) for i in range(20)},
+            port_layouts={"n1_out": PortLayout(id="n1_out", x=60, y=20, side="EAST")},
+            edges={"e1": EdgeRoute(sections=[EdgeSection(startPoint=(0, 0), endPoint=(10, 0))])},
+            labels={"n1_label_0": LabelPosition(x=0, y=-5, text="n1")},
+            rotation={"n3": 90.0},
+        )
+
+    def test_incremental_equals_full_recompute(self):
+        """Aggregate after partial updates equals hashing everything again."""
+        layout = self._layout()
+        layout.positions["n4"] = NodePosition(x=1.0, y=2.0)
+        layout.positions["n20"] = NodePosition(x=3.0, y=4.0)
+        del layout.positions["n7"]
+        layout.edges["e1"] = EdgeRoute(sections=[EdgeSection(startPoint=(0, 0), endPoint=(5, 5))])
+        layout.rotation["n3"] = 180.0
+        layout.touch()
+
+        assert layout.etag == layout.compute_etag(full=True)
+        rebuilt = LayoutMetadata(**{
+            name: getattr(layout, name)
+            for name in ("algorithm", "layout_options", "positions", "port_layouts",
+                         "edges", "labels", "rotation")
+        })
+        assert rebuilt.etag == layout.etag
+
+    def test_only_changed_entries_rehashed(self, monkeypatch):
+        """A single moved node rehashes a single entry."""
+        import src.models.layout_metadata as layout_module
+
+        layout = self._layout()
+        hashed = []
+        original = layout_module._entry_digest
+
+        def counting_digest(section, key, value):
+            hashed.append((section, key))
+            return original(section, key, value)
+
+        monkeypatch.setattr(layout_module, "_entry_digest", counting_digest)
+        layout.positions["n2"] = NodePosition(x=0.0, y=0.0)
+        layout.touch()
+
+        assert hashed == [("positions", "n2")]
+
+    def test_digest_cache_survives_deepcopy(self):
+        """LayoutStore copies keep the cache aligned with the copied entries."""
+        store = LayoutStore()
+        layout_id = store.save(self._layout())
+        current = store.get(layout_id)
+        current.positions["n5"] = NodePosition(x=-1.0, y=-1.0)
+        new_etag = store.update(layout_id, current, expected_etag=current.etag)
+
+        assert new_etag == store.get(layout_id).compute_etag(full=True)
+
+    def test_entry_moved_between_keys_changes_etag(self):
+        """Swapping two positions changes the etag (keys are part of digests)."""
+        layout = self._layout()
+        before = layout.etag
+        positions = layout.positions
+        positions["n1"], positions["n2"] = positions["n2"], positions["n1"]
+        layout.touch()
+
+        assert layout.etag != before
+        assert layout.etag == layout.compute_etag(full=True)
+
+
 class TestEdgeRoute:
     """Test EdgeRoute and EdgeSection classes."""
 
@@ -295,6 +369,58 @@ class TestLayoutStore:
         assert len(layouts_a) == 1
         assert len(layouts_b) == 1
 
+    def test_model_index_recency_and_latest(self):
+        """Test list_by_model orders by recency and tracks updates/deletes."""
+        store = create_layout_store()
+        ref = ModelReference(type="dexpi", model_id="model-A")
+
+        def make(x):
+            return LayoutMetadata(algorithm="elk", positions={"n1": NodePosition(x=x, y=0)})
+
+        first = store.save(make(0), model_ref=ref)
+        second = store.save(make(1), model_ref=ref)
+        assert store.list_by_model("dexpi", "model-A") == [second, first]
+        assert store.get_latest_for_model("dexpi", "model-A").layout_id == second
+
+        store.patch(first, {"positions": {"n1": [5, 5]}})
+        assert store.list_by_model("dexpi", "model-A") == [first, second]
+
+        # update() can move a layout to another model
+        moved = store.get(first)
+        object.__setattr__(moved, "model_ref", ModelReference(type="sfiles", model_id="fs"))
+        store.update(first, moved)
+        assert store.list_by_model("dexpi", "model-A") == [second]
+        assert store.list_by_model("sfiles", "fs") == [first]
+
+        store.delete(second)
+        assert store.list_by_model("dexpi", "model-A") == []
+        assert store.get_latest_for_model("dexpi", "model-A") is None
+
+    def test_retention_keeps_last_n_per_model(self):
+        """Test old layouts of a model are evicted beyond the retention limit."""
+        store = create_layout_store(max_layouts_per_model=2)
+        ref_a = ModelReference(type="dexpi", model_id="model-A")
+        ref_b = ModelReference(type="dexpi", model_id="model-B")
+        layout = LayoutMetadata(algorithm="elk", positions={"n1": NodePosition(x=0, y=0)})
+
+        ids = [store.save(layout, model_ref=ref_a) for _ in range(3)]
+        other = store.save(layout, model_ref=ref_b)
+        unreferenced = store.save(layout)
+
+        assert store.list_by_model("dexpi", "model-A") == [ids[2], ids[1]]
+        assert not store.exists(ids[0])
+        assert store.exists(other)
+        assert store.exists(unreferenced)
+
+    def test_retention_unlimited(self):
+        """Test max_layouts_per_model=None keeps every layout."""
+        store = create_layout_store(max_layouts_per_model=None)
+        ref = ModelReference(type="dexpi", model_id="model-A")
+        layout = LayoutMetadata(algorithm="elk", positions={"n1": NodePosition(x=0, y=0)})
+        for _ in range(15):
+            store.save(layout, model_ref=ref)
+        assert len(store.list_by_model("dexpi", "model-A")) == 15
+
     def test_version_increment(self):
         """Test version increments on update."""
         store = create_layout_store()
@@ -634,6 +760,119 @@ class TestLayoutUpdate:
 # =============================================================================
 
 
+class TestLayoutPatch:
+    """Tests for zero-copy snapshots and patch-based updates."""
+
+    @pytest.fixture
+    def store(self):
+        store = create_layout_store()
+        store.save(
+            LayoutMetadata(
+                algorithm="elk",
+                positions={
+                    "P-101": NodePosition(x=100, y=100),
+                    "R-101": NodePosition(x=200, y=100),
+                },
+                edges={"e1": EdgeRoute(sections=[
+                    EdgeSection(startPoint=(100, 100), endPoint=(200, 100))
+                ])},
+                rotation={"R-101": 90.0},
+            ),
+            layout_id="test-layout",
+        )
+        return store
+
+    def test_snapshot_is_shared_and_read_only(self, store):
+        snapshot = store.get_snapshot("test-layout")
+        assert snapshot.positions is not None
+        with pytest.raises(TypeError):
+            snapshot.positions["P-101"] = NodePosition(x=0, y=0)
+        with pytest.raises(AttributeError):
+            snapshot.version = 5
+        with pytest.raises(ValidationError):
+            snapshot.positions["P-101"].x = 0.0  # Entries are frozen
+
+    def test_snapshot_nested_values_are_read_only(self, store):
+        store.update(
+            "test-layout",
+            store.get("test-layout").model_copy(update={
+                "model_ref": ModelReference(type="dexpi", model_id="M1"),
+                "layout_options": {"elk": {"dir": "RIGHT", "spacing": [10, 20]}},
+            }),
+        )
+        snapshot = store.get_snapshot("test-layout")
+        etag = snapshot.etag
+
+        with pytest.raises(ValidationError):
+            snapshot.model_ref.model_id = "HACKED"
+        with pytest.raises(ValidationError):
+            snapshot.bounding_box.min_x = -1.0
+        with pytest.raises(TypeError):
+            snapshot.layout_options["elk"]["dir"] = "DOWN"
+        with pytest.raises(AttributeError):
+            snapshot.layout_options["elk"]["spacing"].append(30)
+        with pytest.raises(AttributeError):
+            snapshot.edges["e1"].sections.append(snapshot.edges["e1"].sections[0])
+        with pytest.raises(AttributeError):
+            snapshot.edges["e1"].sections[0].bendPoints.append((1.0, 2.0))
+        with pytest.raises(AttributeError):
+            snapshot.edges["e1"].labels.clear()
+
+        stored = store.get("test-layout")
+        assert stored.model_ref.model_id == "M1"
+        assert stored.layout_options == {"elk": {"dir": "RIGHT", "spacing": [10, 20]}}
+        assert store.get_etag("test-layout") == etag
+        assert store.get_latest_for_model("dexpi", "M1").layout_id == "test-layout"
+
+    def test_patch_updates_version_etag_and_bbox(self, store):
+        before = store.get_snapshot("test-layout")
+        new_etag = store.patch("test-layout", {
+            "positions": {"P-101": {"x": 50, "y": 60}, "T-101": [300, 100]},
+            "rotation": {"R-101": None},
+        }, expected_etag=before.etag)
+
+        after = store.get_snapshot("test-layout")
+        assert after.etag == new_etag != before.etag
+        assert after.version == before.version + 1
+        assert after.positions["P-101"].to_list() == [50.0, 60.0]
+        assert after.rotation == {}
+        assert after.bounding_box.min_x == 50.0
+        assert after.bounding_box.max_x == 300.0
+        assert new_etag == after.compute_etag(full=True)
+
+    def test_patch_shares_unchanged_entries(self, store):
+        before = store.get_snapshot("test-layout")
+        store.patch("test-layout", {"positions": {"P-101": [0, 0]}})
+        after = store.get_snapshot("test-layout")
+
+        assert after.positions["R-101"] is before.positions["R-101"]
+        assert after.edges["e1"] is before.edges["e1"]
+        # The earlier snapshot still shows its revision
+        assert before.positions["P-101"].x == 100.0
+
+    def test_patch_matches_full_update(self, store):
+        patched_etag = store.patch("test-layout", {
+            "edges": {"e2": {"sections": [{"startPoint": [1, 2], "endPoint": [3, 4]}]}},
+        })
+        reference = create_layout_store()
+        layout = store.get("test-layout")
+        reference.save(layout, layout_id="ref")
+        assert reference.get_etag("ref") == patched_etag
+
+    def test_patch_wrong_etag(self, store):
+        with pytest.raises(OptimisticLockError):
+            store.patch("test-layout", {"positions": {"P-101": [0, 0]}}, expected_etag="stale")
+        assert store.get_snapshot("test-layout").version == 1
+
+    def test_patch_invalid_changes(self, store):
+        with pytest.raises(ValueError, match="Unknown layout sections"):
+            store.patch("test-layout", {"labels": {}})
+        with pytest.raises(ValueError, match="at least one positioned node"):
+            store.patch("test-layout", {"positions": {"P-101": None, "R-101": None}})
+        with pytest.raises(LayoutNotFoundError):
+            store.patch("missing", {"positions": {"P-101": [0, 0]}})
+
+
 class TestLayoutValidate:
     """Tests for layout_validate tool."""
 
@@ -805,6 +1044,39 @@ class TestLayoutToolsMCP:
         assert result["data"]["valid"] is True
         assert result["data"]["node_count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_layout_validate_legacy_etag_file(self, layout_tools, tmp_path):
+        """A layout file saved with the whole-document etag loads and validates cleanly."""
+        fixture = Path(__file__).parent / "fixtures" / "baseline" / "legacy_etag.layout.json"
+        (tmp_path / "pid").mkdir()
+        (tmp_path / "pid" / "plant.layout.json").write_text(fixture.read_text())
+
+        store = layout_tools.layout_store
+        layout_id = store.load_from_file(str(tmp_path), "plant")
+        layout = store.get(layout_id)
+        assert layout.etag != json.loads(fixture.read_text())["etag"]
+        assert layout.etag == layout.compute_etag(full=True)
+
+        result = await layout_tools.handle_tool("layout_validate", {"layout_id": layout_id})
+        assert result["ok"] is True
+        assert "warnings" not in result["data"]
+
+        # Round trip: the re-stamped etag is what gets saved
+        store.save_to_file(layout_id, str(tmp_path), "plant", "pid")
+        saved = json.loads((tmp_path / "pid" / "plant.layout.json").read_text())
+        assert saved["etag"] == layout.etag
+        assert saved["positions"] == json.loads(fixture.read_text())["positions"]
+
+    def test_tampered_layout_keeps_mismatched_etag(self):
+        """Only etags matching the legacy algorithm are re-stamped."""
+        fixture = Path(__file__).parent / "fixtures" / "baseline" / "legacy_etag.layout.json"
+        data = json.loads(fixture.read_text())
+        data["positions"]["P-101"] = [101.0, 50.0]
+
+        layout = LayoutStore()._dict_to_layout(data)
+        assert layout.etag == data["etag"]
+        assert layout.etag != layout.compute_etag(full=True)
+
 
 # =============================================================================
 # Run Tests
@@ -0,0 +1,100 @@
+"""Tests for OperationRegistry schema validation and memoization."""
+
+import pytest
+
+from src.registry.operation_registry import (
+    InvalidOperationDescriptor,
+    OperationCategory,
+    OperationDescriptor,
+    OperationMetadata,
+    OperationRegistry,
+    OperationResult,
+    SchemaValidationError,
+)
+
+
+def _handler(model, params):
+    return OperationResult(success=True, message="ok", data=dict(params))
+
+
+def _descriptor(name="test_add", schema=None, replaces=None):
+    return OperationDescriptor(
+        name=name,
+        version="1.0.0",
+        category=OperationCategory.UNIVERSAL,
+        description="Test operation",
+        input_schema=schema if schema is not None else {
+            "type": "object",
+            "properties": {
+                "tag": {"type": "string"},
+                "count": {"type": "integer", "minimum": 1, "default": 1},
+                "kind": {"type": "string", "enum": ["pump", "tank"]},
+            },
+            "required": ["tag"],
+        },
+        handler=_handler,
+        metadata=OperationMetadata(replaces=replaces or []),
+    )
+
+
+@pytest.fixture
+def registry():
+    registry = OperationRegistry()
+    registry.register(_descriptor(replaces=["legacy_add"]))
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_valid_params_pass(registry):
+    result = await registry.execute(None, "test_add", {"tag": "P-101", "kind": "pump"})
+    assert result.success
+    # Validation must not inject schema defaults into params
+    assert result.data == {"tag": "P-101", "kind": "pump"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("params", [
+    {},
+    {"tag": 101},
+    {"tag": "P-101", "count": 0},
+    {"tag": "P-101", "kind": "compressor"},
+])
+async def test_invalid_params_rejected(registry, params):
+    with pytest.raises(SchemaValidationError, match="test_add"):
+        await registry.execute(None, "test_add", params)
+
+
+@pytest.mark.asyncio
+async def test_alias_uses_target_validator(registry):
+    with pytest.raises(SchemaValidationError):
+        await registry.execute(None, "legacy_add", {"tag": 5})
+    assert registry.exists("legacy_add")
+    assert registry.get("legacy_add").name == "test_add"
+
+
+def test_invalid_schema_rejected_at_registration():
+    registry = OperationRegistry()
+    with pytest.raises(InvalidOperationDescriptor):
+        registry.register(_descriptor(schema={"type": "not-a-type"}))
+    assert not registry.exists("test_add")
+
+
+def test_get_schema_memoized_until_registration(registry):
+    schema = registry.get_schema()
+    assert registry.get_schema() is schema
+    assert len(schema["oneOf"]) == 1
+
+    registry.register(_descriptor(name="test_other"))
+    updated = registry.get_schema()
+    assert updated is not schema
+    assert len(updated["oneOf"]) == 2
+
+
+def test_operation_docs_memoized_until_registration(registry):
+    docs = registry.get_operation_docs("test_add")
+    assert registry.get_operation_docs("legacy_add") is docs
+    assert docs["input_schema"]["required"] == ["tag"]
+
+    registry.register(_descriptor(name="test_other"))
+    assert registry.get_operation_docs("test_add") is not docs
+    assert registry.get_operation_docs("test_add") == docs
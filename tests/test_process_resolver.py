@@ -0,0 +1,143 @@
+"""Tests for the cached process resolver and flowsheet sequence counters."""
+
+import json
+import os
+from difflib import get_close_matches
+
+import networkx as nx
+import pytest
+
+from src.utils import process_resolver
+from src.utils.process_resolver import (
+    ProcessIndex,
+    generate_semantic_id,
+    get_fuzzy_matches,
+    get_next_sequence_number,
+    load_process_hierarchy,
+    register_unit,
+    resolve_process_type,
+)
+
+HIERARCHY = {
+    "Secondary Treatment": {
+        "Biological": {
+            "Aeration Tank": {"area_number": 230, "process_unit_id": "AT"},
+            "Trickling Filter": {"area_number": 240, "process_unit_id": "TF"},
+        },
+        "Clarification": {
+            "Secondary Clarification": {"area_number": 250, "process_unit_id": "SC"},
+            "Notes": "not a process",
+        },
+    },
+    "Sludge Handling": {
+        "Thickening": {"area_number": 410, "process_unit_id": "TH"},
+    },
+}
+
+
+class FakeFlowsheet:
+    def __init__(self):
+        self.state = nx.DiGraph()
+
+
+@pytest.fixture
+def hierarchy_file(tmp_path, monkeypatch):
+    path = tmp_path / "process_units_hierarchy.json"
+    path.write_text(json.dumps(HIERARCHY))
+    monkeypatch.setattr(process_resolver, "_find_hierarchy_path", lambda: str(path))
+    return path
+
+
+def test_resolves_exact_alias_and_case_insensitive_names(hierarchy_file):
+    assert resolve_process_type("Aeration Tank") == {
+        "canonical_name": "Aeration Tank", "area_number": 230, "process_unit_id": "AT",
+        "category": "Secondary Treatment", "subcategory": "Biological", "process_name": "Aeration Tank",
+    }
+    assert resolve_process_type("AT")["canonical_name"] == "Aeration Tank"
+    assert resolve_process_type("secondary CLARIFICATION")["area_number"] == 250
+    assert resolve_process_type("Biological")["area_number"] == 230
+    assert resolve_process_type("Sludge Handling")["subcategory"] == "Thickening"
+    assert resolve_process_type("Notes") is None
+    assert resolve_process_type("Aeraton Tank") is None
+    assert resolve_process_type("Aeraton Tank", allow_custom=True)["is_custom"] is True
+
+
+def test_hierarchy_is_loaded_once_and_reloaded_on_change(hierarchy_file):
+    hierarchy = load_process_hierarchy()
+    assert load_process_hierarchy() is hierarchy
+
+    resolve_process_type("Aeration Tank")["area_number"] = 999
+    assert resolve_process_type("Aeration Tank")["area_number"] == 230
+
+    edited = json.loads(json.dumps(HIERARCHY))
+    edited["Secondary Treatment"]["Biological"]["Aeration Tank"]["area_number"] = 235
+    hierarchy_file.write_text(json.dumps(edited))
+    stat = hierarchy_file.stat()
+    os.utime(hierarchy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert resolve_process_type("Aeration Tank")["area_number"] == 235
+    assert load_process_hierarchy() is not hierarchy
+
+
+@pytest.mark.parametrize("query", ["Aeraton Tank", "clarification", "Thicken", "X", ""])
+@pytest.mark.parametrize("cutoff", [0.0, 0.6, 0.9])
+def test_fuzzy_matches_equal_difflib(hierarchy_file, query, cutoff):
+    index = ProcessIndex(HIERARCHY)
+    expected = get_close_matches(query, list(index.names), n=3, cutoff=cutoff)
+
+    assert index.fuzzy_matches(query, n=3, cutoff=cutoff) == expected
+    assert get_fuzzy_matches(query, load_process_hierarchy(), n=3, cutoff=cutoff) == expected
+
+
+def test_sequence_counters_track_added_and_removed_units():
+    flowsheet = FakeFlowsheet()
+
+    def add(base, area, code, seq=None):
+        node_id = generate_semantic_id(flowsheet, base)
+        seq = seq or get_next_sequence_number(flowsheet, area, code)
+        flowsheet.state.add_node(node_id, area_number=area, process_unit_id=code, sequence_number=seq)
+        register_unit(flowsheet, node_id)
+        return node_id, seq
+
+    assert add("Aeration Tank", 230, "AT") == ("AerationTank-01", 1)
+    assert add("Aeration Tank", 230, "AT") == ("AerationTank-02", 2)
+    assert add("Aeration", 230, "AT", seq=7) == ("Aeration-03", 7)
+    assert add("Clarifier", 250, "SC") == ("Clarifier-01", 1)
+    assert get_next_sequence_number(flowsheet, 230, "AT") == 8
+
+    # Units added or removed without register_unit are picked up by a rescan
+    flowsheet.state.add_node("AerationTank-09", area_number=230, process_unit_id="AT", sequence_number=9)
+    assert get_next_sequence_number(flowsheet, 230, "AT") == 10
+    assert generate_semantic_id(flowsheet, "Aeration Tank") == "AerationTank-10"
+
+    flowsheet.state.nodes["AerationTank-09"]["sequence_number"] = 4
+    assert get_next_sequence_number(flowsheet, 230, "AT") == 8
+
+    flowsheet.state.remove_nodes_from(["AerationTank-09", "Aeration-03"])
+    assert get_next_sequence_number(flowsheet, 230, "AT") == 3
+    assert generate_semantic_id(flowsheet, "Aeration") == "Aeration-03"
+
+
+def test_sequence_counters_rescan_after_unregistered_remove_and_add():
+    flowsheet = FakeFlowsheet()
+    for _ in range(3):
+        node_id = generate_semantic_id(flowsheet, "Aeration Tank")
+        seq = get_next_sequence_number(flowsheet, 230, "AT")
+        flowsheet.state.add_node(node_id, area_number=230, process_unit_id="AT", sequence_number=seq)
+        register_unit(flowsheet, node_id)
+
+    # Same node count, no register_unit (e.g. graph_modify or a PFD-mode add)
+    flowsheet.state.remove_node("AerationTank-01")
+    flowsheet.state.add_node("AerationTank-04", area_number=230, process_unit_id="AT", sequence_number=4)
+
+    assert generate_semantic_id(flowsheet, "Aeration Tank") == "AerationTank-05"
+    assert get_next_sequence_number(flowsheet, 230, "AT") == 5
+
+    # A registered add after an unregistered one is not trusted either
+    flowsheet.state.add_node("AerationTank-09", area_number=230, process_unit_id="AT", sequence_number=9)
+    flowsheet.state.remove_node("AerationTank-02")
+    flowsheet.state.add_node("AerationTank-05", area_number=230, process_unit_id="AT", sequence_number=5)
+    register_unit(flowsheet, "AerationTank-05")
+
+    assert generate_semantic_id(flowsheet, "Aeration Tank") == "AerationTank-10"
+    assert get_next_sequence_number(flowsheet, 230, "AT") == 10
@@ -0,0 +1,175 @@
+"""Tests for the project model index and lazy project loading."""
+
+import json
+import os
+
+import pytest
+from pydexpi.dexpi_classes.dexpiModel import ConceptualModel, DexpiModel
+from pydexpi.dexpi_classes.equipment import Pump
+from pydexpi.dexpi_classes.metaData import MetaData
+
+from src.core.model_store import InMemoryModelStore, LazyModel, ModelType
+from src.persistence.project_manifest import MANIFEST_FILENAME, ProjectManifest
+from src.persistence.project_persistence import ProjectPersistence
+from src.tools.model_tools import ModelTools
+from src.tools.project_tools import ProjectTools
+
+
+def _model(*tags):
+    conceptual = ConceptualModel(metaData=MetaData(projectName="Plant", drawingNumber="PID-001"))
+    conceptual.taggedPlantItems.extend(Pump(componentName="Pump", tagName=tag) for tag in tags)
+    return DexpiModel(conceptualModel=conceptual)
+
+
+@pytest.fixture
+def project(tmp_path):
+    persistence = ProjectPersistence()
+    persistence.save_dexpi(_model("P-101", "P-102"), str(tmp_path), "plant", artifacts=["json", "meta"])
+    (tmp_path / "pfd").mkdir()
+    (tmp_path / "pfd" / "flow.json").write_text(json.dumps({
+        "type": "PFD",
+        "name": "flow",
+        "description": "Feed section",
+        "nodes": [["feed-1", {"unit_type": "raw"}], ["pump-1", {"unit_type": "pp"}]],
+        "edges": [["feed-1", "pump-1", {}]],
+    }))
+    return tmp_path
+
+
+def test_refresh_indexes_models(project):
+    entries = ProjectManifest(str(project)).refresh()
+
+    assert set(entries) == {"pid/plant", "pfd/flow"}
+    plant = entries["pid/plant"]
+    assert plant.model_type == "dexpi"
+    assert plant.counts["equipment"] == 2
+    assert plant.tags == ["P-101", "P-102"]
+    assert plant.info["drawing_number"] == "PID-001"
+    assert plant.size == (project / "pid" / "plant.json").stat().st_size
+    assert entries["pfd/flow"].counts == {"nodes": 2, "edges": 1}
+    assert (project / MANIFEST_FILENAME).exists()
+
+
+def test_refresh_rereads_only_changed_files(project, monkeypatch):
+    ProjectManifest(str(project)).refresh()
+
+    manifest = ProjectManifest(str(project))
+    indexed = []
+    original = manifest._index_file
+    monkeypatch.setattr(manifest, "_index_file", lambda *args: indexed.append(args[2].name) or original(*args))
+
+    manifest.refresh()
+    assert indexed == []
+
+    ProjectPersistence().save_dexpi(_model("P-201"), str(project), "plant", artifacts=["json"])
+    stat = (project / "pid" / "plant.json").stat()
+    os.utime(project / "pid" / "plant.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    (project / "pfd" / "flow.json").unlink()
+
+    entries = manifest.refresh()
+    assert indexed == ["plant.json"]
+    assert set(entries) == {"pid/plant"}
+    assert entries["pid/plant"].tags == ["P-201"]
+
+
+def test_unreadable_index_is_rebuilt(project):
+    ProjectManifest(str(project)).refresh()
+    index_path = project / MANIFEST_FILENAME
+    index_path.write_text(index_path.read_text()[:40])
+
+    entries = ProjectManifest(str(project)).refresh()
+    assert set(entries) == {"pid/plant", "pfd/flow"}
+    assert json.loads(index_path.read_text())["models"]["pid/plant"]["counts"]["equipment"] == 2
+
+
+@pytest.mark.asyncio
+async def test_malformed_model_file_gets_error_entry(project):
+    (project / "pid" / "broken.json").write_text('{"composition": ')
+
+    entries = ProjectManifest(str(project)).refresh()
+    assert entries["pid/broken"].error.startswith("JSONDecodeError")
+    assert entries["pid/broken"].counts == {} and entries["pid/broken"].tags == []
+    assert entries["pid/plant"].error is None
+    assert [m["name"] for m in ProjectPersistence().search_models(str(project), tag="P-101")] == ["plant"]
+
+    tools = ModelTools(InMemoryModelStore(ModelType.DEXPI), InMemoryModelStore(ModelType.SFILES), None, None)
+    result = await tools.handle_tool("model_load", {
+        "model_type": "dexpi", "format": "project",
+        "project_path": str(project), "model_name": "broken",
+    })
+    assert not result["ok"]
+
+
+def test_search(project):
+    persistence = ProjectPersistence()
+
+    by_tag = persistence.search_models(str(project), tag="P-102")
+    assert [(m["name"], m["matched_tags"]) for m in by_tag] == [("plant", ["P-102"])]
+    assert "tags" not in by_tag[0] and by_tag[0]["tag_count"] == 2
+
+    assert [m["name"] for m in persistence.search_models(str(project), query="feed")] == ["flow"]
+    assert [m["name"] for m in persistence.search_models(str(project), query="pump")] == ["flow"]
+    assert persistence.search_models(str(project), query="p-10", model_type="sfiles") == []
+
+
+@pytest.mark.asyncio
+async def test_project_list_details_and_search(project):
+    tools = ProjectTools({}, {})
+
+    listed = await tools.handle_tool("project_list", {"project_path": str(project), "details": True})
+    assert listed["ok"]
+    assert {d["name"]: d["counts"] for d in listed["data"]["details"]}["plant"]["equipment"] == 2
+
+    found = await tools.handle_tool("project_search", {"project_path": str(project), "tag": "P-101"})
+    assert found["ok"] and found["data"]["count"] == 1
+
+    missing = await tools.handle_tool("project_search", {"project_path": str(project)})
+    assert not missing["ok"]
+
+
+@pytest.mark.asyncio
+async def test_model_load_project_is_lazy(project):
+    dexpi_store = InMemoryModelStore(ModelType.DEXPI)
+    sfiles_store = InMemoryModelStore(ModelType.SFILES)
+    tools = ModelTools(dexpi_store, sfiles_store, None, None)
+
+    result = await tools.handle_tool("model_load", {
+        "model_type": "dexpi", "format": "project",
+        "project_path": str(project), "model_name": "plant",
+    })
+    assert result["ok"]
+    assert result["data"]["lazy"] and result["data"]["counts"]["equipment"] == 2
+    model_id = result["data"]["model_id"]
+    assert not dexpi_store.is_loaded(model_id)
+
+    model = dexpi_store.get(model_id)
+    assert [item.tagName for item in model.conceptualModel.taggedPlantItems] == ["P-101", "P-102"]
+    assert dexpi_store.is_loaded(model_id)
+    assert dexpi_store[model_id] is model
+
+    result = await tools.handle_tool("model_load", {
+        "model_type": "sfiles", "format": "project",
+        "project_path": str(project), "model_name": "flow", "lazy": False,
+    })
+    assert result["ok"] and result["data"]["loaded"]
+    assert sfiles_store.get(result["data"]["model_id"]).state.number_of_nodes() == 2
+
+
+@pytest.mark.asyncio
+async def test_model_load_project_missing_model(project):
+    tools = ModelTools({}, {}, None, None)
+    result = await tools.handle_tool("model_load", {
+        "model_type": "dexpi", "format": "project",
+        "project_path": str(project), "model_name": "flow",
+    })
+    assert result["error"]["code"] == "MODEL_NOT_FOUND"
+
+
+def test_lazy_model_loads_once():
+    calls = []
+    store = InMemoryModelStore(ModelType.DEXPI)
+    store.create("m", LazyModel(lambda: calls.append(1) or {"loaded": True}))
+
+    assert store.values() == [{"loaded": True}]
+    assert store.get("m") == {"loaded": True}
+    assert calls == [1]
@@ -0,0 +1,112 @@
+"""Tests for the selectable DEXPI artifact pipeline in ProjectPersistence.save_dexpi."""
+
+import json
+from pathlib import Path
+
+import pytest
+from pydexpi.loaders.ml_graph_loader import MLGraphLoader
+from pydexpi.dexpi_classes.dexpiModel import ConceptualModel, DexpiModel
+from pydexpi.dexpi_classes.equipment import Pump, Tank
+from pydexpi.dexpi_classes.metaData import MetaData
+
+from src.models.layout_metadata import LayoutMetadata, NodePosition
+from src.persistence.project_persistence import ProjectPersistence
+
+
+@pytest.fixture
+def model():
+    conceptual = ConceptualModel(metaData=MetaData(projectName="Plant", drawingNumber="PID-001"))
+    conceptual.taggedPlantItems.extend([
+        Tank(componentName="Tank", tagName="T-101"),
+        Pump(componentName="Pump", tagName="P-101"),
+    ])
+    return DexpiModel(conceptualModel=conceptual)
+
+
+@pytest.fixture
+def persistence():
+    return ProjectPersistence()
+
+
+def test_default_artifacts(persistence, model, tmp_path):
+    paths = persistence.save_dexpi(model, str(tmp_path), "plant")
+
+    assert paths["skipped"] == []
+    assert paths["layout"] is None
+    for name in ("json", "meta", "graphml"):
+        assert Path(paths[name]).exists()
+    assert persistence.load_dexpi(str(tmp_path), "plant").conceptualModel.taggedPlantItems[0].tagName == "T-101"
+
+
+def test_unchanged_artifacts_skipped(persistence, model, tmp_path):
+    persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "meta", "graphml"])
+    json_mtime = (tmp_path / "pid" / "plant.json").stat().st_mtime_ns
+
+    again = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "meta", "graphml"])
+    assert again["skipped"] == ["json", "meta", "graphml"]
+    assert again["json"] == str(tmp_path / "pid" / "plant.json")
+    assert (tmp_path / "pid" / "plant.json").stat().st_mtime_ns == json_mtime
+
+    # A model change rewrites the model-derived artifacts but not the metadata
+    model.conceptualModel.taggedPlantItems.append(Tank(componentName="Tank2", tagName="T-102"))
+    changed = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "meta", "graphml"])
+    assert changed["skipped"] == ["meta"]
+    assert "T-102" in (tmp_path / "pid" / "plant.json").read_text()
+
+    forced = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json"], force=True)
+    assert forced["skipped"] == []
+
+
+def test_corrupt_artifact_manifest_forces_rewrite(persistence, model, tmp_path):
+    persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "meta"])
+    (tmp_path / "pid" / "plant.artifacts").write_text('{"json": ')
+
+    again = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "meta"])
+    assert again["skipped"] == []
+    assert json.loads((tmp_path / "pid" / "plant.artifacts").read_text()).keys() == {"json", "meta"}
+
+
+def test_json_only(persistence, model, tmp_path):
+    paths = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json"])
+
+    assert paths["meta"] is None and paths["graphml"] is None and paths["html"] is None
+    assert sorted(p.name for p in (tmp_path / "pid").iterdir()) == ["plant.artifacts", "plant.json"]
+    assert persistence.list_models(str(tmp_path))["pid"] == ["plant"]
+
+
+def test_layout_artifact(persistence, model, tmp_path):
+    layout = LayoutMetadata(algorithm="elk", positions={"T-101": NodePosition(x=1, y=2)})
+
+    paths = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["layout"], layout=layout)
+    with open(paths["layout"]) as f:
+        assert json.load(f)["positions"] == {"T-101": [1.0, 2.0]}
+
+    again = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["layout"], layout=layout)
+    assert again["skipped"] == ["layout"]
+
+
+def test_layout_sidecar_not_listed_as_model(persistence, model, tmp_path):
+    layout = LayoutMetadata(algorithm="elk", positions={"T-101": NodePosition(x=1, y=2)})
+    persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "layout"], layout=layout)
+
+    assert (tmp_path / "pid" / "plant.layout.json").exists()
+    assert persistence.list_models(str(tmp_path))["pid"] == ["plant"]
+
+
+def test_invalid_selection(persistence, model, tmp_path):
+    with pytest.raises(ValueError, match="Unknown artifacts"):
+        persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "png"])
+    with pytest.raises(ValueError, match="requires a layout"):
+        persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["layout"])
+
+
+def test_graph_failure_only_drops_graph_artifacts(persistence, model, tmp_path, monkeypatch):
+    def fail(self, model):
+        raise ValueError("unsupported component")
+
+    monkeypatch.setattr(MLGraphLoader, "dexpi_to_graph", fail)
+    paths = persistence.save_dexpi(model, str(tmp_path), "plant", artifacts=["json", "meta", "graphml", "html"])
+
+    assert Path(paths["json"]).exists() and Path(paths["meta"]).exists()
+    assert paths["graphml"] is None and paths["html"] is None
+    assert "graphml" not in json.loads((tmp_path / "pid" / "plant.artifacts").read_text())
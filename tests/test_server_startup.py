@@ -0,0 +1,166 @@
+"""Cold-start regression tests: lazy tool handlers and the cached tool catalog."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.server import TOOL_HANDLERS, EngineeringDrawingMCPServer
+from src.tools import tool_catalog
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Process start to first list_tools response with a current catalog. Loading
+# every tool module (the path this guards against) takes several times longer.
+COLD_START_BUDGET_SECONDS = 6.0
+
+# Imported by the tool modules, never needed to list tools
+HEAVY_MODULES = (
+    "pydexpi.dexpi_classes.pydantic_classes",
+    "matplotlib",
+    "plotly",
+    "networkx",
+    "src.tools.dexpi_tools",
+    "src.tools.visualization_tools",
+    "src.tools.layout_tools",
+    "src.tools.template_tools",
+)
+
+_COLD_START = """
+import time
+start = time.perf_counter()
+import asyncio, json, sys
+sys.path.insert(0, {root!r})
+from mcp import types
+import src.server as server_module
+server = server_module.EngineeringDrawingMCPServer()
+handler = server.server.request_handlers[types.ListToolsRequest]
+result = asyncio.run(handler(types.ListToolsRequest(method="tools/list")))
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "tools": [tool.name for tool in result.root.tools],
+    "heavy": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    path = tmp_path / "tool_catalog.json"
+    monkeypatch.setenv("TOOL_CATALOG_PATH", str(path))
+    return path
+
+
+def _dump(tools):
+    return [tool.model_dump(mode="json") for tool in tools]
+
+
+def test_handlers_are_created_on_first_use(catalog):
+    server = EngineeringDrawingMCPServer()
+    assert not any(attr in vars(server) for attr in TOOL_HANDLERS)
+
+    batch_tools = server.batch_tools
+    assert server.batch_tools is batch_tools
+    assert {"batch_tools", "dexpi_tools", "sfiles_tools"} <= set(vars(server))
+    assert "visualization_tools" not in vars(server)
+    with pytest.raises(AttributeError):
+        server.unknown_tools
+
+
+def test_tool_list_is_cached_and_matches_handlers(catalog):
+    built = EngineeringDrawingMCPServer().get_tools()
+    assert catalog.exists()
+
+    server = EngineeringDrawingMCPServer()
+    cached = server.get_tools()
+    assert _dump(cached) == _dump(built)
+    assert not any(attr in vars(server) for attr in TOOL_HANDLERS)
+
+    names = [tool.name for tool in built]
+    assert len(names) == len(set(names))
+    assert names[0].startswith("model_")
+
+
+def test_stale_catalog_is_rebuilt(catalog, monkeypatch):
+    EngineeringDrawingMCPServer().get_tools()
+    monkeypatch.setattr(tool_catalog, "source_fingerprint", lambda root=None: "changed")
+    monkeypatch.setattr("src.server.source_fingerprint", tool_catalog.source_fingerprint)
+
+    server = EngineeringDrawingMCPServer()
+    server.get_tools()
+    assert "model_tools" in vars(server)
+    assert json.loads(catalog.read_text())["fingerprint"] == "changed"
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: "{\"version\": 2, \"finger",
+    lambda data: "[]",
+    lambda data: json.dumps(dict(data, tools=[{"tool": data["tools"][0]["tool"]}])),
+    lambda data: json.dumps(dict(data, tools=[dict(data["tools"][0], tool={"name": 1})])),
+    lambda data: json.dumps(dict(data, tools=[dict(data["tools"][0], handler="missing_tools")])),
+], ids=["truncated", "not-an-object", "missing-key", "invalid-tool", "unknown-handler"])
+def test_corrupt_catalog_is_rebuilt(catalog, corrupt):
+    built = EngineeringDrawingMCPServer().get_tools()
+    catalog.write_text(corrupt(json.loads(catalog.read_text())))
+
+    server = EngineeringDrawingMCPServer()
+    assert _dump(server.get_tools()) == _dump(built)
+    assert "model_tools" in vars(server)
+    assert len(json.loads(catalog.read_text())["tools"]) == len(built)
+
+
+def test_cold_start_to_first_list_tools(catalog):
+    expected = [tool.name for tool in EngineeringDrawingMCPServer().get_tools()]
+
+    completed = subprocess.run(
+        [sys.executable, "-c", _COLD_START.format(root=str(PROJECT_ROOT), heavy=HEAVY_MODULES)],
+        check=True, capture_output=True, text=True,
+        env=dict(os.environ, TOOL_CATALOG_PATH=str(catalog)),
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert result["tools"] == expected
+    assert result["heavy"] == []
+    assert result["seconds"] < COLD_START_BUDGET_SECONDS
+
+
+def _call(server, name, arguments):
+    return asyncio.run(server.dispatch_tool(name, arguments))
+
+
+def test_dispatch_rejects_unknown_tool(catalog):
+    server = EngineeringDrawingMCPServer()
+    result = _call(server, "no_such_tool", {})
+
+    assert result["ok"] is False
+    assert result["error"]["code"] == "UNKNOWN_TOOL"
+
+
+def test_dispatch_rejects_invalid_arguments_before_tool_code(catalog):
+    EngineeringDrawingMCPServer().get_tools()
+    server = EngineeringDrawingMCPServer()
+    result = _call(server, "model_create", {"model_type": 42})
+
+    assert result["error"]["code"] == "INVALID_ARGUMENTS"
+    assert "model_tools" not in vars(server)
+
+
+def test_dispatch_routes_through_bound_handler(catalog):
+    EngineeringDrawingMCPServer().get_tools()
+    server = EngineeringDrawingMCPServer()
+    calls = []
+
+    async def handle_tool(name, arguments):
+        calls.append((name, arguments))
+        return {"ok": True, "data": name}
+
+    server.schema_tools = type("SchemaToolsStub", (), {"handle_tool": staticmethod(handle_tool)})()
+    assert _call(server, "schema_query", {"operation": "list_classes"}) == {"ok": True, "data": "schema_query"}
+    assert _call(server, "schema_query", {"operation": "list_classes"})["ok"] is True
+
+    assert calls == [("schema_query", {"operation": "list_classes"})] * 2
+    assert list(server._bound) == ["schema_query"]
@@ -0,0 +1,132 @@
+"""Tests for the compiled template cache (src/utils/template_cache.py) and its consumers."""
+
+import os
+
+import pytest
+
+from src.models.template_system import TemplateLoader
+from src.templates import ParametricTemplate, TemplateLoadError
+from src.utils.template_cache import CompiledFileCache, parse_yaml
+
+PUMP_TEMPLATE = """
+name: pump
+parameters:
+  pump_tag:
+    type: string
+    default: "P-001"
+components:
+  - name: pump
+    type: CentrifugalPump
+    tag_pattern: "${pump_tag}"
+"""
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def compiles():
+    """Paths a compiler was called for."""
+    paths = []
+
+    def compile(content, path):
+        paths.append(path.name)
+        return parse_yaml(content, path)
+
+    compile.paths = paths
+    return compile
+
+
+def test_file_is_compiled_once_until_content_changes(tmp_path, compiles):
+    path = tmp_path / "a.yaml"
+    path.write_text("value: 1\n")
+    cache = CompiledFileCache()
+
+    first = cache.load("yaml", path, compiles)
+    assert cache.load("yaml", path, compiles) is first
+
+    _bump_mtime(path)
+    assert cache.load("yaml", path, compiles) is first
+    assert cache.stats()["rehashes"] == 1
+
+    path.write_text("value: 2\n")
+    _bump_mtime(path)
+    assert cache.load("yaml", path, compiles) == {"value": 2}
+    assert compiles.paths == ["a.yaml", "a.yaml"]
+
+
+def test_variant_and_kind_are_part_of_the_key(tmp_path, compiles):
+    path = tmp_path / "a.yaml"
+    path.write_text("value: 1\n")
+    cache = CompiledFileCache()
+
+    cache.load("yaml", path, compiles, variant="v1")
+    cache.load("yaml", path, compiles, variant="v1")
+    cache.load("yaml", path, compiles, variant="v2")
+    cache.load("other", path, compiles, variant="v2")
+    assert compiles.paths == ["a.yaml"] * 3
+    with pytest.raises(FileNotFoundError):
+        cache.load("yaml", tmp_path / "missing.yaml", compiles)
+
+
+def test_parametric_template_is_shared_and_reloaded_on_edit(tmp_path):
+    path = tmp_path / "pump.yaml"
+    path.write_text(PUMP_TEMPLATE)
+
+    template = ParametricTemplate.from_yaml(path)
+    assert ParametricTemplate.from_yaml(path) is template
+    assert template._defaults == {"pump_tag": "P-001"}
+    assert template._component_classes["CentrifugalPump"].__name__ == "CentrifugalPump"
+
+    path.write_text(PUMP_TEMPLATE.replace("P-001", "P-100"))
+    _bump_mtime(path)
+    assert ParametricTemplate.from_yaml(path)._defaults == {"pump_tag": "P-100"}
+
+
+def test_parametric_template_rejects_invalid_parameter_schema(tmp_path):
+    path = tmp_path / "pump.yaml"
+    path.write_text(PUMP_TEMPLATE.replace('default: "P-001"', "default: 1"))
+    with pytest.raises(TemplateLoadError, match="must be string"):
+        ParametricTemplate.from_yaml(path)
+
+    path.write_text(PUMP_TEMPLATE.replace("type: string", "type: text"))
+    _bump_mtime(path)
+    with pytest.raises(TemplateLoadError, match="unknown type"):
+        ParametricTemplate.from_yaml(path)
+
+
+def test_parametric_template_accepts_required_parameters():
+    template = ParametricTemplate({
+        "name": "t",
+        "parameters": {
+            "n": {"type": "integer"},
+            "size": {"type": "integer", "default": 2, "min": 1},
+        },
+    })
+
+    assert template._defaults == {"size": 2}
+    assert template.validate_parameters({}).errors == ["Required parameter missing: n"]
+    assert template.validate_parameters({"n": 3}).is_valid
+
+
+def test_template_loader_returns_copies_and_tracks_components(tmp_path):
+    base = tmp_path / "process_templates"
+    (base / "components").mkdir(parents=True)
+    (base / "registry.yaml").write_text("templates:\n  TK: tank.yaml\n")
+    (base / "tank.yaml").write_text(
+        "process_unit_id: TK\narea_number: 100\nname: Tank\ncomponents: [mixer]\n"
+    )
+    component = base / "components" / "mixer.yaml"
+    component.write_text("id: mixer\nequipment:\n  - {id: M, dexpi_class: Agitator, tag_prefix: M}\n")
+    loader = TemplateLoader(str(base))
+
+    first = loader.load_template("TK")
+    first.per_train_equipment.clear()
+    second = loader.load_template("TK")
+    assert [eq.id for eq in second.per_train_equipment] == ["M"]
+
+    component.write_text(component.read_text().replace("id: M,", "id: MX,"))
+    _bump_mtime(component)
+    assert [eq.id for eq in loader.load_template("TK").per_train_equipment] == ["MX"]
@@ -0,0 +1,90 @@
+"""Tests for compiled template expressions (src/templates/expressions.py)."""
+
+import pytest
+
+from src.templates import ParameterSubstitutionEngine
+from src.templates.expressions import ExpressionError, compile_expression, evaluate_expression
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("index + 1", 5),
+    ("pump_count * 2 - 1", 5),
+    ("flow / pump_count", 100.0),
+    ("pump_count ** 2 % 4", 1),
+    ("-index", -4),
+    ("not enabled", False),
+    ("pump_count > 2 and control == 'flow'", True),
+    ("control == 'level' or 'fallback'", "fallback"),
+    ("1 < index <= 4", True),
+    ("control in ['flow', 'level']", True),
+    ("'a' if enabled else 'b'", "a"),
+    ("sizes[1]", "DN100"),
+    ("max(pump_count, index) + len(sizes)", 6),
+    ("${control} != 'manual'", True),
+    ("${missing|3} * 2", 6),
+    ("${missing|'none'} == 'none'", True),
+])
+def test_evaluates_supported_syntax(source, expected):
+    variables = {"index": 4, "pump_count": 3, "flow": 300.0, "enabled": True,
+                 "control": "flow", "sizes": ["DN50", "DN100"]}
+    assert evaluate_expression(source, variables) == expected
+
+
+@pytest.mark.parametrize("source", [
+    "().__class__.__bases__",
+    "control.upper()",
+    "__import__('os')",
+    "open('/etc/passwd')",
+    "(lambda: 1)()",
+    "[x for x in sizes]",
+    "sizes[0:1]",
+    "index << 2",
+    "index +",
+])
+def test_rejects_unsafe_or_invalid_syntax(source):
+    with pytest.raises(ExpressionError):
+        compile_expression(source)
+
+
+def test_compiled_once_per_expression_string():
+    expression = compile_expression("a + b")
+    assert compile_expression("a + b") is expression
+    assert expression.names == frozenset({"a", "b"})
+    assert [expression.evaluate({"a": i, "b": 1}) for i in range(3)] == [1, 2, 3]
+
+
+def test_evaluation_errors_are_expression_errors():
+    with pytest.raises(ExpressionError, match="unknown parameter 'b'"):
+        evaluate_expression("a + b", {"a": 1})
+    with pytest.raises(ExpressionError, match="without a default"):
+        evaluate_expression("${b} == 1", {})
+    with pytest.raises(ExpressionError, match="Failed to evaluate"):
+        evaluate_expression("a / 0", {"a": 1})
+    with pytest.raises(ExpressionError, match="Exponent"):
+        evaluate_expression("a ** 100000", {"a": 10})
+    with pytest.raises(ExpressionError, match="repetition"):
+        evaluate_expression("'x' * 10 ** 9", {})
+
+
+def test_integer_results_are_size_bounded():
+    with pytest.raises(ExpressionError, match="Integer power"):
+        evaluate_expression("((((9**128)**128)**128)**128)", {})
+    with pytest.raises(ExpressionError, match="Integer product"):
+        evaluate_expression("(2**128)**31 * (2**128)**31", {})
+    assert evaluate_expression("2 ** 128", {}) == 2 ** 128
+
+
+def test_string_formatting_is_rejected():
+    with pytest.raises(ExpressionError, match="String formatting"):
+        evaluate_expression("'%0200000000d' % 1", {})
+    with pytest.raises(ExpressionError, match="String formatting"):
+        evaluate_expression("fmt % n", {"fmt": "%05d", "n": 1})
+    assert evaluate_expression("7 % 3", {}) == 1
+
+
+def test_substitution_engine_uses_compiled_expressions():
+    engine = ParameterSubstitutionEngine()
+    engine.set_parameters({"pump_count": 3})
+
+    assert engine.substitute("P-${pump_count * 2}") == "P-6"
+    assert engine.substitute("${pump_count.__class__ == 1}") == "${pump_count.__class__ == 1}"
@@ -0,0 +1,79 @@
+"""Tests for compiled substitution and bulk template instantiation."""
+
+import pytest
+from pydexpi.dexpi_classes.dexpiModel import DexpiModel
+
+from src.templates import ParameterSubstitutionEngine, ParametricTemplate
+
+TEMPLATE = {
+    "name": "pump_station",
+    "parameters": {
+        "pump_count": {"type": "integer", "default": 3},
+        "area": {"type": "string", "default": "PS"},
+    },
+    "components": [
+        {
+            "name": "pump",
+            "type": "CentrifugalPump",
+            "count": "${pump_count}",
+            "tag_pattern": "P-${area}-${sequence:03d}",
+            "attributes": {"tagNamePrefix": "${area}", "tagNameSuffix": "${index + 1}"},
+        },
+        {
+            "name": "valve",
+            "type": "GateValve",
+            "count": "${pump_count}",
+            "tag_pattern": "V-${area}-${index}",
+            "attributes": {"fluidCode": "WW"},
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize("template", [
+    "plain text",
+    "${area}",
+    "P-${area}-${count:03d}",
+    "${count * 2} units in ${area}",
+    "${area} == 'PS'",
+    "missing ${unknown} stays",
+])
+def test_compiled_template_matches_substitute(template):
+    params = {"area": "PS", "count": 7}
+    engine = ParameterSubstitutionEngine()
+
+    assert engine.compile_template(template)(params) == engine.substitute(template, params)
+    assert engine.compile_template(template) is engine.compile_template(template)
+
+
+def test_compiled_sequence_advances_per_render():
+    engine = ParameterSubstitutionEngine()
+    render = engine.compile_template("T-${sequence:02d}")
+
+    assert [render({}) for _ in range(3)] == ["T-01", "T-02", "T-03"]
+    assert engine.get_sequence_counter() == 3
+
+
+def test_bulk_instantiation_stamps_every_instance():
+    model = DexpiModel()
+    result = ParametricTemplate(TEMPLATE).instantiate(model, {"pump_count": 200})
+
+    items = model.conceptualModel.taggedPlantItems
+    assert len(items) == 400
+    assert result.instantiated_components[:2] == ["P-PS-001", "P-PS-002"]
+    assert result.instantiated_components[200:202] == ["V-PS-0", "V-PS-1"]
+    assert [items[0].tagNamePrefix, items[0].tagNameSuffix, items[199].tagNameSuffix] == ["PS", "1", "200"]
+    assert {type(item).__name__ for item in items[200:]} == {"GateValve"}
+    assert items[399].fluidCode == "WW"
+
+
+def test_substitute_model_rewrites_nested_placeholders():
+    model = DexpiModel()
+    ParametricTemplate(TEMPLATE).instantiate(model, {"pump_count": 2})
+    pump, valve = model.conceptualModel.taggedPlantItems[0], model.conceptualModel.taggedPlantItems[2]
+    pump.tagNameSuffix = "${area}-A"
+    valve.fluidCode = "${fluid}"
+
+    ParameterSubstitutionEngine().substitute_model(model, {"area": "Z", "fluid": "CW"})
+
+    assert (pump.tagNameSuffix, pump.tagNamePrefix, valve.fluidCode) == ("Z-A", "PS", "CW")
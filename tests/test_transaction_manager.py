@@ -468,6 +468,40 @@ def test_structural_diff_tracks_modifications():
     assert not diff.is_empty()
 
 
+def test_structural_diff_record_methods_deduplicate():
+    """Test record_* methods keep lists unique and ordered."""
+    diff = StructuralDiff()
+    for tag in ["T-101", "P-102", "T-101"]:
+        diff.record_added(tag)
+    diff.record_modified("T-101")  # Added in this diff, not a modification
+    diff.record_modified("V-103")
+    diff.record_modified("V-103")
+
+    assert diff.added == ["T-101", "P-102"]
+    assert diff.modified == ["V-103"]
+
+
+def test_structural_diff_index_resyncs_after_direct_append():
+    """Test set index picks up direct list mutation."""
+    diff = StructuralDiff()
+    diff.record_added("T-101")
+    diff.added.append("P-102")
+    diff.record_added("P-102")
+
+    assert diff.added == ["T-101", "P-102"]
+
+
+def test_structural_diff_duplicates_do_not_force_rebuilds():
+    """Test a list with a duplicate keeps its index between records."""
+    diff = StructuralDiff(added=["T-101", "T-101"])
+    index = diff._index("added")
+    diff.record_added("P-102")
+    diff.record_added("T-101")
+
+    assert diff._index("added") is index
+    assert diff.added == ["T-101", "T-101", "P-102"]
+
+
 # ============================================================================
 # Validation Tests
 # ============================================================================
@@ -525,6 +559,103 @@ async def test_full_transaction_workflow(transaction_manager, dexpi_models, smal
     assert tx_id not in transaction_manager.transactions
 
 
+@pytest.mark.asyncio
+async def test_apply_batch_success(transaction_manager, dexpi_models, small_dexpi_model):
+    """Test batch apply records every operation with timings."""
+    model_id = "batch_model_1"
+    dexpi_models[model_id] = small_dexpi_model
+
+    tx_id = await transaction_manager.begin(model_id)
+    operations = [
+        {"operation": "dexpi_add_equipment",
+         "params": {"equipment_type": "Tank", "tag_name": f"T-{i:03d}"}}
+        for i in range(200, 250)
+    ]
+
+    batch = await transaction_manager.apply_batch(tx_id, operations)
+
+    assert len(batch.records) == 50
+    assert all(record.success for record in batch.records)
+    assert all(record.duration_ms >= 0 for record in batch.records)
+    assert batch.total_ms >= sum(record.duration_ms for record in batch.records)
+
+    tx = transaction_manager.transactions[tx_id]
+    assert len(tx.operations) == 50
+    assert tx.diff.added == [f"T-{i:03d}" for i in range(200, 250)]
+
+    working = transaction_manager.get_working_model(tx_id)
+    tags = [item.tagName for item in working.conceptualModel.taggedPlantItems]
+    assert "T-249" in tags
+
+
+@pytest.mark.asyncio
+async def test_apply_batch_stops_at_failure(transaction_manager, dexpi_models, small_dexpi_model):
+    """Test batch apply stops at the first invalid operation."""
+    model_id = "batch_model_2"
+    dexpi_models[model_id] = small_dexpi_model
+
+    tx_id = await transaction_manager.begin(model_id)
+    operations = [
+        {"operation": "dexpi_add_equipment",
+         "params": {"equipment_type": "Tank", "tag_name": "T-301"}},
+        {"operation": "dexpi_add_equipment", "params": {"equipment_type": "Tank"}},
+        {"operation": "dexpi_add_equipment",
+         "params": {"equipment_type": "Tank", "tag_name": "T-303"}},
+    ]
+
+    with pytest.raises(OperationExecutionError, match="Batch operation 1"):
+        await transaction_manager.apply_batch(tx_id, operations)
+
+    tx = transaction_manager.transactions[tx_id]
+    assert [op.success for op in tx.operations] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_apply_batch_defers_post_validation(transaction_manager, dexpi_models,
+                                                  small_dexpi_model):
+    """Test post-validation hooks run once the batch has finished."""
+    from src.registry.operation_registry import (
+        OperationCategory,
+        OperationDescriptor,
+        OperationResult,
+        ValidationHooks,
+        ValidationResult as HookResult,
+    )
+
+    events = []
+
+    def handler(model, params):
+        events.append(("run", params["n"]))
+        return OperationResult(success=True, message="ok", data={"n": params["n"]})
+
+    def post(model, result):
+        events.append(("post", result.data["n"]))
+        return HookResult(is_valid=True)
+
+    name = "test_batch_post_validation_op"
+    if not transaction_manager.registry.exists(name):
+        transaction_manager.registry.register(OperationDescriptor(
+            name=name,
+            version="1.0.0",
+            category=OperationCategory.UNIVERSAL,
+            description="Test op with post-validation hook",
+            input_schema={"type": "object", "properties": {"n": {"type": "integer"}}},
+            handler=handler,
+            validation_hooks=ValidationHooks(post=post),
+        ))
+
+    model_id = "batch_model_3"
+    dexpi_models[model_id] = small_dexpi_model
+    tx_id = await transaction_manager.begin(model_id)
+
+    await transaction_manager.apply_batch(
+        tx_id, [{"operation": name, "params": {"n": i}} for i in range(3)]
+    )
+
+    assert events == [("run", 0), ("run", 1), ("run", 2),
+                      ("post", 0), ("post", 1), ("post", 2)]
+
+
 @pytest.mark.asyncio
 async def test_transaction_isolation(transaction_manager, dexpi_models, small_dexpi_model):
     """Test that multiple models can have concurrent transactions."""